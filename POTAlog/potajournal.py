@@ -0,0 +1,724 @@
+###############################################################################
+###############################################################################
+####
+#### POTAlog log writer: writes contacts to the log files through a
+#### session journal, and replays the journals of sessions that didn't exit
+#### cleanly
+####
+###############################################################################
+###############################################################################
+
+####
+#### Import support modules
+####
+
+import collections
+import glob
+import importlib
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+#
+#File locking for the session journals and log files
+#
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+#
+#Put parent directory in the system path in order to import hamlibIO.py
+#and TestHarness.py from the directory above
+#
+this_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(this_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+import hamlibIO
+
+####
+#### Global definitions
+####
+
+#
+#Log files are kept open for the session and written through a journal
+#by a background thread, which is handed up to log_queue_size contacts
+#at a time. Every contact is handed to the operating system as soon as
+#it's written, and the journal is forced to disk (fsync) after this many
+#contacts or this many seconds, whichever comes first.
+#
+#Each session has its own journal, named with its process ID and locked
+#for as long as the session runs, so POTAlog sessions sharing a
+#directory never touch each other's journal.
+#
+log_journal_format = "POTAlog.{}.journal"
+log_journal_pattern = "POTAlog.*.journal"
+log_queue_size = 100
+log_sync_records = 10
+log_sync_seconds = 5
+
+#
+#Windows locks stop other processes reading or writing the locked
+#bytes, so files are locked at this offset, well past the end of any
+#journal or log file
+#
+lock_offset = 0x7fffffff
+
+####
+#### Subroutines
+####
+
+class LogWriter:
+    """
+    Writes QSOs to the log files through a session journal on a
+    background thread, so the next prompt never waits for the disk. One
+    append handle is kept open, and locked, per log file for the whole
+    session.
+
+    Contacts are queued for the writer thread (the queue holds up to
+    log_queue_size contacts, after which write waits for the writer to
+    catch up). The writer takes every contact that's waiting, records
+    each once in the journal (an append-only file of length-prefixed
+    entries, see journal_entry) and then fans them out with one write
+    per log file. Both are flushed to the operating system as soon as
+    they're written. The journal is forced to disk (fsync) in groups:
+    after log_sync_records contacts, or log_sync_seconds after the first
+    contact that hasn't been forced to disk.
+
+    If writing fails, error is set and the writer stops touching the log
+    files but keeps journaling contacts (forcing each to disk) until the
+    LogWriter is closed; contacts it can't journal are kept in unwritten.
+    Closing then keeps the journal for the next session and reports the
+    error and any unwritten contacts.
+
+    When the LogWriter is closed, the queue is drained, the log files
+    are forced to disk and the journal is removed. A journal left behind
+    (power failure, killed process) is replayed by replay the next time
+    POTAlog starts in the same directory, adding any QSOs that didn't
+    make it into the log files.
+
+    Arguments:
+        header_fields:      Dictonary of ADIF header fields for new log
+                            files
+        journal_filename:   Default None
+                            String containing the journal file name, None
+                            for this session's (see log_journal_format)
+    """
+
+    def __init__(self, header_fields, journal_filename=None):
+        if journal_filename is None:
+            journal_filename = log_journal_format.format(os.getpid())
+
+        self.header_fields = header_fields
+        self.journal_filename = journal_filename
+        self.journal = None
+        self.files = {}
+        self.pending = 0
+        self.sync_time = 0
+        self.queue = queue.Queue(maxsize=log_queue_size)
+        self.thread = None
+        self.error = None
+        self.unwritten = []
+        self.reported = False
+
+    def write(self, QSOs):
+        """
+        Queue a contact to be journaled and appended to its log files.
+
+        Arguments:
+            QSOs:   List of (log file name, string containing the ADIF
+                    record(s)) for the contact
+
+        Returns:
+            Nothing
+        """
+
+        #
+        #The writer is a daemon thread so it never holds up exiting,
+        #close (registered with atexit) drains the queue first.
+        #
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run,
+                name="LogWriter", daemon=True)
+            self.thread.start()
+
+        self.queue.put(QSOs)
+
+    def run(self):
+        """
+        Writer thread: write queued contacts until None is queued by
+        close.
+
+        Returns:
+            Nothing
+        """
+
+        batch = []
+        done = False
+        try:
+            while not done:
+                #
+                #Wait for a contact, or until it's time to force the
+                #journal to disk
+                #
+                timeout = None
+                if self.pending:
+                    timeout = max(0, self.sync_time - time.monotonic())
+                try:
+                    QSOs = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    self.sync_files()
+                    continue
+
+                #
+                #Take everything that's waiting
+                #
+                batch = []
+                while QSOs is not None:
+                    batch.append(QSOs)
+                    try:
+                        QSOs = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                done = QSOs is None
+
+                if batch:
+                    self.journal_batch(batch)
+                    journaled = batch
+                    batch = []
+                    self.append_batch(journaled)
+        except Exception as error:
+            #
+            #batch holds the contacts that didn't make it into the journal
+            #
+            self.error = error
+            self.save(batch, done)
+
+    def save(self, batch, done):
+        """
+        Writer thread, after an error: journal the remaining contacts,
+        forcing each to disk, until None is queued by close. The log
+        files are left alone. Once a contact can't be journaled, it and
+        every later contact are kept in unwritten instead.
+
+        Arguments:
+            batch:  List of contacts that couldn't be journaled, see write
+            done:   True if close has already queued None
+
+        Returns:
+            Nothing
+        """
+
+        self.unwritten.extend(batch)
+        while not done:
+            QSOs = self.queue.get()
+            if QSOs is None:
+                return
+
+            if not self.unwritten:
+                try:
+                    self.journal_batch([QSOs])
+                    self.sync_files()
+                    continue
+                except Exception:
+                    pass
+            self.unwritten.append(QSOs)
+
+    def journal_batch(self, batch):
+        """
+        Journal contacts, forcing the journal to disk if it's time.
+        Writer thread only.
+
+        Arguments:
+            batch:  List of contacts, see write
+
+        Returns:
+            Nothing
+        """
+
+        if self.journal is None:
+            #
+            #Lock the journal before anything is written to it. Opening
+            #it with open(..., "ab") would seek to the end first.
+            #
+            fd = os.open(self.journal_filename, os.O_WRONLY | os.O_CREAT
+                | os.O_APPEND | getattr(os, "O_BINARY", 0))
+            if not lock_file(fd):
+                os.close(fd)
+                raise OSError(
+                    'The journal "{}" is in use by another session'.format(
+                        self.journal_filename))
+            self.journal = os.fdopen(fd, "ab")
+
+        self.journal.write(b"".join(journal_entry(QSOs) for QSOs in batch))
+        self.journal.flush()
+
+        if not self.pending:
+            self.sync_time = time.monotonic() + log_sync_seconds
+        self.pending += len(batch)
+        if self.pending >= log_sync_records:
+            self.sync_files()
+
+    def append_batch(self, batch):
+        """
+        Append the QSO record(s) of journaled contacts to the log files,
+        one write per log file. Writer thread only.
+
+        Arguments:
+            batch:  List of contacts, see write
+
+        Returns:
+            Nothing
+        """
+
+        log_files = {}
+        for QSOs in batch:
+            for filename, QSO in QSOs:
+                log_files.setdefault(filename, []).append(QSO)
+
+        for filename, QSO in log_files.items():
+            self.append(filename, "".join(QSO))
+
+    def append(self, filename, QSO):
+        """
+        Append QSO record(s) to a log file, creating the file with an
+        ADIF header if it doesn't exist.
+
+        Arguments:
+            filename:   String containing the log file name
+            QSO:        String containing the ADIF record(s)
+
+        Returns:
+            Nothing
+        """
+
+        f = self.files.get(filename)
+        if f is None:
+            #
+            #Create the header before opening the file in case an error
+            #is detected in the header, which will cause an exception
+            #and abort.
+            #
+            header = ""
+            if not os.path.exists(filename):
+                header = hamlibIO.ADIF_header(dict(self.header_fields))
+
+            f = open(filename, "a")
+            self.files[filename] = f
+
+            #
+            #Hold a lock on the log file for the session so another
+            #session's replay doesn't truncate it (see log_file_records).
+            #If another session has it locked, write to it anyway.
+            #
+            lock_file(f.fileno())
+            f.write(header)
+
+        f.write(QSO)
+        f.flush()
+
+    def sync_files(self):
+        """
+        Force all journaled contacts to disk.
+
+        Returns:
+            Nothing
+        """
+
+        if self.pending:
+            os.fsync(self.journal.fileno())
+            self.pending = 0
+
+    def close(self):
+        """
+        Wait for the writer to write every queued contact, force the log
+        files to disk, close them and remove the journal, which is no
+        longer needed. If the writer failed, the journal is kept and the
+        error reported instead. Safe to call more than once.
+
+        Returns:
+            Nothing
+        """
+
+        if self.thread is not None:
+            if self.thread.is_alive():
+                self.queue.put(None)
+                self.thread.join()
+            self.thread = None
+
+        for f in self.files.values():
+            try:
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+            except Exception as error:
+                if self.error is None:
+                    self.error = error
+        self.files = {}
+
+        #
+        #Keep the journal if writing failed, it's replayed next time
+        #
+        if self.journal is not None:
+            try:
+                self.journal.close()
+            except Exception as error:
+                if self.error is None:
+                    self.error = error
+            self.journal = None
+            if self.error is None:
+                os.remove(self.journal_filename)
+        self.pending = 0
+
+        if self.error is not None and not self.reported:
+            self.reported = True
+            self.report()
+
+    def report(self):
+        """
+        Report a write error: where the contacts that didn't make it into
+        the log files are, and the ones that couldn't be saved at all.
+
+        Returns:
+            Nothing
+        """
+
+        sys.stderr.write("""
+Error: Unable to write to the log files: {}
+""".format(self.error))
+
+        if os.path.exists(self.journal_filename):
+            sys.stderr.write("""
+Contacts were saved in the journal "{}", and will be
+added to the log files the next time POTAlog is started in this directory.
+""".format(self.journal_filename))
+
+        if self.unwritten:
+            sys.stderr.write("""
+These contacts could not be saved, log them again:
+""")
+            for QSOs in self.unwritten:
+                for filename, QSO in QSOs:
+                    sys.stderr.write("{}: {}".format(filename, QSO))
+
+    def replay(self):
+        """
+        Replay the journals left behind by sessions that didn't exit
+        cleanly: append every journaled QSO record that isn't already in
+        its log file (see missing_records). Journals of sessions that
+        are still running are locked and left alone. Must be called
+        before the first contact is written.
+
+        Returns:
+            Number of QSO records recovered
+        """
+
+        recovered = 0
+        journals = []
+        try:
+            entries = []
+            for journal_filename in sorted(glob.glob(log_journal_pattern)):
+                f = open(journal_filename, "rb")
+                if not lock_file(f.fileno()):
+                    f.close()
+                    continue
+                journals.append(f)
+                entries.extend(journal_entries(f.read()))
+
+            for filename, record in missing_records(entries):
+                self.append(filename, record)
+                recovered += 1
+
+            #
+            #Force the recovered records to disk before the journals go
+            #
+            self.close()
+        finally:
+            for f in journals:
+                f.close()
+
+        for f in journals:
+            os.remove(f.name)
+
+        return(recovered)
+
+def lock_file(fd):
+    """
+    Lock an open file, without waiting, so no other POTAlog session can
+    lock it. The lock is released when the file is closed or the session
+    ends, however it ends. The file is left positioned at its start.
+
+    Arguments:
+        fd: Integer file descriptor of the open file
+
+    Returns:
+        True if the file is locked, False if another session has it
+        locked
+    """
+
+    try:
+        if os.name == "nt":
+            os.lseek(fd, lock_offset, os.SEEK_SET)
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return(False)
+
+    return(True)
+
+def journal_entry(QSOs):
+    """
+    Build the journal entry for a contact: "length\\n" followed by length
+    bytes of JSON and "\\n".
+
+    Arguments:
+        QSOs:   List of (log file name, string containing the ADIF
+                record(s)) for the contact
+
+    Returns:
+        Bytes containing the entry
+    """
+
+    entry = json.dumps(QSOs).encode("utf-8")
+
+    return(b"%d\n" % len(entry) + entry + b"\n")
+
+def journal_entries(journal):
+    """
+    Split journal contents into entries (see journal_entry). Reading
+    stops at a partially written entry or length, which can only be at
+    the end of the journal. A complete entry that isn't a list of (log
+    file name, ADIF record(s)) pairs is skipped.
+
+    Arguments:
+        journal:    Bytes containing the journal
+
+    Returns:
+        Generator of entries, each a list of (log file name, string
+        containing the ADIF record(s)) for a contact
+    """
+
+    offset = 0
+    while True:
+        end_of_length = journal.find(b"\n", offset)
+        if end_of_length < 0:
+            return
+        try:
+            start = end_of_length + 1
+            end = start + int(journal[offset:end_of_length])
+        except ValueError:
+            return
+        if (end < start) or (journal[end:end + 1] != b"\n"):
+            return
+        offset = end + 1
+
+        try:
+            entry = json.loads(journal[start:end])
+        except ValueError:
+            continue
+        if isinstance(entry, list) and all(isinstance(pair, list)
+                and (len(pair) == 2) and isinstance(pair[0], str)
+                and isinstance(pair[1], str) for pair in entry):
+            yield([tuple(pair) for pair in entry])
+
+def log_file_records(filename):
+    """
+    Get the lines (QSO records, one per line) of a log file, ignoring a
+    partially written last line. The partial line, left by an
+    interrupted write, is removed from the file unless another session
+    has the file locked, since it may be a record that session is
+    writing.
+
+    Arguments:
+        filename:   String containing the log file name
+
+    Returns:
+        Counter of the lines in the file, empty if it doesn't exist.
+    """
+
+    if not os.path.exists(filename):
+        return(collections.Counter())
+
+    f = open(filename, "r+", newline="")
+    try:
+        locked = lock_file(f.fileno())
+        contents = f.read()
+        if contents and not contents.endswith("\n"):
+            contents = contents[:contents.rfind("\n") + 1]
+            if locked:
+                f.seek(0)
+                f.truncate(len(contents.encode()))
+    finally:
+        f.close()
+
+    return(collections.Counter(contents.splitlines(keepends=True)))
+
+def missing_records(entries, log_records=log_file_records):
+    """
+    Find the journaled QSO records that aren't in their log files.
+    Records are matched by count, so a record that was deliberately
+    logged twice (a duplicate contact logged anyway) is found twice if
+    neither copy made it into the log file, and once if one did.
+
+    Arguments:
+        entries:        Iterable of journal entries, see journal_entries
+        log_records:    Default log_file_records
+                        Function returning a Counter of the lines of a
+                        log file, given its name. Called once per log
+                        file.
+
+    Returns:
+        Generator of (log file name, string containing the ADIF record)
+        for each missing record, in journal order
+    """
+
+    logged = {}
+    for QSOs in entries:
+        for filename, QSO in QSOs:
+            if filename not in logged:
+                logged[filename] = log_records(filename)
+
+            for record in QSO.splitlines(keepends=True):
+                if logged[filename][record]:
+                    logged[filename][record] -= 1
+                else:
+                    yield((filename, record))
+
+####
+#### Validation tests
+####
+
+def get_validation_tests():
+    """
+    Build the validation tests. They're built when they're run rather
+    than when potajournal is imported, so the TestHarness and
+    potajournal_tests (test helper) modules aren't loaded by POTAlog.
+
+    Returns:
+        Tuple of validation tests for TestHarness.TestHarness
+    """
+
+    import TestHarness
+    import potajournal_tests as tests
+
+    return((
+    (
+    journal_entry,
+        (
+        TestHarness.compare,
+            ([("K1ABC.adi", "<CALL:5>K2XYZ<EOR>\n")],),
+            b'39\n[["K1ABC.adi", "<CALL:5>K2XYZ<EOR>\\n"]]\n'
+        ),
+    ),
+    (
+    tests.test_journal_entries,
+        (
+        TestHarness.compare,
+            ((tests.QSO1, tests.QSO2), b""),
+            [tests.QSO1, tests.QSO2]
+        ), #Complete journal
+        (
+        TestHarness.compare,
+            ((tests.QSO1,), b"3"),
+            [tests.QSO1]
+        ), #Truncated length
+        (
+        TestHarness.compare,
+            ((tests.QSO1,), b"39\n"),
+            [tests.QSO1]
+        ), #Length without an entry
+        (
+        TestHarness.compare,
+            ((tests.QSO1,), b'39\n[["K1ABC.adi", "<CALL:5>'),
+            [tests.QSO1]
+        ), #Partial last entry
+        (
+        TestHarness.compare,
+            ((tests.QSO1,), b"x\n[]\n"),
+            [tests.QSO1]
+        ), #Bad length
+        (
+        TestHarness.compare,
+            ((), b"5\n[1, 2\n" + journal_entry(tests.QSO2) + b"2\n{}\n"),
+            [tests.QSO2]
+        ), #Bad JSON, and JSON that isn't an entry
+    ),
+    (
+    tests.test_missing_records,
+        (
+        TestHarness.compare,
+            ((tests.QSO1, tests.QSO2, tests.QSO3), {}),
+            [("K1ABC.adi", "<CALL:5>K2XYZ<EOR>\n"),
+             ("K1ABC.adi", "<CALL:5>K3ABC<EOR>\n"),
+             ("K1ABC@US-1234.adi", "<CALL:5>K3ABC<EOR>\n"),
+             ("K1ABC.adi", "<CALL:5>K2XYZ<EOR>\n")]
+        ), #Nothing logged
+        (
+        TestHarness.compare,
+            ((tests.QSO1, tests.QSO2, tests.QSO3),
+             {"K1ABC.adi":["<CALL:5>K2XYZ<EOR>\n", "<CALL:5>K3ABC<EOR>\n"],
+              "K1ABC@US-1234.adi":["<CALL:5>K3ABC<EOR>\n"]}),
+            [("K1ABC.adi", "<CALL:5>K2XYZ<EOR>\n")]
+        ), #Duplicate contact, one copy logged
+        (
+        TestHarness.compare,
+            ((tests.QSO1, tests.QSO2, tests.QSO3),
+             {"K1ABC.adi":["<CALL:5>K2XYZ<EOR>\n", "<CALL:5>K3ABC<EOR>\n",
+                "<CALL:5>K2XYZ<EOR>\n"],
+              "K1ABC@US-1234.adi":["<CALL:5>K3ABC<EOR>\n"]}),
+            []
+        ), #Everything logged
+    ),
+    (
+    tests.test_log_file_records,
+        (
+        TestHarness.compare,
+            ("<CALL:5>K2XYZ<EOR>\n<CALL:5>K3", False),
+            ({"<CALL:5>K2XYZ<EOR>\n":1}, "<CALL:5>K2XYZ<EOR>\n")
+        ), #Partial last line removed
+        (
+        TestHarness.compare,
+            ("<CALL:5>K2XYZ<EOR>\n<CALL:5>K3", True),
+            ({"<CALL:5>K2XYZ<EOR>\n":1}, "<CALL:5>K2XYZ<EOR>\n<CALL:5>K3")
+        ), #Locked by another session, left alone
+    ),    (
+    tests.test_write_failure,
+        (
+        TestHarness.compare,
+            (),
+            (True, True, [tests.QSO1, tests.QSO2], 3, (1, 1, 1), 0, False)
+        ),
+    ),
+    ))
+
+def run_tests():
+    """
+    Run all validation tests.
+
+    Returns:
+        Number of tests that failed
+    """
+
+    import TestHarness
+
+    failed = TestHarness.TestHarness(get_validation_tests())
+    if failed:
+        print("Errors detected")
+
+    return(failed)
+
+if __name__ == "__main__":
+    #
+    #Run the tests in potajournal imported as a module rather than in
+    #this script (__main__), so they test the module POTAlog uses
+    #
+    sys.exit(1 if importlib.import_module("potajournal").run_tests() else 0)
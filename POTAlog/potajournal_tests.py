@@ -0,0 +1,164 @@
+###############################################################################
+###############################################################################
+####
+#### Test helpers for the potajournal.py validation tests
+####
+#### Functions that wrap potajournal functions so TestHarness can check
+#### what they return: building journals from entries, writing log files
+#### to a temporary directory and reading them back, and so on.
+#### potajournal loads this module when its validation tests are run.
+####
+###############################################################################
+###############################################################################
+
+####
+#### Import support modules
+####
+
+import collections
+import contextlib
+import glob
+import io
+import os
+import tempfile
+
+import potajournal
+
+####
+#### Global definitions
+####
+
+#
+#Journal entries for the tests: QSO3 is a duplicate of QSO1 that was
+#logged anyway
+#
+QSO1 = [("K1ABC.adi", "<CALL:5>K2XYZ<EOR>\n")]
+QSO2 = [("K1ABC.adi", "<CALL:5>K3ABC<EOR>\n"),
+    ("K1ABC@US-1234.adi", "<CALL:5>K3ABC<EOR>\n")]
+QSO3 = [("K1ABC.adi", "<CALL:5>K2XYZ<EOR>\n")]
+
+def test_journal_entries(entries, tail):
+    """
+    Build a journal from entries, followed by some other bytes (such as
+    a partially written entry), and split it into entries again.
+
+    Arguments:
+        entries:
+            Tuple of journal entries, see potajournal.journal_entry
+        tail:
+            Bytes to add to the end of the journal
+
+    Returns:
+        List of the entries read back from the journal
+    """
+
+    journal = b"".join(potajournal.journal_entry(QSOs) for QSOs in entries)
+
+    return(list(potajournal.journal_entries(journal + tail)))
+
+def test_missing_records(entries, logs):
+    """
+    Find the journaled records missing from a set of log files.
+
+    Arguments:
+        entries:
+            Tuple of journal entries
+        logs:
+            Dictonary of log file names and lists of their lines
+
+    Returns:
+        List of (log file name, record) for each missing record
+    """
+
+    return(list(potajournal.missing_records(entries,
+        lambda filename: collections.Counter(logs.get(filename, ())))))
+
+def test_log_file_records(text, locked):
+    """
+    Write a log file to a temporary directory and read its records with
+    log_file_records.
+
+    Arguments:
+        text:
+            Contents of the log file
+        locked:
+            True to hold a lock on the log file while it's read, as
+            another session appending to it would
+
+    Returns:
+        Tuple of a dictonary of the lines read and their counts, and the
+        log file's contents afterwards
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "K1ABC.adi")
+        with open(filename, "w", newline="") as f:
+            f.write(text)
+
+        other = open(filename, "a")
+        try:
+            if locked:
+                potajournal.lock_file(other.fileno())
+            records = potajournal.log_file_records(filename)
+        finally:
+            other.close()
+
+        with open(filename, newline="") as f:
+            contents = f.read()
+
+    return((dict(records), contents))
+
+def test_write_failure():
+    """
+    Log two contacts when the log file can't be written (a directory is
+    in its place), then start a new session once it can: the first
+    session must report the error and keep the contacts in its journal,
+    and the new session must recover each of them exactly once.
+
+    Returns:
+        Tuple of:
+            True if closing the first session reported the error
+            True if its journal was kept
+            The entries in its journal
+            The number of records the new session recovered
+            Tuple of the number of times each record is in the log files
+            The number of records a third session recovered
+            True if any journals are left
+    """
+
+    current_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            os.mkdir("K1ABC.adi")
+            writer = potajournal.LogWriter({"PROGRAMVERSION":"test"},
+                "POTAlog.1.journal")
+            writer.write(QSO1)
+            writer.write(QSO2)
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                writer.close()
+            reported = "Unable to write to the log files" in stderr.getvalue()
+
+            journal_kept = os.path.exists("POTAlog.1.journal")
+            with open("POTAlog.1.journal", "rb") as f:
+                entries = list(potajournal.journal_entries(f.read()))
+
+            os.rmdir("K1ABC.adi")
+            recovered = potajournal.LogWriter({"PROGRAMVERSION":"test"},
+                "POTAlog.2.journal").replay()
+
+            counts = []
+            for QSOs in (QSO1, QSO2):
+                for filename, QSO in QSOs:
+                    with open(filename, newline="") as f:
+                        counts.append(f.read().count(QSO))
+
+            recovered_again = potajournal.LogWriter(
+                {"PROGRAMVERSION":"test"}, "POTAlog.3.journal").replay()
+            journals_left = bool(glob.glob(potajournal.log_journal_pattern))
+        finally:
+            os.chdir(current_dir)
+
+    return((reported, journal_kept, entries, recovered, tuple(counts),
+        recovered_again, journals_left))
@@ -1,12 +1,102 @@
 
+import array
+import bisect
 import calendar
+import collections.abc
+import functools
+import importlib
+import io
+import itertools
+import mmap
 import os
 import re
 import sys
+import threading
 import time
-import traceback
 
-import TestHarness
+class LazyPattern:
+    """
+    Regular expression that's compiled the first time it's used rather
+    than when hamlibIO is imported. From then on its methods (fullmatch,
+    search, split, ...) are the compiled pattern's own methods, so using
+    it costs the same as using a compiled pattern.
+
+    Arguments:
+        pattern:
+            Regular expression (string or bytes)
+        flags: Default 0
+            re module flags
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, name):
+        #
+        #Only called for attributes that aren't set yet. Compile the
+        #pattern and keep its methods as this object's attributes.
+        #
+        compiled = self.__dict__.get("compiled")
+        if compiled is None:
+            compiled = re.compile(self.pattern, self.flags)
+            self.compiled = compiled
+            for method in ("findall", "finditer", "fullmatch", "match",
+                    "search", "split", "sub", "subn"):
+                setattr(self, method, getattr(compiled, method))
+
+        return(getattr(compiled, name))
+
+    def __repr__(self):
+        return("LazyPattern({!r}, {!r})".format(self.pattern, self.flags))
+
+#
+#The large enumeration tables (DXCC entities and their subdivisions,
+#contests, credits, awards, ...) are in their own module, which is
+#imported by get_enumerations the first time one of them is used.
+#
+enumerations_module = None
+enumerations_lock = threading.Lock()
+
+def get_enumerations():
+    """
+    Get the hamlibIO_enumerations module, importing it the first time.
+    Safe to call from any thread. Also available as
+    hamlibIO.enumerations (see __getattr__).
+
+    Returns:
+        The hamlibIO_enumerations module
+    """
+
+    global enumerations_module
+
+    if enumerations_module is None:
+        with enumerations_lock:
+            if enumerations_module is None:
+                enumerations_module = importlib.import_module(
+                    "hamlibIO_enumerations")
+
+    return(enumerations_module)
+
+@functools.lru_cache(maxsize=None)
+def get_numpy():
+    """
+    Get the NumPy module. NumPy is optional: if it's installed,
+    freqs_to_band_codes uses it to classify whole columns of frequencies
+    at once. It's imported the first time it's needed rather than when
+    hamlibIO is imported.
+
+    Returns:
+        The numpy module
+        None if NumPy is not installed
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        return(None)
+
+    return(numpy)
 
 #
 #Global variables
@@ -40,6 +130,12 @@ adx_adx     = "<ADX>"
 adx_header  = "    <HEADER>"
 adx_records = "    <RECORDS>"
 adx_record  = "        <RECORD>"
+adx_adx_end     = "</ADX>"
+adx_header_end  = "    </HEADER>"
+adx_records_end = "    </RECORDS>"
+adx_record_end  = "        </RECORD>"
+adx_header_field_indent = "        "
+adx_record_field_indent = "            "
 
 #
 #Simple hamlibIO.py exception to be used if error and halt
@@ -139,6 +235,22 @@ Error: Unable to translate type "{}" to string.
     #
     raise hamlibIOerror("validate_arg_type type translation error")
 
+#
+#Argument type checking is on by default. Set the environment variable
+#HAMLIBIO_CHECK_ARG_TYPES to "0" (or set check_arg_types to False after
+#importing) to turn off validate_arg_type for speed when processing
+#large files with code that's already known to be correct.
+#
+check_arg_types = os.environ.get("HAMLIBIO_CHECK_ARG_TYPES", "1") != "0"
+
+#
+#Type lists that validate_arg_type has already checked for correctness,
+#for example (str, None), and the set of types they allow - or None if
+#any type is allowed. Once a type list is in here, checking an argument
+#against it is just a set lookup.
+#
+arg_type_cache = {}
+
 def validate_arg_type(args_to_check) -> None:
     """
     Check arguments against valid type(s).
@@ -200,6 +312,27 @@ def validate_arg_type(args_to_check) -> None:
             Prints the error(s), the stack trace and exits.
     """
 
+    if not check_arg_types:
+        return None
+
+    #
+    #Fast path. If all of the type lists have been checked before, all
+    #that's left is to see if each argument's type is in its set. If
+    #anything is new, wrong or malformed, drop into the full checking
+    #below to report it.
+    #
+    try:
+        for var_and_valid_types in args_to_check:
+            valid_types = arg_type_cache[var_and_valid_types[1:]]
+            if (valid_types is not None) and \
+                (type(var_and_valid_types[0]) not in valid_types):
+                break
+        else:
+            if args_to_check:
+                return None
+    except (KeyError, TypeError, IndexError):
+        pass
+
     def process_type(arg_off:int,
                      type_off:int,
                      one_type) -> type:
@@ -486,8 +619,16 @@ Error: validate_arg_type called with empty tuple or list.""")
         raise hamlibIOerror("Bad argument type passed to function")
 
     #
-    #All arguments are valid, return
+    #All arguments are valid. Remember the (now validated) type lists so
+    #the next call with them takes the fast path.
     #
+    for var_and_valid_types in args_to_check:
+        if isinstance(var_and_valid_types, tuple):
+            valid_types = var_and_valid_types[1:]
+            arg_type_cache[valid_types] = frozenset(
+                type(None) if typ is None else typ
+                    for typ in valid_types) if valid_types else None
+
     return None
 
 ########################################################################
@@ -508,125 +649,6 @@ Ant_Path_Enumeration = {
 ARRL_SECTION_ENUMERATION_SECTION_NAME_INDEX = 0
 ARRL_SECTION_ENUMERATION_DXCC_ENTITY_CODE_INDEX = 1
 
-ARRL_Section_Enumeration = {
-    "AL" : ("Alabama", ("291",)),
-    "AK" : ("Alaska", ("6",)),
-    "AB" : ("Alberta", ("1",)),
-    "AR" : ("Arkansas", ("291",)),
-    "AZ" : ("Arizona", ("291",)),
-    "BC" : ("British Columbia", ("1",)),
-    "CO" : ("Colorado", ("291",)),
-    "CT" : ("Connecticut", ("291",)),
-    "DE" : ("Delaware", ("291",)),
-    "EB" : ("East Bay", ("291",)),
-    "EMA" : ("Eastern Massachusetts", ("291",)),
-    "ENY" : ("Eastern New York", ("291",)),
-    "EPA" : ("Eastern Pennsylvania", ("291",)),
-    "EWA" : ("Eastern Washington", ("291",)),
-    "GA" : ("Georgia", ("291",)),
-    "GTA" : ("Greater Toronto Area", ("1",)),
-    "ID" : ("Idaho", ("291",)),
-    "IL" : ("Illinois", ("291",)),
-    "IN" : ("Indiana", ("291",)),
-    "IA" : ("Iowa", ("291",)),
-    "KS" : ("Kansas", ("291",)),
-    "KY" : ("Kentucky", ("291",)),
-    "LAX" : ("Los Angeles", ("291",)),
-    "LA" : ("Louisiana", ("291",)),
-    "ME" : ("Maine", ("291",)),
-    "MB" : ("Manitoba", ("1",)),
-    "MAR" : ("Maritime", ("1",)),
-    "MDC" : ("Maryland-DC", ("291",)),
-    "MI" : ("Michigan", ("291",)),
-    "MN" : ("Minnesota", ("291",)),
-    "MS" : ("Mississippi", ("291",)),
-    "MO" : ("Missouri", ("291",)),
-    "MT" : ("Montana", ("291",)),
-    "NE" : ("Nebraska", ("291",)),
-    "NV" : ("Nevada", ("291",)),
-    "NH" : ("New Hampshire", ("291",)),
-    "NM" : ("New Mexico", ("291",)),
-    "NLI" : ("New York City-Long Island", ("291",)),
-    "NL" : ("Newfoundland/Labrador", ("1",)),
-    "NC" : ("North Carolina", ("291",)),
-    "ND" : ("North Dakota", ("291",)),
-    "NTX" : ("North Texas", ("291",)),
-    "NFL" : ("Northern Florida", ("291",)),
-    "NNJ" : ("Northern New Jersey", ("291",)),
-    "NNY" : ("Northern New York", ("291",)),
-    "NT" : ("Northwest Territories/Yukon/Nunavut", ("1",)),
-    "OH" : ("Ohio", ("291",)),
-    "OK" : ("Oklahoma", ("291",)),
-    "ONE" : ("Ontario East", ("1",)),
-    "ONN" : ("Ontario North", ("1",)),
-    "ONS" : ("Ontario South", ("1",)),
-    "ORG" : ("Orange", ("291",)),
-    "OR" : ("Oregon", ("291",)),
-    "PAC" : ("Pacific", ("9", "20", "103", "110", "123", "134", "138", "166", "174", "197", "297", "515")),
-    "PR" : ("Puerto Rico", ("43", "202",)),
-    "QC" : ("Quebec", ("1",)),
-    "RI" : ("Rhode Island", ("291",)),
-    "SV" : ("Sacramento Valley", ("291",)),
-    "SDG" : ("San Diego", ("291",)),
-    "SF" : ("San Francisco", ("291",)),
-    "SJV" : ("San Joaquin Valley", ("291",)),
-    "SB" : ("Santa Barbara", ("291",)),
-    "SCV" : ("Santa Clara Valley", ("291",)),
-    "SK" : ("Saskatchewan", ("1",)),
-    "SC" : ("South Carolina", ("291",)),
-    "SD" : ("South Dakota", ("291",)),
-    "STX" : ("South Texas", ("291",)),
-    "SFL" : ("Southern Florida", ("291",)),
-    "SNJ" : ("Southern New Jersey", ("291",)),
-    "TN" : ("Tennessee", ("291",)),
-    "VI" : ("US Virgin Islands", ("105", "182", "285")),
-    "UT" : ("Utah", ("291",)),
-    "VT" : ("Vermont", ("291",)),
-    "VA" : ("Virginia", ("291",)),
-    "WCF" : ("West Central Florida", ("291",)),
-    "WTX" : ("West Texas", ("291",)),
-    "WV" : ("West Virginia", ("291",)),
-    "WMA" : ("Western Massachusetts", ("291",)),
-    "WNY" : ("Western New York", ("291",)),
-    "WPA" : ("Western Pennsylvania", ("291",)),
-    "WWA" : ("Western Washington", ("291",)),
-    "WI" : ("Wisconsin", ("291",)),
-    "WY" : ("Wyoming", ("291",))
-
-    }
-
-Award_Enumeration = (
-    "AJA",
-    "CQDX",
-    "CQDXFIELD",
-    "CQWAZ_MIXED",
-    "CQWAZ_CW",
-    "CQWAZ_PHONE",
-    "CQWAZ_RTTY",
-    "CQWAZ_160m",
-    "CQWPX",
-    "DARC_DOK",
-    "DXCC",
-    "DXCC_MIXED",
-    "DXCC_CW",
-    "DXCC_PHONE",
-    "DXCC_RTTY",
-    "IOTA",
-    "JCC",
-    "JCG",
-    "MARATHON",
-    "RDA",
-    "WAB",
-    "WAC",
-    "WAE",
-    "WAIP",
-    "WAJA",
-    "WAS",
-    "WAZ",
-    "USACA",
-    "VUCC"
-)
-
 BAND_ENUMERATION_LOWER_FREQ_INDEX = 0
 BAND_ENUMERATION_UPPER_FREQ_INDEX = 1
 
@@ -665,237 +687,18 @@ Band_Enumeration = {
     "1MM"    : (241000, 250000)
     }
 
-Contest_ID_Enumeration = {
-    "070-160M-SPRINT" : "PODXS Great Pumpkin Sprint",
-    "070-3-DAY" : "PODXS Three Day Weekend",
-    "070-31-FLAVORS" : "PODXS 31 Flavors",
-    "070-40M-SPRINT" : "PODXS 40m Firecracker Sprint",
-    "070-80M-SPRINT" : "PODXS 80m Jay Hudak Memorial Sprint",
-    "070-PSKFEST" : "PODXS PSKFest",
-    "070-ST-PATS-DAY" : "PODXS St. Patricks Day",
-    "070-VALENTINE-SPRINT" : "PODXS Valentine Sprint",
-    "10-RTTY" : "Ten-Meter RTTY Contest (2011 onwards)",
-    "1010-OPEN-SEASON" : "Open Season Ten Meter QSO Party",
-    "7QP" : "7th-Area QSO Party",
-    "AL-QSO-PARTY" : "Alabama QSO Party",
-    "ALL-ASIAN-DX-CW" : "JARL All Asian DX Contest (CW)",
-    "ALL-ASIAN-DX-PHONE" : "JARL All Asian DX Contest (PHONE)",
-    "ANARTS-RTTY" : "ANARTS WW RTTY",
-    "ANATOLIAN-RTTY" : "Anatolian WW RTTY",
-    "AP-SPRINT" : "Asia - Pacific Sprint",
-    "AR-QSO-PARTY" : "Arkansas QSO Party",
-    "ARI-DX" : "ARI DX Contest",
-    "ARRL-10" : "ARRL 10 Meter Contest",
-    "ARRL-10-GHZ" : "ARRL 10 GHz and Up Contest",
-    "ARRL-160" : "ARRL 160 Meter Contest",
-    "ARRL-222" : "ARRL 222 MHz and Up Distance Contest",
-    "ARRL-DX-CW" : "ARRL International DX Contest (CW)",
-    "ARRL-DX-SSB" : "ARRL International DX Contest (Phone)",
-    "ARRL-EME" : "ARRL EME contest",
-    "ARRL-FIELD-DAY" : "ARRL Field Day",
-    "ARRL-RR-CW" : "ARRL Rookie Roundup (CW)",
-    "ARRL-RR-RTTY" : "ARRL Rookie Roundup (RTTY)",
-    "ARRL-RR-SSB" : "ARRL Rookie Roundup (Phone)",
-    "ARRL-RTTY" : "ARRL RTTY Round-Up",
-    "ARRL-SCR" : "ARRL School Club Roundup",
-    "ARRL-SS-CW" : "ARRL November Sweepstakes (CW)",
-    "ARRL-SS-SSB" : "ARRL November Sweepstakes (Phone)",
-    "ARRL-UHF-AUG" : "ARRL August UHF Contest",
-    "ARRL-VHF-JAN" : "ARRL January VHF Sweepstakes",
-    "ARRL-VHF-JUN" : "ARRL June VHF QSO Party",
-    "ARRL-VHF-SEP" : "ARRL September VHF QSO Party",
-    "AZ-QSO-PARTY" : "Arizona QSO Party",
-    "BARTG-RTTY" : "BARTG Spring RTTY Contest",
-    "BARTG-SPRINT" : "BARTG Sprint Contest",
-    "BC-QSO-PARTY" : "British Columbia QSO Party",
-    "CA-QSO-PARTY" : "California QSO Party",
-    "CIS-DX" : "CIS DX Contest",
-    "CO-QSO-PARTY" : "Colorado QSO Party",
-    "CQ-160-CW" : "CQ WW 160 Meter DX Contest (CW)",
-    "CQ-160-SSB" : "CQ WW 160 Meter DX Contest (SSB)",
-    "CQ-M" : "CQ-M International DX Contest",
-    "CQ-VHF" : "CQ World-Wide VHF Contest",
-    "CQ-WPX-CW" : "CQ WW WPX Contest (CW)",
-    "CQ-WPX-RTTY" : "CQ/RJ WW RTTY WPX Contest",
-    "CQ-WPX-SSB" : "CQ WW WPX Contest (SSB)",
-    "CQ-WW-CW" : "CQ WW DX Contest (CW)",
-    "CQ-WW-RTTY" : "CQ/RJ WW RTTY DX Contest",
-    "CQ-WW-SSB" : "CQ WW DX Contest (SSB)",
-    "CT-QSO-PARTY" : "Connecticut QSO Party",
-    "CVA-DX-CW" : "Concurso Verde e Amarelo DX CW Contest",
-    "CVA-DX-SSB" : "Concurso Verde e Amarelo DX CW Contest",
-    "CWOPS-CW-OPEN" : "CWops CW Open Competition",
-    "CWOPS-CWT" : "CWops Mini-CWT Test",
-    "DARC-WAEDC-CW" : "WAE DX Contest (CW)",
-    "DARC-WAEDC-RTTY" : "WAE DX Contest (RTTY)",
-    "DARC-WAEDC-SSB" : "WAE DX Contest (SSB)",
-    "DARC-WAG" : "DARC Worked All Germany",
-    "DE-QSO-PARTY" : "Delaware QSO Party",
-    "DL-DX-RTTY" : "DL-DX RTTY Contest",
-    "DMC-RTTY" : "DMC RTTY Contest",
-    "EA-CNCW" : "Concurso Nacional de Telegrafía",
-    "EA-DME" : "Municipios Españoles",
-    "EA-PSK63" : "EA PSK63",
-    "EA-RTTY (import-only)" : "Unión de Radioaficionados Españoles RTTY Contest",
-    "EA-SMRE-CW" : "Su Majestad El Rey de España - CW",
-    "EA-SMRE-SSB" : "Su Majestad El Rey de España - SSB",
-    "EA-VHF-ATLANTIC" : "Atlántico V-UHF",
-    "EA-VHF-COM" : "Combinado de V-UHF",
-    "EA-VHF-COSTA-SOL" : "Costa del Sol V-UHF",
-    "EA-VHF-EA" : "Nacional VHF",
-    "EA-VHF-EA1RCS" : "Segovia EA1RCS V-UHF",
-    "EA-VHF-QSL" : "QSL V-UHF & 50MHz",
-    "EA-VHF-SADURNI" : "Sant Sadurni V-UHF",
-    "EA-WW-RTTY" : "Unión de Radioaficionados Españoles RTTY Contest",
-    "EPC-PSK63" : "PSK63 QSO Party",
-    "EU Sprint" : "EU Sprint",
-    "EU-HF" : "EU HF Championship",
-    "EU-PSK-DX" : "EU PSK DX Contest",
-    "EUCW160M" : "European CW Association 160m CW Party",
-    "FALL SPRINT" : "FISTS Fall Sprint",
-    "FL-QSO-PARTY" : "Florida QSO Party",
-    "GA-QSO-PARTY" : "Georgia QSO Party",
-    "HA-DX" : "Hungarian DX Contest",
-    "HELVETIA" : "Helvetia Contest",
-    "HI-QSO-PARTY" : "Hawaiian QSO Party",
-    "HOLYLAND" : "IARC Holyland Contest",
-    "IA-QSO-PARTY" : "Iowa QSO Party",
-    "IARU-FIELD-DAY" : "DARC IARU Region 1 Field Day",
-    "IARU-HF" : "IARU HF World Championship",
-    "ID-QSO-PARTY" : "Idaho QSO Party",
-    "IL QSO Party" : "Illinois QSO Party",
-    "IN-QSO-PARTY" : "Indiana QSO Party",
-    "JARTS-WW-RTTY" : "JARTS WW RTTY",
-    "JIDX-CW" : "Japan International DX Contest (CW)",
-    "JIDX-SSB" : "Japan International DX Contest (SSB)",
-    "JT-DX-RTTY" : "Mongolian RTTY DX Contest",
-    "K1USN-SST" : "K1USN Slow Speed Test",
-    "KS-QSO-PARTY" : "Kansas QSO Party",
-    "KY-QSO-PARTY" : "Kentucky QSO Party",
-    "LA-QSO-PARTY" : "Louisiana QSO Party",
-    "LDC-RTTY" : "DRCG Long Distance Contest (RTTY)",
-    "LZ DX" : "LZ DX Contest",
-    "MAR-QSO-PARTY" : "Maritimes QSO Party",
-    "MD-QSO-PARTY" : "Maryland QSO Party",
-    "ME-QSO-PARTY" : "Maine QSO Party",
-    "MI-QSO-PARTY" : "Michigan QSO Party",
-    "MIDATLANTIC-QSO-PARTY" : "Mid-Atlantic QSO Party",
-    "MN-QSO-PARTY" : "Minnesota QSO Party",
-    "MO-QSO-PARTY" : "Missouri QSO Party",
-    "MS-QSO-PARTY" : "Mississippi QSO Party",
-    "MT-QSO-PARTY" : "Montana QSO Party",
-    "NA-SPRINT-CW" : "North America Sprint (CW)",
-    "NA-SPRINT-RTTY" : "North America Sprint (RTTY)",
-    "NA-SPRINT-SSB" : "North America Sprint (Phone)",
-    "NAQP-CW" : "North America QSO Party (CW)",
-    "NAQP-RTTY" : "North America QSO Party (RTTY)",
-    "NAQP-SSB" : "North America QSO Party (Phone)",
-    "NC-QSO-PARTY" : "North Carolina QSO Party",
-    "ND-QSO-PARTY" : "North Dakota QSO Party",
-    "NE-QSO-PARTY" : "Nebraska QSO Party",
-    "NEQP" : "New England QSO Party",
-    "NH-QSO-PARTY" : "New Hampshire QSO Party",
-    "NJ-QSO-PARTY" : "New Jersey QSO Party",
-    "NM-QSO-PARTY" : "New Mexico QSO Party",
-    "NRAU-BALTIC-CW" : "NRAU-Baltic Contest (CW)",
-    "NRAU-BALTIC-SSB" : "NRAU-Baltic Contest (SSB)",
-    "NV-QSO-PARTY" : "Nevada QSO Party",
-    "NY-QSO-PARTY" : "New York QSO Party",
-    "OCEANIA-DX-CW" : "Oceania DX Contest (CW)",
-    "OCEANIA-DX-SSB" : "Oceania DX Contest (SSB)",
-    "OH-QSO-PARTY" : "Ohio QSO Party",
-    "OK-DX-RTTY" : "Czech Radio Club OK DX Contest",
-    "OK-OM-DX" : "Czech Radio Club OK-OM DX Contest",
-    "OK-QSO-PARTY" : "Oklahoma QSO Party",
-    "OMISS-QSO-PARTY" : "Old Man International Sideband Society QSO Party",
-    "ON-QSO-PARTY" : "Ontario QSO Party",
-    "OR-QSO-PARTY" : "Oregon QSO Party",
-    "PA-QSO-PARTY" : "Pennsylvania QSO Party",
-    "PACC" : "Dutch PACC Contest",
-    "PSK-DEATHMATCH" : "MDXA PSK DeathMatch (2005-2010)",
-    "QC-QSO-PARTY" : "Quebec QSO Party",
-    "RAC (import-only)" : "Canadian Amateur Radio Society Contest",
-    "RAC-CANADA-DAY" : "RAC Canada Day Contest",
-    "RAC-CANADA-WINTER" : "RAC Canada Winter Contest",
-    "RDAC" : "Russian District Award Contest",
-    "RDXC" : "Russian DX Contest",
-    "REF-160M" : "Reseau des Emetteurs Francais 160m Contest",
-    "REF-CW" : "Reseau des Emetteurs Francais Contest (CW)",
-    "REF-SSB" : "Reseau des Emetteurs Francais Contest (SSB)",
-    "REP-PORTUGAL-DAY-HF" : "Rede dos Emissores Portugueses Portugal Day HF Contest",
-    "RI-QSO-PARTY" : "Rhode Island QSO Party",
-    "RSGB-160" : "1.8MHz Contest",
-    "RSGB-21/28-CW" : "21/28 MHz Contest (CW)",
-    "RSGB-21/28-SSB" : "21/28 MHz Contest (SSB)",
-    "RSGB-80M-CC" : "80m Club Championships",
-    "RSGB-AFS-CW" : "Affiliated Societies Team Contest (CW)",
-    "RSGB-AFS-SSB" : "Affiliated Societies Team Contest (SSB)",
-    "RSGB-CLUB-CALLS" : "Club Calls",
-    "RSGB-COMMONWEALTH" : "Commonwealth Contest",
-    "RSGB-IOTA" : "IOTA Contest",
-    "RSGB-LOW-POWER" : "Low Power Field Day",
-    "RSGB-NFD" : "National Field Day",
-    "RSGB-ROPOCO" : "RoPoCo",
-    "RSGB-SSB-FD" : "SSB Field Day",
-    "RUSSIAN-RTTY" : "Russian Radio RTTY Worldwide Contest",
-    "SAC-CW" : "Scandinavian Activity Contest (CW)",
-    "SAC-SSB" : "Scandinavian Activity Contest (SSB)",
-    "SARTG-RTTY" : "SARTG WW RTTY",
-    "SC-QSO-PARTY" : "South Carolina QSO Party",
-    "SCC-RTTY" : "SCC RTTY Championship",
-    "SD-QSO-PARTY" : "South Dakota QSO Party",
-    "SMP-AUG" : "SSA Portabeltest",
-    "SMP-MAY" : "SSA Portabeltest",
-    "SP-DX-RTTY" : "PRC SPDX Contest (RTTY)",
-    "SPAR-WINTER-FD" : "SPAR Winter Field Day(2016 and earlier)",
-    "SPDXContest" : "SP DX Contest",
-    "SPRING SPRINT" : "FISTS Spring Sprint",
-    "SR-MARATHON" : "Scottish-Russian Marathon",
-    "STEW-PERRY" : "Stew Perry Topband Distance Challenge",
-    "SUMMER SPRINT" : "FISTS Summer Sprint",
-    "TARA-GRID-DIP" : "TARA Grid Dip PSK-RTTY Shindig",
-    "TARA-RTTY" : "TARA RTTY Mêlée",
-    "TARA-RUMBLE" : "TARA Rumble PSK Contest",
-    "TARA-SKIRMISH" : "TARA Skirmish Digital Prefix Contest",
-    "TEN-RTTY" : "Ten-Meter RTTY Contest (before 2011)",
-    "TMC-RTTY" : "The Makrothen Contest",
-    "TN-QSO-PARTY" : "Tennessee QSO Party",
-    "TX-QSO-PARTY" : "Texas QSO Party",
-    "UBA-DX-CW" : "UBA Contest (CW)",
-    "UBA-DX-SSB" : "UBA Contest (SSB)",
-    "UK-DX-BPSK63" : "European PSK Club BPSK63 Contest",
-    "UK-DX-RTTY" : "UK DX RTTY Contest",
-    "UKR-CHAMP-RTTY" : "Open Ukraine RTTY Championship",
-    "UKRAINIAN DX" : "Ukrainian DX",
-    "UKSMG-6M-MARATHON" : "UKSMG 6m Marathon",
-    "UKSMG-SUMMER-ES" : "UKSMG Summer Es Contest",
-    "URE-DX  (import-only)" : "Ukrainian DX Contest",
-    "US-COUNTIES-QSO" : "Mobile Amateur Awards Club",
-    "UT-QSO-PARTY" : "Utah QSO Party",
-    "VA-QSO-PARTY" : "Virginia QSO Party",
-    "VENEZ-IND-DAY" : "RCV Venezuelan Independence Day Contest",
-    "VIRGINIA QSO PARTY (import-only)" : "Virginia QSO Party",
-    "VOLTA-RTTY" : "Alessandro Volta RTTY DX Contest",
-    "VT-QSO-PARTY" : "Vermont QSO Party",
-    "WA-QSO-PARTY" : "Washington QSO Party",
-    "WFD" : "Winter Field Day (2017 and later)",
-    "WI-QSO-PARTY" : "Wisconsin QSO Party",
-    "WIA-HARRY ANGEL" : "WIA Harry Angel Memorial 80m Sprint",
-    "WIA-JMMFD" : "WIA John Moyle Memorial Field Day",
-    "WIA-OCDX" : "WIA Oceania DX (OCDX) Contest",
-    "WIA-REMEMBRANCE" : "WIA Remembrance Day",
-    "WIA-ROSS HULL" : "WIA Ross Hull Memorial VHF/UHF Contest",
-    "WIA-TRANS TASMAN" : "WIA Trans Tasman Low Bands Challenge",
-    "WIA-VHF/UHF FD" : "WIA VHF UHF Field Days",
-    "WIA-VK SHIRES" : "WIA VK Shires",
-    "WINTER SPRINT" : "FISTS Winter Sprint",
-    "WV-QSO-PARTY" : "West Virginia QSO Party",
-    "WW-DIGI" : "World Wide Digi DX Contest",
-    "WY-QSO-PARTY" : "Wyoming QSO Party",
-    "XE-INTL-RTTY" : "Mexico International Contest (RTTY)",
-    "YOHFDX" : "YODX HF contest",
-    "YUDXC" : "YU DX Contest"
-    }
+#
+#Band_Enumeration sorted into frequency order as parallel lists of lower
+#edges, upper edges and band names, so the band for a frequency can be
+#found with a binary search of the lower edges rather than checking
+#every band.
+#
+band_index = sorted((edges[BAND_ENUMERATION_LOWER_FREQ_INDEX],
+    edges[BAND_ENUMERATION_UPPER_FREQ_INDEX], band)
+        for band, edges in Band_Enumeration.items())
+band_lower_edges = [lower for (lower, upper, band) in band_index]
+band_upper_edges = [upper for (lower, upper, band) in band_index]
+band_names = [band for (lower, upper, band) in band_index]
 
 Continent_Enumeration = {
     "NA" : "North America",
@@ -911,424 +714,6 @@ CREDIT_ENUMERATION_SPONSOR_INDEX = 0
 CREDIT_ENUMERATION_AWARD_INDEX = 1
 CREDIT_ENUMERATION_FACET_INDEX = 2
 
-Credit_Enumeration = {
-    "CQDX" : ("CQ Magazine", "DX", "Mixed"),
-    "CQDX_BAND" : ("CQ Magazine", "DX", "Band"),
-    "CQDX_MODE" : ("CQ Magazine", "DX", "Mode"),
-    "CQDX_MOBILE" : ("CQ Magazine", "DX", "Mobile"),
-    "CQDX_QRP" : ("CQ Magazine", "DX", "QRP"),
-    "CQDX_SATELLITE" : ("CQ Magazine", "DX", "Satellite"),
-    "CQDXFIELD" : ("CQ Magazine", "DX Field", "Mixed"),
-    "CQDXFIELD_BAND" : ("CQ Magazine", "DX Field", "Band"),
-    "CQDXFIELD_MODE" : ("CQ Magazine", "DX Field", "Mode"),
-    "CQDXFIELD_MOBILE" : ("CQ Magazine", "DX Field", "Mobile"),
-    "CQDXFIELD_QRP" : ("CQ Magazine", "DX Field", "QRP"),
-    "CQDXFIELD_SATELLITE" : ("CQ Magazine", "DX Field", "Satellite"),
-    "CQWAZ_MIXED" : ("CQ Magazine", "Worked All Zones (WAZ)", "Mixed"),
-    "CQWAZ_BAND" : ("CQ Magazine", "Worked All Zones (WAZ)", "Band"),
-    "CQWAZ_MODE" : ("CQ Magazine", "Worked All Zones (WAZ)", "Mode"),
-    "CQWAZ_SATELLITE" : ("CQ Magazine", "Worked All Zones (WAZ)", "Satellite"),
-    "CQWAZ_EME" : ("CQ Magazine", "Worked All Zones (WAZ)", "EME"),
-    "CQWAZ_MOBILE" : ("CQ Magazine", "Worked All Zones (WAZ)", "Mobile"),
-    "CQWAZ_QRP" : ("CQ Magazine", "Worked All Zones (WAZ)", "QRP"),
-    "CQWPX" : ("CQ Magazine", "WPX", "Mixed"),
-    "CQWPX_BAND" : ("CQ Magazine", "WPX", "Band"),
-    "CQWPX_MODE" : ("CQ Magazine", "WPX", "Mode"),
-    "DXCC" : ("ARRL", "DX Century Club (DXCC)", "Mixed"),
-    "DXCC_BAND" : ("ARRL", "DX Century Club (DXCC)", "Band"),
-    "DXCC_MODE" : ("ARRL", "DX Century Club (DXCC)", "Mode"),
-    "DXCC_SATELLITE" : ("ARRL", "DX Century Club (DXCC)", "Satellite"),
-    "EAUSTRALIA" : ("eQSL", "eAustralia", "Mixed"),
-    "ECANADA" : ("eQSL", "eCanada", "Mixed"),
-    "ECOUNTY_STATE" : ("eQSL", "eCounty", "State"),
-    "EDX" : ("eQSL", "eDX", "Mixed"),
-    "EDX100" : ("eQSL", "eDX100", "Mixed"),
-    "EDX100_BAND" : ("eQSL", "eDX100", "Band"),
-    "EDX100_MODE" : ("eQSL", "eDX100", "Mode"),
-    "EECHOLINK50" : ("eQSL", "eEcholink50", "Echolink"),
-    "EGRID_BAND" : ("eQSL", "eGrid", "Band"),
-    "EGRID_SATELLITE" : ("eQSL", "eGrid", "Satellite"),
-    "EPFX300" : ("eQSL", "ePfx300", "Mixed"),
-    "EPFX300_MODE" : ("eQSL", "ePfx300", "Mode"),
-    "EWAS" : ("eQSL", "eWAS", "Mixed"),
-    "EWAS_BAND" : ("eQSL", "eWAS", "Band"),
-    "EWAS_MODE" : ("eQSL", "eWAS", "Mode"),
-    "EWAS_SATELLITE" : ("eQSL", "eWAS", "Satellite"),
-    "EZ40" : ("eQSL", "eZ40", "Mixed"),
-    "EZ40_MODE" : ("eQSL", "eZ40", "Mode"),
-    "FFMA" : ("ARRL", "Fred Fish Memorial Award (FFMA)", "Mixed"),
-    "IOTA" : ("RSGB", "Islands on the Air (IOTA)", "Mixed"),
-    "IOTA_BASIC" : ("RSGB", "Islands on the Air (IOTA)", "Mixed"),
-    "IOTA_CONT" : ("RSGB", "Islands on the Air (IOTA)", "Continent"),
-    "IOTA_GROUP" : ("RSGB", "Islands on the Air (IOTA)", "Group"),
-    "RDA" : ("TAG", "Russian Districts Award (RDA)", "Mixed"),
-    "USACA" : ("CQ Magazine", "United States of America Counties (USA-CA)", "Mixed"),
-    "VUCC_BAND" : ("ARRL", "VHF/UHF Century Club Program (VUCC)", "Band"),
-    "VUCC_SATELLITE" : ("ARRL", "VHF/UHF Century Club Program (VUCC)", "Satellite"),
-    "WAB" : ("WAB AG", "Worked All Britain (WAB)", "Mixed"),
-    "WAC" : ("IARU", "Worked All Continents (WAC)", "Mixed"),
-    "WAC_BAND" : ("IARU", "Worked All Continents (WAC)", "Band"),
-    "WAE" : ("DARC", "Worked All Europe (WAE)", "Mixed"),
-    "WAE_BAND" : ("DARC", "Worked All Europe (WAE)", "Band"),
-    "WAE_MODE" : ("DARC", "Worked All Europe (WAE)", "Mode"),
-    "WAIP" : ("ARI", "Worked All Italian Provinces (WAIP)", "Mixed"),
-    "WAIP_BAND" : ("ARI", "Worked All Italian Provinces (WAIP)", "Band"),
-    "WAIP_MODE" : ("ARI", "Worked All Italian Provinces (WAIP)", "Mode"),
-    "WAS" : ("ARRL", "Worked All States (WAS)", "Mixed"),
-    "WAS_BAND" : ("ARRL", "Worked All States (WAS)", "Band"),
-    "WAS_EME" : ("ARRL", "Worked All States (WAS)", "EME"),
-    "WAS_MODE" : ("ARRL", "Worked All States (WAS)", "Mode"),
-    "WAS_NOVICE" : ("ARRL", "Worked All States (WAS)", "Novice"),
-    "WAS_QRP" : ("ARRL", "Worked All States (WAS)", "QRP"),
-    "WAS_SATELLITE" : ("ARRL", "Worked All States (WAS)", "Satellite"),
-    "WITUZ" : ("RSGB", "Worked ITU Zones (WITUZ)", "Mixed"),
-    "WITUZ_BAND" : ("RSGB", "Worked ITU Zones (WITUZ)", "Band")
-    }
-
-DXCC_Entity_Code_Enumeration = {
-    "0" : "None (the contacted station is known to not be within a DXCC entity)",
-    "1" : "CANADA",
-    "3" : "AFGHANISTAN",
-    "4" : "AGALEGA & ST. BRANDON IS.",
-    "5" : "ALAND IS.",
-    "6" : "ALASKA",
-    "7" : "ALBANIA",
-    "9" : "AMERICAN SAMOA",
-    "10" : "AMSTERDAM & ST. PAUL IS.",
-    "11" : "ANDAMAN & NICOBAR IS.",
-    "12" : "ANGUILLA",
-    "13" : "ANTARCTICA",
-    "14" : "ARMENIA",
-    "15" : "ASIATIC RUSSIA",
-    "16" : "NEW ZEALAND SUBANTARCTIC ISLANDS",
-    "17" : "AVES I.",
-    "18" : "AZERBAIJAN",
-    "20" : "BAKER & HOWLAND IS.",
-    "21" : "BALEARIC IS.",
-    "22" : "PALAU",
-    "24" : "BOUVET",
-    "27" : "BELARUS",
-    "29" : "CANARY IS.",
-    "31" : "C. KIRIBATI (BRITISH PHOENIX IS.)",
-    "32" : "CEUTA & MELILLA",
-    "33" : "CHAGOS IS.",
-    "34" : "CHATHAM IS.",
-    "35" : "CHRISTMAS I.",
-    "36" : "CLIPPERTON I.",
-    "37" : "COCOS I.",
-    "38" : "COCOS (KEELING) IS.",
-    "40" : "CRETE",
-    "41" : "CROZET I.",
-    "43" : "DESECHEO I.",
-    "45" : "DODECANESE",
-    "46" : "EAST MALAYSIA",
-    "47" : "EASTER I.",
-    "48" : "E. KIRIBATI (LINE IS.)",
-    "49" : "EQUATORIAL GUINEA",
-    "50" : "MEXICO",
-    "51" : "ERITREA",
-    "52" : "ESTONIA",
-    "53" : "ETHIOPIA",
-    "54" : "EUROPEAN RUSSIA",
-    "56" : "FERNANDO DE NORONHA",
-    "60" : "BAHAMAS",
-    "61" : "FRANZ JOSEF LAND",
-    "62" : "BARBADOS",
-    "63" : "FRENCH GUIANA",
-    "64" : "BERMUDA",
-    "65" : "BRITISH VIRGIN IS.",
-    "66" : "BELIZE",
-    "69" : "CAYMAN IS.",
-    "70" : "CUBA",
-    "71" : "GALAPAGOS IS.",
-    "72" : "DOMINICAN REPUBLIC",
-    "74" : "EL SALVADOR",
-    "75" : "GEORGIA",
-    "76" : "GUATEMALA",
-    "77" : "GRENADA",
-    "78" : "HAITI",
-    "79" : "GUADELOUPE",
-    "80" : "HONDURAS",
-    "82" : "JAMAICA",
-    "84" : "MARTINIQUE",
-    "86" : "NICARAGUA",
-    "88" : "PANAMA",
-    "89" : "TURKS & CAICOS IS.",
-    "90" : "TRINIDAD & TOBAGO",
-    "91" : "ARUBA",
-    "94" : "ANTIGUA & BARBUDA",
-    "95" : "DOMINICA",
-    "96" : "MONTSERRAT",
-    "97" : "ST. LUCIA",
-    "98" : "ST. VINCENT",
-    "99" : "GLORIOSO IS.",
-    "100" : "ARGENTINA",
-    "103" : "GUAM",
-    "104" : "BOLIVIA",
-    "105" : "GUANTANAMO BAY",
-    "106" : "GUERNSEY",
-    "107" : "GUINEA",
-    "108" : "BRAZIL",
-    "109" : "GUINEA-BISSAU",
-    "110" : "HAWAII",
-    "111" : "HEARD I.",
-    "112" : "CHILE",
-    "114" : "ISLE OF MAN",
-    "116" : "COLOMBIA",
-    "117" : "ITU HQ",
-    "118" : "JAN MAYEN",
-    "120" : "ECUADOR",
-    "122" : "JERSEY",
-    "123" : "JOHNSTON I.",
-    "124" : "JUAN DE NOVA, EUROPA",
-    "125" : "JUAN FERNANDEZ IS.",
-    "126" : "KALININGRAD",
-    "129" : "GUYANA",
-    "130" : "KAZAKHSTAN",
-    "131" : "KERGUELEN IS.",
-    "132" : "PARAGUAY",
-    "133" : "KERMADEC IS.",
-    "135" : "KYRGYZSTAN",
-    "136" : "PERU",
-    "137" : "REPUBLIC OF KOREA",
-    "138" : "KURE I.",
-    "140" : "SURINAME",
-    "141" : "FALKLAND IS.",
-    "142" : "LAKSHADWEEP IS.",
-    "143" : "LAOS",
-    "144" : "URUGUAY",
-    "145" : "LATVIA",
-    "146" : "LITHUANIA",
-    "147" : "LORD HOWE I.",
-    "148" : "VENEZUELA",
-    "149" : "AZORES",
-    "150" : "AUSTRALIA",
-    "152" : "MACAO",
-    "153" : "MACQUARIE I.",
-    "157" : "NAURU",
-    "158" : "VANUATU",
-    "159" : "MALDIVES",
-    "160" : "TONGA",
-    "161" : "MALPELO I.",
-    "162" : "NEW CALEDONIA",
-    "163" : "PAPUA NEW GUINEA",
-    "165" : "MAURITIUS",
-    "166" : "MARIANA IS.",
-    "167" : "MARKET REEF",
-    "168" : "MARSHALL IS.",
-    "169" : "MAYOTTE",
-    "170" : "NEW ZEALAND",
-    "171" : "MELLISH REEF",
-    "172" : "PITCAIRN I.",
-    "173" : "MICRONESIA",
-    "174" : "MIDWAY I.",
-    "175" : "FRENCH POLYNESIA",
-    "176" : "FIJI",
-    "177" : "MINAMI TORISHIMA",
-    "179" : "MOLDOVA",
-    "180" : "MOUNT ATHOS",
-    "181" : "MOZAMBIQUE",
-    "182" : "NAVASSA I.",
-    "185" : "SOLOMON IS.",
-    "187" : "NIGER",
-    "188" : "NIUE",
-    "189" : "NORFOLK I.",
-    "190" : "SAMOA",
-    "191" : "NORTH COOK IS.",
-    "192" : "OGASAWARA",
-    "195" : "ANNOBON I.",
-    "197" : "PALMYRA & JARVIS IS.",
-    "199" : "PETER 1 I.",
-    "201" : "PRINCE EDWARD & MARION IS.",
-    "202" : "PUERTO RICO",
-    "203" : "ANDORRA",
-    "204" : "REVILLAGIGEDO",
-    "205" : "ASCENSION I.",
-    "206" : "AUSTRIA",
-    "207" : "RODRIGUEZ I.",
-    "209" : "BELGIUM",
-    "211" : "SABLE I.",
-    "212" : "BULGARIA",
-    "213" : "SAINT MARTIN",
-    "214" : "CORSICA",
-    "215" : "CYPRUS",
-    "216" : "SAN ANDRES & PROVIDENCIA",
-    "217" : "SAN FELIX & SAN AMBROSIO",
-    "219" : "SAO TOME & PRINCIPE",
-    "221" : "DENMARK",
-    "222" : "FAROE IS.",
-    "223" : "ENGLAND",
-    "224" : "FINLAND",
-    "225" : "SARDINIA",
-    "227" : "FRANCE",
-    "230" : "FEDERAL REPUBLIC OF GERMANY",
-    "232" : "SOMALIA",
-    "233" : "GIBRALTAR",
-    "234" : "SOUTH COOK IS.",
-    "235" : "SOUTH GEORGIA I.",
-    "236" : "GREECE",
-    "237" : "GREENLAND",
-    "238" : "SOUTH ORKNEY IS.",
-    "239" : "HUNGARY",
-    "240" : "SOUTH SANDWICH IS.",
-    "241" : "SOUTH SHETLAND IS.",
-    "242" : "ICELAND",
-    "245" : "IRELAND",
-    "246" : "SOVEREIGN MILITARY ORDER OF MALTA",
-    "247" : "SPRATLY IS.",
-    "248" : "ITALY",
-    "249" : "ST. KITTS & NEVIS",
-    "250" : "ST. HELENA",
-    "251" : "LIECHTENSTEIN",
-    "252" : "ST. PAUL I.",
-    "253" : "ST. PETER & ST. PAUL ROCKS",
-    "254" : "LUXEMBOURG",
-    "256" : "MADEIRA IS.",
-    "257" : "MALTA",
-    "259" : "SVALBARD",
-    "260" : "MONACO",
-    "262" : "TAJIKISTAN",
-    "263" : "NETHERLANDS",
-    "265" : "NORTHERN IRELAND",
-    "266" : "NORWAY",
-    "269" : "POLAND",
-    "270" : "TOKELAU IS.",
-    "272" : "PORTUGAL",
-    "273" : "TRINDADE & MARTIM VAZ IS.",
-    "274" : "TRISTAN DA CUNHA & GOUGH I.",
-    "275" : "ROMANIA",
-    "276" : "TROMELIN I.",
-    "277" : "ST. PIERRE & MIQUELON",
-    "278" : "SAN MARINO",
-    "279" : "SCOTLAND",
-    "280" : "TURKMENISTAN",
-    "281" : "SPAIN",
-    "282" : "TUVALU",
-    "283" : "UK SOVEREIGN BASE AREAS ON CYPRUS",
-    "284" : "SWEDEN",
-    "285" : "VIRGIN IS.",
-    "286" : "UGANDA",
-    "287" : "SWITZERLAND",
-    "288" : "UKRAINE",
-    "289" : "UNITED NATIONS HQ",
-    "291" : "UNITED STATES OF AMERICA",
-    "292" : "UZBEKISTAN",
-    "293" : "VIET NAM",
-    "294" : "WALES",
-    "295" : "VATICAN",
-    "296" : "SERBIA",
-    "297" : "WAKE I.",
-    "298" : "WALLIS & FUTUNA IS.",
-    "299" : "WEST MALAYSIA",
-    "301" : "W. KIRIBATI (GILBERT IS. )",
-    "302" : "WESTERN SAHARA",
-    "303" : "WILLIS I.",
-    "304" : "BAHRAIN",
-    "305" : "BANGLADESH",
-    "306" : "BHUTAN",
-    "308" : "COSTA RICA",
-    "309" : "MYANMAR",
-    "312" : "CAMBODIA",
-    "315" : "SRI LANKA",
-    "318" : "CHINA",
-    "321" : "HONG KONG",
-    "324" : "INDIA",
-    "327" : "INDONESIA",
-    "330" : "IRAN",
-    "333" : "IRAQ",
-    "336" : "ISRAEL",
-    "339" : "JAPAN",
-    "342" : "JORDAN",
-    "344" : "DEMOCRATIC PEOPLE'S REP. OF KOREA",
-    "345" : "BRUNEI DARUSSALAM",
-    "348" : "KUWAIT",
-    "354" : "LEBANON",
-    "363" : "MONGOLIA",
-    "369" : "NEPAL",
-    "370" : "OMAN",
-    "372" : "PAKISTAN",
-    "375" : "PHILIPPINES",
-    "376" : "QATAR",
-    "378" : "SAUDI ARABIA",
-    "379" : "SEYCHELLES",
-    "381" : "SINGAPORE",
-    "382" : "DJIBOUTI",
-    "384" : "SYRIA",
-    "386" : "TAIWAN",
-    "387" : "THAILAND",
-    "390" : "TURKEY",
-    "391" : "UNITED ARAB EMIRATES",
-    "400" : "ALGERIA",
-    "401" : "ANGOLA",
-    "402" : "BOTSWANA",
-    "404" : "BURUNDI",
-    "406" : "CAMEROON",
-    "408" : "CENTRAL AFRICA",
-    "409" : "CAPE VERDE",
-    "410" : "CHAD",
-    "411" : "COMOROS",
-    "412" : "REPUBLIC OF THE CONGO",
-    "414" : "DEMOCRATIC REPUBLIC OF THE CONGO",
-    "416" : "BENIN",
-    "420" : "GABON",
-    "422" : "THE GAMBIA",
-    "424" : "GHANA",
-    "428" : "COTE D'IVOIRE",
-    "430" : "KENYA",
-    "432" : "LESOTHO",
-    "434" : "LIBERIA",
-    "436" : "LIBYA",
-    "438" : "MADAGASCAR",
-    "440" : "MALAWI",
-    "442" : "MALI",
-    "444" : "MAURITANIA",
-    "446" : "MOROCCO",
-    "450" : "NIGERIA",
-    "452" : "ZIMBABWE",
-    "453" : "REUNION I.",
-    "454" : "RWANDA",
-    "456" : "SENEGAL",
-    "458" : "SIERRA LEONE",
-    "460" : "ROTUMA I.",
-    "462" : "SOUTH AFRICA",
-    "464" : "NAMIBIA",
-    "466" : "SUDAN",
-    "468" : "SWAZILAND",
-    "470" : "TANZANIA",
-    "474" : "TUNISIA",
-    "478" : "EGYPT",
-    "480" : "BURKINA FASO",
-    "482" : "ZAMBIA",
-    "483" : "TOGO",
-    "489" : "CONWAY REEF",
-    "490" : "BANABA I. (OCEAN I.)",
-    "492" : "YEMEN",
-    "497" : "CROATIA",
-    "499" : "SLOVENIA",
-    "501" : "BOSNIA-HERZEGOVINA",
-    "502" : "MACEDONIA",
-    "503" : "CZECH REPUBLIC",
-    "504" : "SLOVAK REPUBLIC",
-    "505" : "PRATAS I.",
-    "506" : "SCARBOROUGH REEF",
-    "507" : "TEMOTU PROVINCE",
-    "508" : "AUSTRAL I.",
-    "509" : "MARQUESAS IS.",
-    "510" : "PALESTINE",
-    "511" : "TIMOR-LESTE",
-    "512" : "CHESTERFIELD IS.",
-    "513" : "DUCIE I.",
-    "514" : "MONTENEGRO",
-    "515" : "SWAINS I.",
-    "516" : "SAINT BARTHELEMY",
-    "517" : "CURACAO",
-    "518" : "ST MAARTEN",
-    "519" : "SABA & ST. EUSTATIUS",
-    "520" : "BONAIRE",
-    "521" : "SOUTH SUDAN (REPUBLIC OF)",
-    "522" : "REPUBLIC OF KOSOVO",
-    }
-
 #
 #Table of valid submodes for each mode, if any
 #
@@ -1369,7 +754,7 @@ Mode_Enumeration = {
         "OLIVIA 32/1000"),
     "OPERA" : ("OPERA-BEACON", "OPERA-QSO"),
     "PAC" : ("PAC2", "PAC3", "PAC4"),
-    "PAX" : ("PAX2"),
+    "PAX" : ("PAX2",),
     "PKT" : (),
     "PSK" : ("8PSK125", "8PSK125F", "8PSK125FL", "8PSK250", "8PSK250F",
         "8PSK250FL", "8PSK500", "8PSK500F", "8PSK1000", "8PSK1000F",
@@ -1411,2065 +796,173 @@ for mode in Mode_Enumeration:
     for submode in Mode_Enumeration[mode]:
         Submode_Enumeration[submode] = mode
 
-Propgation_Mode_Enumeration = {
-    "AS" : "Aircraft Scatter",
-    "AUE" : "Aurora-E",
-    "AUR" : "Aurora",
-    "BS" : "Back scatter",
-    "ECH" : "EchoLink",
-    "EME" : "Earth-Moon-Earth",
-    "ES" : "Sporadic E",
-    "F2" : "F2 Reflection",
-    "FAI" : "Field Aligned Irregularities",
-    "GWAVE" : "Ground Wave",
-    "INTERNET" : "Internet-assisted",
-    "ION" : "Ionoscatter",
-    "IRL" : "IRLP",
-    "LOS" : "Line of Sight (includes transmission through obstacles such as walls)",
-    "MS" : "Meteor scatter",
-    "RPT" : "Terrestrial or atmospheric repeater or transponder",
-    "RS" : "Rain scatter",
-    "SAT" : "Satellite",
-    "TEP" : "Trans-equatorial",
-    "TR" : "Tropospheric ducting"
-    }
-
-Primary_Administrative_Subdivision_Enumeration_1 = {
-    "NS" : ("Nova Scotia", None, ("05",), ("09",)),
-    "QC" : ("Québec", None, ("02", "05",), ("04", "09",)),
-    "ON" : ("Ontario", None, ("04",), ("03", "04",)),
-    "MB" : ("Manitoba", None, ("04",), ("03", "04",)),
-    "SK" : ("Saskatchewan", None, ("04",), ("03",)),
-    "AB" : ("Alberta", None, ("04",), ("02",)),
-    "BC" : ("British Columbia", None, ("03",), ("02",)),
-    "NT" : ("Northwest Territories", None, ("01", "02", "04",), ("03", "04", "75",)),
-    "NB" : ("New Brunswick", None, ("05",), ("09",)),
-    "NL" : ("Newfoundland and Labrador", None, ("02", "05",), ("09",)),
-    "YT" : ("Yukon", None, ("01",), ("02",)),
-    "PE" : ("Prince Edward Island", None, ("05",), ("09",)),
-    "NU" : ("Nunavut", None, ("02",), ("04", "09",))
-    }
-
-Primary_Administrative_Subdivision_Enumeration_5 = {
-    "001" : ("Brändö", None, None, None),
-    "002" : ("Eckerö", None, None, None),
-    "003" : ("Finström", None, None, None),
-    "004" : ("Föglö", None, None, None),
-    "005" : ("Geta", None, None, None),
-    "006" : ("Hammarland", None, None, None),
-    "007" : ("Jomala", None, None, None),
-    "008" : ("Kumlinge", None, None, None),
-    "009" : ("Kökar", None, None, None),
-    "010" : ("Lemland", None, None, None),
-    "011" : ("Lumparland", None, None, None),
-    "012" : ("Maarianhamina", None, None, None),
-    "013" : ("Saltvik", None, None, None),
-    "014" : ("Sottunga", None, None, None),
-    "015" : ("Sund", None, None, None),
-    "016" : ("Vårdö", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_6 = {
-    "AK" : ("Alaska", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_15 = {
-    "UO" : ("Ust’-Ordynsky Autonomous Okrug - for contacts made before 2008-01-01", "174", ("18",), ("32",)),
-    "AB" : ("Aginsky Buryatsky Autonomous Okrug - for contacts made before 2008-03-01", "175", ("18",), ("33",)),
-    "CB" : ("Chelyabinsk (Chelyabinskaya oblast)", "165", ("17",), ("30",)),
-    "SV" : ("Sverdlovskaya oblast", "154", ("17",), ("30",)),
-    "PM" : ("Perm` (Permskaya oblast) - for contacts made on or after 2005-12-01", "140", ("17",), ("30",)),
-    "PM" : ("Permskaya Kraj - for contacts made before 2005-12-01", "140", ("17",), ("30",)),
-    "KP" : ("Komi-Permyatsky Autonomous Okrug - for contacts made before 2005-12-01", "141", ("17",), ("30",)),
-    "TO" : ("Tomsk (Tomskaya oblast)", "158", ("18",), ("30",)),
-    "HM" : ("Khanty-Mansyisky Autonomous Okrug", "162", ("17",), ("21",)),
-    "YN" : ("Yamalo-Nenetsky Autonomous Okrug", "163", ("17",), ("21",)),
-    "TN" : ("Tyumen' (Tyumenskaya oblast)", "161", ("17",), ("30",)),
-    "OM" : ("Omsk (Omskaya oblast)", "146", ("17",), ("30",)),
-    "NS" : ("Novosibirsk (Novosibirskaya oblast)", "145", ("18",), ("31",)),
-    "KN" : ("Kurgan (Kurganskaya oblast)", "134", ("17",), ("30",)),
-    "OB" : ("Orenburg (Orenburgskaya oblast)", "167", ("16", "17"), ("30",)),
-    "KE" : ("Kemerovo (Kemerovskaya oblast)", "130", ("18",), ("31",)),
-    "BA" : ("Republic of Bashkortostan", "84", ("16",), ("30",)),
-    "KO" : ("Republic of Komi", "90", ("17",), ("20",)),
-    "AL" : ("Altaysky Kraj", "99", ("18",), ("31",)),
-    "GA" : ("Republic Gorny Altay", "100", ("18",), ("31",)),
-    "KK" : ("Krasnoyarsk (Krasnoyarsk Kraj)", "103", ("18",), ("32",)),
-    "TM" : ("Taymyr Autonomous Okrug - for contacts made before 2007-01-01", "105", ("18",), ("32",)),
-    "HK" : ("Khabarovsk (Khabarovsky Kraj)", "110", ("19",), ("34",)),
-    "EA" : ("Yevreyskaya Autonomous Oblast", "111", ("19",), ("33",)),
-    "SL" : ("Sakhalin (Sakhalinskaya oblast)", "153", ("19",), ("34",)),
-    "EV" : ("Evenkiysky Autonomous Okrug - for contacts made before 2007-01-01", "106", ("18",), ("22",)),
-    "MG" : ("Magadan (Magadanskaya oblast)", "138", ("19",), ("24",)),
-    "AM" : ("Amurskaya oblast", "112", ("19",), ("33",)),
-    "CK" : ("Chukotka Autonomous Okrug", "139", ("19",), ("26",)),
-    "PK" : ("Primorsky Kraj", "107", ("19",), ("34",)),
-    "BU" : ("Republic of Buryatia", "85", ("18",), ("32",)),
-    "YA" : ("Sakha (Yakut) Republic", "98", ("19",), ("32",)),
-    "IR" : ("Irkutsk (Irkutskaya oblast)", "124", ("18",), ("32",)),
-    "CT" : ("Zabaykalsky Kraj - referred to as Chita (Chitinskaya oblast) before 2008-03-01", "166", ("18",), ("33",)),
-    "HA" : ("Republic of Khakassia", "104", ("18",), ("32",)),
-    "KY" : ("Koryaksky Autonomous Okrug - for contacts made before 2007-01-01", "129", ("19",), ("25",)),
-    "TU" : ("Republic of Tuva", "159", ("23",), ("32",)),
-    "KT" : ("Kamchatka (Kamchatskaya oblast)", "128", ("19",), ("35",))
-    }
-
-Primary_Administrative_Subdivision_Enumeration_21 = {
-    "IB" : ("Baleares", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_27 = {
-    "MI" : ("Minsk (Minskaya voblasts')", None, None, None),
-    "BR" : ("Brest (Brestskaya voblasts')", None, None, None),
-    "HR" : ("Grodno (Hrodzenskaya voblasts')", None, None, None),
-    "VI" : ("Vitebsk (Vitsyebskaya voblasts')", None, None, None),
-    "MA" : ("Mogilev (Mahilyowskaya voblasts')", None, None, None),
-    "HO" : ("Gomel (Homyel'skaya voblasts')", None, None, None),
-    "HM" : ("Horad Minsk", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_29 = {
-    "GC" : ("Las Palmas", None, None, None),
-    "TF" : ("Tenerife", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_32 = {
-    "CE" : ("Ceuta", None, None, None),
-    "ML" : ("Melilla", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_50 = {
-    "COL" : ("Colima", None, None, None),
-    "DF" : ("Distrito Federal", None, None, None),
-    "EMX" : ("Estado de México", None, None, None),
-    "GTO" : ("Guanajuato", None, None, None),
-    "HGO" : ("Hidalgo", None, None, None),
-    "JAL" : ("Jalisco", None, None, None),
-    "MIC" : ("Michoacán de Ocampo", None, None, None),
-    "MOR" : ("Morelos", None, None, None),
-    "NAY" : ("Nayarit", None, None, None),
-    "PUE" : ("Puebla", None, None, None),
-    "QRO" : ("Querétaro de Arteaga", None, None, None),
-    "TLX" : ("Tlaxcala", None, None, None),
-    "VER" : ("Veracruz-Llave", None, None, None),
-    "AGS" : ("Aguascalientes", None, None, None),
-    "BC" : ("Baja California", None, None, None),
-    "BCS" : ("Baja California Sur", None, None, None),
-    "CHH" : ("Chihuahua", None, None, None),
-    "COA" : ("Coahuila de Zaragoza", None, None, None),
-    "DGO" : ("Durango", None, None, None),
-    "NL" : ("Nuevo Leon", None, None, None),
-    "SLP" : ("San Luis Potosí", None, None, None),
-    "SIN" : ("Sinaloa", None, None, None),
-    "SON" : ("Sonora", None, None, None),
-    "TMS" : ("Tamaulipas", None, None, None),
-    "ZAC" : ("Zacatecas", None, None, None),
-    "CAM" : ("Campeche", None, None, None),
-    "CHS" : ("Chiapas", None, None, None),
-    "GRO" : ("Guerrero", None, None, None),
-    "OAX" : ("Oaxaca", None, None, None),
-    "QTR" : ("Quintana Roo", None, None, None),
-    "TAB" : ("Tabasco", None, None, None),
-    "YUC" : ("Yucatán", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_54 = {
-    "SP" : ("City of St. Petersburg", "169", ("16",), ("29",)),
-    "LO" : ("Leningradskaya oblast", "136", ("16",), ("29",)),
-    "KL" : ("Republic of Karelia", "88", ("16",), ("19",)),
-    "AR" : ("Arkhangelsk (Arkhangelskaya oblast)", "113", ("16",), ("19",)),
-    "NO" : ("Nenetsky Autonomous Okrug", "114", ("16",), ("20",)),
-    "VO" : ("Vologda (Vologodskaya oblast)", "120", ("16",), ("29",)),
-    "NV" : ("Novgorodskaya oblast", "144", ("16",), ("29",)),
-    "PS" : ("Pskov (Pskovskaya oblast)", "149", ("16",), ("29",)),
-    "MU" : ("Murmansk (Murmanskaya oblast)", "143", ("16",), ("19",)),
-    "MA" : ("City of Moscow", "170", ("16",), ("29",)),
-    "MO" : ("Moscowskaya oblast", "142", ("16",), ("29",)),
-    "OR" : ("Oryel (Orlovskaya oblast)", "147", ("16",), ("29",)),
-    "LP" : ("Lipetsk (Lipetskaya oblast)", "137", ("16",), ("29",)),
-    "TV" : ("Tver' (Tverskaya oblast)", "126", ("16",), ("29",)),
-    "SM" : ("Smolensk (Smolenskaya oblast)", "155", ("16",), ("29",)),
-    "YR" : ("Yaroslavl (Yaroslavskaya oblast)", "168", ("16",), ("29",)),
-    "KS" : ("Kostroma (Kostromskaya oblast)", "132", ("16",), ("29",)),
-    "TL" : ("Tula (Tul'skaya oblast)", "160", ("16",), ("29",)),
-    "VR" : ("Voronezh (Voronezhskaya oblast)", "121", ("16",), ("29",)),
-    "TB" : ("Tambov (Tambovskaya oblast)", "157", ("16",), ("29",)),
-    "RA" : ("Ryazan' (Ryazanskaya oblast)", "151", ("16",), ("29",)),
-    "NN" : ("Nizhni Novgorod (Nizhegorodskaya oblast)", "122", ("16",), ("29",)),
-    "IV" : ("Ivanovo (Ivanovskaya oblast)", "123", ("16",), ("29",)),
-    "VL" : ("Vladimir (Vladimirskaya oblast)", "119", ("16",), ("29",)),
-    "KU" : ("Kursk (Kurskaya oblast)", "135", ("16",), ("29",)),
-    "KG" : ("Kaluga (Kaluzhskaya oblast)", "127", ("16",), ("29",)),
-    "BR" : ("Bryansk (Bryanskaya oblast)", "118", ("16",), ("29",)),
-    "BO" : ("Belgorod (Belgorodskaya oblast)", "117", ("16",), ("29",)),
-    "VG" : ("Volgograd (Volgogradskaya oblast)", "156", ("16",), ("29",)),
-    "SA" : ("Saratov (Saratovskaya oblast)", "152", ("16",), ("29",)),
-    "PE" : ("Penza (Penzenskaya oblast)", "148", ("16",), ("29",)),
-    "SR" : ("Samara (Samarskaya oblast)", "133", ("16",), ("30",)),
-    "UL" : ("Ulyanovsk (Ulyanovskaya oblast)", "164", ("16",), ("29",)),
-    "KI" : ("Kirov (Kirovskaya oblast)", "131", ("16",), ("30",)),
-    "TA" : ("Republic of Tataria", "94", ("16",), ("30",)),
-    "MR" : ("Republic of Marij-El", "91", ("16",), ("29",)),
-    "MD" : ("Republic of Mordovia", "92", ("16",), ("29",)),
-    "UD" : ("Republic of Udmurtia", "95", ("16",), ("30",)),
-    "CU" : ("Republic of Chuvashia", "97", ("16",), ("29",)),
-    "KR" : ("Krasnodar (Krasnodarsky Kraj)", "101", ("16",), ("29",)),
-    "KC" : ("Republic of Karachaevo-Cherkessia", "109", ("16",), ("29",)),
-    "ST" : ("Stavropol' (Stavropolsky Kraj)", "108", ("16",), ("29",)),
-    "KM" : ("Republic of Kalmykia", "89", ("16",), ("29",)),
-    "SO" : ("Republic of Northern Ossetia", "93", ("16",), ("29",)),
-    "RO" : ("Rostov-on-Don (Rostovskaya oblast)", "150", ("16",), ("29",)),
-    "CN" : ("Republic Chechnya", "96", ("16",), ("29",)),
-    "IN" : ("Republic of Ingushetia", "96", ("16",), ("29",)),
-    "AO" : ("Astrakhan' (Astrakhanskaya oblast)", "115", ("16",), ("29",)),
-    "DA" : ("Republic of Daghestan", "86", ("16",), ("29",)),
-    "KB" : ("Republic of Kabardino-Balkaria", "87", ("16",), ("29",)),
-    "AD" : ("Republic of Adygeya", "102", ("16",), ("29",))
-    }
-
-Primary_Administrative_Subdivision_Enumeration_61 = {
-    "AR" : ("Arkhangelsk (Arkhangelskaya oblast)", None, None, None),
-    "FJL" : ("Franz Josef Land (import-only)", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_100 = {
-    "C" : ("Capital federal (Buenos Aires City)", None, None, None),
-    "B" : ("Buenos Aires Province", None, None, None),
-    "S" : ("Santa Fe", None, None, None),
-    "H" : ("Chaco", None, None, None),
-    "P" : ("Formosa", None, None, None),
-    "X" : ("Cordoba", None, None, None),
-    "N" : ("Misiones", None, None, None),
-    "E" : ("Entre Rios", None, None, None),
-    "T" : ("Tucumán", None, None, None),
-    "W" : ("Corrientes", None, None, None),
-    "M" : ("Mendoza", None, None, None),
-    "G" : ("Santiago del Estero", None, None, None),
-    "A" : ("Salta", None, None, None),
-    "J" : ("San Juan", None, None, None),
-    "D" : ("San Luis", None, None, None),
-    "K" : ("Catamarca", None, None, None),
-    "F" : ("La Rioja", None, None, None),
-    "Y" : ("Jujuy", None, None, None),
-    "L" : ("La Pampa", None, None, None),
-    "R" : ("Rió Negro", None, None, None),
-    "U" : ("Chubut", None, None, None),
-    "Z" : ("Santa Cruz", None, None, None),
-    "V" : ("Tierra del Fuego", None, None, None),
-    "Q" : ("Neuquén", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_108 = {
-    "ES" : ("Espírito Santo", None, None, None),
-    "GO" : ("Goiás", None, None, None),
-    "SC" : ("Santa Catarina", None, None, None),
-    "SE" : ("Sergipe", None, None, None),
-    "AL" : ("Alagoas", None, None, None),
-    "AM" : ("Amazonas", None, None, None),
-    "TO" : ("Tocantins", None, None, None),
-    "AP" : ("Amapã", None, None, None),
-    "PB" : ("Paraíba", None, None, None),
-    "MA" : ("Maranhao", None, None, None),
-    "RN" : ("Rio Grande do Norte", None, None, None),
-    "PI" : ("Piaui", None, None, None),
-    "DF" : ("Oietrito Federal (Brasila)", None, None, None),
-    "CE" : ("Ceará", None, None, None),
-    "AC" : ("Acre", None, None, None),
-    "MS" : ("Mato Grosso do Sul", None, None, None),
-    "RR" : ("Roraima", None, None, None),
-    "RO" : ("Rondônia", None, None, None),
-    "RJ" : ("Rio de Janeiro", None, None, None),
-    "SP" : ("Sao Paulo", None, None, None),
-    "RS" : ("Rio Grande do Sul", None, None, None),
-    "MG" : ("Minas Gerais", None, None, None),
-    "PR" : ("Paranã", None, None, None),
-    "BA" : ("Bahia", None, None, None),
-    "PE" : ("Pernambuco", None, None, None),
-    "PA" : ("Parã", None, None, None),
-    "MT" : ("Mato Grosso", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_110 = {
-    "HI" : ("Hawaii", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_112 = {
-    "II" : ("Antofagasta", None, None, None),
-    "III" : ("Atacama", None, None, None),
-    "I" : ("Tarapacá", None, None, None),
-    "XV" : ("Arica y Parinacota", None, None, None),
-    "IV" : ("Coquimbo", None, None, None),
-    "V" : ("Valparaíso", None, None, None),
-    "RM" : ("Region Metropolitana de Santiago", None, None, None),
-    "VI" : ("Libertador General Bernardo O'Higgins", None, None, None),
-    "VII" : ("Maule", None, None, None),
-    "VIII" : ("Bío-Bío", None, None, None),
-    "IX" : ("La Araucanía", None, None, None),
-    "XIV" : ("Los Ríos", None, None, None),
-    "X" : ("Los Lagos", None, None, None),
-    "XI" : ("Aisén del General Carlos Ibáñez del Campo", None, None, None),
-    "XII" : ("Magallanes", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_126 = {
-    "KA" : ("Kalingrad (Kaliningradskaya oblast)", "125", ("15",), ("29",))
-    }
-
-Primary_Administrative_Subdivision_Enumeration_132 = {
-    "16" : ("Alto Paraguay", None, None, None),
-    "19" : ("Boquerón", None, None, None),
-    "15" : ("Presidente Hayes", None, None, None),
-    "13" : ("Amambay", None, None, None),
-    "01" : ("Concepción", None, None, None),
-    "14" : ("Canindeyú", None, None, None),
-    "02" : ("San Pedro", None, None, None),
-    "ASU" : ("Asunción", None, None, None),
-    "11" : ("Central", None, None, None),
-    "03" : ("Cordillera", None, None, None),
-    "09" : ("Paraguarí", None, None, None),
-    "06" : ("Caazapl", None, None, None),
-    "05" : ("Caeguazú", None, None, None),
-    "04" : ("Guairá", None, None, None),
-    "08" : ("Miaiones", None, None, None),
-    "12" : ("Ñeembucu", None, None, None),
-    "10" : ("Alto Paraná", None, None, None),
-    "07" : ("Itapua", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_137 = {
-    "A" : ("Seoul (Seoul Teugbyeolsi)", None, None, None),
-    "N" : ("Inchon (Incheon Gwang'yeogsi)", None, None, None),
-    "D" : ("Kangwon-do (Gang 'weondo)", None, None, None),
-    "C" : ("Kyunggi-do (Gyeonggido)", None, None, None),
-    "E" : ("Choongchungbuk-do (Chungcheongbugdo)", None, None, None),
-    "F" : ("Choongchungnam-do (Chungcheongnamdo)", None, None, None),
-    "R" : ("Taejon (Daejeon Gwang'yeogsi)", None, None, None),
-    "M" : ("Cheju-do (Jejudo)", None, None, None),
-    "G" : ("Chollabuk-do (Jeonrabugdo)", None, None, None),
-    "H" : ("Chollanam-do (Jeonranamdo)", None, None, None),
-    "Q" : ("Kwangju (Gwangju Gwang'yeogsi)", None, None, None),
-    "K" : ("Kyungsangbuk-do (Gyeongsangbugdo)", None, None, None),
-    "L" : ("Kyungsangnam-do (Gyeongsangnamdo)", None, None, None),
-    "B" : ("Pusan (Busan Gwang'yeogsi)", None, None, None),
-    "P" : ("Taegu (Daegu Gwang'yeogsi)", None, None, None),
-    "S" : ("Ulsan (Ulsan Gwanq'yeogsi)", None, None, None),
-    "T" : ("Sejong", None, None, None),
-    "IS" : ("Special Island", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_138 = {
-    "KI" : ("Kure Island", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_144 = {
-    "MO" : ("Montevideo", None, None, None),
-    "CA" : ("Canelones", None, None, None),
-    "SJ" : ("San José", None, None, None),
-    "CO" : ("Colonia", None, None, None),
-    "SO" : ("Soriano", None, None, None),
-    "RN" : ("Rio Negro", None, None, None),
-    "PA" : ("Paysandu", None, None, None),
-    "SA" : ("Salto", None, None, None),
-    "AR" : ("Artigsa", None, None, None),
-    "FD" : ("Florida", None, None, None),
-    "FS" : ("Flores", None, None, None),
-    "DU" : ("Durazno", None, None, None),
-    "TA" : ("Tacuarembo", None, None, None),
-    "RV" : ("Rivera", None, None, None),
-    "MA" : ("Maldonado", None, None, None),
-    "LA" : ("Lavalleja", None, None, None),
-    "RO" : ("Rocha", None, None, None),
-    "TT" : ("Treinta y Tres", None, None, None),
-    "CL" : ("Cerro Largo", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_147 = {
-    "LH" : ("Lord Howe Is", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_148 = {
-    "AM" : ("Amazonas", None, None, None),
-    "AN" : ("Anzoátegui", None, None, None),
-    "AP" : ("Apure", None, None, None),
-    "AR" : ("Aragua", None, None, None),
-    "BA" : ("Barinas", None, None, None),
-    "BO" : ("Bolívar", None, None, None),
-    "CA" : ("Carabobo", None, None, None),
-    "CO" : ("Cojedes", None, None, None),
-    "DA" : ("Delta Amacuro", None, None, None),
-    "DC" : ("Distrito Capital", None, None, None),
-    "FA" : ("Falcón", None, None, None),
-    "GU" : ("Guárico", None, None, None),
-    "LA" : ("Lara", None, None, None),
-    "ME" : ("Mérida", None, None, None),
-    "MI" : ("Miranda", None, None, None),
-    "MO" : ("Monagas", None, None, None),
-    "NE" : ("Nueva Esparta", None, None, None),
-    "PO" : ("Portuguesa", None, None, None),
-    "SU" : ("Sucre", None, None, None),
-    "TA" : ("Táchira", None, None, None),
-    "TR" : ("Trujillo", None, None, None),
-    "VA" : ("Vargas", None, None, None),
-    "YA" : ("Yaracuy", None, None, None),
-    "ZU" : ("Zulia", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_149 = {
-    "AC" : ("Açores", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_150 = {
-    "ACT" : ("Australian Capital Territory", None, None, None),
-    "NSW" : ("New South Wales", None, None, None),
-    "VIC" : ("Victoria", None, None, None),
-    "QLD" : ("Queensland", None, None, None),
-    "SA" : ("South Australia", None, None, None),
-    "WA" : ("Western Australia", None, None, None),
-    "TAS" : ("Tasmania", None, None, None),
-    "NT" : ("Northern Territory", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_151 = {
-    "LO" : ("Leningradskaya Oblast", None, None, None),
-    "MV" : ("Malyj Vysotskij (import-only)", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_153 = {
-    "MA" : ("Macquarie Is", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_163 = {
-    "NCD" : ("National Capital District (Port Moresby)", None, None, None),
-    "CPM" : ("Central", None, None, None),
-    "CPK" : ("Chimbu", None, None, None),
-    "EHG" : ("Eastern Highlands", None, None, None),
-    "EBR" : ("East New Britain", None, None, None),
-    "ESW" : ("East Sepik", None, None, None),
-    "EPW" : ("Enga", None, None, None),
-    "GPK" : ("Gulf", None, None, None),
-    "MPM" : ("Madang", None, None, None),
-    "MRL" : ("Manus", None, None, None),
-    "MBA" : ("Milne Bay", None, None, None),
-    "MPL" : ("Morobe", None, None, None),
-    "NIK" : ("New Ireland", None, None, None),
-    "NPP" : ("Northern", None, None, None),
-    "NSA" : ("North Solomons", None, None, None),
-    "SAN" : ("Santaun", None, None, None),
-    "SHM" : ("Southern Highlands", None, None, None),
-    "WPD" : ("Western", None, None, None),
-    "WHM" : ("Western Highlands", None, None, None),
-    "WBR" : ("West New Britain", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_170 = {
-    "AUK" : ("Auckland", None, None, None),
-    "BOP" : ("Bay of Plenty", None, None, None),
-    "NTL" : ("Northland", None, None, None),
-    "WKO" : ("Waikato", None, None, None),
-    "GIS" : ("Gisborne", None, None, None),
-    "HKB" : ("Hawkes Bay", None, None, None),
-    "MWT" : ("Manawatu-Wanganui", None, None, None),
-    "TKI" : ("Taranaki", None, None, None),
-    "WGN" : ("Wellington", None, None, None),
-    "CAN" : ("Canterbury", None, None, None),
-    "MBH" : ("Marlborough", None, None, None),
-    "NSN" : ("Nelson", None, None, None),
-    "TAS" : ("Tasman", None, None, None),
-    "WTC" : ("West Coast", None, None, None),
-    "OTA" : ("Otago", None, None, None),
-    "STL" : ("Southland", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_177 = {
-    "MT" : ("Minami Torishima", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_192 = {
-    "O" : ("Ogasawara", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_206 = {
-    "WC" : ("Wien", None, None, None),
-    "HA" : ("Hallein", None, None, None),
-    "JO" : ("St. Johann", None, None, None),
-    "SC" : ("Salzburg", None, None, None),
-    "SL" : ("Salzburg-Land", None, None, None),
-    "TA" : ("Tamsweg", None, None, None),
-    "ZE" : ("Zell Am See", None, None, None),
-    "AM" : ("Amstetten", None, None, None),
-    "BL" : ("Bruck/Leitha", None, None, None),
-    "BN" : ("Baden", None, None, None),
-    "GD" : ("Gmünd", None, None, None),
-    "GF" : ("Gänserndorf", None, None, None),
-    "HL" : ("Hollabrunn", None, None, None),
-    "HO" : ("Horn", None, None, None),
-    "KO" : ("Korneuburg", None, None, None),
-    "KR" : ("Krems-Region", None, None, None),
-    "KS" : ("Krems", None, None, None),
-    "LF" : ("Lilienfeld", None, None, None),
-    "MD" : ("Mödling", None, None, None),
-    "ME" : ("Melk", None, None, None),
-    "MI" : ("Mistelbach", None, None, None),
-    "NK" : ("Neunkirchen", None, None, None),
-    "PC" : ("St. Pölten", None, None, None),
-    "PL" : ("St. Pölten-Land", None, None, None),
-    "SB" : ("Scheibbs", None, None, None),
-    "SW" : ("Schwechat", None, None, None),
-    "TU" : ("Tulln", None, None, None),
-    "WB" : ("Wr.Neustadt-Bezirk", None, None, None),
-    "WN" : ("Wr.Neustadt", None, None, None),
-    "WT" : ("Waidhofen/Thaya", None, None, None),
-    "WU" : ("Wien-Umgebung", None, None, None),
-    "WY" : ("Waidhofen/Ybbs", None, None, None),
-    "ZT" : ("Zwettl", None, None, None),
-    "EC" : ("Eisenstadt", None, None, None),
-    "EU" : ("Eisenstadt-Umgebung", None, None, None),
-    "GS" : ("Güssing", None, None, None),
-    "JE" : ("Jennersdorf", None, None, None),
-    "MA" : ("Mattersburg", None, None, None),
-    "ND" : ("Neusiedl/See", None, None, None),
-    "OP" : ("Oberpullendorf", None, None, None),
-    "OW" : ("Oberwart", None, None, None),
-    "BR" : ("Braunau/Inn", None, None, None),
-    "EF" : ("Eferding", None, None, None),
-    "FR" : ("Freistadt", None, None, None),
-    "GM" : ("Gmunden", None, None, None),
-    "GR" : ("Grieskirchen", None, None, None),
-    "KI" : ("Kirchdorf", None, None, None),
-    "LC" : ("Linz", None, None, None),
-    "LL" : ("Linz-Land", None, None, None),
-    "PE" : ("Perg", None, None, None),
-    "RI" : ("Ried/Innkreis", None, None, None),
-    "RO" : ("Rohrbach", None, None, None),
-    "SD" : ("Schärding", None, None, None),
-    "SE" : ("Steyr-Land", None, None, None),
-    "SR" : ("Steyr", None, None, None),
-    "UU" : ("Urfahr", None, None, None),
-    "VB" : ("Vöcklabruck", None, None, None),
-    "WE" : ("Wels", None, None, None),
-    "WL" : ("Wels-Land", None, None, None),
-    "BA" : ("Bad Aussee - for contacts made before 2012/01/01", None, None, None),
-    "BM" : ("Bruck/Mur - for contacts made before 2013/01/01", None, None, None),
-    "BM" : ("Bruck-Mürzzuschlag - for contacts made on or after 2013/01/01", None, None, None),
-    "DL" : ("Deutschlandsberg", None, None, None),
-    "FB" : ("Feldbach - for contacts made before 2013/01/01", None, None, None),
-    "FF" : ("Fürstenfeld - for contacts made before 2013/01/01", None, None, None),
-    "GB" : ("Gröbming", None, None, None),
-    "GC" : ("Graz", None, None, None),
-    "GU" : ("Graz-Umgebung", None, None, None),
-    "HB" : ("Hartberg - for contacts made before 2013/01/01", None, None, None),
-    "HF" : ("Hartberg-Fürstenfeld - for contacts made on or after 2013/01/01", None, None, None),
-    "JU" : ("Judenburg - for contacts made before 2012/01/01", None, None, None),
-    "KF" : ("Knittelfeld - for contacts made before 2012/01/01", None, None, None),
-    "LB" : ("Leibnitz", None, None, None),
-    "LE" : ("Leoben", None, None, None),
-    "LI" : ("Liezen", None, None, None),
-    "LN" : ("Leoben-Land", None, None, None),
-    "MT" : ("Murtal - for contacts made on or after 2012/01/01", None, None, None),
-    "MU" : ("Murau", None, None, None),
-    "MZ" : ("Mürzzuschlag - for contacts made before 2013/01/01", None, None, None),
-    "RA" : ("Radkersburg - for contacts made before 2013/01/01", None, None, None),
-    "SO" : ("Südoststeiermark - for contacts made on or after 2013/01/01", None, None, None),
-    "VO" : ("Voitsberg", None, None, None),
-    "WZ" : ("Weiz", None, None, None),
-    "IC" : ("Innsbruck", None, None, None),
-    "IL" : ("Innsbruck-Land", None, None, None),
-    "IM" : ("Imst", None, None, None),
-    "KB" : ("Kitzbühel", None, None, None),
-    "KU" : ("Kufstein", None, None, None),
-    "LA" : ("Landeck", None, None, None),
-    "LZ" : ("Lienz", None, None, None),
-    "RE" : ("Reutte", None, None, None),
-    "SZ" : ("Schwaz", None, None, None),
-    "FE" : ("Feldkirchen", None, None, None),
-    "HE" : ("Hermagor", None, None, None),
-    "KC" : ("Klagenfurt", None, None, None),
-    "KL" : ("Klagenfurt-Land", None, None, None),
-    "SP" : ("Spittal/Drau", None, None, None),
-    "SV" : ("St.Veit/Glan", None, None, None),
-    "VI" : ("Villach", None, None, None),
-    "VK" : ("Völkermarkt", None, None, None),
-    "VL" : ("Villach-Land", None, None, None),
-    "WO" : ("Wolfsberg", None, None, None),
-    "BC" : ("Bregenz", None, None, None),
-    "BZ" : ("Bludenz", None, None, None),
-    "DO" : ("Dornbirn", None, None, None),
-    "FK" : ("Feldkirch", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_209 = {
-    "AN" : ("Antwerpen", None, None, None),
-    "BR" : ("Brussels", None, None, None),
-    "BW" : ("Brabant Wallon", None, None, None),
-    "HT" : ("Hainaut", None, None, None),
-    "LB" : ("Limburg", None, None, None),
-    "LG" : ("Liêge", None, None, None),
-    "NM" : ("Namur", None, None, None),
-    "LU" : ("Luxembourg", None, None, None),
-    "OV" : ("Oost-Vlaanderen", None, None, None),
-    "VB" : ("Vlaams Brabant", None, None, None),
-    "WV" : ("West-Vlaanderen", None, None, None)
-    }
-
-Primary_Administrative_Subdivision_Enumeration_212 = {
-    "BU" : ("Burgas", None, None, None),
-    "SL" : ("Sliven", None, None, None),
-    "YA" : ("Yambol (Jambol)", None, None, None),
-    "SO" : ("Sofija Grad", None, None, None),
-    "HA" : ("Haskovo", None, None, None),
-    "KA" : ("Kărdžali", None, None, None),
-    "SZ" : ("Stara Zagora", None, None, None),
-    "PA" : ("Pazardžik", None, None, None),
-    "PD" : ("Plovdiv", None, None, None),
-    "SM" : ("Smoljan", None, None, None),
-    "BL" : ("Blagoevgrad", None, None, None),
-    "KD" : ("Kjustendil", None, None, None),
-    "PK" : ("Pernik", None, None, None),
-    "SF" : ("Sofija (Sofia)", None, None, None),
-    "GA" : ("Gabrovo", None, None, None),
-    "LV" : ("Loveč (Lovech)", None, None, None),
-    "PL" : ("Pleven", None, None, None),
-    "VT" : ("Veliko Tărnovo", None, None, None),
-    "MN" : ("Montana", None, None, None),
-    "VD" : ("Vidin", None, None, None),
-    "VR" : ("Vraca", None, None, None),
-    "RZ" : ("Razgrad", None, None, None),
-    "RS" : ("Ruse", None, None, None),
-    "SS" : ("Silistra", None, None, None),
-    "TA" : ("Tărgovište", None, None, None),
-    "DO" : ("Dobrič", None, None, None),
-    "SN" : ("Šumen", None, None, None),
-    "VN" : ("Varna", None, None, None)
-    }
+#
+#Every accepted way of writing a mode and submode, in upper case with
+#single blanks, and the (mode,) or (mode, submode) it stands for:
+#
+#   "OLIVIA"                    ("OLIVIA",)
+#   "OLIVIA 8/250"              ("OLIVIA", "OLIVIA 8/250")
+#   "OLIVIA OLIVIA 8/250"       ("OLIVIA", "OLIVIA 8/250")
+#
+#A mode wins over a submode of the same name, like valid_mode always
+#did.
+#
+Mode_Spellings = {}
+for mode in Mode_Enumeration:
+    for submode in Mode_Enumeration[mode]:
+        spelling = " ".join(submode.split())
+        Mode_Spellings.setdefault(spelling, (mode, submode))
+        Mode_Spellings[mode + " " + spelling] = (mode, submode)
+for mode in Mode_Enumeration:
+    Mode_Spellings[mode] = (mode,)
 
-Primary_Administrative_Subdivision_Enumeration_214 = {
-    "2A" : ("Corse-du-Sud", None, None, None),
-    "2B" : ("Haute-Corse", None, None, None)
-    }
+class EnumerationCodes:
+    """
+    Dense integer codes (0, 1, 2, ...) for the values of an enumeration,
+    with the reverse lookup. Storing and comparing codes is cheaper than
+    upper case strings, and sorting or grouping by code sorts or groups
+    in the enumeration's order - for bands, frequency order.
 
-Primary_Administrative_Subdivision_Enumeration_221 = {
-    "015" : ("Koebenhavns amt", None, None, None),
-    "020" : ("Frederiksborg amt", None, None, None),
-    "025" : ("Roskilde amt", None, None, None),
-    "030" : ("Vestsjaellands amt", None, None, None),
-    "035" : ("Storstrøm amt (Storstroems)", None, None, None),
-    "040" : ("Bornholms amt", None, None, None),
-    "042" : ("Fyns amt", None, None, None),
-    "050" : ("Sínderjylland amt (Sydjyllands)", None, None, None),
-    "055" : ("Ribe amt", None, None, None),
-    "060" : ("Vejle amt", None, None, None),
-    "065" : ("Ringkøbing amt (Ringkoebing)", None, None, None),
-    "070" : ("Århus amt (Aarhus)", None, None, None),
-    "076" : ("Viborg amt", None, None, None),
-    "080" : ("Nordjyllands amt", None, None, None),
-    "101" : ("Copenhagen City", None, None, None),
-    "147" : ("Frederiksberg", None, None, None)
-    }
+    Arguments:
+        values:
+            Enumeration values in code order.
+
+    Attributes:
+        values:
+            Tuple of upper case values by code.
+        codes:
+            Dictonary of upper case value -> code.
+    """
 
-Primary_Administrative_Subdivision_Enumeration_224 = {
-    "100" : ("Somero", None, None, None),
-    "102" : ("Alastaro", None, None, None),
-    "103" : ("Askainen", None, None, None),
-    "104" : ("Aura", None, None, None),
-    "105" : ("Dragsfjärd", None, None, None),
-    "106" : ("Eura", None, None, None),
-    "107" : ("Eurajoki", None, None, None),
-    "108" : ("Halikko", None, None, None),
-    "109" : ("Harjavalta", None, None, None),
-    "110" : ("Honkajoki", None, None, None),
-    "111" : ("Houtskari", None, None, None),
-    "112" : ("Huittinen", None, None, None),
-    "115" : ("Iniö", None, None, None),
-    "116" : ("Jämijärvi", None, None, None),
-    "117" : ("Kaarina", None, None, None),
-    "119" : ("Kankaanpää", None, None, None),
-    "120" : ("Karinainen", None, None, None),
-    "122" : ("Karvia", None, None, None),
-    "123" : ("Äetsä", None, None, None),
-    "124" : ("Kemiö", None, None, None),
-    "126" : ("Kiikala", None, None, None),
-    "128" : ("Kiikoinen", None, None, None),
-    "129" : ("Kisko", None, None, None),
-    "130" : ("Kiukainen", None, None, None),
-    "131" : ("Kodisjoki", None, None, None),
-    "132" : ("Kokemäki", None, None, None),
-    "133" : ("Korppoo", None, None, None),
-    "134" : ("Koski tl", None, None, None),
-    "135" : ("Kullaa", None, None, None),
-    "136" : ("Kustavi", None, None, None),
-    "137" : ("Kuusjoki", None, None, None),
-    "138" : ("Köyliö", None, None, None),
-    "139" : ("Laitila", None, None, None),
-    "140" : ("Lappi", None, None, None),
-    "141" : ("Lavia", None, None, None),
-    "142" : ("Lemu", None, None, None),
-    "143" : ("Lieto", None, None, None),
-    "144" : ("Loimaa", None, None, None),
-    "145" : ("Loimaan kunta", None, None, None),
-    "147" : ("Luvia", None, None, None),
-    "148" : ("Marttila", None, None, None),
-    "149" : ("Masku", None, None, None),
-    "150" : ("Mellilä", None, None, None),
-    "151" : ("Merikarvia", None, None, None),
-    "152" : ("Merimasku", None, None, None),
-    "154" : ("Mietoinen", None, None, None),
-    "156" : ("Muurla", None, None, None),
-    "157" : ("Mynämäki", None, None, None),
-    "158" : ("Naantali", None, None, None),
-    "159" : ("Nakkila", None, None, None),
-    "160" : ("Nauvo", None, None, None),
-    "161" : ("Noormarkku", None, None, None),
-    "162" : ("Nousiainen", None, None, None),
-    "163" : ("Oripää", None, None, None),
-    "164" : ("Paimio", None, None, None),
-    "165" : ("Parainen", None, None, None),
-    "167" : ("Perniö", None, None, None),
-    "168" : ("Pertteli", None, None, None),
-    "169" : ("Piikkiö", None, None, None),
-    "170" : ("Pomarkku", None, None, None),
-    "171" : ("Pori", None, None, None),
-    "172" : ("Punkalaidun", None, None, None),
-    "173" : ("Pyhäranta", None, None, None),
-    "174" : ("Pöytyä", None, None, None),
-    "175" : ("Raisio", None, None, None),
-    "176" : ("Rauma", None, None, None),
-    "178" : ("Rusko", None, None, None),
-    "179" : ("Rymättylä", None, None, None),
-    "180" : ("Salo", None, None, None),
-    "181" : ("Sauvo", None, None, None),
-    "182" : ("Siikainen", None, None, None),
-    "183" : ("Suodenniemi", None, None, None),
-    "184" : ("Suomusjärvi", None, None, None),
-    "185" : ("Säkylä", None, None, None),
-    "186" : ("Särkisalo", None, None, None),
-    "187" : ("Taivassalo", None, None, None),
-    "188" : ("Tarvasjoki", None, None, None),
-    "189" : ("Turku", None, None, None),
-    "190" : ("Ulvila", None, None, None),
-    "191" : ("Uusikaupunki", None, None, None),
-    "192" : ("Vahto", None, None, None),
-    "193" : ("Vammala", None, None, None),
-    "194" : ("Vampula", None, None, None),
-    "195" : ("Vehmaa", None, None, None),
-    "196" : ("Velkua", None, None, None),
-    "198" : ("Västanfjärd", None, None, None),
-    "199" : ("Yläne", None, None, None),
-    "201" : ("Artjärvi", None, None, None),
-    "202" : ("Askola", None, None, None),
-    "204" : ("Espoo", None, None, None),
-    "205" : ("Hanko", None, None, None),
-    "206" : ("Helsinki", None, None, None),
-    "207" : ("Hyvinkää", None, None, None),
-    "208" : ("Inkoo", None, None, None),
-    "209" : ("Järvenpää", None, None, None),
-    "210" : ("Karjaa", None, None, None),
-    "211" : ("Karjalohja", None, None, None),
-    "212" : ("Karkkila", None, None, None),
-    "213" : ("Kauniainen", None, None, None),
-    "214" : ("Kerava", None, None, None),
-    "215" : ("Kirkkonummi", None, None, None),
-    "216" : ("Lapinjärvi", None, None, None),
-    "217" : ("Liljendal", None, None, None),
-    "218" : ("Lohjan kaupunki", None, None, None),
-    "220" : ("Loviisa", None, None, None),
-    "221" : ("Myrskylä", None, None, None),
-    "222" : ("Mäntsälä", None, None, None),
-    "223" : ("Nummi-Pusula", None, None, None),
-    "224" : ("Nurmijärvi", None, None, None),
-    "225" : ("Orimattila", None, None, None),
-    "226" : ("Pernaja", None, None, None),
-    "227" : ("Pohja", None, None, None),
-    "228" : ("Pornainen", None, None, None),
-    "229" : ("Porvoo", None, None, None),
-    "231" : ("Pukkila", None, None, None),
-    "233" : ("Ruotsinpyhtää", None, None, None),
-    "234" : ("Sammatti", None, None, None),
-    "235" : ("Sipoo", None, None, None),
-    "236" : ("Siuntio", None, None, None),
-    "238" : ("Tammisaari", None, None, None),
-    "241" : ("Tuusula", None, None, None),
-    "242" : ("Vantaa", None, None, None),
-    "243" : ("Vihti", None, None, None),
-    "301" : ("Asikkala", None, None, None),
-    "303" : ("Forssa", None, None, None),
-    "304" : ("Hattula", None, None, None),
-    "305" : ("Hauho", None, None, None),
-    "306" : ("Hausjärvi", None, None, None),
-    "307" : ("Hollola", None, None, None),
-    "308" : ("Humppila", None, None, None),
-    "309" : ("Hämeenlinna", None, None, None),
-    "310" : ("Janakkala", None, None, None),
-    "311" : ("Jokioinen", None, None, None),
-    "312" : ("Juupajoki", None, None, None),
-    "313" : ("Kalvola", None, None, None),
-    "314" : ("Kangasala", None, None, None),
-    "315" : ("Hämeenkoski", None, None, None),
-    "316" : ("Kuhmalahti", None, None, None),
-    "318" : ("Kuru", None, None, None),
-    "319" : ("Kylmäkoski", None, None, None),
-    "320" : ("Kärkölä", None, None, None),
-    "321" : ("Lahti", None, None, None),
-    "322" : ("Lammi", None, None, None),
-    "323" : ("Lempäälä", None, None, None),
-    "324" : ("Loppi", None, None, None),
-    "325" : ("Luopioinen", None, None, None),
-    "326" : ("Längelmäki", None, None, None),
-    "327" : ("Mänttä", None, None, None),
-    "328" : ("Nastola", None, None, None),
-    "329" : ("Nokia", None, None, None),
-    "330" : ("Orivesi", None, None, None),
-    "331" : ("Padasjoki", None, None, None),
-    "332" : ("Pirkkala", None, None, None),
-    "333" : ("Pälkäne", None, None, None),
-    "334" : ("Renko", None, None, None),
-    "335" : ("Riihimäki", None, None, None),
-    "336" : ("Ruovesi", None, None, None),
-    "337" : ("Sahalahti", None, None, None),
-    "340" : ("Tammela", None, None, None),
-    "341" : ("Tampere", None, None, None),
-    "342" : ("Toijala", None, None, None),
-    "344" : ("Tuulos", None, None, None),
-    "345" : ("Urjala", None, None, None),
-    "346" : ("Valkeakoski", None, None, None),
-    "347" : ("Vesilahti", None, None, None),
-    "348" : ("Viiala", None, None, None),
-    "349" : ("Vilppula", None, None, None),
-    "350" : ("Virrat", None, None, None),
-    "351" : ("Ylöjärvi", None, None, None),
-    "352" : ("Ypäjä", None, None, None),
-    "353" : ("Hämeenkyrö", None, None, None),
-    "354" : ("Ikaalinen", None, None, None),
-    "355" : ("Kihniö", None, None, None),
-    "356" : ("Mouhijärvi", None, None, None),
-    "357" : ("Parkano", None, None, None),
-    "358" : ("Viljakkala", None, None, None),
-    "402" : ("Enonkoski", None, None, None),
-    "403" : ("Hartola", None, None, None),
-    "404" : ("Haukivuori", None, None, None),
-    "405" : ("Heinola", None, None, None),
-    "407" : ("Heinävesi", None, None, None),
-    "408" : ("Hirvensalmi", None, None, None),
-    "409" : ("Joroinen", None, None, None),
-    "410" : ("Juva", None, None, None),
-    "411" : ("Jäppilä", None, None, None),
-    "412" : ("Kangaslampi", None, None, None),
-    "413" : ("Kangasniemi", None, None, None),
-    "414" : ("Kerimäki", None, None, None),
-    "415" : ("Mikkeli", None, None, None),
-    "417" : ("Mäntyharju", None, None, None),
-    "418" : ("Pertunmaa", None, None, None),
-    "419" : ("Pieksämäki", None, None, None),
-    "420" : ("Pieksänmaa", None, None, None),
-    "421" : ("Punkaharju", None, None, None),
-    "422" : ("Puumala", None, None, None),
-    "423" : ("Rantasalmi", None, None, None),
-    "424" : ("Ristiina", None, None, None),
-    "425" : ("Savonlinna", None, None, None),
-    "426" : ("Savonranta", None, None, None),
-    "427" : ("Sulkava", None, None, None),
-    "428" : ("Sysmä", None, None, None),
-    "502" : ("Elimäki", None, None, None),
-    "503" : ("Hamina", None, None, None),
-    "504" : ("Iitti", None, None, None),
-    "505" : ("Imatra", None, None, None),
-    "506" : ("Jaala", None, None, None),
-    "507" : ("Joutseno", None, None, None),
-    "509" : ("Kotka", None, None, None),
-    "510" : ("Kouvola", None, None, None),
-    "511" : ("Kuusankoski", None, None, None),
-    "513" : ("Lappeenranta", None, None, None),
-    "514" : ("Lemi", None, None, None),
-    "515" : ("Luumäki", None, None, None),
-    "516" : ("Miehikkälä", None, None, None),
-    "518" : ("Parikkala", None, None, None),
-    "519" : ("Pyhtää", None, None, None),
-    "520" : ("Rautjärvi", None, None, None),
-    "521" : ("Ruokolahti", None, None, None),
-    "522" : ("Saari", None, None, None),
-    "523" : ("Savitaipale", None, None, None),
-    "525" : ("Suomenniemi", None, None, None),
-    "526" : ("Taipalsaari", None, None, None),
-    "527" : ("Uukuniemi", None, None, None),
-    "528" : ("Valkeala", None, None, None),
-    "530" : ("Virolahti", None, None, None),
-    "531" : ("Ylämaa", None, None, None),
-    "532" : ("Anjalankoski", None, None, None),
-    "601" : ("Alahärmä", None, None, None),
-    "602" : ("Alajärvi", None, None, None),
-    "603" : ("Alavus", None, None, None),
-    "604" : ("Evijärvi", None, None, None),
-    "605" : ("Halsua", None, None, None),
-    "606" : ("Hankasalmi", None, None, None),
-    "607" : ("Himanka", None, None, None),
-    "608" : ("Ilmajoki", None, None, None),
-    "609" : ("Isojoki", None, None, None),
-    "610" : ("Isokyrö", None, None, None),
-    "611" : ("Jalasjärvi", None, None, None),
-    "612" : ("Joutsa", None, None, None),
-    "613" : ("Jurva", None, None, None),
-    "614" : ("Jyväskylä", None, None, None),
-    "615" : ("Jyväskylän mlk", None, None, None),
-    "616" : ("Jämsä", None, None, None),
-    "617" : ("Jämsänkoski", None, None, None),
-    "619" : ("Kannonkoski", None, None, None),
-    "620" : ("Kannus", None, None, None),
-    "621" : ("Karijoki", None, None, None),
-    "622" : ("Karstula", None, None, None),
-    "623" : ("Kaskinen", None, None, None),
-    "624" : ("Kauhajoki", None, None, None),
-    "625" : ("Kauhava", None, None, None),
-    "626" : ("Kaustinen", None, None, None),
-    "627" : ("Keuruu", None, None, None),
-    "628" : ("Kinnula", None, None, None),
-    "629" : ("Kivijärvi", None, None, None),
-    "630" : ("Kokkola", None, None, None),
-    "632" : ("Konnevesi", None, None, None),
-    "633" : ("Korpilahti", None, None, None),
-    "634" : ("Korsnäs", None, None, None),
-    "635" : ("Kortesjärvi", None, None, None),
-    "636" : ("Kristiinankaupunki", None, None, None),
-    "637" : ("Kruunupyy", None, None, None),
-    "638" : ("Kuhmoinen", None, None, None),
-    "639" : ("Kuortane", None, None, None),
-    "640" : ("Kurikka", None, None, None),
-    "641" : ("Kyyjärvi", None, None, None),
-    "642" : ("Kälviä", None, None, None),
-    "643" : ("Laihia", None, None, None),
-    "644" : ("Lappajärvi", None, None, None),
-    "645" : ("Lapua", None, None, None),
-    "646" : ("Laukaa", None, None, None),
-    "647" : ("Lehtimäki", None, None, None),
-    "648" : ("Leivonmäki", None, None, None),
-    "649" : ("Lestijärvi", None, None, None),
-    "650" : ("Lohtaja", None, None, None),
-    "651" : ("Luhanka", None, None, None),
-    "652" : ("Luoto", None, None, None),
-    "653" : ("Maalahti", None, None, None),
-    "654" : ("Maksamaa", None, None, None),
-    "655" : ("Multia", None, None, None),
-    "656" : ("Mustasaari", None, None, None),
-    "657" : ("Muurame", None, None, None),
-    "658" : ("Nurmo", None, None, None),
-    "659" : ("Närpiö", None, None, None),
-    "660" : ("Oravainen", None, None, None),
-    "661" : ("Perho", None, None, None),
-    "662" : ("Peräseinäjoki", None, None, None),
-    "663" : ("Petäjävesi", None, None, None),
-    "664" : ("Pietarsaari", None, None, None),
-    "665" : ("Pedersöre", None, None, None),
-    "666" : ("Pihtipudas", None, None, None),
-    "668" : ("Pylkönmäki", None, None, None),
-    "669" : ("Saarijärvi", None, None, None),
-    "670" : ("Seinäjoki", None, None, None),
-    "671" : ("Soini", None, None, None),
-    "672" : ("Sumiainen", None, None, None),
-    "673" : ("Suolahti", None, None, None),
-    "675" : ("Teuva", None, None, None),
-    "676" : ("Toholampi", None, None, None),
-    "677" : ("Toivakka", None, None, None),
-    "678" : ("Töysä", None, None, None),
-    "679" : ("Ullava", None, None, None),
-    "680" : ("Uurainen", None, None, None),
-    "681" : ("Uusikaarlepyy", None, None, None),
-    "682" : ("Vaasa", None, None, None),
-    "683" : ("Veteli", None, None, None),
-    "684" : ("Viitasaari", None, None, None),
-    "685" : ("Vimpeli", None, None, None),
-    "686" : ("Vähäkyrö", None, None, None),
-    "687" : ("Vöyri", None, None, None),
-    "688" : ("Ylihärmä", None, None, None),
-    "689" : ("Ylistaro", None, None, None),
-    "690" : ("Ähtäri", None, None, None),
-    "692" : ("Äänekoski", None, None, None),
-    "701" : ("Eno", None, None, None),
-    "702" : ("Iisalmi", None, None, None),
-    "703" : ("Ilomantsi", None, None, None),
-    "704" : ("Joensuu", None, None, None),
-    "705" : ("Juankoski", None, None, None),
-    "706" : ("Juuka", None, None, None),
-    "707" : ("Kaavi", None, None, None),
-    "708" : ("Karttula", None, None, None),
-    "709" : ("Keitele", None, None, None),
-    "710" : ("Kesälahti", None, None, None),
-    "711" : ("Kiihtelysvaara", None, None, None),
-    "712" : ("Kitee", None, None, None),
-    "713" : ("Kiuruvesi", None, None, None),
-    "714" : ("Kontiolahti", None, None, None),
-    "715" : ("Kuopio", None, None, None),
-    "716" : ("Lapinlahti", None, None, None),
-    "717" : ("Leppävirta", None, None, None),
-    "718" : ("Lieksa", None, None, None),
-    "719" : ("Liperi", None, None, None),
-    "720" : ("Maaninka", None, None, None),
-    "721" : ("Nilsiä", None, None, None),
-    "722" : ("Nurmes", None, None, None),
-    "723" : ("Outokumpu", None, None, None),
-    "724" : ("Pielavesi", None, None, None),
-    "725" : ("Polvijärvi", None, None, None),
-    "726" : ("Pyhäselkä", None, None, None),
-    "727" : ("Rautalampi", None, None, None),
-    "728" : ("Rautavaara", None, None, None),
-    "729" : ("Rääkkylä", None, None, None),
-    "730" : ("Siilinjärvi", None, None, None),
-    "731" : ("Sonkajärvi", None, None, None),
-    "732" : ("Suonenjoki", None, None, None),
-    "733" : ("Tervo", None, None, None),
-    "734" : ("Tohmajärvi", None, None, None),
-    "735" : ("Tuupovaara", None, None, None),
-    "736" : ("Tuusniemi", None, None, None),
-    "737" : ("Valtimo", None, None, None),
-    "738" : ("Varkaus", None, None, None),
-    "739" : ("Varpaisjärvi", None, None, None),
-    "740" : ("Vehmersalmi", None, None, None),
-    "741" : ("Vesanto", None, None, None),
-    "742" : ("Vieremä", None, None, None),
-    "743" : ("Värtsilä", None, None, None),
-    "801" : ("Alavieska", None, None, None),
-    "802" : ("Haapajärvi", None, None, None),
-    "803" : ("Haapavesi", None, None, None),
-    "804" : ("Hailuoto", None, None, None),
-    "805" : ("Haukipudas", None, None, None),
-    "806" : ("Hyrynsalmi", None, None, None),
-    "807" : ("Ii", None, None, None),
-    "808" : ("Kajaani", None, None, None),
-    "810" : ("Kalajoki", None, None, None),
-    "811" : ("Kempele", None, None, None),
-    "812" : ("Kestilä", None, None, None),
-    "813" : ("Kiiminki", None, None, None),
-    "814" : ("Kuhmo", None, None, None),
-    "815" : ("Kuivaniemi", None, None, None),
-    "816" : ("Kuusamo", None, None, None),
-    "817" : ("Kärsämäki", None, None, None),
-    "818" : ("Liminka", None, None, None),
-    "819" : ("Lumijoki", None, None, None),
-    "820" : ("Merijärvi", None, None, None),
-    "821" : ("Muhos", None, None, None),
-    "822" : ("Nivala", None, None, None),
-    "823" : ("Oulainen", None, None, None),
-    "824" : ("Oulu", None, None, None),
-    "825" : ("Oulunsalo", None, None, None),
-    "826" : ("Paltamo", None, None, None),
-    "827" : ("Pattijoki", None, None, None),
-    "828" : ("Piippola", None, None, None),
-    "829" : ("Pudasjärvi", None, None, None),
-    "830" : ("Pulkkila", None, None, None),
-    "831" : ("Puolanka", None, None, None),
-    "832" : ("Pyhäjoki", None, None, None),
-    "833" : ("Pyhäjärvi", None, None, None),
-    "834" : ("Pyhäntä", None, None, None),
-    "835" : ("Raahe", None, None, None),
-    "836" : ("Rantsila", None, None, None),
-    "837" : ("Reisjärvi", None, None, None),
-    "838" : ("Ristijärvi", None, None, None),
-    "839" : ("Ruukki", None, None, None),
-    "840" : ("Sievi", None, None, None),
-    "841" : ("Siikajoki", None, None, None),
-    "842" : ("Sotkamo", None, None, None),
-    "843" : ("Suomussalmi", None, None, None),
-    "844" : ("Taivalkoski", None, None, None),
-    "846" : ("Tyrnävä", None, None, None),
-    "847" : ("Utajärvi", None, None, None),
-    "848" : ("Vaala", None, None, None),
-    "849" : ("Vihanti", None, None, None),
-    "850" : ("Vuolijoki", None, None, None),
-    "851" : ("Yli-Ii", None, None, None),
-    "852" : ("Ylikiiminki", None, None, None),
-    "853" : ("Ylivieska", None, None, None),
-    "901" : ("Enontekiö", None, None, None),
-    "902" : ("Inari", None, None, None),
-    "903" : ("Kemi", None, None, None),
-    "904" : ("Keminmaa", None, None, None),
-    "905" : ("Kemijärvi", None, None, None),
-    "907" : ("Kittilä", None, None, None),
-    "908" : ("Kolari", None, None, None),
-    "909" : ("Muonio", None, None, None),
-    "910" : ("Pelkosenniemi", None, None, None),
-    "911" : ("Pello", None, None, None),
-    "912" : ("Posio", None, None, None),
-    "913" : ("Ranua", None, None, None),
-    "914" : ("Rovaniemi", None, None, None),
-    "915" : ("Rovaniemen mlk", None, None, None),
-    "916" : ("Salla", None, None, None),
-    "917" : ("Savukoski", None, None, None),
-    "918" : ("Simo", None, None, None),
-    "919" : ("Sodankylä", None, None, None),
-    "920" : ("Tervola", None, None, None),
-    "921" : ("Tornio", None, None, None),
-    "922" : ("Utsjoki", None, None, None),
-    "923" : ("Ylitornio", None, None, None)
-    }
+    __slots__ = ("values", "codes")
 
-Primary_Administrative_Subdivision_Enumeration_225 = {
-    "CA" : ("Cagliari", None, None, None),
-    "CI" : ("Carbonia-Iglesias", None, None, None),
-    "MD" : ("Medio Campidano (import-only)", None, None, None),
-    "NU" : ("Nuoro", None, None, None),
-    "OG" : ("Ogliastra", None, None, None),
-    "OR" : ("Oristano", None, None, None),
-    "OT" : ("Olbia-Tempio", None, None, None),
-    "SS" : ("Sassari", None, None, None),
-    "VS" : ("MedioCampidano", None, None, None)
-    }
+    def __init__(self, values):
+        self.values = tuple(value.upper() for value in values)
+        self.codes = {value : code for code, value in enumerate(self.values)}
 
-Primary_Administrative_Subdivision_Enumeration_227 = {
-    "01" : ("Ain", None, None, None),
-    "02" : ("Aisne", None, None, None),
-    "03" : ("Allier", None, None, None),
-    "04" : ("Alpes-de-Haute-Provence", None, None, None),
-    "05" : ("Hautes-Alpes", None, None, None),
-    "06" : ("Alpes-Maritimes", None, None, None),
-    "07" : ("Ardèche", None, None, None),
-    "08" : ("Ardennes", None, None, None),
-    "09" : ("Ariège", None, None, None),
-    "10" : ("Aube", None, None, None),
-    "11" : ("Aude", None, None, None),
-    "12" : ("Aveyron", None, None, None),
-    "13" : ("Bouches-du-Rhone", None, None, None),
-    "14" : ("Calvados", None, None, None),
-    "15" : ("Cantal", None, None, None),
-    "16" : ("Charente", None, None, None),
-    "17" : ("Charente-Maritime", None, None, None),
-    "18" : ("Cher", None, None, None),
-    "19" : ("Corrèze", None, None, None),
-    "21" : ("Cote-d'Or", None, None, None),
-    "22" : ("Cotes-d'Armor", None, None, None),
-    "23" : ("Creuse", None, None, None),
-    "24" : ("Dordogne", None, None, None),
-    "25" : ("Doubs", None, None, None),
-    "26" : ("Drôme", None, None, None),
-    "27" : ("Eure", None, None, None),
-    "28" : ("Eure-et-Loir", None, None, None),
-    "29" : ("Finistère", None, None, None),
-    "30" : ("Gard", None, None, None),
-    "31" : ("Haute-Garonne", None, None, None),
-    "32" : ("Gere", None, None, None),
-    "33" : ("Gironde", None, None, None),
-    "34" : ("Hérault", None, None, None),
-    "35" : ("Ille-et-Vilaine", None, None, None),
-    "36" : ("Indre", None, None, None),
-    "37" : ("Indre-et-Loire", None, None, None),
-    "38" : ("Isère", None, None, None),
-    "39" : ("Jura", None, None, None),
-    "40" : ("Landes", None, None, None),
-    "41" : ("Loir-et-Cher", None, None, None),
-    "42" : ("Loire", None, None, None),
-    "43" : ("Haute-Loire", None, None, None),
-    "44" : ("Loire-Atlantique", None, None, None),
-    "45" : ("Loiret", None, None, None),
-    "46" : ("Lot", None, None, None),
-    "47" : ("Lot-et-Garonne", None, None, None),
-    "48" : ("Lozère", None, None, None),
-    "49" : ("Maine-et-Loire", None, None, None),
-    "50" : ("Manche", None, None, None),
-    "51" : ("Marne", None, None, None),
-    "52" : ("Haute-Marne", None, None, None),
-    "53" : ("Mayenne", None, None, None),
-    "54" : ("Meurthe-et-Moselle", None, None, None),
-    "55" : ("Meuse", None, None, None),
-    "56" : ("Morbihan", None, None, None),
-    "57" : ("Moselle", None, None, None),
-    "58" : ("Niëvre", None, None, None),
-    "59" : ("Nord", None, None, None),
-    "60" : ("Oise", None, None, None),
-    "61" : ("Orne", None, None, None),
-    "62" : ("Pas-de-Calais", None, None, None),
-    "63" : ("Puy-de-Dôme", None, None, None),
-    "64" : ("Pyrénées-Atlantiques", None, None, None),
-    "65" : ("Hautea-Pyrénées", None, None, None),
-    "66" : ("Pyrénées-Orientales", None, None, None),
-    "67" : ("Bas-Rhin", None, None, None),
-    "68" : ("Haut-Rhin", None, None, None),
-    "69" : ("Rhône", None, None, None),
-    "70" : ("Haute-Saône", None, None, None),
-    "71" : ("Saône-et-Loire", None, None, None),
-    "72" : ("Sarthe", None, None, None),
-    "73" : ("Savoie", None, None, None),
-    "74" : ("Haute-Savoie", None, None, None),
-    "75" : ("Paris", None, None, None),
-    "76" : ("Seine-Maritime", None, None, None),
-    "77" : ("Seine-et-Marne", None, None, None),
-    "78" : ("Yvelines", None, None, None),
-    "79" : ("Deux-Sèvres", None, None, None),
-    "80" : ("Somme", None, None, None),
-    "81" : ("Tarn", None, None, None),
-    "82" : ("Tarn-et-Garonne", None, None, None),
-    "83" : ("Var", None, None, None),
-    "84" : ("Vaucluse", None, None, None),
-    "85" : ("Vendée", None, None, None),
-    "86" : ("Vienne", None, None, None),
-    "87" : ("Haute-Vienne", None, None, None),
-    "88" : ("Vosges", None, None, None),
-    "89" : ("Yonne", None, None, None),
-    "90" : ("Territoire de Belfort", None, None, None),
-    "91" : ("Essonne", None, None, None),
-    "92" : ("Hauts-de-Selne", None, None, None),
-    "93" : ("Seine-Saint-Denis", None, None, None),
-    "94" : ("Val-de-Marne", None, None, None),
-    "95" : ("Val-d'Oise", None, None, None)
-    }
+    def __len__(self):
+        return(len(self.values))
 
-Primary_Administrative_Subdivision_Enumeration_230 = {
-    "BB" : ("Brandenburg", None, None, None),
-    "BE" : ("Berlin", None, None, None),
-    "BW" : ("Baden-Württemberg", None, None, None),
-    "BY" : ("Freistaat Bayern", None, None, None),
-    "HB" : ("Freie Hansestadt Bremen", None, None, None),
-    "HE" : ("Hessen", None, None, None),
-    "HH" : ("Freie und Hansestadt Hamburg", None, None, None),
-    "MV" : ("Mecklenburg-Vorpommern", None, None, None),
-    "NI" : ("Niedersachsen", None, None, None),
-    "NW" : ("Nordrhein-Westfalen", None, None, None),
-    "RP" : ("Rheinland-Pfalz", None, None, None),
-    "SL" : ("Saarland", None, None, None),
-    "SH" : ("Schleswig-Holstein", None, None, None),
-    "SN" : ("Freistaat Sachsen", None, None, None),
-    "ST" : ("Sachsen-Anhalt", None, None, None),
-    "TH" : ("Freistaat Thüringen", None, None, None)
-    }
+    def __contains__(self, value):
+        return(value.upper() in self.codes)
 
-Primary_Administrative_Subdivision_Enumeration_239 = {
-    "GY" : ("Gyõr (Gyõr-Moson-Sopron)", None, None, None),
-    "VA" : ("Vas", None, None, None),
-    "ZA" : ("Zala", None, None, None),
-    "KO" : ("Komárom (Komárom-Esztergom)", None, None, None),
-    "VE" : ("Veszprém", None, None, None),
-    "BA" : ("Baranya", None, None, None),
-    "SO" : ("Somogy", None, None, None),
-    "TO" : ("Tolna", None, None, None),
-    "FE" : ("Fejér", None, None, None),
-    "BP" : ("Budapest", None, None, None),
-    "HE" : ("Heves", None, None, None),
-    "NG" : ("Nógrád", None, None, None),
-    "PE" : ("Pest", None, None, None),
-    "SZ" : ("Szolnok (Jász-Nagykun-Szolnok)", None, None, None),
-    "BE" : ("Békés", None, None, None),
-    "BN" : ("Bács-Kiskun", None, None, None),
-    "CS" : ("Csongrád", None, None, None),
-    "BO" : ("Borsod (Borsod-Abaúj-Zemplén)", None, None, None),
-    "HB" : ("Hajdú-Bihar", None, None, None),
-    "SA" : ("Szabolcs (Szabolcs-Szatmár-Bereg)", None, None, None)
-    }
+    def __repr__(self):
+        return("EnumerationCodes({!r})".format(self.values))
 
-Primary_Administrative_Subdivision_Enumeration_245 = {
-    "CW" : ("Carlow (Ceatharlach)", None, None, None),
-    "CN" : ("Cavan (An Cabhán)", None, None, None),
-    "CE" : ("Clare (An Clár)", None, None, None),
-    "C" : ("Cork (Corcaigh)", None, None, None),
-    "DL" : ("Donegal (Dún na nGall)", None, None, None),
-    "D" : ("Dublin (Baile Áth Cliath)", None, None, None),
-    "G" : ("Galway (Gaillimh)", None, None, None),
-    "KY" : ("Kerry (Ciarraí)", None, None, None),
-    "KE" : ("Kildare (Cill Dara)", None, None, None),
-    "KK" : ("Kilkenny (Cill Chainnigh)", None, None, None),
-    "LS" : ("Laois (Laois)", None, None, None),
-    "LM" : ("Leitrim (Liatroim)", None, None, None),
-    "LK" : ("Limerick (Luimneach)", None, None, None),
-    "LD" : ("Longford (An Longfort)", None, None, None),
-    "LH" : ("Louth (Lú)", None, None, None),
-    "MO" : ("Mayo (Maigh Eo)", None, None, None),
-    "MH" : ("Meath (An Mhí)", None, None, None),
-    "MN" : ("Monaghan (Muineachán)", None, None, None),
-    "OY" : ("Offaly (Uíbh Fhailí)", None, None, None),
-    "RN" : ("Roscommon (Ros Comáin)", None, None, None),
-    "SO" : ("Sligo (Sligeach)", None, None, None),
-    "TA" : ("Tipperary (Tiobraid Árann)", None, None, None),
-    "WD" : ("Waterford (Port Láirge)", None, None, None),
-    "WH" : ("Westmeath (An Iarmhí)", None, None, None),
-    "WX" : ("Wexford (Loch Garman)", None, None, None),
-    "WW" : ("Wicklow (Cill Mhantáin)", None, None, None)
-    }
+    def code(self, value):
+        """
+        Code of an enumeration value (any character case).
 
-Primary_Administrative_Subdivision_Enumeration_248 = {
-    "GE" : ("Genova", None, None, None),
-    "IM" : ("Imperia", None, None, None),
-    "SP" : ("La Spezia", None, None, None),
-    "SV" : ("Savona", None, None, None),
-    "AL" : ("Alessandria", None, None, None),
-    "AT" : ("Asti", None, None, None),
-    "BI" : ("Biella", None, None, None),
-    "CN" : ("Cuneo", None, None, None),
-    "NO" : ("Novara", None, None, None),
-    "TO" : ("Torino", None, None, None),
-    "VB" : ("Verbano Cusio Ossola", None, None, None),
-    "VC" : ("Vercelli", None, None, None),
-    "AO" : ("Aosta", None, None, None),
-    "BG" : ("Bergamo", None, None, None),
-    "BS" : ("Brescia", None, None, None),
-    "CO" : ("Como", None, None, None),
-    "CR" : ("Cremona", None, None, None),
-    "LC" : ("Lecco", None, None, None),
-    "LO" : ("Lodi", None, None, None),
-    "MB" : ("Monza e Brianza", None, None, None),
-    "MN" : ("Mantova", None, None, None),
-    "MI" : ("Milano", None, None, None),
-    "PV" : ("Pavia", None, None, None),
-    "SO" : ("Sondrio", None, None, None),
-    "VA" : ("Varese", None, None, None),
-    "BL" : ("Belluno", None, None, None),
-    "PD" : ("Padova", None, None, None),
-    "RO" : ("Rovigo", None, None, None),
-    "TV" : ("Treviso", None, None, None),
-    "VE" : ("Venezia", None, None, None),
-    "VR" : ("Verona", None, None, None),
-    "VI" : ("Vicenza", None, None, None),
-    "BZ" : ("Bolzano", None, None, None),
-    "TN" : ("Trento", None, None, None),
-    "GO" : ("Gorizia", None, None, None),
-    "PN" : ("Pordenone", None, None, None),
-    "TS" : ("Trieste", None, None, None),
-    "UD" : ("Udine", None, None, None),
-    "BO" : ("Bologna", None, None, None),
-    "FE" : ("Ferrara", None, None, None),
-    "FO" : ("Forlì (import-only)", None, None, None),
-    "FC" : ("Forlì-Cesena", None, None, None),
-    "MO" : ("Modena", None, None, None),
-    "PR" : ("Parma", None, None, None),
-    "PC" : ("Piacenza", None, None, None),
-    "RA" : ("Ravenna", None, None, None),
-    "RE" : ("Reggio Emilia", None, None, None),
-    "RN" : ("Rimini", None, None, None),
-    "AR" : ("Arezzo", None, None, None),
-    "FI" : ("Firenze", None, None, None),
-    "GR" : ("Grosseto", None, None, None),
-    "LI" : ("Livorno", None, None, None),
-    "LU" : ("Lucca", None, None, None),
-    "MS" : ("Massa Carrara", None, None, None),
-    "PT" : ("Pistoia", None, None, None),
-    "PI" : ("Pisa", None, None, None),
-    "PO" : ("Prato", None, None, None),
-    "SI" : ("Siena", None, None, None),
-    "CH" : ("Chieti", None, None, None),
-    "AQ" : ("L'Aquila", None, None, None),
-    "PE" : ("Pescara", None, None, None),
-    "TE" : ("Teramo", None, None, None),
-    "AN" : ("Ancona", None, None, None),
-    "AP" : ("Ascoli Piceno", None, None, None),
-    "FM" : ("Fermo", None, None, None),
-    "MC" : ("Macerata", None, None, None),
-    "PS" : ("Pesaro e Urbino (import-only)", None, None, None),
-    "PU" : ("Pesaro e Urbino", None, None, None),
-    "MT" : ("Matera", None, None, None),
-    "PZ" : ("Potenza", None, None, None),
-    "BA" : ("Bari", None, None, None),
-    "BT" : ("Barletta-Andria-Trani", None, None, None),
-    "BR" : ("Brindisi", None, None, None),
-    "FG" : ("Foggia", None, None, None),
-    "LE" : ("Lecce", None, None, None),
-    "TA" : ("Taranto", None, None, None),
-    "CZ" : ("Catanzaro", None, None, None),
-    "CS" : ("Cosenza", None, None, None),
-    "KR" : ("Crotone", None, None, None),
-    "RC" : ("Reggio Calabria", None, None, None),
-    "VV" : ("Vibo Valentia", None, None, None),
-    "AV" : ("Avellino", None, None, None),
-    "BN" : ("Benevento", None, None, None),
-    "CE" : ("Caserta", None, None, None),
-    "NA" : ("Napoli", None, None, None),
-    "SA" : ("Salerno", None, None, None),
-    "IS" : ("Isernia", None, None, None),
-    "CB" : ("Campobasso", None, None, None),
-    "FR" : ("Frosinone", None, None, None),
-    "LT" : ("Latina", None, None, None),
-    "RI" : ("Rieti", None, None, None),
-    "RM" : ("Roma", None, None, None),
-    "VT" : ("Viterbo", None, None, None),
-    "PG" : ("Perugia", None, None, None),
-    "TR" : ("Terni", None, None, None),
-    "AG" : ("Agrigento", None, None, None),
-    "CL" : ("Caltanissetta", None, None, None),
-    "CT" : ("Catania", None, None, None),
-    "EN" : ("Enna", None, None, None),
-    "ME" : ("Messina", None, None, None),
-    "PA" : ("Palermo", None, None, None),
-    "RG" : ("Ragusa", None, None, None),
-    "SR" : ("Siracusa", None, None, None),
-    "TP" : ("Trapani", None, None, None)
-    }
+        Arguments:
+            value:
+                Enumeration value
 
-Primary_Administrative_Subdivision_Enumeration_256 = {
-    "MD" : ("Madeira", None, None, None)
-    }
+        Returns:
+            Code, None if value isn't in the enumeration.
+        """
 
-Primary_Administrative_Subdivision_Enumeration_263 = {
-    "DR" : ("Drenthe", None, None, None),
-    "FR" : ("Friesland", None, None, None),
-    "GR" : ("Groningen", None, None, None),
-    "NB" : ("Noord-Brabant", None, None, None),
-    "OV" : ("Overijssel", None, None, None),
-    "ZH" : ("Zuid-Holland", None, None, None),
-    "FL" : ("Flevoland", None, None, None),
-    "GD" : ("Gelderland", None, None, None),
-    "LB" : ("Limburg", None, None, None),
-    "NH" : ("Noord-Holland", None, None, None),
-    "UT" : ("Utrecht", None, None, None),
-    "ZL" : ("Zeeland", None, None, None)
-    }
+        return(self.codes.get(value.upper()))
 
-Primary_Administrative_Subdivision_Enumeration_269 = {
-    "Z" : ("Zachodnio-Pomorskie", None, None, None),
-    "F" : ("Pomorskie", None, None, None),
-    "P" : ("Kujawsko-Pomorskie", None, None, None),
-    "B" : ("Lubuskie", None, None, None),
-    "W" : ("Wielkopolskie", None, None, None),
-    "J" : ("Warminsko-Mazurskie", None, None, None),
-    "O" : ("Podlaskie", None, None, None),
-    "R" : ("Mazowieckie", None, None, None),
-    "D" : ("Dolnoslaskie", None, None, None),
-    "U" : ("Opolskie", None, None, None),
-    "C" : ("Lodzkie", None, None, None),
-    "S" : ("Swietokrzyskie", None, None, None),
-    "K" : ("Podkarpackie", None, None, None),
-    "L" : ("Lubelskie", None, None, None),
-    "G" : ("Slaskie", None, None, None),
-    "M" : ("Malopolskie", None, None, None)
-    }
+    def value(self, code):
+        """
+        Enumeration value of a code.
 
-Primary_Administrative_Subdivision_Enumeration_272 = {
-    "AV" : ("Aveiro", None, None, None),
-    "BJ" : ("Beja", None, None, None),
-    "BR" : ("Braga", None, None, None),
-    "BG" : ("Bragança", None, None, None),
-    "CB" : ("Castelo Branco", None, None, None),
-    "CO" : ("Coimbra", None, None, None),
-    "EV" : ("Evora", None, None, None),
-    "FR" : ("Faro", None, None, None),
-    "GD" : ("Guarda", None, None, None),
-    "LR" : ("Leiria", None, None, None),
-    "LX" : ("Lisboa", None, None, None),
-    "PG" : ("Portalegre", None, None, None),
-    "PT" : ("Porto", None, None, None),
-    "SR" : ("Santarem", None, None, None),
-    "ST" : ("Setubal", None, None, None),
-    "VC" : ("Viana do Castelo", None, None, None),
-    "VR" : ("Vila Real", None, None, None),
-    "VS" : ("Viseu", None, None, None)
-    }
+        Arguments:
+            code:
+                Code
 
-Primary_Administrative_Subdivision_Enumeration_275 = {
-    "AR" : ("Arad", None, None, None),
-    "CS" : ("Cara'-Severin", None, None, None),
-    "HD" : ("Hunedoara", None, None, None),
-    "TM" : ("Timiş (Timis)", None, None, None),
-    "BU" : ("Bucureşti (Bucure'ti)", None, None, None),
-    "IF" : ("Ilfov", None, None, None),
-    "BR" : ("Brăila (Braila)", None, None, None),
-    "CT" : ("Conatarta", None, None, None),
-    "GL" : ("Galati", None, None, None),
-    "TL" : ("Tulcea", None, None, None),
-    "VN" : ("Vrancea", None, None, None),
-    "AB" : ("Alba", None, None, None),
-    "BH" : ("Bihor", None, None, None),
-    "BN" : ("Bistrita-Nasaud", None, None, None),
-    "CJ" : ("Cluj", None, None, None),
-    "MM" : ("Maramureş (Maramures)", None, None, None),
-    "SJ" : ("Sălaj (Salaj)", None, None, None),
-    "SM" : ("Satu Mare", None, None, None),
-    "BV" : ("Braşov (Bra'ov)", None, None, None),
-    "CV" : ("Covasna", None, None, None),
-    "HR" : ("Harghita", None, None, None),
-    "MS" : ("Mureş (Mures)", None, None, None),
-    "SB" : ("Sibiu", None, None, None),
-    "AG" : ("Arge'", None, None, None),
-    "DJ" : ("Dolj", None, None, None),
-    "GJ" : ("Gorj", None, None, None),
-    "MH" : ("Mehedinţi (Mehedinti)", None, None, None),
-    "OT" : ("Olt", None, None, None),
-    "VL" : ("Vâlcea", None, None, None),
-    "BC" : ("Bacau", None, None, None),
-    "BT" : ("Boto'ani", None, None, None),
-    "IS" : ("Iaşi (Iasi)", None, None, None),
-    "NT" : ("Neamţ (Neamt)", None, None, None),
-    "SV" : ("Suceava", None, None, None),
-    "VS" : ("Vaslui", None, None, None),
-    "BZ" : ("Buzău (Buzau)", None, None, None),
-    "CL" : ("Călăraşi (Calarasi)", None, None, None),
-    "DB" : ("Dâmboviţa (Dambovita)", None, None, None),
-    "GR" : ("Giurqiu", None, None, None),
-    "IL" : ("Ialomita", None, None, None),
-    "PH" : ("Prahova", None, None, None),
-    "TR" : ("Teleorman", None, None, None)
-    }
+        Returns:
+            Upper case enumeration value. IndexError is raised for an
+            invalid code.
+        """
 
-Primary_Administrative_Subdivision_Enumeration_281 = {
-    "AV" : ("Avila", None, None, None),
-    "BU" : ("Burgos", None, None, None),
-    "C" : ("A Coruña", None, None, None),
-    "LE" : ("Leon", None, None, None),
-    "LO" : ("La Rioja", None, None, None),
-    "LU" : ("Lugo", None, None, None),
-    "O" : ("Asturias", None, None, None),
-    "OU" : ("Ourense", None, None, None),
-    "P" : ("Palencia", None, None, None),
-    "PO" : ("Pontevedra", None, None, None),
-    "S" : ("Cantabria", None, None, None),
-    "SA" : ("Salamanca", None, None, None),
-    "SG" : ("Segovia", None, None, None),
-    "SO" : ("Soria", None, None, None),
-    "VA" : ("Valladolid", None, None, None),
-    "ZA" : ("Zamora", None, None, None),
-    "BI" : ("Vizcaya", None, None, None),
-    "HU" : ("Huesca", None, None, None),
-    "NA" : ("Navarra", None, None, None),
-    "SS" : ("Guipuzcoa", None, None, None),
-    "TE" : ("Teruel", None, None, None),
-    "VI" : ("Alava", None, None, None),
-    "Z" : ("Zaragoza", None, None, None),
-    "B" : ("Barcelona", None, None, None),
-    "GI" : ("Girona", None, None, None),
-    "L" : ("Lleida", None, None, None),
-    "T" : ("Tarragona", None, None, None),
-    "BA" : ("Badajoz", None, None, None),
-    "CC" : ("Caceres", None, None, None),
-    "CR" : ("Ciudad Real", None, None, None),
-    "CU" : ("Cuenca", None, None, None),
-    "GU" : ("Guadalajara", None, None, None),
-    "M" : ("Madrid", None, None, None),
-    "TO" : ("Toledo", None, None, None),
-    "A" : ("Alicante", None, None, None),
-    "AB" : ("Albacete", None, None, None),
-    "CS" : ("Castellon", None, None, None),
-    "MU" : ("Murcia", None, None, None),
-    "V" : ("Valencia", None, None, None),
-    "AL" : ("Almeria", None, None, None),
-    "CA" : ("Cadiz", None, None, None),
-    "CO" : ("Cordoba", None, None, None),
-    "GR" : ("Granada", None, None, None),
-    "H" : ("Huelva", None, None, None),
-    "J" : ("Jaen", None, None, None),
-    "MA" : ("Malaga", None, None, None),
-    "SE" : ("Sevilla", None, None, None)
-    }
+        return(self.values[code])
 
-Primary_Administrative_Subdivision_Enumeration_284 = {
-    "AB" : ("Stockholm län", None, None, None),
-    "I" : ("Gotlands län", None, None, None),
-    "BD" : ("Norrbottens län", None, None, None),
-    "AC" : ("Västerbottens län", None, None, None),
-    "X" : ("Gävleborgs län", None, None, None),
-    "Z" : ("Jämtlands län", None, None, None),
-    "Y" : ("Västernorrlands län", None, None, None),
-    "W" : ("Dalarna län", None, None, None),
-    "S" : ("Värmlands län", None, None, None),
-    "O" : ("Västra Götalands län", None, None, None),
-    "T" : ("Örebro län", None, None, None),
-    "E" : ("Östergötlands län", None, None, None),
-    "D" : ("Södermanlands län", None, None, None),
-    "C" : ("Uppsala län", None, None, None),
-    "U" : ("Västmanlands län", None, None, None),
-    "N" : ("Hallands län", None, None, None),
-    "K" : ("Blekinge län", None, None, None),
-    "F" : ("Jönköpings län", None, None, None),
-    "H" : ("Kalmar län", None, None, None),
-    "G" : ("Kronobergs län", None, None, None),
-    "M" : ("Skåne län", None, None, None)
-    }
+#
+#Fields with enumeration codes, and a function returning the values to
+#code in code order: bands in frequency order (so band codes are offsets
+#into band_names), modes, submodes and continents alphabetically and
+#DXCC entities in entity code order. Fields in the same tuple share
+#codes.
+#
+enumeration_code_values = (
+    (("BAND", "BAND_RX"), lambda: band_names),
+    (("CONT",), lambda: sorted(Continent_Enumeration)),
+    (("DXCC", "MY_DXCC"), lambda: sorted(
+        get_enumerations().DXCC_Entity_Code_Enumeration, key=int)),
+    (("MODE",), lambda: sorted(Mode_Enumeration)),
+    (("SUBMODE",), lambda: sorted(Submode_Enumeration)),
+    )
 
-Primary_Administrative_Subdivision_Enumeration_287 = {
-    "AG" : ("Aargau", None, None, None),
-    "AR" : ("Appenzell Ausserrhoden", None, None, None),
-    "AI" : ("Appenzell Innerrhoden", None, None, None),
-    "BL" : ("Basel Landschaft", None, None, None),
-    "BS" : ("Basel Stadt", None, None, None),
-    "BE" : ("Bern", None, None, None),
-    "FR" : ("Freiburg / Fribourg", None, None, None),
-    "GE" : ("Genf / Genève", None, None, None),
-    "GL" : ("Glarus", None, None, None),
-    "GR" : ("Graubuenden / Grisons", None, None, None),
-    "JU" : ("Jura", None, None, None),
-    "LU" : ("Luzern", None, None, None),
-    "NE" : ("Neuenburg / Neuchâtel", None, None, None),
-    "NW" : ("Nidwalden", None, None, None),
-    "OW" : ("Obwalden", None, None, None),
-    "SH" : ("Schaffhausen", None, None, None),
-    "SZ" : ("Schwyz", None, None, None),
-    "SO" : ("Solothurn", None, None, None),
-    "SG" : ("St. Gallen", None, None, None),
-    "TI" : ("Tessin / Ticino", None, None, None),
-    "TG" : ("Thurgau", None, None, None),
-    "UR" : ("Uri", None, None, None),
-    "VD" : ("Waadt / Vaud", None, None, None),
-    "VS" : ("Wallis / Valais", None, None, None),
-    "ZH" : ("Zuerich", None, None, None),
-    "ZG" : ("Zug", None, None, None)
-    }
+#
+#Enumeration codes by field name. They're built by get_enumeration_codes
+#the first time they're needed rather than when hamlibIO is imported
+#(and the DXCC table isn't loaded until then).
+#
+enumeration_codes = {}
 
-Primary_Administrative_Subdivision_Enumeration_288 = {
-    "SU" : ("Sums'ka Oblast'", None, None, None),
-    "TE" : ("Ternopil's'ka Oblast'", None, None, None),
-    "CH" : ("Cherkas'ka Oblast'", None, None, None),
-    "ZA" : ("Zakarpats'ka Oblast'", None, None, None),
-    "DN" : ("Dnipropetrovs'ka Oblast'", None, None, None),
-    "OD" : ("Odes'ka Oblast'", None, None, None),
-    "HE" : ("Khersons'ka Oblast'", None, None, None),
-    "PO" : ("Poltavs'ka Oblast'", None, None, None),
-    "DO" : ("Donets'ka Oblast'", None, None, None),
-    "RI" : ("Rivnens'ka Oblast'", None, None, None),
-    "HA" : ("Kharkivs'ka Oblast'", None, None, None),
-    "LU" : ("Luhans'ka Oblast'", None, None, None),
-    "VI" : ("Vinnyts'ka Oblast'", None, None, None),
-    "VO" : ("Volyos'ka Oblast'", None, None, None),
-    "ZP" : ("Zaporiz'ka Oblast'", None, None, None),
-    "CR" : ("Chernihivs'ka Oblast'", None, None, None),
-    "IF" : ("Ivano-Frankivs'ka Oblast'", None, None, None),
-    "HM" : ("Khmel'nyts'ka Oblast'", None, None, None),
-    "KV" : ("Kyïv", None, None, None),
-    "KO" : ("Kyivs'ka Oblast'", None, None, None),
-    "KI" : ("Kirovohrads'ka Oblast'", None, None, None),
-    "LV" : ("L'vivs'ka Oblast'", None, None, None),
-    "ZH" : ("Zhytomyrs'ka Oblast'", None, None, None),
-    "CN" : ("Chernivets'ka Oblast'", None, None, None),
-    "NI" : ("Mykolaivs'ka Oblast'", None, None, None),
-    "KR" : ("Respublika Krym", None, None, None),
-    "SL" : ("Sevastopol'", None, None, None)
+#
+#Module attributes for the codes of the commonly used enumerations (see
+#__getattr__), and their field
+#
+enumeration_code_attributes = {
+    "band_codes" : "BAND",
+    "continent_codes" : "CONT",
+    "mode_codes" : "MODE",
+    "submode_codes" : "SUBMODE",
     }
 
-Primary_Administrative_Subdivision_Enumeration_291 = {
-    "CT" : ("Connecticut", None, ("05",), ("08",)),
-    "ME" : ("Maine", None, ("05",), ("08",)),
-    "MA" : ("Massachusetts", None, ("05",), ("08",)),
-    "NH" : ("New Hampshire", None, ("05",), ("08",)),
-    "RI" : ("Rhode Island", None, ("05",), ("08",)),
-    "VT" : ("Vermont", None, ("05",), ("08",)),
-    "NJ" : ("New Jersey", None, ("05",), ("08",)),
-    "NY" : ("New York", None, ("05",), ("08",)),
-    "DE" : ("Delaware", None, ("05",), ("08",)),
-    "DC" : ("District of Columbia", None, ("05",), ("08",)),
-    "MD" : ("Maryland", None, ("05",), ("08",)),
-    "PA" : ("Pennsylvania", None, ("05",), ("08",)),
-    "AL" : ("Alabama", None, ("04",), ("08",)),
-    "FL" : ("Florida", None, ("05",), ("08",)),
-    "GA" : ("Georgia", None, ("05",), ("08",)),
-    "KY" : ("Kentucky", None, ("04",), ("08",)),
-    "NC" : ("North Carolina", None, ("04",), ("08",)),
-    "SC" : ("South Carolina", None, ("05",), ("08",)),
-    "TN" : ("Tennessee", None, ("04",), ("07", "08",)),
-    "VA" : ("Virginia", None, ("05",), ("08",)),
-    "AR" : ("Arkansas", None, ("04",), ("07", "08",)),
-    "LA" : ("Louisiana", None, ("04",), ("07", "08",)),
-    "MS" : ("Mississippi", None, ("04",), ("07", "08",)),
-    "NM" : ("New Mexico", None, ("04",), ("07",)),
-    "OK" : ("Oklahoma", None, ("04",), ("07",)),
-    "TX" : ("Texas", None, ("04",), ("07",)),
-    "CA" : ("California", None, ("03",), ("06",)),
-    "AZ" : ("Arizona", None, ("03",), ("06", "07",)),
-    "ID" : ("Idaho", None, ("03",), ("06",)),
-    "MT" : ("Montana", None, ("04",), ("06", "07",)),
-    "NV" : ("Nevada", None, ("03",), ("06",)),
-    "OR" : ("Oregon", None, ("03",), ("06",)),
-    "UT" : ("Utah", None, ("03",), ("06", "07",)),
-    "WA" : ("Washington", None, ("03",), ("06",)),
-    "WY" : ("Wyoming", None, ("04",), ("07",)),
-    "MI" : ("Michigan", None, ("04",), ("07", "08",)),
-    "OH" : ("Ohio", None, ("04",), ("08",)),
-    "WV" : ("West Virginia", None, ("05",), ("08",)),
-    "IL" : ("Illinois", None, ("04",), ("07", "08",)),
-    "IN" : ("Indiana", None, ("04",), ("08",)),
-    "WI" : ("Wisconsin", None, ("04",), ("07", "08",)),
-    "CO" : ("Colorado", None, ("04",), ("07",)),
-    "IA" : ("Iowa", None, ("04",), ("07",)),
-    "KS" : ("Kansas", None, ("04",), ("07",)),
-    "MN" : ("Minnesota", None, ("04",), ("07", "08",)),
-    "MO" : ("Missouri", None, ("04",), ("07", "08",)),
-    "NE" : ("Nebraska", None, ("04",), ("07",)),
-    "ND" : ("North Dakota", None, ("04",), ("07",)),
-    "SD" : ("South Dakota", None, ("04",), ("07",))
-    }
+def get_enumeration_codes(field_name):
+    """
+    Get the EnumerationCodes for a field, building them the first time
+    they're asked for.
 
-Primary_Administrative_Subdivision_Enumeration_318 = {
-    "AH" : ("Anhui", None, None, None),
-    "BJ" : ("Beijing", None, None, None),
-    "CQ" : ("Chongqing", None, None, None),
-    "FJ" : ("Fujian", None, None, None),
-    "GD" : ("Guangdong", None, None, None),
-    "GS" : ("Gansu", None, None, None),
-    "GX" : ("Guangxi Zhuangzu", None, None, None),
-    "GZ" : ("Guizhou", None, None, None),
-    "HA" : ("Henan", None, None, None),
-    "HB" : ("Hubei", None, None, None),
-    "HE" : ("Hebei", None, None, None),
-    "HI" : ("Hainan", None, None, None),
-    "HL" : ("Heilongjiang", None, None, None),
-    "HN" : ("Hunan", None, None, None),
-    "JL" : ("Jilin", None, None, None),
-    "JS" : ("Jiangsu", None, None, None),
-    "JX" : ("Jiangxi", None, None, None),
-    "LN" : ("Liaoning", None, None, None),
-    "NM" : ("Nei Mongol", None, None, None),
-    "NX" : ("Ningxia Huizu", None, None, None),
-    "QH" : ("Qinghai", None, None, None),
-    "SC" : ("Sichuan", None, None, None),
-    "SD" : ("Shandong", None, None, None),
-    "SH" : ("Shanghai", None, None, None),
-    "SN" : ("Shaanxi", None, None, None),
-    "SX" : ("Shanxi", None, None, None),
-    "TJ" : ("Tianjin", None, None, None),
-    "XJ" : ("Xinjiang Uygur", None, None, None),
-    "XZ" : ("Xizang", None, None, None),
-    "YN" : ("Yunnan", None, None, None),
-    "ZJ" : ("Zhejiang", None, None, None),
-    }
+    Arguments:
+        field_name:
+            Field name (BAND, BAND_RX, CONT, DXCC, MODE, MY_DXCC or
+            SUBMODE)
 
-Primary_Administrative_Subdivision_Enumeration_339 = {
-    "12" : ("Chiba", None, None, None),
-    "16" : ("Gunma", None, None, None),
-    "14" : ("Ibaraki", None, None, None),
-    "11" : ("Kanagawa", None, None, None),
-    "13" : ("Saitama", None, None, None),
-    "15" : ("Tochigi", None, None, None),
-    "10" : ("Tokyo", None, None, None),
-    "17" : ("Yamanashi", None, None, None),
-    "20" : ("Aichi", None, None, None),
-    "19" : ("Gifu", None, None, None),
-    "21" : ("Mie", None, None, None),
-    "18" : ("Shizuoka", None, None, None),
-    "27" : ("Hyogo", None, None, None),
-    "22" : ("Kyoto", None, None, None),
-    "24" : ("Nara", None, None, None),
-    "25" : ("Osaka", None, None, None),
-    "23" : ("Shiga", None, None, None),
-    "26" : ("Wakayama", None, None, None),
-    "35" : ("Hiroshima", None, None, None),
-    "31" : ("Okayama", None, None, None),
-    "32" : ("Shimane", None, None, None),
-    "34" : ("Tottori", None, None, None),
-    "33" : ("Yamaguchi", None, None, None),
-    "38" : ("Ehime", None, None, None),
-    "36" : ("Kagawa", None, None, None),
-    "39" : ("Kochi", None, None, None),
-    "37" : ("Tokushima", None, None, None),
-    "40" : ("Fukuoka", None, None, None),
-    "46" : ("Kagoshima", None, None, None),
-    "43" : ("Kumamoto", None, None, None),
-    "45" : ("Miyazaki", None, None, None),
-    "42" : ("Nagasaki", None, None, None),
-    "44" : ("Oita", None, None, None),
-    "47" : ("Okinawa", None, None, None),
-    "41" : ("Saga", None, None, None),
-    "04" : ("Akita", None, None, None),
-    "02" : ("Aomori", None, None, None),
-    "07" : ("Fukushima", None, None, None),
-    "03" : ("Iwate", None, None, None),
-    "06" : ("Miyagi", None, None, None),
-    "05" : ("Yamagata", None, None, None),
-    "01" : ("Hokkaido", None, None, None),
-    "29" : ("Fukui", None, None, None),
-    "30" : ("Ishikawa", None, None, None),
-    "28" : ("Toyama", None, None, None),
-    "09" : ("Nagano", None, None, None),
-    "08" : ("Niigata", None, None, None)
-    }
+    Returns:
+        EnumerationCodes, None if the field isn't coded.
+    """
 
-Primary_Administrative_Subdivision_Enumeration_375 = {
-    "AUR" : ("Aurora", None, None, None),
-    "BTG" : ("Batangas", None, None, None),
-    "CAV" : ("Cavite", None, None, None),
-    "LAG" : ("Laguna", None, None, None),
-    "MAD" : ("Marinduque", None, None, None),
-    "MDC" : ("Mindoro Occidental", None, None, None),
-    "MDR" : ("Mindoro Oriental", None, None, None),
-    "PLW" : ("Palawan", None, None, None),
-    "QUE" : ("Quezon", None, None, None),
-    "RIZ" : ("Rizal", None, None, None),
-    "ROM" : ("Romblon", None, None, None),
-    "ILN" : ("Ilocos Norte", None, None, None),
-    "ILS" : ("Ilocos Sur", None, None, None),
-    "LUN" : ("La Union", None, None, None),
-    "PAN" : ("Pangasinan", None, None, None),
-    "BTN" : ("Batanes", None, None, None),
-    "CAG" : ("Cagayan", None, None, None),
-    "ISA" : ("Isabela", None, None, None),
-    "NUV" : ("Nueva Vizcaya", None, None, None),
-    "QUI" : ("Quirino", None, None, None),
-    "ABR" : ("Abra", None, None, None),
-    "APA" : ("Apayao", None, None, None),
-    "BEN" : ("Benguet", None, None, None),
-    "IFU" : ("Ifugao", None, None, None),
-    "KAL" : ("Kalinga-Apayso", None, None, None),
-    "MOU" : ("Mountain Province", None, None, None),
-    "BAN" : ("Batasn", None, None, None),
-    "BUL" : ("Bulacan", None, None, None),
-    "NUE" : ("Nueva Ecija", None, None, None),
-    "PAM" : ("Pampanga", None, None, None),
-    "TAR" : ("Tarlac", None, None, None),
-    "ZMB" : ("Zambales", None, None, None),
-    "ALB" : ("Albay", None, None, None),
-    "CAN" : ("Camarines Norte", None, None, None),
-    "CAS" : ("Camarines Sur", None, None, None),
-    "CAT" : ("Catanduanes", None, None, None),
-    "MAS" : ("Masbate", None, None, None),
-    "SOR" : ("Sorsogon", None, None, None),
-    "BIL" : ("Biliran", None, None, None),
-    "EAS" : ("Eastern Samar", None, None, None),
-    "LEY" : ("Leyte", None, None, None),
-    "NSA" : ("Northern Samar", None, None, None),
-    "SLE" : ("Southern Leyte", None, None, None),
-    "WSA" : ("Western Samar", None, None, None),
-    "AKL" : ("Aklan", None, None, None),
-    "ANT" : ("Antique", None, None, None),
-    "CAP" : ("Capiz", None, None, None),
-    "GUI" : ("Guimaras", None, None, None),
-    "ILI" : ("Iloilo", None, None, None),
-    "NEC" : ("Negroe Occidental", None, None, None),
-    "BOH" : ("Bohol", None, None, None),
-    "CEB" : ("Cebu", None, None, None),
-    "NER" : ("Negros Oriental", None, None, None),
-    "SIG" : ("Siquijor", None, None, None),
-    "ZAN" : ("Zamboanga del Norte", None, None, None),
-    "ZAS" : ("Zamboanga del Sur", None, None, None),
-    "ZSI" : ("Zamboanga Sibugay", None, None, None),
-    "NCO" : ("North Cotabato", None, None, None),
-    "SUK" : ("Sultan Kudarat", None, None, None),
-    "SAR" : ("Sarangani", None, None, None),
-    "SCO" : ("South Cotabato", None, None, None),
-    "BAS" : ("Basilan", None, None, None),
-    "LAS" : ("Lanao del Sur", None, None, None),
-    "MAG" : ("Maguindanao", None, None, None),
-    "SLU" : ("Sulu", None, None, None),
-    "TAW" : ("Tawi-Tawi", None, None, None),
-    "LAN" : ("Lanao del Norte", None, None, None),
-    "BUK" : ("Bukidnon", None, None, None),
-    "CAM" : ("Camiguin", None, None, None),
-    "MSC" : ("Misamis Occidental", None, None, None),
-    "MSR" : ("Misamis Oriental", None, None, None),
-    "COM" : ("Compostela Valley", None, None, None),
-    "DAV" : ("Davao del Norte", None, None, None),
-    "DAS" : ("Davao del Sur", None, None, None),
-    "DAO" : ("Davao Oriental", None, None, None),
-    "AGN" : ("Agusan del Norte", None, None, None),
-    "AGS" : ("Agusan del Sur", None, None, None),
-    "SUN" : ("Surigao del Norte", None, None, None),
-    "SUR" : ("Surigao del Sur", None, None, None)
-    }
+    field_name = field_name.upper()
+    codes = enumeration_codes.get(field_name)
+    if codes is not None:
+        return(codes)
 
-Primary_Administrative_Subdivision_Enumeration_497 = {
-    "01" : ("Zagrebačka županija", None, None, None),
-    "02" : ("Krapinsko-Zagorska županija", None, None, None),
-    "03" : ("Sisačko-Moslavačka županija", None, None, None),
-    "04" : ("Karlovačka županija", None, None, None),
-    "05" : ("Varaždinska županija", None, None, None),
-    "06" : ("Koprivničko-Križevačka županija", None, None, None),
-    "07" : ("Bjelovarsko-Bilogorska županija", None, None, None),
-    "08" : ("Primorsko-Goranska županija", None, None, None),
-    "09" : ("Ličko-Senjska županija", None, None, None),
-    "10" : ("Virovitičko-Podravska županija", None, None, None),
-    "11" : ("Požeško-Slavonska županija", None, None, None),
-    "12" : ("Brodsko-Posavska županija", None, None, None),
-    "13" : ("Zadarska županija", None, None, None),
-    "14" : ("Osječko-Baranjska županija", None, None, None),
-    "15" : ("Šibensko-Kninska županija", None, None, None),
-    "16" : ("Vukovarsko-Srijemska županija", None, None, None),
-    "17" : ("Splitsko-Dalmatinska županija", None, None, None),
-    "18" : ("Istarska županija", None, None, None),
-    "19" : ("Dubrovačko-Neretvanska županija", None, None, None),
-    "20" : ("Međimurska županija", None, None, None),
-    "21" : ("Grad Zagreb", None, None, None)
-    }
+    for (fields, values) in enumeration_code_values:
+        if field_name in fields:
+            codes = EnumerationCodes(values())
+            for coded_field in fields:
+                enumeration_codes[coded_field] = codes
+            break
 
-Primary_Administrative_Subdivision_Enumeration_503 = {
-    "APA" : ("Praha 1", None, None, None),
-    "APB" : ("Praha 2", None, None, None),
-    "APC" : ("Praha 3", None, None, None),
-    "APD" : ("Praha 4", None, None, None),
-    "APE" : ("Praha 5", None, None, None),
-    "APF" : ("Praha 6", None, None, None),
-    "APG" : ("Praha 7", None, None, None),
-    "APH" : ("Praha 8", None, None, None),
-    "API" : ("Praha 9", None, None, None),
-    "APJ" : ("Praha 10", None, None, None),
-    "BBN" : ("Benesov", None, None, None),
-    "BBE" : ("Beroun", None, None, None),
-    "BKD" : ("Kladno", None, None, None),
-    "BKO" : ("Kolin", None, None, None),
-    "BKH" : ("Kutna Hora", None, None, None),
-    "BME" : ("Melnik", None, None, None),
-    "BMB" : ("Mlada Boleslav", None, None, None),
-    "BNY" : ("Nymburk", None, None, None),
-    "BPZ" : ("Praha zapad", None, None, None),
-    "BPV" : ("Praha vychod", None, None, None),
-    "BPB" : ("Pribram", None, None, None),
-    "BRA" : ("Rakovnik", None, None, None),
-    "CBU" : ("Ceske Budejovice", None, None, None),
-    "CCK" : ("Cesky Krumlov", None, None, None),
-    "CJH" : ("Jindrichuv Hradec", None, None, None),
-    "CPE" : ("Pelhrimov", None, None, None),
-    "CPI" : ("Pisek", None, None, None),
-    "CPR" : ("Prachatice", None, None, None),
-    "CST" : ("Strakonice", None, None, None),
-    "CTA" : ("Tabor", None, None, None),
-    "DDO" : ("Domazlice", None, None, None),
-    "DCH" : ("Cheb", None, None, None),
-    "DKV" : ("Karlovy Vary", None, None, None),
-    "DKL" : ("Klatovy", None, None, None),
-    "DPM" : ("Plzen mesto", None, None, None),
-    "DPJ" : ("Plzen jih", None, None, None),
-    "DPS" : ("Plzen sever", None, None, None),
-    "DRO" : ("Rokycany", None, None, None),
-    "DSO" : ("Sokolov", None, None, None),
-    "DTA" : ("Tachov", None, None, None),
-    "ECL" : ("Ceska Lipa", None, None, None),
-    "EDE" : ("Decin", None, None, None),
-    "ECH" : ("Chomutov", None, None, None),
-    "EJA" : ("Jablonec n. Nisou", None, None, None),
-    "ELI" : ("Liberec", None, None, None),
-    "ELT" : ("Litomerice", None, None, None),
-    "ELO" : ("Louny", None, None, None),
-    "EMO" : ("Most", None, None, None),
-    "ETE" : ("Teplice", None, None, None),
-    "EUL" : ("Usti nad Labem", None, None, None),
-    "FHB" : ("Havlickuv Brod", None, None, None),
-    "FHK" : ("Hradec Kralove", None, None, None),
-    "FCR" : ("Chrudim", None, None, None),
-    "FJI" : ("Jicin", None, None, None),
-    "FNA" : ("Nachod", None, None, None),
-    "FPA" : ("Pardubice", None, None, None),
-    "FRK" : ("Rychn n. Kneznou", None, None, None),
-    "FSE" : ("Semily", None, None, None),
-    "FSV" : ("Svitavy", None, None, None),
-    "FTR" : ("Trutnov", None, None, None),
-    "FUO" : ("Usti nad Orlici", None, None, None),
-    "GBL" : ("Blansko", None, None, None),
-    "GBM" : ("Brno mesto", None, None, None),
-    "GBV" : ("Brno venkov", None, None, None),
-    "GBR" : ("Breclav", None, None, None),
-    "GHO" : ("Hodonin", None, None, None),
-    "GJI" : ("Jihlava", None, None, None),
-    "GKR" : ("Kromeriz", None, None, None),
-    "GPR" : ("Prostejov", None, None, None),
-    "GTR" : ("Trebic", None, None, None),
-    "GUH" : ("Uherske Hradiste", None, None, None),
-    "GVY" : ("Vyskov", None, None, None),
-    "GZL" : ("Zlin", None, None, None),
-    "GZN" : ("Znojmo", None, None, None),
-    "GZS" : ("Zdar nad Sazavou", None, None, None),
-    "HBR" : ("Bruntal", None, None, None),
-    "HFM" : ("Frydek-Mistek", None, None, None),
-    "HJE" : ("Jesenik", None, None, None),
-    "HKA" : ("Karvina", None, None, None),
-    "HNJ" : ("Novy Jicin", None, None, None),
-    "HOL" : ("Olomouc", None, None, None),
-    "HOP" : ("Opava", None, None, None),
-    "HOS" : ("Ostrava", None, None, None),
-    "HPR" : ("Prerov", None, None, None),
-    "HSU" : ("Sumperk", None, None, None),
-    "HVS" : ("Vsetin", None, None, None)
-    }
+    return(codes)
 
-Primary_Administrative_Subdivision_Enumeration_504 = {
-    "BAA" : ("Bratislava 1", None, None, None),
-    "BAB" : ("Bratislava 2", None, None, None),
-    "BAC" : ("Bratislava 3", None, None, None),
-    "BAD" : ("Bratislava 4", None, None, None),
-    "BAE" : ("Bratislava 5", None, None, None),
-    "MAL" : ("Malacky", None, None, None),
-    "PEZ" : ("Pezinok", None, None, None),
-    "SEN" : ("Senec", None, None, None),
-    "DST" : ("Dunajska Streda", None, None, None),
-    "GAL" : ("Galanta", None, None, None),
-    "HLO" : ("Hlohovec", None, None, None),
-    "PIE" : ("Piestany", None, None, None),
-    "SEA" : ("Senica", None, None, None),
-    "SKA" : ("Skalica", None, None, None),
-    "TRN" : ("Trnava", None, None, None),
-    "BAN" : ("Banovce n. Bebr.", None, None, None),
-    "ILA" : ("Ilava", None, None, None),
-    "MYJ" : ("Myjava", None, None, None),
-    "NMV" : ("Nove Mesto n. Vah", None, None, None),
-    "PAR" : ("Partizanske", None, None, None),
-    "PBY" : ("Povazska Bystrica", None, None, None),
-    "PRI" : ("Prievidza", None, None, None),
-    "PUC" : ("Puchov", None, None, None),
-    "TNC" : ("Trencin", None, None, None),
-    "KOM" : ("Komarno", None, None, None),
-    "LVC" : ("Levice", None, None, None),
-    "NIT" : ("Nitra", None, None, None),
-    "NZA" : ("Nove Zamky", None, None, None),
-    "SAL" : ("Sala", None, None, None),
-    "TOP" : ("Topolcany", None, None, None),
-    "ZMO" : ("Zlate Moravce", None, None, None),
-    "BYT" : ("Bytca", None, None, None),
-    "CAD" : ("Cadca", None, None, None),
-    "DKU" : ("Dolny Kubin", None, None, None),
-    "KNM" : ("Kysucke N. Mesto", None, None, None),
-    "LMI" : ("Liptovsky Mikulas", None, None, None),
-    "MAR" : ("Martin", None, None, None),
-    "NAM" : ("Namestovo", None, None, None),
-    "RUZ" : ("Ruzomberok", None, None, None),
-    "TTE" : ("Turcianske Teplice", None, None, None),
-    "TVR" : ("Tvrdosin", None, None, None),
-    "ZIL" : ("Zilina", None, None, None),
-    "BBY" : ("Banska Bystrica", None, None, None),
-    "BST" : ("Banska Stiavnica", None, None, None),
-    "BRE" : ("Brezno", None, None, None),
-    "DET" : ("Detva", None, None, None),
-    "KRU" : ("Krupina", None, None, None),
-    "LUC" : ("Lucenec", None, None, None),
-    "POL" : ("Poltar", None, None, None),
-    "REV" : ("Revuca", None, None, None),
-    "RSO" : ("Rimavska Sobota", None, None, None),
-    "VKR" : ("Velky Krtis", None, None, None),
-    "ZAR" : ("Zarnovica", None, None, None),
-    "ZIH" : ("Ziar nad Hronom", None, None, None),
-    "ZVO" : ("Zvolen", None, None, None),
-    "GEL" : ("Gelnica", None, None, None),
-    "KEA" : ("Kosice 1", None, None, None),
-    "KEB" : ("Kosice 2", None, None, None),
-    "KEC" : ("Kosice 3", None, None, None),
-    "KED" : ("Kosice 4", None, None, None),
-    "KEO" : ("Kosice-okolie", None, None, None),
-    "MIC" : ("Michalovce", None, None, None),
-    "ROZ" : ("Roznava", None, None, None),
-    "SOB" : ("Sobrance", None, None, None),
-    "SNV" : ("Spisska Nova Ves", None, None, None),
-    "TRE" : ("Trebisov", None, None, None),
-    "BAR" : ("Bardejov", None, None, None),
-    "HUM" : ("Humenne", None, None, None),
-    "KEZ" : ("Kezmarok", None, None, None),
-    "LEV" : ("Levoca", None, None, None),
-    "MED" : ("Medzilaborce", None, None, None),
-    "POP" : ("Poprad", None, None, None),
-    "PRE" : ("Presov", None, None, None),
-    "SAB" : ("Sabinov", None, None, None),
-    "SNI" : ("Snina", None, None, None),
-    "SLU" : ("Stara Lubovna", None, None, None),
-    "STR" : ("Stropkov", None, None, None),
-    "SVI" : ("Svidnik", None, None, None),
-    "VRT" : ("Vranov nad Toplou", None, None, None)
+Propgation_Mode_Enumeration = {
+    "AS" : "Aircraft Scatter",
+    "AUE" : "Aurora-E",
+    "AUR" : "Aurora",
+    "BS" : "Back scatter",
+    "ECH" : "EchoLink",
+    "EME" : "Earth-Moon-Earth",
+    "ES" : "Sporadic E",
+    "F2" : "F2 Reflection",
+    "FAI" : "Field Aligned Irregularities",
+    "GWAVE" : "Ground Wave",
+    "INTERNET" : "Internet-assisted",
+    "ION" : "Ionoscatter",
+    "IRL" : "IRLP",
+    "LOS" : "Line of Sight (includes transmission through obstacles such as walls)",
+    "MS" : "Meteor scatter",
+    "RPT" : "Terrestrial or atmospheric repeater or transponder",
+    "RS" : "Rain scatter",
+    "SAT" : "Satellite",
+    "TEP" : "Trans-equatorial",
+    "TR" : "Tropospheric ducting"
     }
 
-#
-#Rather than maintaining a table of DXCC_Entity_Code_Enumeration to
-#Primary_Administrative_Subdivision_Enumeration_NNN links, allow the
-#Primary_Administrative_Subdivision_Enumeration tables to be added to
-#the DXCC_Entity_Code_Enumeration table on-the-fly by merely defining a
-#Primary_Administrative_Subdivision_Enumeration_NNN table.
-#
-#This code will change the couuntry number to country name dictonary
-#mapping to a (country name, None) tuple - if no further information on
-#a country, or a (country name,
-#Primary_Administrative_Subdivision_Enumeration_NNN) tuple if there is
-#subdivision information on the country.
-#
-for i in DXCC_Entity_Code_Enumeration.keys():
-    #
-    #Figure out the name of the table (text) for that country
-    #
-    Primary_Administrative_Subdivision_Enumeration_number = (
-        "Primary_Administrative_Subdivision_Enumeration_" +  str(i))
-
-    #
-    #If the subdivision table exists, create a country name and a
-    #DXCC_Entity_Code_Enumeration tuple. If not, create a country name
-    #and a None tuple.
-    #
-    if Primary_Administrative_Subdivision_Enumeration_number in locals():
-        DXCC_Entity_Code_Enumeration[i] = (
-            DXCC_Entity_Code_Enumeration[i],
-            eval(Primary_Administrative_Subdivision_Enumeration_number)
-            )
-    else:
-        DXCC_Entity_Code_Enumeration[i] = (
-            DXCC_Entity_Code_Enumeration[i], None)
-
 QSL_Medium_Enumeration = {
     "CARD" : "QSO confirmation via paper QSL card",
     "EQSL" : "QSO confirmation via eQSL.cc",
@@ -3514,41 +1007,6 @@ QSO_Upload_Status_Enumeration = {
 
 Secondary_Administrative_Subdivision_Enumeration = "TBS"
 
-Enumeration_for_US_Counties_DXCC_Entity_Code_6 = {
-    "AK,Aleutians East" : ("Aleutians East", "Alaska Third Judicial District"),
-    "AK,Aleutians West" : ("Aleutians West", "Alaska Third Judicial District"),
-    "AK,Anchorage" : ("Anchorage", "Alaska Third Judicial District"),
-    "AK,Bethel" : ("Bethel", "Alaska Fourth Judicial District"),
-    "AK,Bristol Bay" : ("Bristol Bay", "Alaska Third Judicial District"),
-    "AK,Denali" : ("Denali", "Alaska Fourth Judicial District"),
-    "AK,Dillingham" : ("Dillingham", "Alaska Third Judicial District"),
-    "AK,Fairbanks" : ("Fairbanks", "Alaska Fourth Judicial District"),
-    "AK,Fairbanks North Star" : ("Fairbanks North Star", "Alaska Fourth Judicial District"),
-    "AK,Haines" : ("Haines", "Alaska First Judicial District"),
-    "AK,Juneau" : ("Juneau", "Alaska First Judicial District"),
-    "AK,Hoonah-Angoon" : ("Hoonah-Angoon", "Alaska First Judicial District"),
-    "AK,Kenai Peninsula" : ("Kenai Peninsula", "Alaska Third Judicial District"),
-    "AK,Ketchikan Gateway" : ("Ketchikan Gateway", "Alaska First Judicial District"),
-    "AK,Kodiak Island" : ("Kodiak Island", "Alaska Third Judicial District"),
-    "AK,Kusilvak" : ("Kusilvak", "Alaska Second Judicial District"),
-    "AK,Lake and Peninsula" : ("Lake and Peninsula", "Alaska Third Judicial District"),
-    "AK,Matanuska-Susitna" : ("Matanuska-Susitna", "Alaska Third Judicial District"),
-    "AK,Nome" : ("Nome", "Alaska Second Judicial District"),
-    "AK,North Slope" : ("North Slope", "Alaska Second Judicial District"),
-    "AK,Northwest Arctic" : ("Northwest Arctic", "Alaska Second Judicial District"),
-    "AK,Petersburg" : ("Petersburg", "Alaska First Judicial District"),
-    "AK,Pribilof Islands" : ("Pribilof Islands", "Alaska Third Judicial District"),
-    "AK,Prince of Wales-Hyder" : ("Prince of Wales-Hyder", "Alaska First Judicial District"),
-    "AK,Saint Matthew Island" : ("Saint Matthew Island", "Alaska Fourth Judicial District"),
-    "AK,Sitka" : ("Sitka", "Alaska First Judicial District"),
-    "AK,Skagway" : ("Skagway", "Alaska First Judicial District"),
-    "AK,Southeast Fairbanks" : ("Southeast Fairbanks", "Alaska Fourth Judicial District"),
-    "AK,Valdez-Cordova" : ("Valdez-Cordova", "Alaska Third Judicial District"),
-    "AK,Wales-Hyder" : ("Wales-Hyder", "Alaska First Judicial District"),
-    "AK,Wrangell" : ("Wrangell", "Alaska First Judicial District"),
-    "AK,Yakutat" : ("Yakutat", "Alaska First Judicial District")
-}
-
 Region_Enumeration = {
     "NONE" : (None, "Not within a WAE or CQ region that is within a DXCC entity", None, None),
     "IV" : ("206", "ITU Vienna", "4U1V", ("CQ", "WAE",)),
@@ -3586,6 +1044,66 @@ state_enumeration = {
 #re_band = r'\d+\.?\d*[M|CM|MM]'   Get rid of this?
 re_frequency = r'(\.\d+)|(\d+\.?\d*)'
 
+#
+#Regular expressions used by the data type validators. They're compiled
+#once (the first time they're used, see LazyPattern) rather than looked
+#up in the re module's cache on every call, since the validators are
+#called for every field of every record.
+#
+re_boolean = LazyPattern(r'[YN]', re.IGNORECASE)
+re_digit = LazyPattern(r'[0-9]')
+re_integer = LazyPattern(r'-?\d+')
+re_positive_integer = LazyPattern(r'\d+')
+re_number = LazyPattern(r'-?((\.\d+)|(\d+\.?\d*))')
+re_character = LazyPattern(r'[\ -~]')
+re_string = LazyPattern(r'[\ -~]+')
+re_only_cr = LazyPattern(onlycr_re)
+re_only_lf = LazyPattern(onlylf_re)
+re_cr_or_lf = LazyPattern(cr_or_lf_re)
+re_date = LazyPattern(r'(\d{4})(\d{2})(\d{2})')
+re_time = LazyPattern(r'(\d{2})(\d{2})(\d{0,2})')
+re_location = LazyPattern(r'([NSEW])(\d{3}) (\d{2})\.(\d{3})')
+re_longitude = LazyPattern(r'[EW]')
+re_latitude = LazyPattern(r'[NS]')
+re_grid_square = LazyPattern(r'[A-R]{2}(\d{2}([A-X]{2}(\d{2})?)?)?',
+    re.IGNORECASE)
+re_grid_square_pairs = LazyPattern(r'.{2}')
+re_whitespace = LazyPattern(r'\s')
+re_credit_medium = LazyPattern(r'(.*?):(.+)')
+re_wwff_ref = LazyPattern(r'[A-Z0-9]{1,4}F{2}-\d{4}', re.IGNORECASE)
+re_callsign = LazyPattern(r'[A-Z0-9]{3,}', re.IGNORECASE)
+re_callsign_slash = LazyPattern(r'[A-Z0-9]{3,}(/[A-Z0-9]+|$)',
+    re.IGNORECASE)
+re_default_split = LazyPattern(default_split)
+
+#
+#Maidenhead locator field checks for GridSquare. Each pair of characters
+#in the locator is checked against its pattern and reported with its
+#error.
+#
+grid_square_verify = (
+    (LazyPattern(r'[A-R]{2}', re.IGNORECASE), """
+    "{}" is not a correctly formatted Maidenhead locator.
+    The first two characters are the field encodes and each character
+    must be "A"-"R".
+"""),
+    (LazyPattern(r'\d{2}'), """
+    "{}" is not a correctly formatted Maidenhead locator.
+    The second two characters are the square encodes and must be
+    "00"-"99".
+"""),
+    (LazyPattern(r'[A-X]{2}', re.IGNORECASE), """
+    "{}" is not a correctly formatted Maidenhead locator.
+    The third two characters are the subsquare encodes and each
+    character must be "a"-"x".
+"""),
+    (LazyPattern(r'\d{2}'), """
+    "{}" is not a correctly formatted Maidenhead locator.
+    The fourth two characters are the extended square encodes and must
+    be "00"-"99".
+""")
+    )
+
 def Boolean(test):
     """
     ADIF Boolean field must be a "Y", "N", "y" or "n", error otherwise.
@@ -3605,7 +1123,7 @@ def Boolean(test):
         (test, str),
     ))
 
-    if re.fullmatch(r'[YN]', test, flags=re.IGNORECASE):
+    if re_boolean.fullmatch(test):
         return("")
 
     return("""
@@ -3631,7 +1149,7 @@ def Digit(test):
         (test, str),
     ))
 
-    if re.fullmatch(r'[0-9]', test):
+    if re_digit.fullmatch(test):
         return("")
 
     return("""
@@ -3658,7 +1176,7 @@ def Integer(test):
         (test, str),
     ))
 
-    if re.fullmatch(r'-?\d+', test):
+    if re_integer.fullmatch(test):
         return("")
 
     return("""
@@ -3688,7 +1206,7 @@ def PositiveInteger(test):
         (test, str),
     ))
 
-    if not re.fullmatch(r'\d+', test):
+    if not re_positive_integer.fullmatch(test):
         #
         #Incorrect format
         #
@@ -3732,7 +1250,7 @@ def Number(test):
         (test, str),
     ))
 
-    if re.fullmatch(r'-?((\.\d+)|(\d+\.?\d*))', test):
+    if re_number.fullmatch(test):
         return("")
 
     return("""
@@ -3771,7 +1289,7 @@ def Character(test):
     Character field was passed multiple characters: "{}"
 """.format(test))
 
-    if re.fullmatch(r'[\ -~]', test):
+    if re_character.fullmatch(test):
         return("")
 
     return("""
@@ -3803,7 +1321,7 @@ def String(test):
     Zero-length string not allowed. Must have at least one character.
 """)
 
-    if re.fullmatch(r'[\ -~]+', test):
+    if re_string.fullmatch(test):
         return("")
 
     return("""
@@ -3884,7 +1402,7 @@ def AwardList(test):
 
     errors = ""
     for i in test.split(","):
-        if i.upper() not in Award_Enumeration:
+        if i.upper() not in get_enumerations().Award_Enumeration:
             errors += """
     "{}" is not a valid award.
 """.format(i)
@@ -3893,7 +1411,7 @@ def AwardList(test):
         errors += """
     Awards must be one of:
         "{}"
-""".format('"\n        "'.join(sorted(Award_Enumeration)))
+""".format('"\n        "'.join(sorted(get_enumerations().Award_Enumeration)))
 
     return(errors)
 
@@ -3957,7 +1475,7 @@ def MultilineString(test):
     #See if there are any carriage returns without line feeds or
     #vice-versa
     #
-    if re.search(onlycr_re, test) or re.search(onlylf_re, test):
+    if re_only_cr.search(test) or re_only_lf.search(test):
         errors = """
     Multiline strings must have carriage return-line feed pairs. Either
     a linefeed without a carriage return or a carriage return without a
@@ -3968,7 +1486,7 @@ def MultilineString(test):
     #Now remove all the carriage returns and linefeeds and make sure all
     #the rest of the text is in-range
     #
-    return(errors + String(re.sub(cr_or_lf_re, '', test)))
+    return(errors + String(re_cr_or_lf.sub('', test)))
 
 def Date(test):
     """
@@ -3992,12 +1510,12 @@ def Date(test):
 
     errors = ""
 
-    ymd = re.findall(r'^(\d{4})(\d{2})(\d{2})$', test)
+    ymd = re_date.fullmatch(test)
     if ymd:
         #
         #Get year, month and day and validate
         #
-        (year, month, day) = ymd[0]
+        (year, month, day) = ymd.groups()
 
         #
         #Make sure month is in range
@@ -4049,12 +1567,12 @@ def Time(test):
 
     errors = ""
 
-    hms = re.findall(r'^(\d{2})(\d{2})(\d{0,2})$', test)
+    hms = re_time.fullmatch(test)
     if hms:
         #
         #Get hour, minute and [maybe] seond and validate
         #
-        (hour, minute, second) = hms[0]
+        (hour, minute, second) = hms.groups()
 
         #
         #Make sure hour is in range
@@ -4141,7 +1659,7 @@ def Location(test):
         (test, str),
     ))
 
-    loc = re.findall(r'^([NSEW])(\d{3}) (\d{2})\.(\d{3})$', test)
+    loc = re_location.fullmatch(test)
     if not loc:
         return("""
     "{}" does not have correct location format: XDDD MM.MMM
@@ -4153,7 +1671,7 @@ def Location(test):
     #
     #Check ranges
     #
-    (cardinal, degrees, minutes, decimal_minutes) = loc[0]
+    (cardinal, degrees, minutes, decimal_minutes) = loc.groups()
 
     errors = ""
 
@@ -4205,7 +1723,7 @@ def Longitude(test):
 
     errors = Location(test)
     
-    if not re.match(r'[EW]', test):
+    if not re_longitude.match(test):
         errors += """
     For longitude, "{}" must start with "E" or "W".
 """.format(test)
@@ -4238,7 +1756,7 @@ def Latitude(test):
     if errors:
         return(errors)
 
-    if not re.match(r'[NS]', test):
+    if not re_latitude.match(test):
         return("""
     For latitude, "{}" must start with "N" or "S".
 """.format(test))
@@ -4248,7 +1766,7 @@ def Latitude(test):
     #check, and that passed if we're here.
     #
     (cardinal, degrees, minutes, decimal_minutes) = \
-        re.findall(r'^(.)(\d{3}) (\d{2})\.(\d{3})$', test)[0]
+        re_location.fullmatch(test).groups()
     if int(degrees) > 90:
         errors += """
     "{}" degrees in "{}" (DDD in XDDD MM.MMM), is greater than 090
@@ -4289,7 +1807,15 @@ def GridSquare(test):
         (test, str),
     ))
 
-    fields = re.findall(r'.{2}', test)
+    #
+    #Correctly formatted locators are by far the most common, check the
+    #whole thing in one shot before breaking it into pairs to find out
+    #what's wrong.
+    #
+    if re_grid_square.fullmatch(test):
+        return("")
+
+    fields = re_grid_square_pairs.findall(test)
 
     if (not fields) or (len(fields) > 4):
         return("""
@@ -4298,29 +1824,6 @@ def GridSquare(test):
     each "U" is "a"-"x" and "EE" is "00"-"99"
 """.format(test))
 
-    field_verify = (
-        (r'[A-R]{2}', """
-    "{}" is not a correctly formatted Maidenhead locator.
-    The first two characters are the field encodes and each character
-    must be "A"-"R".
-"""),
-        (r'\d{2}', """
-    "{}" is not a correctly formatted Maidenhead locator.
-    The second two characters are the square encodes and must be
-    "00"-"99".
-"""),
-        (r'[A-X]{2}', """
-    "{}" is not a correctly formatted Maidenhead locator.
-    The third two characters are the subsquare encodes and each
-    character must be "a"-"x".
-"""),
-        (r'\d{2}', """
-    "{}" is not a correctly formatted Maidenhead locator.
-    The fourth two characters are the extended square encodes and must
-    be "00"-"99".
-""")
-        )
-
     #
     #Start with no errors
     #
@@ -4330,9 +1833,8 @@ def GridSquare(test):
     #For all fields present, assure their format is correct
     #
     for i in range(len(fields)):
-        if not re.fullmatch(field_verify[i][0], fields[i],
-            flags=re.IGNORECASE):
-            errors += field_verify[i][1].format(test)
+        if not grid_square_verify[i][0].fullmatch(fields[i]):
+            errors += grid_square_verify[i][1].format(test)
 
     return(errors)
 
@@ -4359,7 +1861,7 @@ def GridSquareList(test):
     #
     #Make sure there's no blanks in the list
     #
-    if re.search(r'\s', test):
+    if re_whitespace.search(test):
         return("""
     The GridSquareList contains blanks. It may only contain Grid Squares
     seperated by commas.
@@ -4401,13 +1903,14 @@ def Arrl_Sect(test):
         (test, str),
     ))
 
-    if test.upper() in ARRL_Section_Enumeration:
+    if test.upper() in get_enumerations().ARRL_Section_Enumeration:
         return("")
 
     return("""
     "{}" not a valid ARRL section, must be one of:
         "{}"
-""".format(test, '"\n        "'.join(sorted(ARRL_Section_Enumeration.keys()))))
+""".format(test, '"\n        "'.join(sorted(
+            get_enumerations().ARRL_Section_Enumeration.keys()))))
 
 def Band(test):
     """
@@ -4513,13 +2016,14 @@ def Contest(test):
         (test, str),
     ))
 
-    if test.upper() in Contest_ID_Enumeration:
+    if test.upper() in get_enumerations().Contest_ID_Enumeration:
         return("")
 
     return("""
     "{}" not a valid contest, must be one of:
         "{}"
-""".format(test, '"\n        "'.join(sorted(Contest_ID_Enumeration.keys()))))
+""".format(test, '"\n        "'.join(sorted(
+            get_enumerations().Contest_ID_Enumeration.keys()))))
 
 def CreditList(test):
     """
@@ -4547,13 +2051,13 @@ def CreditList(test):
         #
         #See if this has any QSL medium ennumerations
         #
-        match = re.findall(r'^(.*?):(.+)$', line)
+        match = re_credit_medium.fullmatch(line)
         if match:
             #
-            #If has medium enumerations. Split on "&" and check them.
+            #If has medium get_enumerations(). Split on "&" and check them.
             #Change "line" to just the credit enumeration.
             #
-            (line, qsl_list) = match[0]
+            (line, qsl_list) = match.groups()
             bad_qsl = []
             for qsl in qsl_list.split("&"):
                 if qsl.upper() not in QSL_Medium_Enumeration:
@@ -4567,7 +2071,7 @@ def CreditList(test):
         #
         #Now check the Credit field itself.
         #
-        if line.upper() not in Credit_Enumeration:
+        if line.upper() not in get_enumerations().Credit_Enumeration:
             errors += """
     "{}" is not a valid contest credit.
 """.format(line)
@@ -4576,7 +2080,7 @@ def CreditList(test):
         errors += """
     Contest credits must be one of:
         "{}"
-""".format('"\n        "'.join(sorted(Credit_Enumeration)))
+""".format('"\n        "'.join(sorted(get_enumerations().Credit_Enumeration)))
 
     if medium:
         for line, qsl in sorted(medium.items()):
@@ -4614,8 +2118,8 @@ def CreditList_or_AwardList(test):
         (test, str),
     ))
 
-    credit_award_enumeration = list(Credit_Enumeration) \
-        + list(Award_Enumeration)
+    credit_award_enumeration = list(get_enumerations().Credit_Enumeration) \
+        + list(get_enumerations().Award_Enumeration)
 
     errors = ""
     bad_medium = {}
@@ -4625,12 +2129,12 @@ def CreditList_or_AwardList(test):
         #
         #See if this has any QSL medium ennumerations
         #
-        match = re.findall(r'^(.*?):(.+)$', line)
+        match = re_credit_medium.fullmatch(line)
         if match:
             #
             #Break out the Credit and QSL medium enumeration
             #
-            (line, qsl_list) = match[0]
+            (line, qsl_list) = match.groups()
 
             #
             #If this has a QSL medium enumeration after it, it MUST be
@@ -4640,7 +2144,7 @@ def CreditList_or_AwardList(test):
             #If invalid, eliminate duplicates and don't bother to check
             #the QSL Medium Enumeration.
             #
-            if line.upper() not in Credit_Enumeration:
+            if line.upper() not in get_enumerations().Credit_Enumeration:
                 bad_credit[line] = True
                 continue
 
@@ -4673,7 +2177,7 @@ def CreditList_or_AwardList(test):
         errors += """
     Contest credits must be one of:
         "{}"
-""".format('"\n        "'.join(sorted(Credit_Enumeration)))
+""".format('"\n        "'.join(sorted(get_enumerations().Credit_Enumeration)))
 
     if bad_medium:
         #
@@ -4703,6 +2207,162 @@ def CreditList_or_AwardList(test):
 
     return(errors)
 
+class DXCCEntity:
+    """
+    One DXCC entity from the DXCC entity index (see dxcc_entity and
+    dxcc_entity_by_name).
+
+    Attributes:
+        code:
+            DXCC entity code (integer)
+        name:
+            Entity name
+        deleted:
+            True if the entity has been deleted from the DXCC list.
+            DXCC_Entity_Code_Enumeration only has current entities, so
+            this is False for every entity in the index.
+        subdivisions:
+            Dictonary of the entity's primary administrative
+            subdivisions (STATE/MY_STATE codes), empty if none are
+            defined. Same layout as the
+            Primary_Administrative_Subdivision_Enumeration tables.
+        secondary_subdivisions:
+            Dictonary of the entity's secondary administrative
+            subdivisions (CNTY/MY_CNTY) by upper cased name, empty if
+            none are defined.
+    """
+
+    __slots__ = ("code", "name", "deleted", "subdivisions",
+        "secondary_subdivisions")
+
+    def __init__(self, code, name, deleted, subdivisions,
+            secondary_subdivisions=None):
+        self.code = code
+        self.name = name
+        self.deleted = deleted
+        self.subdivisions = subdivisions
+        self.secondary_subdivisions = secondary_subdivisions or {}
+
+    def __repr__(self):
+        return("DXCCEntity({!r}, {!r})".format(self.code, self.name))
+
+    def __reduce__(self):
+        #
+        #Unpickle (from a worker process) as the entity in the index,
+        #so entities can still be compared by identity.
+        #
+        return((dxcc_entity, (self.code,)))
+
+#
+#DXCC entity index by code (integer) and by upper cased name. Built by
+#build_dxcc_index the first time it's needed.
+#
+dxcc_entity_codes = None
+dxcc_entity_names = None
+
+def build_dxcc_index():
+    """
+    Build the DXCC entity index from DXCC_Entity_Code_Enumeration and
+    the Primary_Administrative_Subdivision_Enumeration and secondary
+    subdivision (county) tables. Only done once.
+
+    Returns:
+        Dictonary of DXCCEntity by code
+    """
+
+    global dxcc_entity_codes
+    global dxcc_entity_names
+
+    if dxcc_entity_codes is not None:
+        return(dxcc_entity_codes)
+
+    subdivision_tables = (
+        get_enumerations().Primary_Administrative_Subdivision_Enumerations)
+    secondary_subdivision_tables = (
+        get_enumerations().Secondary_Administrative_Subdivision_Enumerations)
+
+    codes = {}
+    names = {}
+    for (code, name) in (
+            get_enumerations().DXCC_Entity_Code_Enumeration.items()):
+        counties = {}
+        for (county, info) in secondary_subdivision_tables.get(code,
+                {}).items():
+            counties[county.upper()] = info
+
+        entity = DXCCEntity(int(code), name, False,
+            subdivision_tables.get(code, {}), counties)
+        codes[entity.code] = entity
+        names[name.upper()] = entity
+
+    dxcc_entity_names = names
+    dxcc_entity_codes = codes
+
+    return(dxcc_entity_codes)
+
+def dxcc_entity(code):
+    """
+    Look up a DXCC entity by its entity code.
+
+    Arguments:
+        code:
+            DXCC entity code, integer or string (as in a DXCC field).
+            Strings must be written the way the ADIF DXCC field is, no
+            leading zeros or blanks.
+
+    Returns:
+        DXCCEntity if found
+        None if not a valid DXCC entity code
+    """
+
+    validate_arg_type((
+        (code, int, str),
+    ))
+
+    codes = dxcc_entity_codes
+    if codes is None:
+        codes = build_dxcc_index()
+
+    if isinstance(code, str):
+        text = code
+        try:
+            code = int(text)
+        except ValueError:
+            return(None)
+
+        if str(code) != text:
+            return(None)
+
+    return(codes.get(code))
+
+def dxcc_entity_by_name(name):
+    """
+    Look up a DXCC entity by its name, ignoring character case.
+
+    Arguments:
+        name:
+            DXCC entity name, such as "UNITED STATES OF AMERICA"
+
+    Returns:
+        DXCCEntity if found
+        None if not a valid DXCC entity name
+    """
+
+    validate_arg_type((
+        (name, str),
+    ))
+
+    if dxcc_entity_names is None:
+        build_dxcc_index()
+
+    return(dxcc_entity_names.get(name.upper()))
+
+#
+#Printable list of DXCC entity codes for Dxcc error messages, built the
+#first time it's needed.
+#
+dxcc_listing = None
+
 def Dxcc(test):
     """
     ADIF Dxcc field may only contain only one of an explicit list of
@@ -4723,28 +2383,30 @@ def Dxcc(test):
         (test, str),
     ))
 
-    if test.upper() in DXCC_Entity_Code_Enumeration:
+    if dxcc_entity(test) is not None:
         return("")
 
+    global dxcc_listing
+
     #
     #Convert the strings that are numbers into integers, sort, then
-    #print so they come out in a pretty order.
+    #print so they come out in a pretty order. The list never changes,
+    #so only build it the first time it's needed.
     #
-    dxcc_numbers = []
-    for num in DXCC_Entity_Code_Enumeration.keys():
-        dxcc_numbers.append(int(num))
+    if dxcc_listing is None:
+        #
+        #Sort in correct numerical order and convert back into strings
+        #
+        dxcc_string = []
+        for num in sorted(build_dxcc_index()):
+            dxcc_string.append("{:>5}".format('"{}"'.format(num)))
 
-    #
-    #Sort in correct numerical order and convert back into strings
-    #
-    dxcc_string = []
-    for num in sorted(dxcc_numbers):
-        dxcc_string.append("{:>5}".format('"{}"'.format(num)))
+        dxcc_listing = "\n        ".join(dxcc_string)
 
     return("""
     "{}" not a valid DXCC entity code, must be one of:
         {}
-""".format(test, "\n        ".join(dxcc_string)))
+""".format(test, dxcc_listing))
 
 def QSL_Rcvd(test):
     """
@@ -4878,8 +2540,7 @@ def WWFFRef(test):
         (test, str),
     ))
 
-    if re.fullmatch(r'[A-Z0-9]{1,4}F{2}-\d{4}', test,
-        flags=re.IGNORECASE):
+    if re_wwff_ref.fullmatch(test):
         return("")
 
     return("""
@@ -4888,6 +2549,77 @@ def WWFFRef(test):
     characters (A-Z, 0-9) and nnnn is "0000" - "9999".
 """.format(test))
 
+#
+#Enumeration validation functions that are a simple lookup of the upper
+#cased contents in a table, and that table. Used to check contents
+#without building the validation function's error text.
+#
+enumeration_tables = {
+    Ant_Path : Ant_Path_Enumeration,
+    Band : Band_Enumeration,
+    QSO_Upload_Status : QSO_Upload_Status_Enumeration,
+    Continent : Continent_Enumeration,
+    QSL_Rcvd : QSL_Rcvd_Enumeration,
+    QSL_Sent : QSL_Sent_Enumeration,
+    QSL_Via : QSL_Via_Enumeration,
+    Mode : Mode_Enumeration,
+    Region : Region_Enumeration
+    }
+
+#
+#Same, for the tables in hamlibIO_enumerations. These are added to
+#enumeration_tables the first time they're used, so that the tables
+#aren't loaded until they're needed.
+#
+lazy_enumeration_tables = {
+    Arrl_Sect : "ARRL_Section_Enumeration",
+    Contest : "Contest_ID_Enumeration",
+    Dxcc : "DXCC_Entity_Code_Enumeration"
+    }
+
+#
+#Tables that used to be defined in hamlibIO.py, so hamlibIO.<table>
+#still works (see __getattr__)
+#
+enumerations_tables = ("ARRL_Section_Enumeration", "Award_Enumeration",
+    "Contest_ID_Enumeration", "Credit_Enumeration",
+    "DXCC_Entity_Code_Enumeration",
+    "Enumeration_for_US_Counties_DXCC_Entity_Code_6")
+
+def __getattr__(name):
+    """
+    Module attributes that aren't loaded until they're used:
+    enumerations (the hamlibIO_enumerations module), its tables,
+    band_codes, continent_codes, mode_codes,
+    submode_codes, qso_table_coded_fields and validation_tests.
+
+    Arguments:
+        name:
+            Attribute name
+
+    Returns:
+        The attribute's value
+    """
+
+    if name == "enumerations":
+        return(get_enumerations())
+
+    if (name in enumerations_tables) or name.startswith(
+            "Primary_Administrative_Subdivision_Enumeration_"):
+        return(getattr(get_enumerations(), name))
+
+    if name in enumeration_code_attributes:
+        return(get_enumeration_codes(enumeration_code_attributes[name]))
+
+    if name == "qso_table_coded_fields":
+        return(get_qso_table_coded_fields())
+
+    if name == "validation_tests":
+        return(get_validation_tests())
+
+    raise AttributeError("module 'hamlibIO' has no attribute '{}'".format(
+        name))
+
 ########################################################################
 ########################################################################
 #
@@ -5029,7 +2761,7 @@ record_fields = {
     "MY_FISTS" : ("PositiveInteger",),
     "MY_GRIDSQUARE" : ("GridSquare",),
     "MY_IOTA" : ("IOTARefNo",),
-    "MY_IOTA_ISLAND_ID" : "PositiveInteger",
+    "MY_IOTA_ISLAND_ID" : ("PositiveInteger",),
     "MY_ITU_ZONE" : ("PositiveInteger",),
     "MY_LAT" : ("Location",),
     "MY_LON" : ("Location",),
@@ -5038,7 +2770,7 @@ record_fields = {
     "MY_RIG" : ("String",),
     "MY_SIG" : ("String",),
     "MY_SIG_INFO" : ("String",),
-    "MY_SOTA_REF" : "SOTARef",
+    "MY_SOTA_REF" : ("SOTARef",),
     "MY_STATE" : TBS,
     "MY_STREET" : ("String",),
     "MY_USACA_COUNTIES" : TBS,
@@ -5081,7 +2813,7 @@ record_fields = {
     "SIG_INFO" : ("String",),
     "SILENT_KEY" : ("Boolean",),
     "SKCC" : ("String",),
-    "SOTA_REF" : "SOTARef",
+    "SOTA_REF" : ("SOTARef",),
     "SRX" : ("Integer",),
     "SRX_STRING" : ("String",),
     "STATE" : TBS,
@@ -5095,7 +2827,7 @@ record_fields = {
     "TIME_ON" : ("Time",),
     "TX_PWR" : ("PositiveInteger",),
     "UKSMG" : ("PositiveInteger",),
-    "USACA_COUNTIES" : "SecondarySubdivisionList",
+    "USACA_COUNTIES" : ("SecondarySubdivisionList",),
     "VE_PROV" : ("String",),
     "VUCC_GRIDS" : ("GridSquareList",),
     "WEB" : ("String",),
@@ -5106,25 +2838,25 @@ record_fields = {
 #XML supports the internationalization fields (UTF-8)
 #
 xml_subset_record_fields = {
-    "ADDRESS_INTL" : "IntlMultilineString",
-    "COMMENT_INTL" : "IntlString",
-    "COUNTRY_INTL" : "IntlString",
-    "MY_ANTENNA_INTL" : "IntlString",
-    "MY_CITY_INTL" : "IntlString",
-    "MY_COUNTRY_INTL" : "IntlString",
-    "MY_NAME_INTL" : "IntlString",
-    "MY_POSTAL_CODE_INTL" : "IntlString",
-    "MY_RIG_INTL" : "IntlString",
-    "MY_SIG_INTL" : "IntlString",
-    "MY_SIG_INFO_INTL" : "IntlString",
-    "MY_STREET_INTL" : "IntlString",
-    "NAME_INTL" : "IntlString",
-    "NOTES_INTL" : "IntlMultilineString",
-    "QSLMSG_INTL" : "IntlMultilineString",
-    "QTH_INTL" : "IntlString",
-    "RIG_INTL" : "IntlMultilineString",
-    "SIG_INTL" : "IntlString",
-    "SIG_INFO_INTL" : "IntlString",
+    "ADDRESS_INTL" : ("IntlMultilineString",),
+    "COMMENT_INTL" : ("IntlString",),
+    "COUNTRY_INTL" : ("IntlString",),
+    "MY_ANTENNA_INTL" : ("IntlString",),
+    "MY_CITY_INTL" : ("IntlString",),
+    "MY_COUNTRY_INTL" : ("IntlString",),
+    "MY_NAME_INTL" : ("IntlString",),
+    "MY_POSTAL_CODE_INTL" : ("IntlString",),
+    "MY_RIG_INTL" : ("IntlString",),
+    "MY_SIG_INTL" : ("IntlString",),
+    "MY_SIG_INFO_INTL" : ("IntlString",),
+    "MY_STREET_INTL" : ("IntlString",),
+    "NAME_INTL" : ("IntlString",),
+    "NOTES_INTL" : ("IntlMultilineString",),
+    "QSLMSG_INTL" : ("IntlMultilineString",),
+    "QTH_INTL" : ("IntlString",),
+    "RIG_INTL" : ("IntlMultilineString",),
+    "SIG_INTL" : ("IntlString",),
+    "SIG_INFO_INTL" : ("IntlString",),
     }
 
 #
@@ -5135,12 +2867,12 @@ xml_record_fields = {**record_fields, **xml_subset_record_fields}
 #
 #USERDEFn is a special case
 #
-re_userdef = r'USERDEF(\d+)'
+re_userdef = LazyPattern(r'USERDEF(\d+)')
 
 def userdef(test):
-    udnum = re.findall(r'USERDEF(\d+)', test)
+    udnum = re_userdef.search(test)
     if udnum:
-        udnum = udnum[0]
+        udnum = udnum.group(1)
         if int(udnum) < 1:
             return("""
     ADIF USERDEF number "{}" invalid, it must be greater than 0:
@@ -5155,6 +2887,114 @@ def userdef(test):
 
     return("")
 
+#
+#Application-defined fields, APP_{PROGRAMID}_{FIELDNAME}
+#
+re_app_field = LazyPattern(r'APP_([^_]+)_(.+)', re.IGNORECASE)
+
+def application_field(test):
+    """
+    Validation function (and field definition) of application-defined
+    fields, APP_{PROGRAMID}_{FIELDNAME}. Their contents belong to the
+    application that wrote them, so they're passed through unchecked.
+
+    Arguments:
+        test:
+            String to test
+
+    Returns:
+        Null string ("")
+    """
+
+    validate_arg_type((
+        (test, str),
+    ))
+
+    return("")
+
+def field_definition(field_definitions, field_name):
+    """
+    Look up a field's entry in a field definition dictonary.
+    Application-defined fields (APP_{PROGRAMID}_{FIELDNAME}) are valid in
+    every dictonary, with application_field as their entry. USERDEFn
+    header fields (n greater than 0) share the USERDEF entry of a
+    dictonary that has one (header_fields).
+
+    Arguments:
+        field_definitions:
+            Dictonary of valid field names.
+        field_name:
+            Upper case field name
+
+    Returns:
+        The field's entry, None if it isn't a valid field.
+    """
+
+    field_type = field_definitions.get(field_name)
+    if field_type is not None:
+        return(field_type)
+
+    if re_app_field.fullmatch(field_name):
+        return(application_field)
+
+    if ("USERDEF" in field_definitions) and re_userdef.fullmatch(
+            field_name) and not userdef(field_name):
+        return(field_definitions["USERDEF"])
+
+    return(None)
+
+#
+#Data types of user-defined fields, by the data type indicator of their
+#USERDEFn header field. Enumeration values are strings. A field without
+#a data type indicator is passed through unchecked.
+#
+userdef_data_types = {indicator : (data_type,)
+    for data_type, (indicator, validator) in data_types.items()
+    if indicator and validator}
+userdef_data_types["E"] = ("String",)
+userdef_unknown_data_type = ("IntlMultilineString",)
+
+def userdef_field_definitions(header, header_types=None):
+    """
+    Field definitions for the user-defined fields declared by the
+    USERDEFn fields of an ADIF header, for checking the records that
+    use them. Each field's data type is taken from its USERDEFn field's
+    data type indicator. The enumeration or range a USERDEFn field may
+    give ("SWEATERSIZE,{S,M,L}", "SHOESIZE,{5:20}") isn't checked.
+
+    Arguments:
+        header:
+            Dictonary of header fields and their contents.
+        header_types: Default None
+            Dictonary of upper case header field names and their data
+            type indicators, see iter_ADIF_records.
+
+    Returns:
+        Dictonary of upper case user-defined field names and their
+        field definitions. Empty if the header doesn't declare any.
+    """
+
+    validate_arg_type((
+        (header, dict),
+        (header_types, dict, None),
+    ))
+
+    definitions = {}
+    for field_name, field_value in header.items():
+        upper_name = field_name.upper()
+        if (not re_userdef.fullmatch(upper_name)) or userdef(upper_name):
+            continue
+
+        name = field_value.split(",", 1)[0].strip().upper()
+        if (not name) or (name in xml_record_fields):
+            continue
+
+        indicator = (header_types or {}).get(upper_name, "")
+        definitions[name] = userdef_data_types.get(indicator.upper(),
+            userdef_unknown_data_type)
+
+    return(definitions)
+
 def dictonary_duplicates(dictonary):
     """
     Verify that there are not any duplicate keys that differ only in
@@ -5231,7 +3071,9 @@ def get_data_type_indicator(dti):
         (dti, tuple, type(get_data_type_indicator)),
     ))
 
-    if callable(dti):
+    if dti is application_field:
+        return("")
+    elif callable(dti):
         return("E")
     else:
         return(data_types[dti[0]][0])
@@ -5255,13 +3097,14 @@ lib_errors = ""
 #table (or, in the case of the enumeration types, there should be a
 #callable routine). Assure one or the other exists.
 #
-#We use the table's names (strings) for error reporting reasons, see the
-#error message at the bottom of the loop which uses the string in the
-#error message.
+#We keep the table's names (strings) for error reporting reasons, see
+#the error message at the bottom of the loop which uses the string in
+#the error message.
 #
-for table in ("header_fields",
-        "record_fields", "xml_subset_record_fields"):
-    for key, value in eval(table).items():
+for (table, fields) in (("header_fields", header_fields),
+        ("record_fields", record_fields),
+        ("xml_subset_record_fields", xml_subset_record_fields)):
+    for key, value in fields.items():
         #
         #The value should be a tuple of ADIF data types OR a callable
         #function if the data type is ennumerated.
@@ -5273,7 +3116,14 @@ for table in ("header_fields",
             #
             continue
 
-        if isinstance(value, tuple):
+        if not isinstance(value, tuple):
+            lib_errors += """
+Error: In hamlibIO.py, {0} field "{1}" has a data type of
+       "{2}" which is neither a tuple of data types nor an
+       enumeration validation function.
+""".format(table, key, value)
+
+        else:
             #
             #It's a tuple of one or more data types. Check that all data
             #types are valid
@@ -5297,6 +3147,162 @@ if lib_errors:
     print(lib_errors)
     raise hamlibIOerror("Data type not found")
 
+########################################################################
+########################################################################
+#
+# Compiled field validation plans. For each field definition, the
+# FieldCheck that validates its contents, so validating a field is a
+# dictonary lookup and a call.
+#
+########################################################################
+########################################################################
+
+class FieldCheck:
+    """
+    Compiled validation plan for one field definition (see
+    compile_field_type): the two ways a field's contents are checked.
+    Everything that validates fields - validate_field, check_field,
+    check_record, the writers and the readers built on them - checks
+    through these.
+
+    Attributes:
+        field_type:
+            The field's entry in a field definition dictonary (such as
+            record_fields) - a tuple of data types or an enumeration
+            validation function.
+        validate:
+            Function returning a null string ("") if field contents are
+            valid, otherwise the error text.
+        valid:
+            Function returning True if field contents are valid, False
+            if not, without generating any error text.
+    """
+
+    __slots__ = ("field_type", "validate", "valid")
+
+    def __init__(self, field_type, validate, valid):
+        self.field_type = field_type
+        self.validate = validate
+        self.valid = valid
+
+    def __repr__(self):
+        return("FieldCheck({!r})".format(self.field_type))
+
+def multiple_data_type_validator(validators):
+    """
+    Create a validation function for a field that can be any one of
+    several data types (see compile_field_type).
+
+    Arguments:
+        validators:
+            Tuple of data type validation functions
+
+    Returns:
+        Function that validates field contents against each data type
+        and returns a null string ("") if any one is valid, or all of
+        the data types' error strings if none are.
+    """
+
+    def validator(field_contents):
+        errors = ""
+        for validate in validators:
+            error = validate(field_contents)
+            if not error:
+                return("")
+            errors += error
+
+        return(errors)
+
+    return(validator)
+
+def enumeration_lookup(field_type):
+    """
+    Create a function that checks field contents against an enumeration
+    with a table lookup, skipping the enumeration's validation function
+    and the enumeration listing it builds for its error text. Tables in
+    hamlibIO_enumerations aren't loaded until the first check.
+
+    Arguments:
+        field_type:
+            Enumeration validation function with a table in
+            enumeration_tables or lazy_enumeration_tables.
+
+    Returns:
+        Function returning True if field contents are in the
+        enumeration, False if not.
+    """
+
+    def valid(field_contents):
+        table = enumeration_tables.get(field_type)
+        if table is None:
+            table = getattr(get_enumerations(),
+                lazy_enumeration_tables[field_type])
+            enumeration_tables[field_type] = table
+
+        return(field_contents.upper() in table)
+
+    return(valid)
+
+@functools.lru_cache(maxsize=None)
+def compile_field_type(field_type):
+    """
+    Compile a field's entry in a field definition dictonary into its
+    validation plan, a FieldCheck.
+
+    Field types are tuples of data type names or enumeration validation
+    functions, so they can't change once they are made and the compiled
+    plan is cached by the field type itself. Looking a field up in any
+    field definition dictonary and compiling its type is always up to
+    date and costs a dictonary lookup after the first time.
+
+    Arguments:
+        field_type:
+            The field's entry in a field definition dictonary (such as
+            record_fields) - a tuple of data types or an enumeration
+            validation function.
+
+    Returns:
+        FieldCheck for the field type
+    """
+
+    validate_arg_type((
+        (field_type, tuple, type(multiple_data_type_validator)),
+    ))
+
+    if callable(field_type):
+        #
+        #Enumeration, the validation function is the validator. If
+        #there's a table, checking is just a lookup.
+        #
+        if (field_type in enumeration_tables) or (
+                field_type in lazy_enumeration_tables):
+            return(FieldCheck(field_type, field_type,
+                enumeration_lookup(field_type)))
+
+        return(FieldCheck(field_type, field_type,
+            lambda field_contents: not field_type(field_contents)))
+
+    for data_type in field_type:
+        if data_type not in data_types:
+            sys.stderr.write("""
+Error: Data type "{}" is NOT in the data_types dictonary.
+""".format(data_type))
+
+            #
+            #Don't return, throw exception to generate trace
+            #
+            raise hamlibIOerror("Data type not found")
+
+    validators = tuple(data_types[data_type][DATA_TYPES_VALIDATOR_INDEX]
+        for data_type in field_type)
+    if len(validators) == 1:
+        validate = validators[0]
+    else:
+        validate = multiple_data_type_validator(validators)
+
+    return(FieldCheck(field_type, validate,
+        lambda field_contents: not validate(field_contents)))
+
 ########################################################################
 ########################################################################
 #
@@ -5537,9 +3543,7 @@ def valid_callsign(callsign, slash=False):
     ))
 
     if slash:
-        if not re.fullmatch(r'[A-Z0-9]{3,}(/[A-Z0-9]+|$)',
-            callsign,
-            re.IGNORECASE):
+        if not re_callsign_slash.fullmatch(callsign):
             #
             #If an error is found, report it
             #
@@ -5550,9 +3554,7 @@ Error: "{}" is not a valid format for a callsign.
        Examples: "K0RLO", "W1JU" or "K0RLO/R1", "W1JU/MOBILE"
 """.format(callsign))
     else:
-        if not re.fullmatch(r'[A-Z0-9]{3,}',
-            callsign,
-            re.IGNORECASE):
+        if not re_callsign.fullmatch(callsign):
             #
             #If an error is found, report it
             #
@@ -5632,83 +3634,283 @@ def validate_field(field_definitions, field_name, field_contents):
     ))
 
     #
-    #Make sure field is a valid header field. If not, report error and
-    #return
+    #Make sure field is a valid field. If not, report error and return
     #
-    if field_name.upper() not in field_definitions:
+    field_type = field_definition(field_definitions, field_name.upper())
+    if field_type is None:
         return("""
     field "{}" is not a valid field name.
 """.format(field_name))
 
     #
-    #Make sure field contents are valid by calling the field
-    #verification function in the data_types dictonary.
-    #
-    #We're guaranteed that the validation routine exists becasue of the
-    #up-front library checking that happens at the end of this module.
+    #Make sure field contents are valid with the compiled plan for the
+    #field's type.
     #
-    field_type = field_definitions[field_name.upper()]
-
-    if callable(field_type):
-        #
-        #It's an enumeration type with a validation function. Call the
-        #valididation function.
-        #
-        errors = field_type(field_contents)
-    else:
-        #
-        #It's not an ennumeration type. Cjeck all types and if any one
-        #comes back without errors, were good to go...
-        #
-        errors = ""
-        for test_type in field_type:
-            #
-            #Validate against each data type possible.
-            #
-            hold_error = data_types[test_type][1](field_contents)
-            if not hold_error:
-                #
-                #If this data type matches, we're good. Clear any errors
-                #you may have found for other data types.
-                #
-                errors = ""
-                #
-                #Exit the loop
-                #
-                break
+    return(compile_field_type(field_type).validate(field_contents))
 
-            #
-            #We never found a valid data type, report errors.
-            #
-            errors += hold_error
+#
+#FieldError reason codes
+#
+FIELD_ERROR_UNKNOWN = "UNKNOWN_FIELD"
+FIELD_ERROR_INVALID = "INVALID_CONTENTS"
+FIELD_ERROR_DUPLICATE = "DUPLICATE_FIELD"
+FIELD_ERROR_SUBDIVISION = "INVALID_SUBDIVISION"
 
-    #
-    #Retrun errors or null string
-    #
-    return(errors)
+class FieldError:
+    """
+    Lightweight field validation error returned by check_field and
+    check_record: the field name, its contents, a reason code and the
+    field's definition. The human readable error text (the same text
+    validate_field returns) isn't generated until the error is printed
+    or converted with str().
 
-def ADIF_record(fields, spaces=0, include_data_type=False):
+    Attributes:
+        field_name:
+            Name of the field in error.
+        field_contents:
+            Contents of the field in error.
+        reason:
+            FIELD_ERROR_UNKNOWN, FIELD_ERROR_INVALID,
+            FIELD_ERROR_DUPLICATE or FIELD_ERROR_SUBDIVISION.
+        field_type:
+            The field's entry in the field definition dictonary, None if
+            the field is unknown. For FIELD_ERROR_SUBDIVISION, the
+            DXCCEntity the contents were checked against.
     """
-    Convert a dictonary of fields to an ADIF record and return the
-    string.
 
-    Arguments:
-        fields:
-            Dictonary of fields and their contents.
-        spaces: Default: 0
-            Number of spaces between fields.
-        include_data_type: Default: False
-            If True, include data type in data specifier.
+    __slots__ = ("field_name", "field_contents", "reason", "field_type")
 
-    Returns:
-        Correctly formatted ADIF record with <EOR>\n at end
-    """
+    def __init__(self, field_name, field_contents, reason, field_type=None):
+        self.field_name = field_name
+        self.field_contents = field_contents
+        self.reason = reason
+        self.field_type = field_type
 
-    validate_arg_type((
-        (fields, dict),
-        (spaces, int),
-        (include_data_type, bool),
-    ))
+    def __eq__(self, other):
+        if not isinstance(other, FieldError):
+            return NotImplemented
+        return((self.field_name, self.field_contents, self.reason,
+            self.field_type) == (other.field_name, other.field_contents,
+            other.reason, other.field_type))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return("FieldError({!r}, {!r}, {!r})".format(self.field_name,
+            self.field_contents, self.reason))
+
+    def __str__(self):
+        if self.reason == FIELD_ERROR_UNKNOWN:
+            error = """
+    field "{}" is not a valid field name.
+""".format(self.field_name)
+        elif self.reason == FIELD_ERROR_DUPLICATE:
+            error = """
+    Field "{}" is a duplicate of another field, differing only by
+    character case.
+""".format(self.field_name)
+        elif self.reason == FIELD_ERROR_SUBDIVISION:
+            error = """
+    "{}" is not a valid subdivision of DXCC entity {} ({}).
+""".format(self.field_contents, self.field_type.code,
+                self.field_type.name)
+        else:
+            error = compile_field_type(self.field_type).validate(
+                self.field_contents)
+
+        return("""
+Error: Errors were found with the "{}" ADIF
+       record field: "{}"
+""".format(self.field_name, self.field_contents) + error)
+
+def check_field(field_definitions, field_name, field_contents):
+    """
+    Validate a field like validate_field does, but return a FieldError
+    instead of error text. Meant for batch validation of large or dirty
+    logs where most of the error text would never be read.
+
+    Arguments:
+        field_definitions:
+            Dictonary of valid field names.
+        field_name:
+            Name of the field
+        field_contents:
+            Contents of field
+
+    Returns:
+        Field and contents valid:
+            None
+        Field or contents invalid:
+            FieldError
+    """
+
+    validate_arg_type((
+        (field_definitions, dict),
+        (field_name, str),
+        (field_contents, str),
+    ))
+
+    field_type = field_definition(field_definitions, field_name.upper())
+    if field_type is None:
+        return(FieldError(field_name, field_contents, FIELD_ERROR_UNKNOWN))
+
+    if compile_field_type(field_type).valid(field_contents):
+        return(None)
+
+    return(FieldError(field_name, field_contents, FIELD_ERROR_INVALID,
+        field_type))
+
+#
+#Fields that are checked against the subdivisions of their DXCC entity:
+#the field, the field with the DXCC entity code, and True if it's a
+#primary subdivision (state/province) or False if it's a secondary
+#subdivision (county).
+#
+subdivision_fields = (
+    ("CNTY", "DXCC", False),
+    ("MY_CNTY", "MY_DXCC", False),
+    ("MY_STATE", "MY_DXCC", True),
+    ("STATE", "DXCC", True),
+    )
+
+#
+#Fields that give the DXCC entity for subdivision_fields
+#
+subdivision_dxcc_fields = frozenset(("DXCC", "MY_DXCC"))
+
+def check_subdivisions(fields):
+    """
+    Cross-field check of STATE, CNTY, MY_STATE and MY_CNTY against the
+    DXCC entity in DXCC or MY_DXCC. Each is only checked if its DXCC
+    field is a valid entity code and the entity has a subdivision table
+    for it - without an entity, a STATE can't be checked.
+
+    Arguments:
+        fields:
+            Dictonary of fields and their contents.
+
+    Returns:
+        List of FieldErrors (FIELD_ERROR_SUBDIVISION), empty if no
+        errors.
+    """
+
+    validate_arg_type((
+        (fields, dict),
+    ))
+
+    upper_fields = {}
+    for field_name, field_contents in fields.items():
+        upper_fields[field_name.upper()] = (field_name, field_contents)
+
+    errors = []
+    for (subdivision_field, dxcc_field, primary) in subdivision_fields:
+        if (subdivision_field not in upper_fields) or (
+                dxcc_field not in upper_fields):
+            continue
+
+        (field_name, field_contents) = upper_fields[subdivision_field]
+        dxcc_code = upper_fields[dxcc_field][1]
+        if not (isinstance(field_contents, str) and
+                isinstance(dxcc_code, str)):
+            continue
+
+        #
+        #A bad DXCC code is reported by the DXCC field's own check
+        #
+        entity = dxcc_entity(dxcc_code)
+        if entity is None:
+            continue
+
+        if primary:
+            table = entity.subdivisions
+        else:
+            table = entity.secondary_subdivisions
+
+        if table and (field_contents.upper() not in table):
+            errors.append(FieldError(field_name, field_contents,
+                FIELD_ERROR_SUBDIVISION, entity))
+
+    return(errors)
+
+def check_record(fields, field_definitions=record_fields):
+    """
+    Validate all the fields of a record, returning FieldErrors rather
+    than printing errors and raising an exception as ADIF_record does.
+
+    Arguments:
+        fields:
+            Dictonary of fields and their contents.
+        field_definitions: Default record_fields
+            Dictonary of valid field names.
+
+    Returns:
+        List of FieldErrors in field name order, followed by any
+        subdivision (STATE, CNTY, ...) errors found by
+        check_subdivisions. Empty if the record is valid.
+    """
+
+    validate_arg_type((
+        (fields, dict),
+        (field_definitions, dict),
+    ))
+
+    errors = []
+    upper_names = {}
+    for field_name, field_contents in sorted(fields.items()):
+        upper_name = field_name.upper()
+        if upper_name in upper_names:
+            errors.append(FieldError(field_name, field_contents,
+                FIELD_ERROR_DUPLICATE))
+        upper_names[upper_name] = True
+
+        error = check_field(field_definitions, field_name, field_contents)
+        if error is not None:
+            errors.append(error)
+
+    if not subdivision_dxcc_fields.isdisjoint(upper_names):
+        errors.extend(check_subdivisions(fields))
+
+    return(errors)
+
+def ADIF_record(fields, spaces=0, include_data_type=False, errors=None):
+    """
+    Convert a dictonary of fields to an ADIF record and return the
+    string.
+
+    Arguments:
+        fields:
+            Dictonary of fields and their contents.
+        spaces: Default: 0
+            Number of spaces between fields.
+        include_data_type: Default: False
+            If True, include data type in data specifier.
+        errors: Default None
+            Error sink for batch use. If a list is supplied, nothing is
+            printed or raised: the record's FieldErrors (see
+            check_record) are appended to it and None is returned if
+            the record is in error.
+
+    Returns:
+        Correctly formatted ADIF record with <EOR>\n at end
+        None if the record is in error and an errors list was supplied
+    """
+
+    validate_arg_type((
+        (fields, dict),
+        (spaces, int),
+        (include_data_type, bool),
+        (errors, list, None),
+    ))
+
+    #
+    #Collecting errors: check the whole record without generating any
+    #error text, then build it without checking again.
+    #
+    if errors is not None:
+        record_errors = check_record(fields)
+        if record_errors:
+            errors.extend(record_errors)
+            return(None)
 
     #
     #Number of spaces between fields
@@ -5718,19 +3920,20 @@ def ADIF_record(fields, spaces=0, include_data_type=False):
     #
     #Generate fields in requested order
     #
-    adif_record = ""
-    errors = False
+    adif_record = []
+    in_error = False
     for field_name, field_value in sorted(fields.items()):
         #
         #Validate field and contents
         #
-        error = validate_field(record_fields, field_name, field_value)
+        error = "" if errors is not None else validate_field(record_fields,
+            field_name, field_value)
 
         #
         #If any errors, detected, print and continue checking
         #
         if error:
-            errors = True
+            in_error = True
             print("""
 Error: Errors were found with the "{}" ADIF
        record field: "{}"
@@ -5740,12 +3943,21 @@ Error: Errors were found with the "{}" ADIF
         #
         #Generate data type identifier if reqested
         #
-        dti = get_data_type_indicator(record_fields[field_name.upper()]) if include_data_type else ""
+        dti = get_data_type_indicator(field_definition(record_fields,
+            field_name.upper())) if include_data_type else ""
 
         #
         #Add field to record
         #
-        adif_record += field(field_name, fields[field_name], dti) + spaces
+        adif_record.append(field(field_name, fields[field_name], dti))
+        adif_record.append(spaces)
+
+    #
+    #Already checked by check_record
+    #
+    if errors is not None:
+        adif_record.append(end_of_record + "\n")
+        return("".join(adif_record))
 
     #
     #Validate dictonary and assure that no mixed-case field names cause
@@ -5761,16 +3973,264 @@ Error: Errors were found with the "{}" ADIF
 Error: Errors were found with the following ADIF record fields:
 """ + error)
 
-    if error or errors:
+    #
+    #Check STATE, CNTY, etc. against the DXCC entity
+    #
+    for subdivision_error in check_subdivisions(fields):
+        in_error = True
+        print(subdivision_error)
+
+    if error or in_error:
         raise hamlibIOerror("ADIF record (QSO) field(s) in error.")
 
     #
     #Return the correctly formatted record with an <EOR> and newline at
     #the end
     #
-    return(adif_record + end_of_record + "\n")
+    adif_record.append(end_of_record + "\n")
+    return("".join(adif_record))
+
+class ADIFRecordTemplate:
+    """
+    Template for writing many ADIF records that differ in only a few
+    fields, such as one record per operator and park for the same
+    contact. The shared fields are validated and converted to ADIF once,
+    when the template is created. Each record then only validates and
+    converts its own fields (the variable fields), which are spliced in
+    between the already converted shared fields.
+
+    record returns exactly what ADIF_record would return for the shared
+    fields plus the record's own fields.
+
+    Arguments:
+        fields:
+            Dictonary of the fields shared by every record and their
+            contents. Errors are printed and a hamlibIOerror is raised,
+            like ADIF_record.
+        variable_fields:
+            Tuple or list of the names of the fields that are given to
+            record. They may not also be shared fields.
+        spaces: Default: 0
+            Number of spaces between fields.
+        include_data_type: Default: False
+            If True, include data type in data specifier.
+
+    Attributes:
+        fields:
+            The shared fields.
+        parts:
+            The record in field order: a string for each run of
+            converted shared fields, and for each variable field a tuple
+            of the field name, start of tag, end of tag (the field
+            length goes between them) and the field's FieldCheck.
+        spaces:
+            Spaces between fields.
+        check_subdivisions:
+            True if check_subdivisions has to be run for every record
+            because a variable field is one of the fields it checks.
+    """
+
+    __slots__ = ("fields", "parts", "spaces", "check_subdivisions")
+
+    def __init__(self, fields, variable_fields, spaces=0,
+            include_data_type=False):
+        validate_arg_type((
+            (fields, dict),
+            (variable_fields, tuple, list),
+            (spaces, int),
+            (include_data_type, bool),
+        ))
+
+        #
+        #Shared fields
+        #
+        errors = check_record(fields)
+        if errors:
+            for error in errors:
+                print(error)
+            raise hamlibIOerror("ADIF record (QSO) field(s) in error.")
+
+        #
+        #Variable fields must be valid field names that aren't shared
+        #
+        shared_names = {field_name.upper() for field_name in fields}
+        upper_names = set(shared_names)
+        for field_name in variable_fields:
+            upper_name = field_name.upper()
+            if (field_definition(record_fields, upper_name) is None) or (
+                    upper_name in upper_names):
+                sys.stderr.write("""
+Error: ADIFRecordTemplate variable field "{}" is not a valid field name,
+       or is a duplicate of another field.
+""".format(field_name))
+                raise hamlibIOerror("ADIFRecordTemplate field in error.")
+            upper_names.add(upper_name)
+
+        self.fields = fields
+        self.spaces = spaces * " "
+        self.check_subdivisions = any(
+            (subdivision_field in upper_names) and (dxcc_field in upper_names)
+                and ((subdivision_field not in shared_names) or
+                    (dxcc_field not in shared_names))
+            for (subdivision_field, dxcc_field, primary)
+                in subdivision_fields)
+
+        #
+        #Lay out the record in the order ADIF_record would write it,
+        #converting runs of shared fields into one string.
+        #
+        self.parts = []
+        shared = []
+        for field_name in sorted(list(fields) + list(variable_fields)):
+            field_type = field_definition(record_fields, field_name.upper())
+            dti = get_data_type_indicator(field_type) \
+                if include_data_type else ""
+
+            if field_name in fields:
+                shared.append(field(field_name, fields[field_name], dti))
+                shared.append(self.spaces)
+                continue
+
+            if shared:
+                self.parts.append("".join(shared))
+                shared = []
+            self.parts.append((field_name, "<" + field_name + ":",
+                (":" + dti if dti else "") + ">",
+                compile_field_type(field_type)))
+
+        shared.append(end_of_record + "\n")
+        self.parts.append("".join(shared))
+
+    def record(self, values, errors=None):
+        """
+        Create an ADIF record from the template.
+
+        Arguments:
+            values:
+                Dictonary of the record's own (variable) fields and
+                their contents. Variable fields that aren't given are
+                left out of the record.
+            errors: Default None
+                Error sink, see ADIF_record.
+
+        Returns:
+            Correctly formatted ADIF record with <EOR>\n at end
+            None if the record is in error and an errors list was
+            supplied
+        """
+
+        validate_arg_type((
+            (values, dict),
+            (errors, list, None),
+        ))
+
+        record_errors = []
+        adif_record = []
+        used = 0
+        for part in self.parts:
+            if part.__class__ is str:
+                adif_record.append(part)
+                continue
+
+            (field_name, tag_start, tag_end, check) = part
+            field_value = values.get(field_name)
+            if field_value is None:
+                continue
+            used += 1
+
+            if field_value.__class__ is not str:
+                validate_arg_type((
+                    (field_value, str),
+                ))
+
+            if not check.valid(field_value):
+                record_errors.append(FieldError(field_name, field_value,
+                    FIELD_ERROR_INVALID, check.field_type))
+                continue
+
+            adif_record.append(tag_start + str(len(field_value)) + tag_end)
+            adif_record.append(field_value)
+            adif_record.append(self.spaces)
+
+        if used != len(values):
+            for field_name, field_value in values.items():
+                if not any((part.__class__ is tuple) and
+                        (part[0] == field_name) for part in self.parts):
+                    record_errors.append(FieldError(field_name, field_value,
+                        FIELD_ERROR_UNKNOWN))
+
+        if self.check_subdivisions:
+            record_errors.extend(check_subdivisions({**self.fields,
+                **values}))
+
+        if record_errors:
+            if errors is not None:
+                errors.extend(record_errors)
+                return(None)
+            for error in record_errors:
+                print(error)
+            raise hamlibIOerror("ADIF record (QSO) field(s) in error.")
+
+        return("".join(adif_record))
+
+def header_defaults(fields, gmt):
+    """
+    Fill in the default header fields (ADIF_VER, CREATED_TIMESTAMP and
+    PROGRAMID) that haven't been defined.
+
+    Arguments:
+        fields:
+            Dictonary of header fields and their contents, None for all
+            defaults. The defaults are added to this dictonary.
+        gmt:
+            time.struct_time to use for CREATED_TIMESTAMP
+
+    Returns:
+        Dictonary of header fields
+    """
+
+    #
+    #User allowed all fields to default. Note that PROGRAMVERSION will
+    #not be defined since there's no way to determine that.
+    #
+    if fields is None:
+        fields = {}
+
+    #
+    #Set ADIF_VER to the version supported by this file unless the user
+    #has defined it.
+    #
+    for i in fields:
+        if i.upper() == ADIF_VER_FIELD:
+            break
+    else:
+        fields[ADIF_VER_FIELD] = ADIF_VER
+
+    #
+    #Set CREATED_TIMESTAMP to current zulu time unless the user has
+    #defined it.
+    #
+    for i in fields:
+        if i.upper() == CREATED_TIMESTAMP_FIELD:
+            break
+    else:
+        fields[CREATED_TIMESTAMP_FIELD] = \
+            time.strftime("%Y%m%d %H%M%S", gmt)
+
+    #
+    #Set PROGRAMID to the current script name unless the user has
+    #defined it.
+    #
+    for i in fields:
+        if i.upper() == PROGRAMID_FIELD:
+            break
+    else:
+        fields[PROGRAMID_FIELD] = script_name
 
-def ADIF_header(fields, header_comment="", include_data_type=False):
+    return(fields)
+
+def ADIF_header(fields, header_comment="", include_data_type=False,
+    errors=None, header_types=None):
     """
     Convert a dictonary of fields to an ADIF header and return the
     string.
@@ -5787,15 +4247,28 @@ def ADIF_header(fields, header_comment="", include_data_type=False):
             Se it to None if you do not want ANY header.
         include_data_type: Default: False
             If True, include data type identifier in data specifier.
+        errors: Default None
+            Error sink, see ADIF_record. If a list is supplied, the
+            header's FieldErrors are appended to it and None is returned
+            if the header is in error.
+        header_types: Default None
+            Dictonary of upper case header field names and their data
+            type indicators, for fields whose data type isn't fixed:
+            USERDEFn (the user-defined field's data type) and APP_
+            fields. These are always included, the ADIF specification
+            requires one for USERDEFn.
 
     Returns:
-        Correctly formatted ADIF record with <EOR>\n at end
+        Correctly formatted ADIF header with <EOH>\n at end
+        None if the header is in error and an errors list was supplied
     """
 
     validate_arg_type((
         (fields, dict, None),
         (header_comment, str, None),
         (include_data_type, bool),
+        (errors, list, None),
+        (header_types, dict, None),
     ))
 
     gmt = time.gmtime()
@@ -5826,67 +4299,49 @@ def ADIF_header(fields, header_comment="", include_data_type=False):
         #
         adif_header = ""
 
-    #
-    #User allowed all fields to default. Note that PROGRAMVERSION will
-    #not be defined since there's no way to determine that.
-    #
-    if fields is None:
-        fields = {}
-
-    #
-    #Set ADIF_VER to the version supported by this file unless the user
-    #has defined it.
-    #
-    for i in fields:
-        if i.upper() == ADIF_VER_FIELD:
-            break
-    else:
-        fields[ADIF_VER_FIELD] = ADIF_VER
-
-    #
-    #Set CREATED_TIMESTAMP to current zulu time unless the user has
-    #defined it.
-    #
-    for i in fields:
-        if i.upper() == CREATED_TIMESTAMP_FIELD:
-            break
-    else:
-        fields[CREATED_TIMESTAMP_FIELD] = \
-            time.strftime("%Y%m%d %H%M%S", gmt)
+    fields = header_defaults(fields, gmt)
 
     #
-    #Set PROGRAMID to the current script name unless the user has
-    #defined it.
+    #Collecting errors: check the whole header without generating any
+    #error text
     #
-    for i in fields:
-        if i.upper() == PROGRAMID_FIELD:
-            break
-    else:
-        fields[PROGRAMID_FIELD] = script_name
+    if errors is not None:
+        header_errors = check_record(fields, header_fields)
+        if header_errors:
+            errors.extend(header_errors)
+            return(None)
 
     #
     #Generate fields in sorted order
     #
-    errors = False
+    in_error = False
     for field_name,field_value in sorted(fields.items()):
 
         #
         #Validate field and contents
         #
-        error = validate_field(header_fields, field_name, field_value)
+        error = "" if errors is not None else validate_field(header_fields,
+            field_name, field_value)
 
         #
         #If any errors, detected, print and continue checking
         #
         if error:
-            errors = True
+            in_error = True
             print("""
 Error: Errors were found with the "{}" ADIF
        record field: "{}"
 """.format(field_name, field_value) + error)
             continue
 
-        dti = get_data_type_indicator(header_fields[field_name.upper()]) if include_data_type else ""
+        upper_name = field_name.upper()
+        if header_types and (upper_name in header_types):
+            dti = header_types[upper_name]
+        elif include_data_type:
+            dti = get_data_type_indicator(field_definition(header_fields,
+                upper_name))
+        else:
+            dti = ""
 
         #
         #Add field to header
@@ -5905,9 +4360,9 @@ Error: Errors were found with the "{}" ADIF
     if error:
         print("""
 Error: Errors were found with the following ADIF header fields:
-""" + errors)
+""" + error)
 
-    if error or errors:
+    if error or in_error:
         raise hamlibIOerror("ADIF header field(s) in error.")
 
     #
@@ -5916,15 +4371,392 @@ Error: Errors were found with the following ADIF header fields:
     #
     return(adif_header + end_of_header + "\n")
 
-
-def freq_to_band(freq):
+def write_ADIF_file(records, filename, header_fields=None,
+    header_comment="", spaces=0, include_data_type=False, errors=None,
+    header_types=None):
     """
-    Given a frequency, convert it to a band
+    Write a complete ADIF (.adi) file - header and records - in one
+    pass through a single buffered file.
 
-    Arguments:
-        freq:   Frequency to use to search for band
+    The work done for each field name (upcasing, looking up its
+    definition and data type indicator, building the tag) is done once
+    per file and reused for every record, rather than once per field per
+    record as with ADIF_record.
 
-    Returns:
+    Arguments:
+        records:
+            Iterable (list, generator, etc.) of dictonaries of fields
+            and their contents, one per record.
+        filename:
+            Name of the file to create. An existing file is replaced.
+        header_fields: Default None
+            Dictonary of header fields, see ADIF_header.
+        header_comment: Default ""
+            Header comment, see ADIF_header.
+        spaces: Default: 0
+            Number of spaces between fields.
+        include_data_type: Default: False
+            If True, include data type in data specifier.
+        errors: Default None
+            If a list is supplied, records in error are skipped and
+            (record number, list of FieldErrors) is appended to it for
+            each, like check_ADIF_records returns. Record numbers start
+            at 1 and count every record, written or not.
+        header_types: Default None
+            Data type indicators of USERDEFn and APP_ header fields,
+            see ADIF_header.
+
+    Records may also hold application-defined (APP_) fields and the
+    user-defined fields declared by the header's USERDEFn fields.
+
+    Returns:
+        Number of records written. If a record has errors and no errors
+        list was supplied, they are printed and a hamlibIOerror is
+        raised - records before it have already been written.
+    """
+
+    validate_arg_type((
+        (records,),
+        (filename, str),
+        (header_fields, dict, None),
+        (header_comment, str, None),
+        (spaces, int),
+        (include_data_type, bool),
+        (errors, list, None),
+        (header_types, dict, None),
+    ))
+
+    spaces = spaces * " "
+
+    #
+    #Per field name plan, filled in the first time a field name is seen:
+    #field name -> (upper case name, FieldCheck, start of tag, end of
+    #tag). The field length goes between the start and end of tag.
+    #
+    definitions = {**record_fields,
+        **userdef_field_definitions(header_fields or {}, header_types)}
+    plan = {}
+
+    record_number = 0
+    count = 0
+    f = open(filename, "w", buffering=1024 * 1024)
+    try:
+        f.write(ADIF_header(header_fields, header_comment, include_data_type,
+            header_types=header_types))
+
+        for fields in records:
+            record_number += 1
+            adif_record = []
+            upper_names = set()
+            record_errors = []
+            for field_name, field_value in sorted(fields.items()):
+                step = plan.get(field_name)
+                if step is None:
+                    upper_name = field_name.upper()
+                    field_type = field_definition(definitions, upper_name)
+                    if field_type is None:
+                        record_errors.append(FieldError(field_name,
+                            field_value, FIELD_ERROR_UNKNOWN))
+                        continue
+
+                    dti = get_data_type_indicator(field_type) \
+                        if include_data_type else ""
+                    step = plan[field_name] = (upper_name,
+                        compile_field_type(field_type),
+                        "<" + field_name + ":",
+                        (":" + dti if dti else "") + ">")
+
+                (upper_name, check, tag_start, tag_end) = step
+
+                #
+                #Fields that differ only by case are duplicates
+                #
+                if upper_name in upper_names:
+                    record_errors.append(FieldError(field_name, field_value,
+                        FIELD_ERROR_DUPLICATE))
+                    continue
+                upper_names.add(upper_name)
+
+                if not check.valid(field_value):
+                    record_errors.append(FieldError(field_name, field_value,
+                        FIELD_ERROR_INVALID, check.field_type))
+                    continue
+
+                adif_record.append(tag_start + str(len(field_value))
+                    + tag_end)
+                adif_record.append(field_value)
+                adif_record.append(spaces)
+
+            #
+            #Check STATE, CNTY, etc. against the DXCC entity
+            #
+            if not upper_names.isdisjoint(subdivision_dxcc_fields):
+                record_errors.extend(check_subdivisions(fields))
+
+            if record_errors:
+                if errors is not None:
+                    errors.append((record_number, record_errors))
+                    continue
+                print("""
+Error: Record {} of "{}":""".format(record_number, filename)
+                    + "".join(str(error) for error in record_errors))
+                raise hamlibIOerror("ADIF record (QSO) field(s) in error.")
+
+            adif_record.append(end_of_record + "\n")
+            f.write("".join(adif_record))
+            count += 1
+    finally:
+        f.close()
+
+    return(count)
+
+def xml_escape(text):
+    """
+    Escape text for the contents of an ADX element. Carriage returns
+    are escaped too, so CR/LF line endings in multiline fields survive
+    being read back (XML parsers turn a bare CR/LF into LF).
+
+    Arguments:
+        text:
+            Text to escape
+
+    Returns:
+        Escaped text
+    """
+
+    if ("&" in text) or ("<" in text) or (">" in text) or ("\r" in text):
+        return(text.replace("&", "&amp;").replace("<", "&lt;").replace(
+            ">", "&gt;").replace("\r", "&#13;"))
+
+    return(text)
+
+def ADX_field_tags(field_name, userdef_names=(), data_type_indicator=""):
+    """
+    Return the start and end tags of an ADX header or record field. APP_
+    fields become <APP PROGRAMID=... FIELDNAME=...> elements, USERDEFn
+    header fields <USERDEF FIELDID=...> elements and user-defined record
+    fields <USERDEF FIELDNAME=...> elements; the reverse of
+    ADX_field_name.
+
+    Arguments:
+        field_name:
+            Upper case field name
+        userdef_names: Default ()
+            Names of the user-defined fields (see
+            userdef_field_definitions)
+        data_type_indicator: Default ""
+            Data type indicator of an APP_ or USERDEFn field, for its
+            TYPE attribute
+
+    Returns:
+        Tuple of the start tag and end tag
+    """
+
+    type_attribute = ' TYPE="{}"'.format(xml_attribute(
+        data_type_indicator)) if data_type_indicator else ""
+
+    app = re_app_field.fullmatch(field_name)
+    if app:
+        return(('<APP PROGRAMID="{}" FIELDNAME="{}"{}>'.format(
+            xml_attribute(app.group(1)), xml_attribute(app.group(2)),
+            type_attribute), "</APP>"))
+
+    userdef_number = re_userdef.fullmatch(field_name)
+    if userdef_number:
+        return(('<USERDEF FIELDID="{}"{}>'.format(userdef_number.group(1),
+            type_attribute), "</USERDEF>"))
+
+    if field_name in userdef_names:
+        return(('<USERDEF FIELDNAME="{}">'.format(xml_attribute(field_name)),
+            "</USERDEF>"))
+
+    return(("<" + field_name + ">", "</" + field_name + ">"))
+
+def xml_attribute(text):
+    """
+    Escape text for an ADX attribute value (in double quotes).
+
+    Arguments:
+        text:
+            Text to escape
+
+    Returns:
+        Escaped text
+    """
+
+    return(xml_escape(text).replace('"', "&quot;"))
+
+#
+#The module's header field definitions, for write_ADX_file (its
+#header_fields argument hides header_fields)
+#
+header_field_definitions = header_fields
+
+def write_ADX_file(records, filename, header_fields=None, errors=None,
+    header_types=None):
+    """
+    Write a complete ADX (ADIF XML) file - header and records - in one
+    pass, a record at a time, so records can come from a generator
+    (such as iter_ADIF_records) and memory use doesn't grow with the
+    number of records.
+
+    Fields are validated against xml_record_fields, so the
+    internationalized (_INTL) fields are allowed. Application-defined
+    (APP_) fields, and the user-defined fields declared by the header's
+    USERDEFn fields, are written as APP and USERDEF elements. The file
+    is UTF-8.
+
+    Arguments:
+        records:
+            Iterable (list, generator, etc.) of dictonaries of fields
+            and their contents, one per record.
+        filename:
+            Name of the file to create. An existing file is replaced.
+        header_fields: Default None
+            Dictonary of header fields, see ADIF_header.
+        errors: Default None
+            If a list is supplied, records in error are skipped and
+            reported in it, see write_ADIF_file.
+        header_types: Default None
+            Data type indicators of USERDEFn and APP_ header fields,
+            see ADIF_header. They're written as TYPE attributes.
+
+    Returns:
+        Number of records written. If the header has errors, or a record
+        has errors and no errors list was supplied, they are printed and
+        a hamlibIOerror is raised - records before it have already been
+        written.
+    """
+
+    validate_arg_type((
+        (records,),
+        (filename, str),
+        (header_fields, dict, None),
+        (errors, list, None),
+        (header_types, dict, None),
+    ))
+
+    header = header_defaults(header_fields, time.gmtime())
+    header_types = header_types or {}
+
+    #
+    #Per field name plan, filled in the first time a field name is seen:
+    #field name -> (upper case name, FieldCheck, start tag, end tag).
+    #
+    userdefs = userdef_field_definitions(header, header_types)
+    definitions = {**xml_record_fields, **userdefs}
+    plan = {}
+
+    record_number = 0
+    count = 0
+    f = open(filename, "w", encoding="utf-8", buffering=1024 * 1024)
+    try:
+        adx_lines = [adx_first_line, adx_adx, adx_header]
+        header_errors = ""
+        for field_name, field_value in sorted(header.items()):
+            error = validate_field(header_field_definitions, field_name,
+                field_value)
+            if error:
+                header_errors += """
+Error: Errors were found with the "{}" ADIF
+       header field: "{}"
+""".format(field_name, field_value) + error
+                continue
+
+            upper_name = field_name.upper()
+            (start_tag, end_tag) = ADX_field_tags(upper_name,
+                data_type_indicator=header_types.get(upper_name, ""))
+            adx_lines.append(adx_header_field_indent + start_tag
+                + xml_escape(field_value) + end_tag)
+
+        error = dictonary_duplicates(header)
+        if error:
+            header_errors += """
+Error: Errors were found with the following ADIF header fields:
+""" + error
+
+        if header_errors:
+            print(header_errors)
+            raise hamlibIOerror("ADIF header field(s) in error.")
+
+        adx_lines.append(adx_header_end)
+        adx_lines.append(adx_records)
+        f.write("\n".join(adx_lines) + "\n")
+
+        for fields in records:
+            record_number += 1
+            adx_lines = [adx_record]
+            upper_names = set()
+            record_errors = []
+            for field_name, field_value in sorted(fields.items()):
+                step = plan.get(field_name)
+                if step is None:
+                    upper_name = field_name.upper()
+                    field_type = field_definition(definitions, upper_name)
+                    if field_type is None:
+                        record_errors.append(FieldError(field_name,
+                            field_value, FIELD_ERROR_UNKNOWN))
+                        continue
+
+                    (start_tag, end_tag) = ADX_field_tags(upper_name,
+                        userdefs)
+                    step = plan[field_name] = (upper_name,
+                        compile_field_type(field_type),
+                        adx_record_field_indent + start_tag, end_tag)
+
+                (upper_name, check, start_tag, end_tag) = step
+
+                #
+                #Fields that differ only by case are duplicates
+                #
+                if upper_name in upper_names:
+                    record_errors.append(FieldError(field_name, field_value,
+                        FIELD_ERROR_DUPLICATE))
+                    continue
+                upper_names.add(upper_name)
+
+                if not check.valid(field_value):
+                    record_errors.append(FieldError(field_name, field_value,
+                        FIELD_ERROR_INVALID, check.field_type))
+                    continue
+
+                adx_lines.append(start_tag + xml_escape(field_value)
+                    + end_tag)
+
+            #
+            #Check STATE, CNTY, etc. against the DXCC entity
+            #
+            if not upper_names.isdisjoint(subdivision_dxcc_fields):
+                record_errors.extend(check_subdivisions(fields))
+
+            if record_errors:
+                if errors is not None:
+                    errors.append((record_number, record_errors))
+                    continue
+                print("""
+Error: Record {} of "{}":""".format(record_number, filename)
+                    + "".join(str(error) for error in record_errors))
+                raise hamlibIOerror("ADIF record (QSO) field(s) in error.")
+
+            adx_lines.append(adx_record_end + "\n")
+            f.write("\n".join(adx_lines))
+            count += 1
+
+        f.write(adx_records_end + "\n" + adx_adx_end + "\n")
+    finally:
+        f.close()
+
+    return(count)
+
+
+def freq_to_band(freq):
+    """
+    Given a frequency, convert it to a band
+
+    Arguments:
+        freq:   Frequency to use to search for band
+
+    Returns:
         Tuple of one member if frequency valid
         String containing error if frequency invalid
     """
@@ -5944,15 +4776,15 @@ def freq_to_band(freq):
 """.format(freq))
 
     #
-    #Go through bands and check to see if frequency in range
+    #Find the band with the highest lower edge at or below the frequency
+    #and check that the frequency isn't above the band's upper edge.
     #
-    for band in Band_Enumeration:
-        if ((float_freq >= Band_Enumeration[band][BAND_ENUMERATION_LOWER_FREQ_INDEX]) and
-            (float_freq <= Band_Enumeration[band][BAND_ENUMERATION_UPPER_FREQ_INDEX])):
-            #
-            #Frequency in range, return band
-            #
-            return((band,))
+    index = bisect.bisect_right(band_lower_edges, float_freq) - 1
+    if (index >= 0) and (float_freq <= band_upper_edges[index]):
+        #
+        #Frequency in range, return band
+        #
+        return((band_names[index],))
 
     #
     #Frequency not found in any band range, return False
@@ -5961,6 +4793,158 @@ def freq_to_band(freq):
     Frequency "{}" is does not fall within a valid range.
 """.format(freq))
 
+def freqs_to_bands(freqs):
+    """
+    Given a list of frequencies, convert them to bands. Same band edges
+    as freq_to_band, but for cleaning up whole logs at a time.
+
+    Arguments:
+        freqs:
+            Tuple or list of frequency strings.
+
+    Returns:
+        List with the band for each frequency, or None for frequencies
+        that are incorrectly formatted or not in a band.
+    """
+
+    validate_arg_type((
+        (freqs, tuple, list),
+    ))
+
+    find = bisect.bisect_right
+    bands = []
+    for freq in freqs:
+        try:
+            float_freq = float(freq)
+        except (TypeError, ValueError):
+            bands.append(None)
+            continue
+
+        index = find(band_lower_edges, float_freq) - 1
+        if (index >= 0) and (float_freq <= band_upper_edges[index]):
+            bands.append(band_names[index])
+        else:
+            bands.append(None)
+
+    return(bands)
+
+def parse_frequency(freq):
+    """
+    Convert a frequency to a float for freqs_to_band_codes, NaN if it's
+    not a valid frequency format.
+    """
+
+    try:
+        return(float(freq))
+    except (TypeError, ValueError):
+        return(float("nan"))
+
+def frequency_column_error():
+    """
+    Report that freqs_to_band_codes was given something other than one
+    column of frequencies.
+    """
+
+    sys.stderr.write("""
+Error: freqs_to_band_codes frequencies must be one column of frequency
+       strings or numbers, not rows of them.
+""")
+
+    #
+    #Don't return, throw exception to generate trace
+    #
+    raise hamlibIOerror("Frequencies not a column")
+
+def freqs_to_band_codes(freqs, use_numpy=True):
+    """
+    Classify a column of frequencies into bands in bulk. Band codes are
+    the BAND enumeration codes (offsets into band_names, which is in
+    frequency order), get_enumeration_codes("BAND").value(code) is the
+    band.
+
+    If NumPy is installed the frequencies are converted in one shot and
+    looked up with numpy.searchsorted, otherwise it's done in Python
+    with bisect. Band edges are the same as freq_to_band.
+
+    Arguments:
+        freqs:
+            Tuple, list (or NumPy array if NumPy is installed) of
+            frequency strings or numbers. It must be one column - a
+            frequency that is itself a tuple, list or array is an error
+            and raises a hamlibIOerror.
+        use_numpy: Default True
+            False forces the pure Python version even if NumPy is
+            installed.
+
+    Returns:
+        Tuple of band codes and invalid flags, one of each per
+        frequency. Invalid frequencies (bad format or not in a band)
+        have a band code of -1 and an invalid flag of True.
+        With NumPy:
+            Two NumPy arrays, integer band codes and a boolean mask.
+        Without NumPy:
+            Two lists, integer band codes and booleans.
+    """
+
+    numpy = get_numpy() if use_numpy else None
+    if numpy is not None:
+        validate_arg_type((
+            (freqs, tuple, list, numpy.ndarray),
+            (use_numpy, bool),
+        ))
+
+        try:
+            values = numpy.asarray(freqs)
+        except ValueError:
+            #
+            #Rows of different lengths, not a column
+            #
+            values = None
+        if (values is None) or (values.ndim != 1):
+            frequency_column_error()
+
+        try:
+            values = values.astype(numpy.float64)
+        except (TypeError, ValueError):
+            #
+            #At least one bad frequency, convert them one at a time so
+            #the bad ones become NaN.
+            #
+            for freq in values:
+                if isinstance(freq, tuple_or_list):
+                    frequency_column_error()
+            values = numpy.fromiter((parse_frequency(freq)
+                for freq in values), numpy.float64, values.size)
+
+        index = numpy.searchsorted(numpy.asarray(band_lower_edges),
+            values, side="right") - 1
+        valid = (index >= 0) & (values <=
+            numpy.asarray(band_upper_edges)[index.clip(0)])
+
+        return((numpy.where(valid, index, -1), ~valid))
+
+    validate_arg_type((
+        (freqs, tuple, list),
+        (use_numpy, bool),
+    ))
+
+    find = bisect.bisect_right
+    codes = []
+    invalid = []
+    for freq in freqs:
+        float_freq = parse_frequency(freq)
+        if (float_freq != float_freq) and isinstance(freq, tuple_or_list):
+            frequency_column_error()
+        index = find(band_lower_edges, float_freq) - 1
+        if (index >= 0) and (float_freq <= band_upper_edges[index]):
+            codes.append(index)
+            invalid.append(False)
+        else:
+            codes.append(-1)
+            invalid.append(True)
+
+    return((codes, invalid))
+
 def valid_band(band):
     """
     See if valid band specified. If so, return it. If not, return False
@@ -5980,7 +4964,7 @@ def valid_band(band):
     #
     #See if more than one value in string
     #
-    band = re.split(default_split, band)
+    band = re_default_split.split(band)
 
     #
     #If more than one band specified, it's an error
@@ -6032,7 +5016,7 @@ def valid_frequency(freq):
     #
     #See if more than one value in string
     #
-    frequency = re.split(default_split, freq)
+    frequency = re_default_split.split(freq)
 
     #
     #If more than one frequency specified, it's an error
@@ -6069,61 +5053,71 @@ def valid_mode(mode_submode):
     See if mode (and submode) specified. If so, return the mode and
     submode.
 
+    Results are cached, since the same few modes get typed over and
+    over while logging.
+
     Arguments:
         mode_submode:
             String containing mode (and submode) to be verified
 
     Returns:
-        [mode, submode] is valid.
-        False if mode or submode not valid
+        (mode,) or (mode, submode) if valid, in upper case.
+        Error text string if mode or submode not valid
     """
 
     validate_arg_type((
         (mode_submode, str),
     ))
 
+    return(lookup_mode(mode_submode))
+
+@functools.lru_cache(maxsize=1024)
+def lookup_mode(mode_submode):
+    """
+    Look up a mode (and submode) for valid_mode. Cached, so the
+    argument must already have been validated.
+
+    Arguments:
+        mode_submode:
+            String containing mode (and submode) to be verified
+
+    Returns:
+        Same as valid_mode
+    """
+
     #
     #Some submodes can have blanks in them (thanks a lot, folks). So I
-    #strip the blanks out for comparing, but keep around the original
-    #format for reporting
+    #squeeze the blanks down to one for comparing, but keep around the
+    #original format for reporting
     #
     #OLIVIA
-    #OLIVIA OLIVIA8/500
-    #OLIVIA8/500
+    #OLIVIA OLIVIA 8/500
+    #OLIVIA 8/500
     #
-    #So I need to generate all the possible permutations and
-    #combinations of mode and submode and throw it at the code that
-    #identifies it to see if I get a match somehow.
+    #Every one of those spellings is in Mode_Spellings, so it's a
+    #single dictionary lookup.
     #
+    mode_submode = [text for text in re_default_split.split(mode_submode)
+        if text]
+
+    spelling = " ".join(mode_submode).upper()
+    if spelling in Mode_Spellings:
+        return(Mode_Spellings[spelling])
 
     #
-    #Breakup the mode and submode
-    #
-    mode_submode = re.split(default_split, mode_submode)
-    
-    #
-    #Pull off mode and re-create the submode with single blanks for
-    #when the submode has blanks in it - to assure we have a match.
+    #Not valid. Figure out what's wrong to report it.
     #
+    if not mode_submode:
+        mode_submode = [""]
     mode_text = mode_submode.pop(0)
     submode_text = " ".join(mode_submode)
 
     if submode_text:
-        #
-        #We've specified both a mode and submode, assure that they are
-        #valid and compatible
-        #
         if mode_text.upper() in Mode_Enumeration:
-            if submode_text.upper() in Mode_Enumeration[mode_text.upper()]:
-                #
-                #Mode and submode are consistent
-                #
-                return(mode_text, submode_text)
-            else:
-                #
-                #Not a valid submode for this mode, report error
-                #
-                return("""
+            #
+            #Not a valid submode for this mode, report error
+            #
+            return("""
 Error: Submode "{}" specified for mode "{}".
        that is an invalid submode. Submode must be one of the following:
        "{}"
@@ -6137,24 +5131,6 @@ Error: "{}" is an invalid mode. It must be one of the following:
        "{}"
 """.format(mode_text, '"\n       "'.join(Mode_Enumeration)))
 
-    #
-    #Only a mode or submode specified, validate
-    #
-    if mode_text.upper() in Mode_Enumeration:
-        #
-        #Only a mode was specified, just return a mode
-        #
-        return(mode_text,)
-
-    #
-    #See if a valid submode specified alone
-    #
-    if mode_text.upper() in Submode_Enumeration:
-        #
-        #Only a submode was specified, return both a mode and submode.
-        #
-        return(Submode_Enumeration[mode_text.upper()], mode_text.upper())
-
     #
     #Mode incorrect for submode specified
     #
@@ -6163,1224 +5139,3357 @@ Error: "{}" is an invalid mode or submode.
    Examples: "CW", "LSB" "SSB USB" or "JT9 JT9H FAST".
 """.format(mode_text))
 
+########################################################################
+########################################################################
 #
-#Validation tests are created in [hopefully] the order of the functions
-#in hamlibIO. Each tuple contains the function to test, followed by any
-#number of 3 element tuples consisting of the type of test, a tuple of
-#arguments to the function and data.
+# ADIF file reading
 #
-#Data depends on the test:
-#   If it's an exception test, the data is the start of the text of the
-#       exception expected.
-#   If it's a compare, data is EXACTLY the data that should be returned
-#       from the function called with the supplied argumens.
-#   In the case of a display, it's an optional note as to what the
-#       person looking over the test log should see returned from the
-#       function.
+########################################################################
+########################################################################
+
 #
+#Matches one ADIF tag: <NAME>, <NAME:LENGTH> or <NAME:LENGTH:TYPE>
+#
+re_ADIF_tag = LazyPattern(r'<([^:<>]+)(?::(\d+)(?::([^<>]*))?)?>')
 
-validation_tests = (
-    (
-    type_xlate,
-        (
-        TestHarness.exception,
-            ("TEST",),
-            "hamlibIO.hamlibIOerror"
-        ), #Not a type
-        (
-        TestHarness.compare,
-            (type(None),),
-            "None"
-        ),
-        (
-        TestHarness.compare,
-            (dict,),
-            "dict"
-        ),
-    ),
-    (
-    validate_arg_type,
-        (
-        TestHarness.exception,
-            ("TEST",),
-            "hamlibIO.hamlibIOerror"
-        ),
-        (
-        TestHarness.exception,
-            ("[]", ),
-            "hamlibIO.hamlibIOerror"
-        ),
-        (
-        TestHarness.exception,
-            ((("TEST",)),),
-            "hamlibIO.hamlibIOerror"
-        ),
-        (
-        TestHarness.exception,
-            (((("TEST", str), ())),),
-            "hamlibIO.hamlibIOerror"
-        ),
-        (
-        TestHarness.exception,
-            ((("TEST", str, str),),),
+ADIF_READ_CHUNK_SIZE = 64 * 1024
+
+def iter_ADIF_records(fileobj, header=None, chunk_size=ADIF_READ_CHUNK_SIZE,
+    header_types=None):
+    """
+    Read ADIF (.adi) records from an open text file one record at a
+    time. The file is read in chunks, so memory use is bounded by the
+    chunk size and the largest record - not the size of the file.
+
+    Field lengths are taken from the <NAME:LENGTH[:TYPE]> tags, so field
+    contents are never scanned for tags and may contain "<" and ">".
+    Lengths count characters. Field names are returned in upper case,
+    data type indicators of record fields are discarded. Anything that
+    is not a tag, such as header comments and newlines between fields,
+    is skipped.
+
+    Arguments:
+        fileobj:
+            Text file object (or anything with a read(size) method
+            returning strings).
+        header: Default None
+            If a dictonary is supplied, the header fields (everything
+            before <EOH>) are stored in it.
+        chunk_size: Default ADIF_READ_CHUNK_SIZE
+            Number of characters to read from the file at a time.
+        header_types: Default None
+            If a dictonary is supplied, the data type indicators of the
+            header fields that have one (such as USERDEFn, which gives
+            the data type of a user-defined field) are stored in it by
+            upper case field name.
+
+    Returns:
+        Generator yielding one dictonary of field names and contents for
+        each <EOR>. A trailing record without an <EOR> (truncated file)
+        is not returned.
+    """
+
+    validate_arg_type((
+        (fileobj,),
+        (header, dict, None),
+        (chunk_size, int),
+        (header_types, dict, None),
+    ))
+
+    if chunk_size < 1:
+        sys.stderr.write("""
+Error: iter_ADIF_records chunk_size must be greater than zero, {} was
+       specified.
+""".format(chunk_size))
+        raise hamlibIOerror("iter_ADIF_records parameter error")
+
+    #
+    #Field names seen so far and their upper case versions, so each
+    #distinct name is only upcased once.
+    #
+    names = {}
+    search = re_ADIF_tag.search
+
+    #
+    #Data type indicators of the fields read so far, until the header
+    #has been read
+    #
+    types = {} if header_types is not None else None
+
+    buffer = ""
+    buffer_length = 0
+    position = 0
+    record = {}
+    while True:
+        match = search(buffer, position)
+        if match is not None:
+            (name, length, data_type) = match.groups()
+            end = match.end()
+
+            if length is None:
+                #
+                #Tag without contents, only <EOR> and <EOH> mean anything
+                #
+                position = end
+                name = name.strip().upper()
+                if name == "EOR":
+                    types = None
+                    yield record
+                    record = {}
+                elif name == "EOH":
+                    #
+                    #Everything read so far is the header
+                    #
+                    if header is not None:
+                        header.update(record)
+                    if types:
+                        header_types.update(types)
+                    types = None
+                    record = {}
+                continue
+
+            length = int(length)
+            if end + length <= buffer_length:
+                #
+                #Field with contents, save it and skip over the contents.
+                #
+                upper_name = names.get(name)
+                if upper_name is None:
+                    upper_name = names[name] = name.strip().upper()
+                position = end + length
+                record[upper_name] = buffer[end:position]
+                if data_type and (types is not None):
+                    types[upper_name] = data_type.strip().upper()
+                continue
+
+        #
+        #Read more of the file, there's no complete tag in the buffer or
+        #the tag's field contents haven't all been read yet.
+        #
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            #
+            #End of file. Any fields without an <EOR> are dropped.
+            #
+            return
+
+        #
+        #Throw away what's been processed, keeping any partial tag or
+        #field at the end of the buffer.
+        #
+        if match is None:
+            keep = buffer.rfind("<", position)
+            buffer = (buffer[keep:] if keep >= 0 else "") + chunk
+        else:
+            buffer = buffer[match.start():] + chunk
+        buffer_length = len(buffer)
+        position = 0
+
+#
+#Matches one ADIF tag in bytes, mmap or other buffer objects
+#
+re_ADIF_tag_bytes = LazyPattern(rb'<([^:<>]+)(?::(\d+)(?::([^<>]*))?)?>')
+
+#
+#Matches a byte that isn't ASCII. Up to the next one, field lengths in
+#characters are also lengths in bytes.
+#
+re_non_ASCII_bytes = LazyPattern(rb'[\x80-\xff]')
+
+def ADIF_contents_size(data, offset, length, end, encoding="utf-8"):
+    """
+    Return the number of bytes taken by a field's contents. ADIF field
+    lengths count characters (as iter_ADIF_records and the writers do),
+    so contents holding multi-byte characters take more bytes than the
+    length in their tag. Bytes that aren't valid in the encoding count
+    as one character each.
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data.
+        offset:
+            Offset of the field contents.
+        length:
+            Length of the field contents in characters.
+        end:
+            Offset of the end of the data.
+        encoding: Default "utf-8"
+            Character encoding of the data.
+
+    Returns:
+        Size of the field contents in bytes, None if the data ends
+        before all of them.
+    """
+
+    contents = str(memoryview(data)[offset:min(end, offset + 4 * length)],
+        encoding, "surrogateescape")
+    if len(contents) < length:
+        return(None)
+
+    return(len(contents[:length].encode(encoding, "surrogateescape")))
+
+def iter_ADIF_spans(data, start=0, end=None, encoding="utf-8"):
+    """
+    Tokenize ADIF (.adi) data held in a bytes-like object - bytes,
+    bytearray, memoryview or mmap - without copying or decoding it.
+
+    Field contents are skipped using the length in each tag, so only the
+    tags themselves are scanned. Tag lengths count characters, like
+    iter_ADIF_records; contents are only decoded to find their size in
+    bytes when they hold non-ASCII bytes. Use memoryview(data)[offset:
+    offset + length] for a zero-copy slice of a field's contents, or
+    ADIF_field_value to decode it.
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data.
+        start: Default 0
+            Offset to start tokenizing at.
+        end: Default None
+            Offset to stop tokenizing at, None for the end of data.
+        encoding: Default "utf-8"
+            Character encoding of the data.
+
+    Returns:
+        Generator yielding a (name, offset, length) tuple for each tag.
+        name is the upper case field name, offset and length are the
+        position and size in bytes of the field contents in data. For
+        tags without
+        contents (<EOR> and <EOH>) offset is the position of the tag
+        and length is None. A field whose contents run past the end is
+        not returned.
+    """
+
+    validate_arg_type((
+        (data, bytes, bytearray, memoryview, mmap.mmap),
+        (start, int),
+        (end, int, None),
+        (encoding, str),
+    ))
+
+    if end is None:
+        end = len(data)
+
+    #
+    #Field names seen so far and their upper case versions, so each
+    #distinct name is only decoded and upcased once.
+    #
+    names = {}
+    search = re_ADIF_tag_bytes.search
+    search_non_ASCII = re_non_ASCII_bytes.search
+    non_ASCII = -1
+
+    position = start
+    while True:
+        match = search(data, position, end)
+        if match is None:
+            return
+
+        (name, length, data_type) = match.groups()
+        upper_name = names.get(name)
+        if upper_name is None:
+            upper_name = names[name] = \
+                name.decode("ascii", "replace").strip().upper()
+
+        position = match.end()
+        if length is None:
+            yield((upper_name, match.start(), None))
+            continue
+
+        length = int(length)
+        if non_ASCII < position:
+            match = search_non_ASCII(data, position, end)
+            non_ASCII = match.start() if match is not None else end
+        if position + length > non_ASCII:
+            length = ADIF_contents_size(data, position, length, end,
+                encoding)
+            if length is None:
+                return
+
+        if position + length > end:
+            return
+
+        yield((upper_name, position, length))
+        position += length
+
+def ADIF_field_value(data, offset, length, encoding="utf-8"):
+    """
+    Decode the contents of a field found by iter_ADIF_spans.
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data.
+        offset:
+            Offset of the field contents.
+        length:
+            Size of the field contents in bytes.
+        encoding: Default "utf-8"
+            Character encoding of the data.
+
+    Returns:
+        Field contents as a string.
+    """
+
+    validate_arg_type((
+        (data, bytes, bytearray, memoryview, mmap.mmap),
+        (offset, int),
+        (length, int),
+        (encoding, str),
+    ))
+
+    return(str(memoryview(data)[offset:offset + length], encoding))
+
+def scan_ADIF_records(data, field_names, encoding="utf-8"):
+    """
+    Pull a few fields out of every record in ADIF data held in a
+    bytes-like object. Only the requested fields are decoded, everything
+    else is skipped by offset. Fields before <EOH> (the header) are
+    ignored.
+
+    Example, a mmap'ed log:
+
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                for qso in scan_ADIF_records(m, ("CALL", "QSO_DATE")):
+                    ...
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data.
+        field_names:
+            Tuple or list of field names to return.
+        encoding: Default "utf-8"
+            Character encoding of the data.
+
+    Returns:
+        Generator yielding a dictonary of the requested fields found in
+        each record (<EOR>).
+    """
+
+    validate_arg_type((
+        (data, bytes, bytearray, memoryview, mmap.mmap),
+        (field_names, tuple, list),
+        (encoding, str),
+    ))
+
+    wanted = {name.upper() for name in field_names}
+
+    #
+    #Raw field names seen so far, mapped to their upper case versions if
+    #they're wanted, "" if they're not. This is the same loop as
+    #iter_ADIF_spans, inlined since it's the hot path.
+    #
+    names = {}
+    search = re_ADIF_tag_bytes.search
+    search_non_ASCII = re_non_ASCII_bytes.search
+    non_ASCII = -1
+    view = memoryview(data)
+    end = len(data)
+
+    position = 0
+    record = {}
+    while True:
+        match = search(data, position)
+        if match is None:
+            return
+
+        (name, length, data_type) = match.groups()
+        position = match.end()
+
+        if length is None:
+            name = name.strip().upper()
+            if name == b"EOR":
+                yield record
+                record = {}
+            elif name == b"EOH":
+                record = {}
+            continue
+
+        length = int(length)
+        if non_ASCII < position:
+            match = search_non_ASCII(data, position, end)
+            non_ASCII = match.start() if match is not None else end
+        if position + length > non_ASCII:
+            length = ADIF_contents_size(data, position, length, end,
+                encoding)
+            if length is None:
+                return
+
+        if position + length > end:
+            return
+
+        upper_name = names.get(name)
+        if upper_name is None:
+            upper_name = name.decode("ascii", "replace").strip().upper()
+            upper_name = names[name] = \
+                upper_name if upper_name in wanted else ""
+
+        if upper_name:
+            record[upper_name] = str(view[position:position + length],
+                encoding)
+        position += length
+
+def ADX_field_name(element):
+    """
+    Return the ADIF field name for an element of an ADX record or
+    header. APP and USERDEF elements are named the way they are in an
+    ADIF (.adi) file.
+
+    Arguments:
+        element:
+            xml.etree.ElementTree Element
+
+    Returns:
+        Upper case field name
+    """
+
+    name = element.tag.upper()
+    if name == "APP":
+        return("APP_{}_{}".format(element.get("PROGRAMID", ""),
+            element.get("FIELDNAME", "")).upper())
+
+    if name == "USERDEF":
+        if "FIELDID" in element.attrib:
+            return("USERDEF" + element.get("FIELDID"))
+        return(element.get("FIELDNAME", name).upper())
+
+    return(name)
+
+def iter_ADX_records(source, header=None, header_types=None):
+    """
+    Read ADX (ADIF XML) records one record at a time. The file is parsed
+    incrementally and each record's elements are cleared once it has
+    been returned, so memory use doesn't grow with the size of the file.
+
+    Arguments:
+        source:
+            File name or file object opened in binary mode.
+        header: Default None
+            Dictonary to receive the header fields, or None to ignore
+            the header.
+        header_types: Default None
+            Dictonary to receive the data type indicators (TYPE
+            attributes) of the header fields that have one, see
+            iter_ADIF_records.
+
+    Returns:
+        Generator yielding a dictonary of upper case field names and
+        their contents for each record, like iter_ADIF_records.
+    """
+
+    validate_arg_type((
+        (source,),
+        (header, dict, None),
+        (header_types, dict, None),
+    ))
+
+    import xml.etree.ElementTree as ElementTree
+
+    records_element = None
+    for (event, element) in ElementTree.iterparse(source,
+            events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == "RECORDS":
+                records_element = element
+            continue
+
+        if tag == "RECORD":
+            fields = {}
+            for child in element:
+                fields[ADX_field_name(child)] = child.text or ""
+
+            yield(fields)
+
+            #
+            #Done with the record, throw away its elements
+            #
+            element.clear()
+            if records_element is not None:
+                records_element.clear()
+
+        elif tag == "HEADER":
+            for child in element:
+                field_name = ADX_field_name(child)
+                if header is not None:
+                    header[field_name] = child.text or ""
+                if (header_types is not None) and child.get("TYPE"):
+                    header_types[field_name] = child.get("TYPE").upper()
+            element.clear()
+
+def check_ADIF_records(records, field_definitions=record_fields):
+    """
+    Validate a whole log in one pass with check_record, including the
+    STATE, CNTY, ... checks against each record's DXCC entity.
+
+    Arguments:
+        records:
+            Iterable of record dictonaries, such as iter_ADIF_records
+            returns.
+        field_definitions: Default record_fields
+            Dictonary of valid field names.
+
+    Returns:
+        List of (record number, list of FieldErrors) for each record in
+        error. Record numbers start at 1. Empty if all records are
+        valid.
+    """
+
+    validate_arg_type((
+        (field_definitions, dict),
+    ))
+
+    results = []
+    for record_number, fields in enumerate(records, 1):
+        errors = check_record(fields, field_definitions)
+        if errors:
+            results.append((record_number, errors))
+
+    return(results)
+
+def check_ADIF_file(filename, encoding="utf-8"):
+    """
+    Validate every record of an ADIF (.adi) file in one pass. See
+    check_ADIF_records.
+
+    Arguments:
+        filename:
+            Name of the ADIF file
+        encoding: Default "utf-8"
+            Encoding of the file
+
+    Returns:
+        List of (record number, list of FieldErrors) for each record in
+        error. Empty if all records are valid.
+    """
+
+    validate_arg_type((
+        (filename, str),
+        (encoding, str),
+    ))
+
+    f = open(filename, "r", encoding=encoding, newline="")
+    try:
+        #
+        #The header has been read once the first record has, and may
+        #declare user-defined fields
+        #
+        header = {}
+        header_types = {}
+        records = iter_ADIF_records(f, header, header_types=header_types)
+        first_record = next(records, None)
+        if first_record is None:
+            return([])
+
+        return(check_ADIF_records(itertools.chain((first_record,),
+            records), {**record_fields,
+                **userdef_field_definitions(header, header_types)}))
+    finally:
+        f.close()
+
+########################################################################
+########################################################################
+#
+# ADIF file conversion
+#
+########################################################################
+########################################################################
+
+#
+#File name extensions of the two ADIF file formats
+#
+ADIF_FORMAT_ADI = "ADI"
+ADIF_FORMAT_ADX = "ADX"
+ADIF_file_formats = {
+    ".adi" : ADIF_FORMAT_ADI,
+    ".adif" : ADIF_FORMAT_ADI,
+    ".adx" : ADIF_FORMAT_ADX,
+    }
+
+#
+#Header fields that describe the file itself rather than the log. These
+#aren't copied to a converted file - header_defaults fills them in for
+#the new file.
+#
+conversion_header_fields = frozenset((ADIF_VER_FIELD,
+    CREATED_TIMESTAMP_FIELD, PROGRAMID_FIELD, "PROGRAMVERSION"))
+
+def ADIF_file_format(filename):
+    """
+    Determine the format of an ADIF file from its file name extension.
+
+    Arguments:
+        filename:
+            Name of the file
+
+    Returns:
+        ADIF_FORMAT_ADI (.adi, .adif) or ADIF_FORMAT_ADX (.adx).
+        hamlibIOerror is raised for any other extension.
+    """
+
+    validate_arg_type((
+        (filename, str),
+    ))
+
+    file_format = ADIF_file_formats.get(
+        os.path.splitext(filename)[1].lower())
+    if file_format is None:
+        sys.stderr.write("""
+Error: "{}" is not an ADIF file name, the extension must be one of:
+       {}
+""".format(filename, ", ".join(ADIF_file_formats)))
+        raise hamlibIOerror("Unknown ADIF file format.")
+
+    return(file_format)
+
+def convert_ADIF_file(in_filename, out_filename, errors=None,
+    encoding="utf-8"):
+    """
+    Convert an ADIF (.adi) file to ADX (.adx) or the reverse, or copy a
+    file to the same format. The format of each file is taken from its
+    extension, see ADIF_file_format.
+
+    Records are streamed one at a time from iter_ADIF_records or
+    iter_ADX_records to write_ADIF_file or write_ADX_file, so every
+    field is checked against the field validation tables of the target
+    format and memory use doesn't grow with the size of the file.
+
+    The internationalized (_INTL) fields are kept when writing ADX. ADI
+    doesn't allow them, so they are dropped when writing ADI. Valid
+    header fields are copied, except those describing the file itself
+    (ADIF_VER, CREATED_TIMESTAMP, PROGRAMID and PROGRAMVERSION) which
+    are set for the new file. Application-defined (APP_) fields are
+    passed through unchanged, and USERDEFn header fields are copied with
+    their data types, along with the user-defined fields they declare.
+
+    Arguments:
+        in_filename:
+            Name of the file to convert
+        out_filename:
+            Name of the file to create. An existing file is replaced.
+        errors: Default None
+            If a list is supplied, records in error are skipped and
+            reported in it, see write_ADIF_file. If None, the first
+            record in error is printed and a hamlibIOerror raised.
+        encoding: Default "utf-8"
+            Encoding of an ADI input file. ADX files are always read as
+            XML.
+
+    Returns:
+        Number of records written.
+    """
+
+    validate_arg_type((
+        (in_filename, str),
+        (out_filename, str),
+        (errors, list, None),
+        (encoding, str),
+    ))
+
+    in_format = ADIF_file_format(in_filename)
+    out_format = ADIF_file_format(out_filename)
+
+    if in_format == ADIF_FORMAT_ADX:
+        f = open(in_filename, "rb")
+    else:
+        #
+        #newline="" so CR/LF in multiline fields is left alone and field
+        #lengths stay right
+        #
+        f = open(in_filename, "r", encoding=encoding, newline="")
+    try:
+        header = {}
+        header_types = {}
+        if in_format == ADIF_FORMAT_ADX:
+            records = iter_ADX_records(f, header, header_types)
+        else:
+            records = iter_ADIF_records(f, header,
+                header_types=header_types)
+
+        #
+        #The header has been read once the first record has
+        #
+        first_record = next(records, None)
+        if first_record is not None:
+            records = itertools.chain((first_record,), records)
+
+        out_header = {}
+        for field_name, field_value in header.items():
+            if (field_name.upper() not in conversion_header_fields) and (
+                    check_field(header_fields, field_name,
+                        field_value) is None):
+                out_header[field_name] = field_value
+
+        if out_format == ADIF_FORMAT_ADX:
+            return(write_ADX_file(records, out_filename, out_header,
+                errors, header_types))
+
+        #
+        #ADI files can't hold the _INTL fields
+        #
+        records = ({field_name: field_value
+            for field_name, field_value in fields.items()
+            if field_name.upper() not in xml_subset_record_fields}
+            for fields in records)
+
+        return(write_ADIF_file(records, out_filename, out_header,
+            errors=errors, header_types=header_types))
+    finally:
+        f.close()
+
+########################################################################
+########################################################################
+#
+# Parallel ADIF file validation
+#
+########################################################################
+########################################################################
+
+#
+#Files larger than this are split into shards of about this many bytes
+#(at <EOR> boundaries) so one large file can be validated by several
+#processes.
+#
+ADIF_SHARD_SIZE = 4 * 1024 * 1024
+
+def ADIF_shards(data, shard_size=ADIF_SHARD_SIZE, encoding="utf-8"):
+    """
+    Split ADIF (.adi) data into shards of whole records. Shards end
+    just after an <EOR> tag. The tags are found with iter_ADIF_spans, so
+    an "<EOR>" inside field contents doesn't split a record.
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data (see
+            iter_ADIF_spans).
+        shard_size: Default ADIF_SHARD_SIZE
+            Approximate size of each shard in bytes.
+        encoding: Default "utf-8"
+            Character encoding of the data.
+
+    Returns:
+        List of (start offset, end offset, number of the shard's first
+        record) tuples that cover all of data. Record numbers start at
+        1.
+    """
+
+    validate_arg_type((
+        (data, bytes, bytearray, memoryview, mmap.mmap),
+        (shard_size, int),
+        (encoding, str),
+    ))
+
+    if shard_size < 1:
+        sys.stderr.write("""
+Error: shard_size must be 1 or greater, not {}.
+""".format(shard_size))
+        raise hamlibIOerror("Invalid shard size")
+
+    shards = []
+    start = 0
+    first_record = 1
+    records = 0
+    for (name, offset, length) in iter_ADIF_spans(data,
+            encoding=encoding):
+        if name != "EOR":
+            continue
+
+        records += 1
+        if offset - start >= shard_size:
+            end = data.find(b">", offset) + 1
+            shards.append((start, end, first_record))
+            start = end
+            first_record = records + 1
+
+    shards.append((start, len(data), first_record))
+
+    return(shards)
+
+def ADIF_field_definitions(data, encoding="utf-8"):
+    """
+    Field definitions for checking the records of ADIF (.adi) data: the
+    ADIF record fields, plus the user-defined fields declared by the
+    USERDEFn fields of its header (see userdef_field_definitions).
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data (see
+            iter_ADIF_spans).
+        encoding: Default "utf-8"
+            Character encoding of the data.
+
+    Returns:
+        Dictonary of field definitions, record_fields itself if the
+        header doesn't declare any user-defined fields.
+    """
+
+    validate_arg_type((
+        (data, bytes, bytearray, memoryview, mmap.mmap),
+        (encoding, str),
+    ))
+
+    for (name, offset, length) in iter_ADIF_spans(data, encoding=encoding):
+        if name == "EOR":
+            return(record_fields)
+        if name == "EOH":
+            break
+    else:
+        return(record_fields)
+
+    #
+    #Read the header again with iter_ADIF_records for the data type
+    #indicators of its fields
+    #
+    header = {}
+    header_types = {}
+    text = str(memoryview(data)[:data.find(b">", offset) + 1], encoding,
+        "replace")
+    for fields in iter_ADIF_records(io.StringIO(text), header,
+            header_types=header_types):
+        pass
+
+    definitions = userdef_field_definitions(header, header_types)
+    if not definitions:
+        return(record_fields)
+
+    return({**record_fields, **definitions})
+
+def validate_ADIF_shard(filename, start, end, first_record,
+        encoding="utf-8"):
+    """
+    Validate the records of one shard of an ADIF (.adi) file with
+    check_record, accepting the user-defined fields declared in the
+    file's header. Run by validate_ADIF_files, in a worker process if
+    there's more than one worker.
+
+    Arguments:
+        filename:
+            Name of the ADIF file
+        start:
+            Offset of the start of the shard (see ADIF_shards)
+        end:
+            Offset of the end of the shard
+        first_record:
+            Record number of the first record in the shard
+        encoding: Default "utf-8"
+            Encoding of the file
+
+    Returns:
+        List of (record number, list of FieldErrors) for each record in
+        error.
+    """
+
+    validate_arg_type((
+        (filename, str),
+        (start, int),
+        (end, int),
+        (first_record, int),
+        (encoding, str),
+    ))
+
+    results = []
+    if start >= end:
+        return(results)
+
+    f = open(filename, "rb")
+    try:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            field_definitions = ADIF_field_definitions(data, encoding)
+            record_number = first_record
+            fields = {}
+            for (name, offset, length) in iter_ADIF_spans(data, start, end,
+                    encoding):
+                if length is not None:
+                    fields[name] = data[offset:offset + length].decode(
+                        encoding, "replace")
+                elif name == "EOR":
+                    errors = check_record(fields, field_definitions)
+                    if errors:
+                        results.append((record_number, errors))
+                    record_number += 1
+                    fields = {}
+                elif name == "EOH":
+                    #
+                    #Everything so far was the header
+                    #
+                    fields = {}
+        finally:
+            data.close()
+    finally:
+        f.close()
+
+    return(results)
+
+def validate_ADIF_files(filenames, workers=None, shard_size=ADIF_SHARD_SIZE,
+        encoding="utf-8"):
+    """
+    Validate every record of a list of ADIF (.adi) files, spreading the
+    work over several processes. Large files are split into shards at
+    <EOR> boundaries (see ADIF_shards) so they're validated in
+    parallel too.
+
+    Results are always in the order of filenames, then record number,
+    no matter which process finishes first.
+
+    Arguments:
+        filenames:
+            Tuple or list of ADIF file names
+        workers: Default None
+            Number of worker processes, None for one per CPU. With 1,
+            everything is validated in this process.
+        shard_size: Default ADIF_SHARD_SIZE
+            Approximate size of each shard in bytes.
+        encoding: Default "utf-8"
+            Encoding of the files
+
+    Returns:
+        List of (filename, list of (record number, list of
+        FieldErrors)) for each file, in the order of filenames.
+    """
+
+    validate_arg_type((
+        (filenames, tuple, list),
+        (workers, int, None),
+        (shard_size, int),
+        (encoding, str),
+    ))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        sys.stderr.write("""
+Error: workers must be 1 or greater, not {}.
+""".format(workers))
+        raise hamlibIOerror("Invalid number of workers")
+
+    #
+    #Split every file into shards: (file index, shard arguments). Files
+    #that fit in one shard, or everything if there's only one worker,
+    #aren't scanned.
+    #
+    tasks = []
+    for file_index, filename in enumerate(filenames):
+        size = os.path.getsize(filename)
+        if size == 0:
+            continue
+
+        if (workers == 1) or (size <= shard_size):
+            tasks.append((file_index, (filename, 0, size, 1, encoding)))
+            continue
+
+        f = open(filename, "rb")
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for shard in ADIF_shards(data, shard_size, encoding):
+                    tasks.append((file_index, (filename,) + shard
+                        + (encoding,)))
+            finally:
+                data.close()
+        finally:
+            f.close()
+
+    if (workers == 1) or (len(tasks) < 2):
+        shard_results = [validate_ADIF_shard(*arguments)
+            for (file_index, arguments) in tasks]
+    else:
+        import concurrent.futures
+
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)))
+        try:
+            pending = [executor.submit(validate_ADIF_shard, *arguments)
+                for (file_index, arguments) in tasks]
+            shard_results = [future.result() for future in pending]
+        finally:
+            executor.shutdown()
+
+    #
+    #Shards are in file then record order, so merging is just putting
+    #each file's shards back together.
+    #
+    results = [(filename, []) for filename in filenames]
+    for (file_index, arguments), errors in zip(tasks, shard_results):
+        results[file_index][1].extend(errors)
+
+    return(results)
+
+########################################################################
+########################################################################
+#
+# Columnar QSO storage
+#
+########################################################################
+########################################################################
+
+@functools.lru_cache(maxsize=None)
+def get_qso_table_coded_fields():
+    """
+    Fields QSOTable stores as small integer codes, one code per distinct
+    value, rather than a string per QSO: the enumerated fields and other
+    fields that take few distinct values in a log (QSO_DATE and TIME_ON
+    are repeated across a busy log, FREQ and RST even more so). Built
+    the first time a QSOTable needs it.
+
+    Returns:
+        Frozen set of upper case field names
+    """
+
+    return(frozenset(
+        [field_name for field_name, field_type in record_fields.items()
+            if callable(field_type) and ((field_type in enumeration_tables)
+                or (field_type in lazy_enumeration_tables))]
+        + ["CNTY", "COUNTRY", "FREQ", "FREQ_RX", "GRIDSQUARE",
+            "MY_ANTENNA", "MY_CNTY", "MY_GRIDSQUARE", "MY_RIG", "MY_SIG",
+            "MY_SIG_INFO", "MY_STATE", "OPERATOR", "PROP_MODE", "QSO_DATE",
+            "QSO_DATE_OFF", "RST_RCVD", "RST_SENT", "RX_PWR", "SIG",
+            "STATE", "STATION_CALLSIGN", "SUBMODE", "TIME_OFF", "TIME_ON",
+            "TX_PWR"]))
+
+#
+#Array type code of a code column, and the type code it's widened to
+#when it runs out of codes
+#
+qso_table_code_type = "B"
+qso_table_wider_code_type = {"B" : "H", "H" : "I", "I" : "Q"}
+
+class QSORow(collections.abc.Mapping):
+    """
+    Read only view of one row (QSO) of a QSOTable. It behaves like a
+    dictonary of upper case field names and their contents, with only
+    the fields the QSO has. Use dict(row) or QSOTable.record for a
+    dictonary that can be changed or passed to write_ADIF_file.
+
+    Attributes:
+        table:
+            The QSOTable
+        row:
+            Row number
+    """
+
+    __slots__ = ("table", "row")
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, field_name):
+        value = self.table.value(self.row, field_name)
+        if value is None:
+            raise KeyError(field_name)
+        return(value)
+
+    def __iter__(self):
+        for field_name in self.table.columns:
+            if self.table.value(self.row, field_name) is not None:
+                yield(field_name)
+
+    def __len__(self):
+        return(sum(1 for field_name in self))
+
+    def __repr__(self):
+        return("QSORow({!r})".format(dict(self)))
+
+class QSOTable:
+    """
+    Columnar in-memory store for a log: one column per ADIF field rather
+    than a dictonary per QSO, which takes about 5 to 9 times less memory
+    for large logs (fewer repeated field values, less saving). See
+    "python3 hamlibIO_bench.py qsotable".
+
+    Fields in get_qso_table_coded_fields() (BAND, MODE, DXCC, MY_SIG,
+    ...) are stored as integer codes in an array - one byte per QSO
+    until a field has more than 255 distinct values, then the array is
+    widened. Other fields are stored in a list. Field contents aren't
+    validated, use check_record or check_ADIF_records for that.
+
+    Arguments:
+        records: Default None
+            Iterable of record dictonaries, such as iter_ADIF_records
+            returns, to load into the table.
+
+    Attributes:
+        columns:
+            Dictonary of upper case field name -> column: an array of
+            codes for a coded field, otherwise a list of field contents.
+            A column is created the first time its field is seen and
+            only extended when a QSO has the field, so it may be shorter
+            than the table - QSOs past its end don't have the field.
+        column_values:
+            Dictonary of coded field name -> list of field contents by
+            code. Code 0 is None (QSO doesn't have the field). For the
+            fields with EnumerationCodes (BAND, MODE, DXCC, ...), codes
+            1 to the size of the enumeration are the enumeration's
+            codes plus 1, so they're the same in every table and in
+            enumeration order. Other contents (including other
+            character cases) get the codes after those.
+        value_codes:
+            Dictonary of coded field name -> dictonary of field contents
+            -> code.
+        length:
+            Number of QSOs.
+    """
+
+    __slots__ = ("columns", "column_values", "value_codes", "length")
+
+    def __init__(self, records=None):
+        self.columns = {}
+        self.column_values = {}
+        self.value_codes = {}
+        self.length = 0
+
+        if records is not None:
+            self.extend(records)
+
+    def __len__(self):
+        return(self.length)
+
+    def __getitem__(self, row):
+        """
+        Row view of a QSO.
+
+        Arguments:
+            row:
+                Row number, negative numbers count from the end
+
+        Returns:
+            QSORow
+        """
+
+        if row < 0:
+            row += self.length
+        if not (0 <= row < self.length):
+            raise IndexError("QSOTable row out of range")
+
+        return(QSORow(self, row))
+
+    def __iter__(self):
+        for row in range(self.length):
+            yield(QSORow(self, row))
+
+    def append(self, fields):
+        """
+        Add a QSO to the end of the table.
+
+        Arguments:
+            fields:
+                Dictonary of fields and their contents.
+
+        Returns:
+            Row number of the QSO. If two field names differ only by
+            character case, the QSO isn't added and a hamlibIOerror is
+            raised.
+        """
+
+        validate_arg_type((
+            (fields, dict),
+        ))
+
+        #
+        #Check for field names that differ only by character case before
+        #changing anything, so a bad QSO leaves the table as it was
+        #
+        if len({field_name.upper() for field_name in fields}) < len(fields):
+            upper_names = set()
+            for field_name in fields:
+                if field_name.upper() in upper_names:
+                    break
+                upper_names.add(field_name.upper())
+
+            sys.stderr.write("""
+Error: QSOTable QSO field "{}" is a duplicate of another field, differing
+       only by character case.
+""".format(field_name))
+            raise hamlibIOerror("Duplicate QSO field.")
+
+        row = self.length
+        columns = self.columns
+        value_codes = self.value_codes
+        for field_name, field_value in fields.items():
+            upper_name = field_name.upper()
+            column = columns.get(upper_name)
+            if column is None:
+                column = self.add_column(upper_name)
+
+            codes = value_codes.get(upper_name)
+
+            #
+            #Fill in the QSOs that didn't have this field
+            #
+            missing = row - len(column)
+            if missing > 0:
+                if codes is None:
+                    column.extend([None] * missing)
+                else:
+                    column.frombytes(bytes(missing * column.itemsize))
+
+            if codes is None:
+                column.append(field_value)
+                continue
+
+            code = codes.get(field_value)
+            if code is None:
+                code = self.add_value(upper_name, field_value)
+                column = columns[upper_name]
+            column.append(code)
+
+        self.length = row + 1
+        return(row)
+
+    def extend(self, records):
+        """
+        Add QSOs to the end of the table.
+
+        Arguments:
+            records:
+                Iterable of record dictonaries.
+
+        Returns:
+            Nothing
+        """
+
+        for fields in records:
+            self.append(fields)
+
+    def add_column(self, field_name):
+        """
+        Create an empty column for a field.
+
+        Arguments:
+            field_name:
+                Upper case field name
+
+        Returns:
+            The new column
+        """
+
+        if field_name in get_qso_table_coded_fields():
+            column = array.array(qso_table_code_type)
+            self.column_values[field_name] = [None]
+            self.value_codes[field_name] = {}
+
+            #
+            #Enumerated fields start with their enumeration's codes
+            #
+            codes = get_enumeration_codes(field_name)
+            if codes is not None:
+                self.column_values[field_name].extend(codes.values)
+                self.value_codes[field_name] = {value : code + 1
+                    for code, value in enumerate(codes.values)}
+                if len(codes) >= (1 << (8 * column.itemsize)):
+                    column = array.array(
+                        qso_table_wider_code_type[column.typecode])
+        else:
+            column = []
+
+        self.columns[field_name] = column
+        return(column)
+
+    def add_value(self, field_name, field_value):
+        """
+        Give new contents of a coded field the next code, widening the
+        field's column if the code doesn't fit.
+
+        Arguments:
+            field_name:
+                Upper case field name
+            field_value:
+                Field contents
+
+        Returns:
+            Code
+        """
+
+        values = self.column_values[field_name]
+        code = len(values)
+        values.append(field_value)
+        self.value_codes[field_name][field_value] = code
+
+        column = self.columns[field_name]
+        if code >= (1 << (8 * column.itemsize)):
+            self.columns[field_name] = array.array(
+                qso_table_wider_code_type[column.typecode], column)
+
+        return(code)
+
+    def value(self, row, field_name):
+        """
+        Contents of one field of one QSO.
+
+        Arguments:
+            row:
+                Row number
+            field_name:
+                Field name
+
+        Returns:
+            Field contents, None if the QSO doesn't have the field.
+        """
+
+        field_name = field_name.upper()
+        column = self.columns.get(field_name)
+        if (column is None) or (row >= len(column)):
+            return(None)
+
+        values = self.column_values.get(field_name)
+        if values is None:
+            return(column[row])
+        return(values[column[row]])
+
+    def record(self, row):
+        """
+        Dictonary of the fields of one QSO.
+
+        Arguments:
+            row:
+                Row number
+
+        Returns:
+            Dictonary of upper case field names and their contents.
+        """
+
+        return(dict(self[row]))
+
+    def records(self):
+        """
+        Dictonaries of the fields of every QSO, for write_ADIF_file,
+        check_ADIF_records, etc.
+
+        Returns:
+            Generator yielding a dictonary per QSO.
+        """
+
+        for row in range(self.length):
+            yield(dict(QSORow(self, row)))
+
+    def column(self, field_name):
+        """
+        Column scan: the contents of one field for every QSO.
+
+        Arguments:
+            field_name:
+                Field name
+
+        Returns:
+            List of field contents, one per QSO, None for QSOs that
+            don't have the field.
+        """
+
+        field_name = field_name.upper()
+        column = self.columns.get(field_name, ())
+        values = self.column_values.get(field_name)
+        if values is None:
+            contents = list(column)
+        else:
+            contents = [values[code] for code in column]
+
+        contents.extend([None] * (self.length - len(column)))
+        return(contents)
+
+    def find(self, field_name, field_value):
+        """
+        Column scan: the QSOs whose field has the given contents. Coded
+        fields are scanned by comparing codes.
+
+        Arguments:
+            field_name:
+                Field name
+            field_value:
+                Field contents to look for (exact match)
+
+        Returns:
+            List of row numbers
+        """
+
+        field_name = field_name.upper()
+        column = self.columns.get(field_name, ())
+        codes = self.value_codes.get(field_name)
+        if codes is not None:
+            field_value = codes.get(field_value)
+            if field_value is None:
+                return([])
+
+        return([row for row, contents in enumerate(column)
+            if contents == field_value])
+
+    def value_counts(self, field_name):
+        """
+        Column scan: how many QSOs have each value of a field.
+
+        Arguments:
+            field_name:
+                Field name
+
+        Returns:
+            Dictonary of field contents -> number of QSOs. QSOs that
+            don't have the field aren't counted.
+        """
+
+        field_name = field_name.upper()
+        column = self.columns.get(field_name, ())
+        counts = collections.Counter(column)
+        counts.pop(None, None)
+
+        values = self.column_values.get(field_name)
+        if values is None:
+            return(dict(counts))
+
+        counts.pop(0, None)
+        return({values[code]: count for code, count in counts.items()})
+
+    def order(self, field_name):
+        """
+        Column scan: the QSOs sorted by a field, for reports. Enumerated
+        fields sort in enumeration order (bands in frequency order)
+        followed by any contents not in the enumeration, other fields
+        sort by their contents. QSOs that don't have the field are last.
+        The sort is stable.
+
+        Arguments:
+            field_name:
+                Field name
+
+        Returns:
+            List of row numbers
+        """
+
+        field_name = field_name.upper()
+        column = self.columns.get(field_name, ())
+        values = self.column_values.get(field_name)
+        if values is None:
+            rows = sorted(range(len(column)), key=lambda row:
+                (column[row] is None, column[row]))
+        else:
+            #
+            #Sort the codes once, then the QSOs by the rank of their
+            #code
+            #
+            codes = get_enumeration_codes(field_name)
+            enumerated = len(codes) + 1 if codes is not None else 1
+            rank = list(range(len(values)))
+            for position, code in enumerate(sorted(range(enumerated,
+                    len(values)), key=values.__getitem__), enumerated):
+                rank[code] = position
+            rank[0] = len(values)
+
+            rows = sorted(range(len(column)), key=lambda row:
+                rank[column[row]])
+
+        rows.extend(range(len(column), self.length))
+        return(rows)
+
+#
+#Validation tests are created in [hopefully] the order of the functions
+#in hamlibIO. Each tuple contains the function to test, followed by any
+#number of 3 element tuples consisting of the type of test, a tuple of
+#arguments to the function and data.
+#
+#Data depends on the test:
+#   If it's an exception test, the data is the start of the text of the
+#       exception expected.
+#   If it's a compare, data is EXACTLY the data that should be returned
+#       from the function called with the supplied argumens.
+#   In the case of a display, it's an optional note as to what the
+#       person looking over the test log should see returned from the
+#       function.
+#
+
+def get_validation_tests():
+    """
+    Build the validation tests. They're built when they're run rather
+    than when hamlibIO is imported, so the TestHarness and
+    hamlibIO_tests (test helper) modules aren't loaded unless they're
+    needed.
+
+    Returns:
+        Tuple of validation tests for TestHarness.TestHarness
+    """
+
+    import TestHarness
+    import hamlibIO_tests as tests
+
+    return((
+    (
+    type_xlate,
+        (
+        TestHarness.exception,
+            ("TEST",),
+            "hamlibIO.hamlibIOerror"
+        ), #Not a type
+        (
+        TestHarness.compare,
+            (type(None),),
+            "None"
+        ),
+        (
+        TestHarness.compare,
+            (dict,),
+            "dict"
+        ),
+    ),
+    (
+    validate_arg_type,
+        (
+        TestHarness.exception,
+            ("TEST",),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ("[]", ),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ((("TEST",)),),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            (((("TEST", str), ())),),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ((("TEST", str, str),),),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ((("TEST", "TEST"),),),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.compare,
+            ((("TEST", str, None), (7,)),),
+            None
+        ),
+        (
+        TestHarness.compare,
+            (((None, str, None), ("TEST",)),),
+            None
+        ),
+        (
+        TestHarness.exception,
+            (((7, str, None),),),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ((("TEST", str, None), (7, str, None)),),
             "hamlibIO.hamlibIOerror"
         ),
+    ),
+    (
+    Boolean,
+        (
+        TestHarness.display,
+            ("X",),
+            "Not one of YyNn"
+        ),
+        (
+        TestHarness.compare,
+            ("Y",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("y",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("N",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("n",),
+            ""
+        ),
+    ),
+    (
+    Digit,
+        (
+        TestHarness.display,
+            ("X",),
+            "Non-numeric"
+        ),
+        (
+        TestHarness.compare,
+            ("0",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("9",),
+            ""
+        ),
+    ),
+
+    (
+    Integer,
+        (
+        TestHarness.display,
+            ("+17",),
+            "Plus (+)  not allowed"
+        ),
+        (
+        TestHarness.display,
+            ("1d",),
+            "Non-numeric character"
+        ),
+        (
+        TestHarness.compare,
+            ("17",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("-17",),
+            ""
+        ),
+    ),
+
+    (
+    PositiveInteger,
+        (
+        TestHarness.display,
+            ("0",),
+            "Not a positive number"
+        ),
+        (
+        TestHarness.display,
+            ("-17",),
+            "Not a positive number"
+        ),
+        (
+        TestHarness.display,
+            ("1d",),
+            "Non-numeric character"
+        ),
+        (
+        TestHarness.compare,
+            ("17",),
+             ""
+        ),
+    ),
+
+    (
+    Number,
+        (
+        TestHarness.display,
+            ("",),
+            "Zero-length string"
+        ),
+        (
+        TestHarness.display,
+            ("+17",),
+            "Plus (+)  not allowed"
+        ),
+        (
+        TestHarness.display,
+            (".",),
+            "Must have digits"
+        ),
+        (
+        TestHarness.display,
+            ("1d",),
+            "Non-numeric character"
+        ),
+        (
+        TestHarness.compare,
+            ("0",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("17",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("-17",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("17.17",),
+            ""
+        ),
+        (TestHarness.compare,
+            ("-.17",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("-17.17",),
+            ""
+        ),
+    ),
+
+    (
+    Character,
+        (
+        TestHarness.display,
+            ("",),
+            "Zero-length string"
+        ),
         (
-        TestHarness.exception,
-            ((("TEST", "TEST"),),),
-            "hamlibIO.hamlibIOerror"
+        TestHarness.display,
+            ("17",),
+            "More than one character"
+        ),
+        (
+        TestHarness.display,
+            (chr(ord(" ")-1),),
+            "0x1f - one character less than valid range"
+        ),
+        (
+        TestHarness.display,
+            (chr(ord("~")+1),),
+            "0x7f - one character more than valid range"
         ),
+        (
+        TestHarness.compare,
+            (" ",),
+            ""
+        ), #Bottom end of valid range
+        (
+        TestHarness.compare,
+            ("~",),
+            ""
+        ), #Top end of valid range
     ),
+
     (
-    Boolean,
+    String,
         (
         TestHarness.display,
-            ("X",),
-            "Not one of YyNn"
+            (chr(ord(" ")-1),),
+            "0x1f - one character less than valid range"
+        ),
+        (
+        TestHarness.display,
+            (chr(ord("~")+1),),
+            "0x7f - one character more than valid range"
+        ),
+        (
+        TestHarness.display,
+            ("",),
+            "Zero-length string"
         ),
         (
         TestHarness.compare,
-            ("Y",),
+            (" ",),
             ""
-        ),
+        ), #Bottom end of valid range
         (
         TestHarness.compare,
-            ("y",),
+            ("~",),
+            ""
+        ), #Top end of valid range
+    ),
+
+    (
+    TBS,
+        (
+        TestHarness.compare,
+            ("Ignored",),
             ""
         ),
+    ),
+
+    (
+    Region,
+        (
+        TestHarness.display,
+        ("TEST",),
+        "Invalid region"
+        ),
         (
         TestHarness.compare,
-            ("N",),
+            ("AI",),
             ""
         ),
         (
         TestHarness.compare,
-            ("n",),
+            ("ai",),
             ""
         ),
     ),
+
     (
-    Digit,
+    AwardList,
         (
         TestHarness.display,
-            ("X",),
-            "Non-numeric"
+            ("TEST",),
+            "Invalid award list"
         ),
         (
         TestHarness.compare,
-            ("0",),
+            ("DXCC",),
             ""
         ),
         (
         TestHarness.compare,
-            ("9",),
+            ("dxcc",),
             ""
         ),
     ),
 
     (
-    Integer,
+    SponsoredAwardList,
         (
         TestHarness.display,
-            ("+17",),
-            "Plus (+)  not allowed"
+            ("TEST",),
+            "Invalid sponsored award list"
+        ),
+        (
+        TestHarness.compare,
+            ("ARRL_",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("arrl_",),
+            ""
         ),
+    ),
+
+    (
+    MultilineString,
         (
         TestHarness.display,
-            ("1d",),
-            "Non-numeric character"
+            ("TEST",),
+            "Placeholder for further tests once implemented"
         ),
         (
         TestHarness.compare,
-            ("17",),
+            ("TEST",),
             ""
         ),
+    ),
+
+    (
+    Date,
+        (
+        TestHarness.display,
+            ("1956",),
+            "Only year specified"
+        ),
+        (
+        TestHarness.display,
+            ("20220000",),
+            "Invalid month and day"
+        ),
+        (
+        TestHarness.display,
+            ("20220100",),
+            "Invalid day"
+        ),
+        (
+        TestHarness.display,
+            ("20221332",),
+            "Invalid month"
+        ),
+        (
+        TestHarness.display,
+            ("20220229",),
+            "Invalid February day for 2022"
+        ),
+        (
+        TestHarness.display,
+            ("20221032",),
+            "Invalid October day"
+        ),
         (
         TestHarness.compare,
-            ("-17",),
+            ("20221030",),
             ""
         ),
     ),
 
     (
-    PositiveInteger,
+    Time,
         (
         TestHarness.display,
-            ("0",),
-            "Not a positive number"
+            ("ABCDEF",),
+            "Invalid characters for time"
         ),
         (
         TestHarness.display,
-            ("-17",),
-            "Not a positive number"
+            ("00",),
+            "Not enough digits for time"
         ),
         (
         TestHarness.display,
-            ("1d",),
-            "Non-numeric character"
+            ("00000000",),
+            "Too many digits for time"
+        ),
+        (
+        TestHarness.display,
+            ("2400",),
+            "Invalid hour for time"
+        ),
+        (
+        TestHarness.display,
+            ("2360",),
+            "Invalid minutes for time"
+        ),
+        (
+        TestHarness.display,
+            ("240000",),
+            "Invalid hour for time"
+        ),
+        (
+        TestHarness.display,
+            ("236000",),
+            "Invalid minute for time"
+        ),
+        (
+        TestHarness.display,
+            ("230060",),
+            "Invalid seconds for time"
+        ),
+        (
+        TestHarness.display,
+            ("236060",),
+            "Invalid minutes and seconds for time"
+        ),
+        (
+        TestHarness.display,
+            ("246060",),
+            "Invalid hour, minte and seconds for time"
         ),
         (
         TestHarness.compare,
-            ("17",),
-             ""
+        ("0000",), ""),
+        (
+        TestHarness.compare,
+        ("2359",), ""),
+        (
+        TestHarness.compare,
+            ("000000",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("235959",),
+            ""
         ),
     ),
 
     (
-    Number,
+    Ant_Path,
         (
         TestHarness.display,
-            ("",),
-            "Zero-length string"
+            ("TEST",),
+            "Invalid antenna path"
+        ),
+        (
+        TestHarness.compare,
+            ("O",),
+            ""
+        ),
+    ),
+
+    (
+    Location,
+        (
+        TestHarness.display,
+            ("W90 00.000",),
+            "90 degrees invalid"
         ),
         (
         TestHarness.display,
-            ("+17",),
-            "Plus (+)  not allowed"
+            ("W090 0.000",),
+            "Two digits must preceed decimal (.) point"
         ),
         (
         TestHarness.display,
-            (".",),
-            "Must have digits"
+            ("W090 00.00",),
+            "Three digits must follow decimal (.) point"
         ),
         (
         TestHarness.display,
-            ("1d",),
-            "Non-numeric character"
+            ("A000 00.000",),
+            "Invalid cardinal direction"
+        ),
+        (
+        TestHarness.display,
+            ("W181 60.000",),
+            "Longitude cannot exceed 180 degrees and minutes must be less than 60"
+        ),
+        (
+        TestHarness.display,
+            ("W180 01.000",),
+            "Longitude annot exceed 180 degrees"
+        ),
+        (
+        TestHarness.display,
+            ("W180 00.001",),
+            "Longitude annot exceed 180 degrees"
         ),
         (
         TestHarness.compare,
-            ("0",),
+            ("N000 00.000",),
             ""
         ),
         (
         TestHarness.compare,
-            ("17",),
+            ("S180 00.000",),
             ""
         ),
         (
         TestHarness.compare,
-            ("-17",),
+            ("E000 00.000",),
             ""
         ),
         (
         TestHarness.compare,
-            ("17.17",),
+            ("W180 00.000",),
             ""
         ),
-        (TestHarness.compare,
-            ("-.17",),
+    ),
+
+    #Note that "Longitude" uses "Location" so no need to repeat those
+    #tests.
+    (
+    Longitude,
+        (
+        TestHarness.display,
+            ("N000 00.000",),
+            'Longitude can only be "E" or "W"'
+        ),
+        (
+        TestHarness.compare,
+            ("E000 00.000",),
             ""
         ),
         (
         TestHarness.compare,
-            ("-17.17",),
+            ("W180 00.000",),
             ""
         ),
     ),
 
+    #Note that "Latitude" uses "Location" so no need to repeat those
+    #tests.
     (
-    Character,
+    Latitude,
         (
         TestHarness.display,
-            ("",),
-            "Zero-length string"
+            ("W000 00.000",),
+            'Latitude can only be "N" or "S"'
         ),
         (
         TestHarness.display,
-            ("17",),
-            "More than one character"
+            ("N091 00.000",),
+            "Latitude cannot exceed 90 degrees"
         ),
         (
         TestHarness.display,
-            (chr(ord(" ")-1),),
-            "0x1f - one character less than valid range"
+            ("S090 01.000",),
+            "Latitude cannot exceed 90 degrees"
         ),
         (
         TestHarness.display,
-            (chr(ord("~")+1),),
-            "0x7f - one character more than valid range"
+            ("N090 00.001",),
+            "Latitude cannot exceed 90 degrees"
         ),
         (
         TestHarness.compare,
-            (" ",),
+            ("N000 00.000",),
             ""
-        ), #Bottom end of valid range
+        ),
         (
         TestHarness.compare,
-            ("~",),
+            ("S090 00.000",),
             ""
-        ), #Top end of valid range
+        ),
     ),
-
     (
-    String,
+    GridSquare,
         (
         TestHarness.display,
-            (chr(ord(" ")-1),),
-            "0x1f - one character less than valid range"
+            ("00",),
+            "First two characters must be letters"
         ),
         (
         TestHarness.display,
-            (chr(ord("~")+1),),
-            "0x7f - one character more than valid range"
+            ("AS",),
+            'First letters must be less than "R"'
         ),
         (
         TestHarness.display,
-            ("",),
-            "Zero-length string"
+            ("AABB",),
+            "Characters 2 & 3 must be digits"
+        ),
+        (
+        TestHarness.display,
+            ("AA00AY",),
+            'Letters 5 & 6 must be less than "X"'
+        ),
+        (
+        TestHarness.display,
+            ("XX99YY00",),
+            "Every field wrong"
+        ),
+        (
+        TestHarness.display,
+            ("SSAAYYBB",),
+            "Every field wrong"
         ),
         (
         TestHarness.compare,
-            (" ",),
+            ("AA",),
             ""
-        ), #Bottom end of valid range
+        ),
         (
         TestHarness.compare,
-            ("~",),
+            ("AA00",),
             ""
-        ), #Top end of valid range
-    ),
-
-    (
-    TBS,
+        ),
         (
         TestHarness.compare,
-            ("Ignored",),
+            ("AA00AA",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("rr99xx99",),
             ""
         ),
     ),
 
     (
-    Region,
+    GridSquareList,
         (
         TestHarness.display,
-        ("TEST",),
-        "Invalid region"
+            ("AA, BB",),
+            "No blanks allowed in list"
         ),
         (
         TestHarness.compare,
-            ("AI",),
+            ("AA",),
             ""
         ),
         (
         TestHarness.compare,
-            ("ai",),
+            ("AA,rr",),
             ""
         ),
     ),
 
     (
-    AwardList,
+    Arrl_Sect,
         (
         TestHarness.display,
             ("TEST",),
-            "Invalid award list"
+            "Invalid ARRL section"
         ),
         (
         TestHarness.compare,
-            ("DXCC",),
+            ("CO",),
             ""
         ),
         (
         TestHarness.compare,
-            ("dxcc",),
+            ("vt",),
             ""
         ),
     ),
 
     (
-    SponsoredAwardList,
+    Band,
         (
         TestHarness.display,
-            ("TEST",),
-            "Invalid sponsored award list"
+            ("0M",),
+            "Invalid band"
         ),
         (
         TestHarness.compare,
-            ("ARRL_",),
+            ("1.25M",),
             ""
         ),
         (
         TestHarness.compare,
-            ("arrl_",),
+            ("630m",),
             ""
         ),
     ),
 
     (
-    MultilineString,
+    QSO_Upload_Status,
         (
         TestHarness.display,
-            ("TEST",),
-            "Placeholder for further tests once implemented"
+            ("X",),
+            "Not a valid status"
         ),
         (
         TestHarness.compare,
-            ("TEST",),
+            ("M",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("y",),
             ""
         ),
     ),
 
     (
-    Date,
-        (
-        TestHarness.display,
-            ("1956",),
-            "Only year specified"
-        ),
-        (
-        TestHarness.display,
-            ("20220000",),
-            "Invalid month and day"
-        ),
-        (
-        TestHarness.display,
-            ("20220100",),
-            "Invalid day"
-        ),
-        (
-        TestHarness.display,
-            ("20221332",),
-            "Invalid month"
-        ),
+    Continent,
+    
         (
         TestHarness.display,
-            ("20220229",),
-            "Invalid February day for 2022"
+            ("TEST",),
+            "Not a valid continent"
         ),
         (
-        TestHarness.display,
-            ("20221032",),
-            "Invalid October day"
+        TestHarness.compare,
+            ("AF",),
+            ""
         ),
         (
         TestHarness.compare,
-            ("20221030",),
+            ("oc",),
             ""
         ),
     ),
 
     (
-    Time,
+    Contest,
         (
         TestHarness.display,
-            ("ABCDEF",),
-            "Invalid characters for time"
+            ("TEST",),
+            "Not a valid contest"
         ),
         (
-        TestHarness.display,
-            ("00",),
-            "Not enough digits for time"
+        TestHarness.compare,
+            ("ARRL-10-GHZ",),
+            ""
         ),
         (
-        TestHarness.display,
-            ("00000000",),
-            "Too many digits for time"
+            TestHarness.compare,
+            ("wfd",),
+            ""
         ),
+    ),
+
+    (
+    CreditList,
         (
         TestHarness.display,
-            ("2400",),
-            "Invalid hour for time"
+            ("TEST",),
+            "Invalid credit list"
         ),
         (
         TestHarness.display,
-            ("2360",),
-            "Invalid minutes for time"
+            ("TEST:TEST",),
+            "Invalid credit list"
         ),
         (
         TestHarness.display,
-            ("240000",),
-            "Invalid hour for time"
+            ("WAS_SATELLITE:",),
+            "Partial credit list"
         ),
         (
         TestHarness.display,
-            ("236000",),
-            "Invalid minute for time"
+            ("WAS_SATELLITE:&",),
+            "Partial credit list"
         ),
         (
         TestHarness.display,
-            ("230060",),
-            "Invalid seconds for time"
+            ("WAS_SATELLITE:TEST",),
+            "Invalid credit list"
         ),
         (
         TestHarness.display,
-            ("236060",),
-            "Invalid minutes and seconds for time"
+            ("WAS_SATELLITE:TEST1&TEST2",),
+            "Invalid credit list"
         ),
         (
         TestHarness.display,
-            ("246060",),
-            "Invalid hour, minte and seconds for time"
+            ("WAS_SATELLITE:LOTW&TEST",),
+            "Invalid credit list"
         ),
         (
         TestHarness.compare,
-        ("0000",), ""),
-        (
-        TestHarness.compare,
-        ("2359",), ""),
-        (
-        TestHarness.compare,
-            ("000000",),
+            ("CQWPX",),
             ""
         ),
         (
         TestHarness.compare,
-            ("235959",),
+            ("WAS_SATELLITE:CARD",),
             ""
         ),
-    ),
-
-    (
-    Ant_Path,
-        (
-        TestHarness.display,
-            ("TEST",),
-            "Invalid antenna path"
-        ),
         (
         TestHarness.compare,
-            ("O",),
+            ("WAS_SATELLITE:CARD&LOTW",),
             ""
         ),
     ),
 
     (
-    Location,
+    CreditList_or_AwardList,
         (
         TestHarness.display,
-            ("W90 00.000",),
-            "90 degrees invalid"
+            ("TEST",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.display,
-            ("W090 0.000",),
-            "Two digits must preceed decimal (.) point"
+            ("TEST:TEST",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.display,
-            ("W090 00.00",),
-            "Three digits must follow decimal (.) point"
+            ("WAS_SATELLITE:",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.display,
-            ("A000 00.000",),
-            "Invalid cardinal direction"
+            ("WAS_SATELLITE:&",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.display,
-            ("W181 60.000",),
-            "Longitude cannot exceed 180 degrees and minutes must be less than 60"
+            ("WAS_SATELLITE:TEST",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.display,
-            ("W180 01.000",),
-            "Longitude annot exceed 180 degrees"
+            ("WAS_SATELLITE:TEST1&TEST2",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.display,
-            ("W180 00.001",),
-            "Longitude annot exceed 180 degrees"
+            ("WAS_SATELLITE:LOTW&TEST",),
+            "Invalid credit list or award list"
         ),
         (
         TestHarness.compare,
-            ("N000 00.000",),
+            ("CQWPX",),
             ""
         ),
         (
         TestHarness.compare,
-            ("S180 00.000",),
+            ("WAS_SATELLITE:CARD",),
             ""
         ),
         (
         TestHarness.compare,
-            ("E000 00.000",),
+            ("was_satellite:card&lotw&eqsl",),
             ""
         ),
         (
         TestHarness.compare,
-            ("W180 00.000",),
+            ("DXCC",),
+            ""
+        ),
+        (
+        TestHarness.compare,
+            ("dxcc",),
             ""
         ),
     ),
 
-    #Note that "Longitude" uses "Location" so no need to repeat those
-    #tests.
     (
-    Longitude,
+    Dxcc,
         (
         TestHarness.display,
-            ("N000 00.000",),
-            'Longitude can only be "E" or "W"'
+            ("TEST",),
+            "Not a valid DXCC value"
         ),
         (
         TestHarness.compare,
-            ("E000 00.000",),
+            ("291",),
             ""
         ),
         (
-        TestHarness.compare,
-            ("W180 00.000",),
-            ""
+        TestHarness.display,
+            ("0291",),
+            "Not a valid DXCC value"
         ),
     ),
 
-    #Note that "Latitude" uses "Location" so no need to repeat those
-    #tests.
     (
-    Latitude,
+    ADIF_shards,
         (
-        TestHarness.display,
-            ("W000 00.000",),
-            'Latitude can only be "N" or "S"'
+        TestHarness.compare,
+            (b"<EOH><CALL:5>W3MIX<EOR><COMMENT:5><EOR><EOR>"
+             b"<CALL:5>K0RLO<eor>\n<CALL:2>N0", 1),
+            [(0, 23, 1), (23, 44, 2), (44, 62, 3), (62, 73, 4)]
         ),
         (
-        TestHarness.display,
-            ("N091 00.000",),
-            "Latitude cannot exceed 90 degrees"
+        TestHarness.compare,
+            (b"<CALL:5>W3MIX<EOR><CALL:5>K0RLO<EOR>", 1000),
+            [(0, 36, 1)]
         ),
         (
-        TestHarness.display,
-            ("S090 01.000",),
-            "Latitude cannot exceed 90 degrees"
+        TestHarness.exception,
+            (b"", 0),
+            "hamlibIO.hamlibIOerror"
         ),
+    ),
+
+    (
+    tests.test_validate_ADIF_files,
         (
-        TestHarness.display,
-            ("N090 00.001",),
-            "Latitude cannot exceed 90 degrees"
+        TestHarness.compare,
+            (("<EOH><CALL:5>W3MIX<BAND:3>20M<EOR>"
+              "<CALL:5>K0RLO<BAND:3>21M<EOR>"
+              "<DXCC:3>291<STATE:2>XX<EOR>",
+              "",
+              "<TEST:1>X<EOR>"), 1, 10),
+            [(0, [(2, [FieldError("BAND", "21M", FIELD_ERROR_INVALID,
+                    Band)]),
+                  (3, [FieldError("STATE", "XX", FIELD_ERROR_SUBDIVISION,
+                    dxcc_entity(291))])]),
+             (1, []),
+             (2, [(1, [FieldError("TEST", "X", FIELD_ERROR_UNKNOWN)])])]
         ),
         (
         TestHarness.compare,
-            ("N000 00.000",),
-            ""
+            (("<EOH><CALL:5>W3MIX<BAND:3>20M<EOR>"
+              "<CALL:5>K0RLO<BAND:3>21M<EOR>"
+              "<DXCC:3>291<STATE:2>XX<EOR>",
+              "<TEST:1>X<EOR>"), 2, 10),
+            [(0, [(2, [FieldError("BAND", "21M", FIELD_ERROR_INVALID,
+                    Band)]),
+                  (3, [FieldError("STATE", "XX", FIELD_ERROR_SUBDIVISION,
+                    dxcc_entity(291))])]),
+             (1, [(1, [FieldError("TEST", "X", FIELD_ERROR_UNKNOWN)])])]
         ),
         (
         TestHarness.compare,
-            ("S090 00.000",),
-            ""
+            (("<USERDEF1:4>NICK<USERDEF2:3:N>EPC<EOH>"
+              "<NICK:5>Grüße<CALL:5>W3MIX<EPC:3>123<EOR>"
+              "<NICK:9>Ünïcødé<X><CALL:5>K0RLO<BAND:3>21M<EOR>"
+              "<NICK:3>日本語<EPC:1>x<APP_TEST_Y:2>ü!<EOR>",), 2, 20),
+            [(0, [(2, [FieldError("BAND", "21M", FIELD_ERROR_INVALID,
+                    Band)]),
+                  (3, [FieldError("EPC", "x", FIELD_ERROR_INVALID,
+                    ("Number",))])])]
         ),
     ),
+
     (
-    GridSquare,
+    tests.test_dxcc_entity,
         (
-        TestHarness.display,
-            ("00",),
-            "First two characters must be letters"
+        TestHarness.compare,
+            ("1", "NS"),
+            (1, "CANADA", False, ("Nova Scotia", None, ("05",), ("09",)))
         ),
         (
-        TestHarness.display,
-            ("AS",),
-            'First letters must be less than "R"'
+        TestHarness.compare,
+            (291, "XX"),
+            (291, "UNITED STATES OF AMERICA", False, None)
         ),
         (
-        TestHarness.display,
-            ("AABB",),
-            "Characters 2 & 3 must be digits"
+        TestHarness.compare,
+            ("2", "NS"),
+            None
         ),
         (
-        TestHarness.display,
-            ("AA00AY",),
-            'Letters 5 & 6 must be less than "X"'
+        TestHarness.compare,
+            (" 1", "NS"),
+            None
         ),
         (
-        TestHarness.display,
-            ("XX99YY00",),
-            "Every field wrong"
+        TestHarness.compare,
+            ("01", "NS"),
+            None
         ),
+    ),
+
+    (
+    dxcc_entity,
         (
-        TestHarness.display,
-            ("SSAAYYBB",),
-            "Every field wrong"
+        TestHarness.exception,
+            (1.0,),
+            "hamlibIO.hamlibIOerror"
         ),
+    ),
+
+    (
+    dxcc_entity_by_name,
         (
         TestHarness.compare,
-            ("AA",),
-            ""
+            ("United States of America",),
+            dxcc_entity(291)
         ),
         (
         TestHarness.compare,
-            ("AA00",),
-            ""
+            ("Atlantis",),
+            None
         ),
+    ),
+
+    (
+    QSL_Rcvd,
         (
-        TestHarness.compare,
-            ("AA00AA",),
-            ""
+        TestHarness.display,
+            ("T",),
+            "Not a valid value"
         ),
         (
         TestHarness.compare,
-            ("rr99xx99",),
+            ("Y",),
             ""
         ),
     ),
 
     (
-    GridSquareList,
+    QSL_Sent,
         (
         TestHarness.display,
-            ("AA, BB",),
-            "No blanks allowed in list"
+            ("T",),
+            "Not a valid value"
         ),
         (
         TestHarness.compare,
-            ("AA",),
+            ("Y",),
             ""
         ),
+    ),
+
+    (
+    QSL_Via,
+        (
+        TestHarness.display,
+            ("T",),
+            "Not a valid value"
+        ),
         (
         TestHarness.compare,
-            ("AA,rr",),
+            ("D",),
             ""
         ),
     ),
 
     (
-    Arrl_Sect,
+    Mode,
         (
         TestHarness.display,
             ("TEST",),
-            "Invalid ARRL section"
-        ),
-        (
-        TestHarness.compare,
-            ("CO",),
-            ""
+            "Not a valid mode"
         ),
         (
         TestHarness.compare,
-            ("vt",),
+            ("SSB",),
             ""
         ),
     ),
 
     (
-    Band,
+    WWFFRef,
         (
         TestHarness.display,
-            ("0M",),
-            "Invalid band"
+            ("AFF-000",),
+            "Not a valid WWRef"
         ),
         (
-        TestHarness.compare,
-            ("1.25M",),
-            ""
+        TestHarness.display,
+            ("AFF-00000",),
+            "Not a valid WWRef"
         ),
         (
         TestHarness.compare,
-            ("630m",),
+            ("AFF-0000",),
             ""
         ),
-    ),
-
-    (
-    QSO_Upload_Status,
         (
-        TestHarness.display,
-            ("X",),
-            "Not a valid status"
+        TestHarness.compare,
+            ("ABFF-0000",),
+            ""
         ),
         (
         TestHarness.compare,
-            ("M",),
+            ("ABCFF-0000",),
             ""
         ),
         (
         TestHarness.compare,
-            ("y",),
+            ("abcdFF-9999",),
             ""
         ),
     ),
 
     (
-    Continent,
-    
+    userdef,
         (
         TestHarness.display,
-            ("TEST",),
-            "Not a valid continent"
+            ("USERDEF",),
+            "Not a valid user definition"
         ),
         (
-        TestHarness.compare,
-            ("AF",),
-            ""
+        TestHarness.display,
+            ("USERDEF0",),
+            "Not a valid user definition"
+        ),
+        (
+        TestHarness.display,
+            ("USERDEFX",),
+            "Not a valid user definition"
         ),
         (
         TestHarness.compare,
-            ("oc",),
+            ("USERDEF1",),
             ""
         ),
     ),
 
     (
-    Contest,
+    dictonary_duplicates,
         (
         TestHarness.display,
-            ("TEST",),
-            "Not a valid contest"
+            ({"AA":4, "aa":8},),
+            "Keys only differ by character case"
         ),
         (
         TestHarness.compare,
-            ("ARRL-10-GHZ",),
-            ""
-        ),
-        (
-            TestHarness.compare,
-            ("wfd",),
+            ({"AA":4, "BB":8},),
             ""
         ),
     ),
 
     (
-    CreditList,
-        (
-        TestHarness.display,
-            ("TEST",),
-            "Invalid credit list"
-        ),
-        (
-        TestHarness.display,
-            ("TEST:TEST",),
-            "Invalid credit list"
-        ),
+    get_data_type_indicator,
         (
-        TestHarness.display,
-            ("WAS_SATELLITE:",),
-            "Partial credit list"
+        TestHarness.compare,
+            (record_fields["ANT_AZ"],),
+            "N"
         ),
         (
-        TestHarness.display,
-            ("WAS_SATELLITE:&",),
-            "Partial credit list"
+        TestHarness.compare,
+            (record_fields["BAND"],),
+            "E"
         ),
+    ),
+
+    (
+    valid_callsign,
+    
         (
         TestHarness.display,
-            ("WAS_SATELLITE:TEST",),
-            "Invalid credit list"
+            ("K0RLO/mobile",),
+            "Slash not allowed"
         ),
-        (
-        TestHarness.display,
-            ("WAS_SATELLITE:TEST1&TEST2",),
-            "Invalid credit list"
+        (
+        TestHarness.compare,
+            ("JY1",),
+            ""
         ),
         (
-        TestHarness.display,
-            ("WAS_SATELLITE:LOTW&TEST",),
-            "Invalid credit list"
+        TestHarness.compare,
+            ("K0RLO",),
+            ""
         ),
         (
         TestHarness.compare,
-            ("CQWPX",),
+            ("W1JU",),
             ""
         ),
         (
         TestHarness.compare,
-            ("WAS_SATELLITE:CARD",),
+            ("VE7XYZ",),
             ""
         ),
         (
         TestHarness.compare,
-            ("WAS_SATELLITE:CARD&LOTW",),
+            ("K0RLO/mobile", True),
             ""
         ),
     ),
 
     (
-    CreditList_or_AwardList,
+    field,
+        (TestHarness.compare,
+            ("FOO", "BAR",),
+            "<FOO:3>BAR"
+        ),
+        (TestHarness.compare,
+            ("FOO", "BAR", "S",),
+            "<FOO:3:S>BAR"
+        ),
+    ),
+
+    (
+    validate_field,
+    
         (
         TestHarness.display,
-            ("TEST",),
-            "Invalid credit list or award list"
+            (record_fields, "TEST", "0"),
+            "Invalid field name"
         ),
         (
         TestHarness.display,
-            ("TEST:TEST",),
-            "Invalid credit list or award list"
+            (record_fields, "CQZ", "0"),
+            "Invalid value for field"
         ),
         (
         TestHarness.display,
-            ("WAS_SATELLITE:",),
-            "Invalid credit list or award list"
+            (record_fields, "HRDLOG_QSO_UPLOAD_STATUS", "TEST"),
+            "Invalid value for field"
         ),
         (
         TestHarness.display,
-            ("WAS_SATELLITE:&",),
-            "Invalid credit list or award list"
+            (record_fields, "CREDIT_SUBMITTED", "TEST1,TEST2"),
+            "Invalid value for field"
         ),
         (
         TestHarness.display,
-            ("WAS_SATELLITE:TEST",),
-            "Invalid credit list or award list"
+            (record_fields, "CREDIT_SUBMITTED", "CQDX_QRP:TEST"),
+            "Invalid value for field"
         ),
         (
         TestHarness.display,
-            ("WAS_SATELLITE:TEST1&TEST2",),
-            "Invalid credit list or award list"
+            (record_fields, "CREDIT_SUBMITTED", "CQDX_QRP:LOTW&TEST"),
+            "Invalid value for field"
         ),
         (
-        TestHarness.display,
-            ("WAS_SATELLITE:LOTW&TEST",),
-            "Invalid credit list or award list"
+        TestHarness.compare,
+            (record_fields, "HRDLOG_QSO_UPLOAD_STATUS", "N"),
+            ""
         ),
         (
         TestHarness.compare,
-            ("CQWPX",),
+            (record_fields, "CQZ", "17"),
             ""
         ),
         (
         TestHarness.compare,
-            ("WAS_SATELLITE:CARD",),
+            (record_fields, "CREDIT_SUBMITTED", "CQDXFIELD_SATELLITE"),
             ""
         ),
         (
         TestHarness.compare,
-            ("was_satellite:card&lotw&eqsl",),
+            (record_fields, "CREDIT_SUBMITTED", "DXCC,USACA"),
             ""
         ),
         (
         TestHarness.compare,
-            ("DXCC",),
+            (record_fields, "CREDIT_SUBMITTED", "DXCC,CQDX_QRP:LOTW&CARD"),
             ""
         ),
         (
         TestHarness.compare,
-            ("dxcc",),
+            (record_fields, "sota_ref", "W0C/FR-001"),
             ""
         ),
-    ),
-
-    (
-    Dxcc,
         (
-        TestHarness.display,
-            ("TEST",),
-            "Not a valid DXCC value"
+        TestHarness.compare,
+            (xml_record_fields, "COMMENT_INTL", "Test"),
+            ""
         ),
         (
         TestHarness.compare,
-            ("291",),
+            ({"TEST" : ("Number", "Date")}, "test", "20240101"),
             ""
         ),
+        (
+        TestHarness.display,
+            ({"TEST" : ("Number", "Date")}, "test", "X"),
+            "Invalid value for field, both data types' errors"
+        ),
     ),
 
     (
-    QSL_Rcvd,
+    tests.test_field_checks,
         (
-        TestHarness.display,
-            ("T",),
-            "Not a valid value"
+        TestHarness.compare,
+            ({"test" : Band, "TEST2" : ("Number",),
+                "TEST3" : ("Number", "Date"), "TEST4" : Arrl_Sect}, "20M"),
+            {"TEST" : (True, True), "TEST2" : (False, False),
+                "TEST3" : (False, False), "TEST4" : (False, False)}
         ),
         (
         TestHarness.compare,
-            ("Y",),
-            ""
+            ({"test" : Band, "TEST2" : ("Number",),
+                "TEST3" : ("Number", "Date"), "TEST4" : Arrl_Sect}, "co"),
+            {"TEST" : (False, False), "TEST2" : (False, False),
+                "TEST3" : (False, False), "TEST4" : (True, True)}
+        ),
+        (
+        TestHarness.compare,
+            ({"test" : Band, "TEST2" : ("Number",),
+                "TEST3" : ("Number", "Date"), "TEST4" : Arrl_Sect},
+                "20240101"),
+            {"TEST" : (False, False), "TEST2" : (True, True),
+                "TEST3" : (True, True), "TEST4" : (False, False)}
         ),
     ),
 
     (
-    QSL_Sent,
+    tests.test_compile_field_type,
         (
-        TestHarness.display,
-            ("T",),
-            "Not a valid value"
+        TestHarness.compare,
+            (("Number",),),
+            (("Number",), Number)
         ),
         (
         TestHarness.compare,
-            ("Y",),
-            ""
+            (Band,),
+            (Band, Band)
         ),
     ),
 
     (
-    QSL_Via,
+    compile_field_type,
         (
-        TestHarness.display,
-            ("T",),
-            "Not a valid value"
+        TestHarness.exception,
+            (("Number", "NoSuchType"),),
+            "hamlibIO.hamlibIOerror"
         ),
+    ),
+
+    (
+    check_field,
         (
         TestHarness.compare,
-            ("D",),
-            ""
+            (record_fields, "band", "20m"),
+            None
+        ),
+        (
+        TestHarness.compare,
+            (record_fields, "BAND", "20X"),
+            FieldError("BAND", "20X", FIELD_ERROR_INVALID, Band)
+        ),
+        (
+        TestHarness.compare,
+            (record_fields, "FREQ", "14.2.1"),
+            FieldError("FREQ", "14.2.1", FIELD_ERROR_INVALID, ("Number",))
+        ),
+        (
+        TestHarness.compare,
+            (record_fields, "NOT_A_FIELD", "X"),
+            FieldError("NOT_A_FIELD", "X", FIELD_ERROR_UNKNOWN)
         ),
     ),
 
     (
-    Mode,
+    check_record,
         (
-        TestHarness.display,
-            ("TEST",),
-            "Not a valid mode"
+        TestHarness.compare,
+            ({"CALL":"W3MIX", "BAND":"20M", "DXCC":"291"},),
+            []
         ),
         (
         TestHarness.compare,
-            ("SSB",),
-            ""
+            ({"CALL":"W3MIX", "call":"K0RLO", "DXCC":"9999"},),
+            [FieldError("DXCC", "9999", FIELD_ERROR_INVALID, Dxcc),
+             FieldError("call", "K0RLO", FIELD_ERROR_DUPLICATE)]
+        ),
+        (
+        TestHarness.compare,
+            ({"CALL":"W3MIX", "DXCC":"291", "STATE":"XX"},),
+            [FieldError("STATE", "XX", FIELD_ERROR_SUBDIVISION,
+                dxcc_entity(291))]
         ),
     ),
 
     (
-    WWFFRef,
+    check_subdivisions,
         (
-        TestHarness.display,
-            ("AFF-000",),
-            "Not a valid WWRef"
+        TestHarness.compare,
+            ({"DXCC":"291", "STATE":"co", "MY_DXCC":"6",
+              "MY_STATE":"AK", "MY_CNTY":"ak,nome"},),
+            []
         ),
         (
-        TestHarness.display,
-            ("AFF-00000",),
-            "Not a valid WWRef"
+        TestHarness.compare,
+            ({"STATE":"XX", "CNTY":"XX"},),
+            []
         ),
         (
         TestHarness.compare,
-            ("AFF-0000",),
-            ""
+            ({"DXCC":"9999", "STATE":"XX"},),
+            []
         ),
         (
         TestHarness.compare,
-            ("ABFF-0000",),
-            ""
+            ({"DXCC":"291", "CNTY":"CO,Jefferson"},),
+            []
         ),
         (
         TestHarness.compare,
-            ("ABCFF-0000",),
-            ""
+            ({"dxcc":"1", "state":"XX", "MY_DXCC":"6",
+              "MY_CNTY":"AK,Boston"},),
+            [FieldError("MY_CNTY", "AK,Boston", FIELD_ERROR_SUBDIVISION,
+                dxcc_entity(6)),
+             FieldError("state", "XX", FIELD_ERROR_SUBDIVISION,
+                dxcc_entity(1))]
         ),
+    ),
+
+    (
+    check_ADIF_records,
         (
         TestHarness.compare,
-            ("abcdFF-9999",),
-            ""
+            (({"CALL":"W3MIX", "DXCC":"291", "STATE":"CO"},
+              {"CALL":"K0RLO", "DXCC":"291", "STATE":"XX"},
+              {"CALL":"N0CALL"}),),
+            [(2, [FieldError("STATE", "XX", FIELD_ERROR_SUBDIVISION,
+                dxcc_entity(291))])]
+        ),
+        (
+        TestHarness.compare,
+            ((),),
+            []
         ),
     ),
 
     (
-    userdef,
+    str,
         (
         TestHarness.display,
-            ("USERDEF",),
-            "Not a valid user definition"
+            (FieldError("DXCC", "9999", FIELD_ERROR_INVALID, Dxcc),),
+            "DXCC error text with sorted DXCC entity code list"
         ),
         (
         TestHarness.display,
-            ("USERDEF0",),
-            "Not a valid user definition"
+            (FieldError("CALL", "K0RLO", FIELD_ERROR_DUPLICATE),),
+            "Duplicate field error text"
         ),
         (
         TestHarness.display,
-            ("USERDEFX",),
-            "Not a valid user definition"
+            (FieldError("STATE", "XX", FIELD_ERROR_SUBDIVISION,
+                dxcc_entity(291)),),
+            "Subdivision error text"
+        ),
+    ),
+
+    (
+    ADIF_record,
+        (
+        TestHarness.exception,
+            ({"TEST" : "TEST"},),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ({"DXCC" : "291", "STATE" : "XX"},),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ({"HRDLOG_QSO_UPLOAD_STATUS" : "TEST"},),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ({"CREDIT_SUBMITTED" : "CQDX_QRP:LOTW&TEST"},),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "hrdlog_qso_upload_status" : "Y"},),
+            "hamlibIO.hamlibIOerror"
         ),
         (
         TestHarness.compare,
-            ("USERDEF1",),
-            ""
+            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "call" : "K0RLO"},),
+            "<HRDLOG_QSO_UPLOAD_STATUS:1>N<call:5>K0RLO<EOR>\n"
+        ),
+        (
+        TestHarness.compare,
+            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "call" : "K0RLO"}, 2),
+            "<HRDLOG_QSO_UPLOAD_STATUS:1>N  <call:5>K0RLO  <EOR>\n"
+        ),
+        (
+        TestHarness.compare,
+            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "call" : "K0RLO"}, 1, True),
+            "<HRDLOG_QSO_UPLOAD_STATUS:1:E>N <call:5:S>K0RLO <EOR>\n"
         ),
     ),
 
     (
-    dictonary_duplicates,
+    ADIF_header,
         (
-        TestHarness.display,
-            ({"AA":4, "aa":8},),
-            "Keys only differ by character case"
+        TestHarness.exception,
+            ({"TEST" : "TEST"},),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ({"CREATED_TIMESTAMP" : 7},),
+            "hamlibIO.hamlibIOerror"
         ),
         (
         TestHarness.compare,
-            ({"AA":4, "BB":8},),
-            ""
+            ({"PROGRAMID" : "pota_rapidlog", "CREATED_TIMESTAMP" : "19561030 120101", "ADIF_VER" : "0.0.0"}, None),
+            """<ADIF_VER:5>0.0.0
+<CREATED_TIMESTAMP:15>19561030 120101
+<PROGRAMID:13>pota_rapidlog
+<EOH>
+"""
+        ),
+        (
+        TestHarness.compare,
+            ({"PROGRAMID" : "pota_rapidlog", "CREATED_TIMESTAMP" : "19561030 120101", "ADIF_VER" : "0.0.0"}, None, True),
+            """<ADIF_VER:5:S>0.0.0
+<CREATED_TIMESTAMP:15:S>19561030 120101
+<PROGRAMID:13:S>pota_rapidlog
+<EOH>
+"""
         ),
     ),
 
     (
-    get_data_type_indicator,
+    tests.test_QSOTable,
         (
         TestHarness.compare,
-            (record_fields["ANT_AZ"],),
-            "N"
+            ([{"CALL":"W3MIX", "BAND":"20M"}, {"call":"K0RLO"},
+              {"CALL":"N0CA", "BAND":"40M", "MY_SIG":"POTA"},
+              {"BAND":"20M", "CALL":"W3MIX"}], "band", "20M"),
+            (4, [{"CALL":"W3MIX", "BAND":"20M"}, {"CALL":"K0RLO"},
+                 {"CALL":"N0CA", "BAND":"40M", "MY_SIG":"POTA"},
+                 {"CALL":"W3MIX", "BAND":"20M"}],
+             ["20M", None, "40M", "20M"], [0, 3], {"20M":2, "40M":1})
         ),
         (
         TestHarness.compare,
-            (record_fields["BAND"],),
-            "E"
+            ([{"CALL":"W3MIX"}, {"CALL":"K0RLO"}, {"CALL":"W3MIX"},
+              {"BAND":"20M"}], "CALL", "W3MIX"),
+            (4, [{"CALL":"W3MIX"}, {"CALL":"K0RLO"}, {"CALL":"W3MIX"},
+                 {"BAND":"20M"}],
+             ["W3MIX", "K0RLO", "W3MIX", None], [0, 2],
+             {"W3MIX":2, "K0RLO":1})
+        ),
+        (
+        TestHarness.compare,
+            ([{"SIG_INFO":str(i), "MY_SIG_INFO":str(i)} for i in
+                range(300)], "MY_SIG_INFO", "299"),
+            (300, [{"SIG_INFO":str(i), "MY_SIG_INFO":str(i)} for i in
+                range(300)], [str(i) for i in range(300)], [299],
+             {str(i):1 for i in range(300)})
+        ),
+        (
+        TestHarness.exception,
+            ([{"CALL":"W3MIX", "call":"K0RLO"}], "CALL", "W3MIX"),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.compare,
+            ([{"CALL":"W3MIX"}], "MODE", "FT8",
+             {"CALL":"K0RLO", "MODE":"FT8", "GRIDSQUARE":"EM29",
+              "Mode":"FT4"}),
+            (1, [{"CALL":"W3MIX"}], [None], [], {})
         ),
     ),
 
     (
-    valid_callsign,
-    
+    tests.test_enumeration_codes,
         (
-        TestHarness.display,
-            ("K0RLO/mobile",),
-            "Slash not allowed"
+        TestHarness.compare,
+            ("band", "20m"),
+            (band_names.index("20M"), "20M")
+        ),
+        (
+        TestHarness.compare,
+            ("BAND_RX", "2190M"),
+            (0, "2190M")
         ),
         (
         TestHarness.compare,
-            ("JY1",),
-            ""
+            ("MODE", "AM"),
+            (0, "AM")
         ),
         (
         TestHarness.compare,
-            ("K0RLO",),
-            ""
+            ("SUBMODE", "usb"),
+            (get_enumeration_codes("SUBMODE").code("USB"), "USB")
         ),
         (
         TestHarness.compare,
-            ("W1JU",),
-            ""
+            ("CONT", "EU"),
+            (3, "EU")
         ),
         (
         TestHarness.compare,
-            ("VE7XYZ",),
-            ""
+            ("MY_DXCC", "1"),
+            (1, "1")
         ),
         (
         TestHarness.compare,
-            ("K0RLO/mobile", True),
-            ""
+            ("DXCC", "2"),
+            (None, None)
+        ),
+        (
+        TestHarness.compare,
+            ("MODE", "XX"),
+            (None, None)
         ),
     ),
 
     (
-    field,
-        (TestHarness.compare,
-            ("FOO", "BAR",),
-            "<FOO:3>BAR"
+    tests.test_QSOTable_order,
+        (
+        TestHarness.compare,
+            ([{"BAND":"20M"}, {"BAND":"160M"}, {"CALL":"W3MIX"},
+              {"BAND":"20m"}, {"BAND":"2M"}, {"BAND":"160M"}], "BAND"),
+            ["160M", "160M", "20M", "2M", "20m", None]
         ),
-        (TestHarness.compare,
-            ("FOO", "BAR", "S",),
-            "<FOO:3:S>BAR"
+        (
+        TestHarness.compare,
+            ([{"QSO_DATE":"20240102"}, {"CALL":"W3MIX"},
+              {"QSO_DATE":"20240101"}, {"QSO_DATE":"20240102"}],
+              "QSO_DATE"),
+            ["20240101", "20240102", "20240102", None]
+        ),
+        (
+        TestHarness.compare,
+            ([{"CALL":"W3MIX"}, {"BAND":"20M"}, {"CALL":"K0RLO"}], "CALL"),
+            ["K0RLO", "W3MIX", None]
         ),
     ),
 
     (
-    validate_field,
-    
+    tests.test_ADIFRecordTemplate,
         (
-        TestHarness.display,
-            (record_fields, "TEST", "0"),
-            "Invalid field name"
+        TestHarness.compare,
+            ({"CALL":"K0RLO", "BAND":"20M", "MY_SIG":"POTA"},
+             ["OPERATOR", "MY_SIG_INFO", "SIG_INFO"],
+             [{"OPERATOR":"W3MIX", "MY_SIG_INFO":"US-1234"},
+              {"OPERATOR":"W3MIX", "MY_SIG_INFO":"US-1234",
+               "SIG_INFO":"US-5555"}]),
+            ["<BAND:3>20M<CALL:5>K0RLO<MY_SIG:4>POTA<MY_SIG_INFO:7>US-1234"
+             "<OPERATOR:5>W3MIX<EOR>\n",
+             "<BAND:3>20M<CALL:5>K0RLO<MY_SIG:4>POTA<MY_SIG_INFO:7>US-1234"
+             "<OPERATOR:5>W3MIX<SIG_INFO:7>US-5555<EOR>\n"]
         ),
         (
-        TestHarness.display,
-            (record_fields, "CQZ", "0"),
-            "Invalid value for field"
+        TestHarness.compare,
+            ({"call":"K0RLO"}, ["OPERATOR"], [{"OPERATOR":"W3MIX"}, {}], 1),
+            ["<OPERATOR:5>W3MIX <call:5>K0RLO <EOR>\n",
+             "<call:5>K0RLO <EOR>\n"]
         ),
         (
-        TestHarness.display,
-            (record_fields, "HRDLOG_QSO_UPLOAD_STATUS", "TEST"),
-            "Invalid value for field"
+        TestHarness.compare,
+            ({"DXCC":"291"}, ["STATE"], [{"STATE":"CO"}]),
+            ["<DXCC:3>291<STATE:2>CO<EOR>\n"]
         ),
         (
-        TestHarness.display,
-            (record_fields, "CREDIT_SUBMITTED", "TEST1,TEST2"),
-            "Invalid value for field"
+        TestHarness.exception,
+            ({"DXCC":"291"}, ["STATE"], [{"STATE":"XX"}]),
+            "hamlibIO.hamlibIOerror"
         ),
         (
-        TestHarness.display,
-            (record_fields, "CREDIT_SUBMITTED", "CQDX_QRP:TEST"),
-            "Invalid value for field"
+        TestHarness.exception,
+            ({"BAND":"20X"}, ["OPERATOR"], []),
+            "hamlibIO.hamlibIOerror"
         ),
         (
-        TestHarness.display,
-            (record_fields, "CREDIT_SUBMITTED", "CQDX_QRP:LOTW&TEST"),
-            "Invalid value for field"
+        TestHarness.exception,
+            ({"CALL":"K0RLO"}, ["call"], []),
+            "hamlibIO.hamlibIOerror"
         ),
+        (
+        TestHarness.exception,
+            ({"CALL":"K0RLO"}, ["OPERATOR"], [{"STATION_CALLSIGN":"W3MIX"}]),
+            "hamlibIO.hamlibIOerror"
+        ),
+    ),
+
+    (
+    tests.test_error_sink,
         (
         TestHarness.compare,
-            (record_fields, "HRDLOG_QSO_UPLOAD_STATUS", "N"),
-            ""
+            (ADIF_record, {"CALL" : "W3MIX", "BAND" : "20M"}),
+            ("<BAND:3>20M<CALL:5>W3MIX<EOR>\n", [])
         ),
         (
         TestHarness.compare,
-            (record_fields, "CQZ", "17"),
-            ""
+            (ADIF_record, {"TEST" : "TEST", "BAND" : "20X", "CALL" : "W3MIX",
+                "call" : "K0RLO"}),
+            (None, [FieldError("BAND", "20X", FIELD_ERROR_INVALID,
+                record_fields["BAND"]), FieldError("TEST", "TEST",
+                FIELD_ERROR_UNKNOWN), FieldError("call", "K0RLO",
+                FIELD_ERROR_DUPLICATE)])
         ),
         (
         TestHarness.compare,
-            (record_fields, "CREDIT_SUBMITTED", "CQDXFIELD_SATELLITE"),
-            ""
+            (ADIF_record, {"DXCC" : "291", "STATE" : "XX"}),
+            (None, [FieldError("STATE", "XX", FIELD_ERROR_SUBDIVISION,
+                dxcc_entity(291))])
         ),
         (
         TestHarness.compare,
-            (record_fields, "CREDIT_SUBMITTED", "DXCC,USACA"),
-            ""
+            (ADIF_header, {"PROGRAMID" : "pota_rapidlog",
+                "CREATED_TIMESTAMP" : "19561030 120101",
+                "ADIF_VER" : "0.0.0"}),
+            ("<ADIF_VER:5>0.0.0\n<CREATED_TIMESTAMP:15>19561030 120101\n"
+             "<PROGRAMID:13>pota_rapidlog\n<EOH>\n", [])
         ),
         (
         TestHarness.compare,
-            (record_fields, "CREDIT_SUBMITTED", "DXCC,CQDX_QRP:LOTW&CARD"),
-            ""
+            (ADIF_header, {"TEST" : "TEST", "PROGRAMID" : "pota_rapidlog",
+                "CREATED_TIMESTAMP" : "19561030 120101",
+                "ADIF_VER" : "0.0.0"}),
+            (None, [FieldError("TEST", "TEST", FIELD_ERROR_UNKNOWN)])
         ),
     ),
 
     (
-    ADIF_record,
+    tests.test_write_ADIF_file,
         (
-        TestHarness.exception,
-            ({"TEST" : "TEST"},),
-            "hamlibIO.hamlibIOerror"
+        TestHarness.compare,
+            ([{"CALL":"W3MIX", "BAND":"20M"}, {"call":"K0RLO"}], False),
+            (2, "<ADIF_VER:5>3.1.3\n<CREATED_TIMESTAMP:15>20240101 000000\n"
+                "<PROGRAMID:4>test\n<EOH>\n"
+                "<BAND:3>20M<CALL:5>W3MIX<EOR>\n<call:5>K0RLO<EOR>\n")
         ),
         (
-        TestHarness.exception,
-            ({"HRDLOG_QSO_UPLOAD_STATUS" : "TEST"},),
-            "hamlibIO.hamlibIOerror"
+        TestHarness.compare,
+            ((r for r in [{"CALL":"W3MIX", "BAND":"20M"}]), True),
+            (1, "<ADIF_VER:5:S>3.1.3\n"
+                "<CREATED_TIMESTAMP:15:S>20240101 000000\n"
+                "<PROGRAMID:4:S>test\n<EOH>\n"
+                "<BAND:3:E>20M<CALL:5:S>W3MIX<EOR>\n")
         ),
         (
         TestHarness.exception,
-            ({"CREDIT_SUBMITTED" : "CQDX_QRP:LOTW&TEST"},),
+            ([{"CALL":"W3MIX", "BAND":"20X"}], False),
             "hamlibIO.hamlibIOerror"
         ),
         (
         TestHarness.exception,
-            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "hrdlog_qso_upload_status" : "Y"},),
+            ([{"CALL":"W3MIX", "call":"K0RLO"}], False),
             "hamlibIO.hamlibIOerror"
         ),
+    ),
+    (
+    tests.test_write_ADX_file,
         (
         TestHarness.compare,
-            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "call" : "K0RLO"},),
-            "<HRDLOG_QSO_UPLOAD_STATUS:1>N<call:5>K0RLO<EOR>\n"
+            ([{"CALL":"W3MIX", "COMMENT":"a<b>&c", "NAME_INTL":"Grüße",
+               "NOTES":"1\r\n2"}, {"call":"K0RLO"}],),
+            (2, '<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n'
+                "    <HEADER>\n"
+                "        <ADIF_VER>3.1.3</ADIF_VER>\n"
+                "        <CREATED_TIMESTAMP>20240101 000000"
+                "</CREATED_TIMESTAMP>\n"
+                "        <PROGRAMID>test</PROGRAMID>\n"
+                "    </HEADER>\n    <RECORDS>\n"
+                "        <RECORD>\n"
+                "            <CALL>W3MIX</CALL>\n"
+                "            <COMMENT>a&lt;b&gt;&amp;c</COMMENT>\n"
+                "            <NAME_INTL>Grüße</NAME_INTL>\n"
+                "            <NOTES>1&#13;\n2</NOTES>\n"
+                "        </RECORD>\n"
+                "        <RECORD>\n"
+                "            <CALL>K0RLO</CALL>\n"
+                "        </RECORD>\n"
+                "    </RECORDS>\n</ADX>\n")
         ),
         (
-        TestHarness.compare,
-            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "call" : "K0RLO"}, 2),
-            "<HRDLOG_QSO_UPLOAD_STATUS:1>N  <call:5>K0RLO  <EOR>\n"
+        TestHarness.exception,
+            ([{"CALL":"W3MIX", "BAND":"20X"}],),
+            "hamlibIO.hamlibIOerror"
         ),
+    ),
+    (
+    tests.test_iter_ADX_records,
         (
         TestHarness.compare,
-            ({"HRDLOG_QSO_UPLOAD_STATUS" : "N", "call" : "K0RLO"}, 1, True),
-            "<HRDLOG_QSO_UPLOAD_STATUS:1:E>N <call:5:S>K0RLO <EOR>\n"
+            ('<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n'
+             "<HEADER><ADIF_VER>3.1.3</ADIF_VER>"
+             '<USERDEF FIELDID="1" TYPE="N">EPC</USERDEF></HEADER>\n'
+             "<RECORDS><RECORD><CALL>W3MIX</CALL><COMMENT></COMMENT>"
+             "<NOTES>1&#13;\n2</NOTES>"
+             '<APP PROGRAMID="MONOLOG" FIELDNAME="Compression" TYPE="s">'
+             "off</APP>"
+             '<USERDEF FIELDNAME="EPC">32123</USERDEF></RECORD>\n'
+             "<RECORD><call>K0RLO</call></RECORD></RECORDS></ADX>\n",),
+            ({"ADIF_VER":"3.1.3", "USERDEF1":"EPC"},
+             [{"CALL":"W3MIX", "COMMENT":"", "NOTES":"1\r\n2",
+               "APP_MONOLOG_COMPRESSION":"off", "EPC":"32123"},
+              {"CALL":"K0RLO"}])
         ),
     ),
-
     (
-    ADIF_header,
+    tests.test_convert_ADIF_file,
         (
-        TestHarness.exception,
-            ({"TEST" : "TEST"},),
-            "hamlibIO.hamlibIOerror"
+        TestHarness.compare,
+            ("Log\n<PROGRAMID:3>foo<EOH>\n<CALL:5>W3MIX<BAND:3>20M<EOR>\n"
+             "<CALL:5>K0RLO<BAND:3>20X<EOR>\n"
+             "<CALL:4>N0CA<NOTES:4>1\r\n2<EOR>\n", ".adi", ".adx"),
+            (2, [(2, [FieldError("BAND", "20X", FIELD_ERROR_INVALID,
+                record_fields["BAND"])])],
+             '<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n'
+             "    <HEADER>\n"
+             "        <ADIF_VER>3.1.3</ADIF_VER>\n"
+             "    </HEADER>\n    <RECORDS>\n"
+             "        <RECORD>\n"
+             "            <BAND>20M</BAND>\n"
+             "            <CALL>W3MIX</CALL>\n"
+             "        </RECORD>\n"
+             "        <RECORD>\n"
+             "            <CALL>N0CA</CALL>\n"
+             "            <NOTES>1&#13;\n2</NOTES>\n"
+             "        </RECORD>\n"
+             "    </RECORDS>\n</ADX>\n")
         ),
         (
-        TestHarness.exception,
-            ({"CREATED_TIMESTAMP" : 7},),
-            "hamlibIO.hamlibIOerror"
+        TestHarness.compare,
+            ('<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n'
+             "<HEADER><PROGRAMID>foo</PROGRAMID></HEADER>\n"
+             "<RECORDS><RECORD><CALL>W3MIX</CALL>"
+             "<NAME_INTL>Grüße</NAME_INTL><NAME>Grusse</NAME></RECORD>\n"
+             "<RECORD><CALL>K0RLO</CALL><BAND>20X</BAND></RECORD>"
+             "</RECORDS></ADX>\n", ".adx", ".adi"),
+            (1, [(2, [FieldError("BAND", "20X", FIELD_ERROR_INVALID,
+                record_fields["BAND"])])],
+             "\n<ADIF_VER:5>3.1.3\n<EOH>\n"
+             "<CALL:5>W3MIX<NAME:6>Grusse<EOR>\n")
         ),
         (
         TestHarness.compare,
-            ({"PROGRAMID" : "pota_rapidlog", "CREATED_TIMESTAMP" : "19561030 120101", "ADIF_VER" : "0.0.0"}, None),
-            """<ADIF_VER:5>0.0.0
-<CREATED_TIMESTAMP:15>19561030 120101
-<PROGRAMID:13>pota_rapidlog
-<EOH>
-"""
+            ("Log\n<USERDEF1:3:N>EPC<APP_MONOLOG_COMPRESSION:3>off<EOH>\n"
+             "<CALL:5>W3MIX<EPC:5>32123<APP_MONOLOG_COMPRESSION:2>on<EOR>\n"
+             "<CALL:5>K0RLO<EPC:3>abc<EOR>\n", ".adi", ".adx"),
+            (1, [(2, [FieldError("EPC", "abc", FIELD_ERROR_INVALID,
+                ("Number",))])],
+             '<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n'
+             "    <HEADER>\n"
+             "        <ADIF_VER>3.1.3</ADIF_VER>\n"
+             '        <APP PROGRAMID="MONOLOG" FIELDNAME="COMPRESSION">'
+             "off</APP>\n"
+             '        <USERDEF FIELDID="1" TYPE="N">EPC</USERDEF>\n'
+             "    </HEADER>\n    <RECORDS>\n"
+             "        <RECORD>\n"
+             '            <APP PROGRAMID="MONOLOG" FIELDNAME="COMPRESSION">'
+             "on</APP>\n"
+             "            <CALL>W3MIX</CALL>\n"
+             '            <USERDEF FIELDNAME="EPC">32123</USERDEF>\n'
+             "        </RECORD>\n"
+             "    </RECORDS>\n</ADX>\n")
         ),
         (
         TestHarness.compare,
-            ({"PROGRAMID" : "pota_rapidlog", "CREATED_TIMESTAMP" : "19561030 120101", "ADIF_VER" : "0.0.0"}, None, True),
-            """<ADIF_VER:5:S>0.0.0
-<CREATED_TIMESTAMP:15:S>19561030 120101
-<PROGRAMID:13:S>pota_rapidlog
-<EOH>
-"""
+            ('<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n'
+             '<HEADER><USERDEF FIELDID="1" TYPE="N">EPC</USERDEF></HEADER>\n'
+             "<RECORDS><RECORD><CALL>W3MIX</CALL>"
+             '<APP PROGRAMID="MONOLOG" FIELDNAME="Compression" TYPE="s">'
+             "off</APP>"
+             '<USERDEF FIELDNAME="EPC">32123</USERDEF></RECORD>'
+             "</RECORDS></ADX>\n", ".adx", ".adi"),
+            (1, [],
+             "\n<ADIF_VER:5>3.1.3\n<USERDEF1:3:N>EPC\n<EOH>\n"
+             "<APP_MONOLOG_COMPRESSION:3>off<CALL:5>W3MIX<EPC:5>32123"
+             "<EOR>\n")
+        ),
+        (
+        TestHarness.exception,
+            ("", ".adi", ".txt"),
+            "hamlibIO.hamlibIOerror"
         ),
     ),
-
     (
     freq_to_band,
         (TestHarness.display,
@@ -7411,6 +8520,77 @@ validation_tests = (
             ("250000",),
             ("1MM",)
         ),
+        (TestHarness.compare,
+            ("54",),
+            ("6M",)
+        ),
+        (TestHarness.display,
+            ("54.0000005",),
+            "Frequency between the 6M and 5M bands"
+        ),
+        (TestHarness.compare,
+            ("54.000001",),
+            ("5M",)
+        ),
+    ),
+
+    (
+    freqs_to_bands,
+        (TestHarness.compare,
+            (["14.2", "54.0000005", "54.000001", "7a", "0.1357", "250000",
+              "250001", "-1"],),
+            ["20M", None, "5M", None, "2190M", "1MM", None, None]
+        ),
+        (TestHarness.compare,
+            ((),),
+            []
+        ),
+    ),
+
+    (
+    freqs_to_band_codes,
+        (TestHarness.compare,
+            (["14.2", "54.0000005", "54.000001", "7a", "0.1357", "250000",
+              "nan"], False),
+            ([band_names.index("20M"), -1, band_names.index("5M"), -1, 0,
+              len(band_names) - 1, -1],
+             [False, True, False, True, False, False, True])
+        ),
+        (TestHarness.compare,
+            ((), False),
+            ([], [])
+        ),
+        (
+        TestHarness.exception,
+            ([["14.2", "7.1"], ["3.5", "1.8"]], False),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ([["14.2", "7.1"], ["3.5", "1.8"]], True),
+            "hamlibIO.hamlibIOerror"
+        ),
+        (
+        TestHarness.exception,
+            ([["14.2", "7.1"], ["3.5"]], True),
+            "hamlibIO.hamlibIOerror"
+        ),
+    ),
+
+    (
+    tests.test_freqs_to_band_codes,
+        (TestHarness.compare,
+            (["14.2", "54.0000005", "54.000001", "7a", "0.1357", "250000",
+              "nan", 7.074, None],),
+            ([band_names.index("20M"), -1, band_names.index("5M"), -1, 0,
+              len(band_names) - 1, -1, band_names.index("40M"), -1],
+             [False, True, False, True, False, False, True, False, True])
+        ),
+        (TestHarness.compare,
+            ([14.074, 7.074, 3000.0],),
+            ([band_names.index("20M"), band_names.index("40M"), -1],
+             [False, False, True])
+        ),
     ),
 
     (
@@ -7522,13 +8702,192 @@ validation_tests = (
             ("OLIVIA OLIVIA    32/1000",),
             ('OLIVIA', 'OLIVIA 32/1000')
         ),
+        (
+        TestHarness.compare,
+            ("olivia  8/250",),
+            ('OLIVIA', 'OLIVIA 8/250')
+        ),
+        (
+        TestHarness.compare,
+            ("ssb, usb",),
+            ('SSB', 'USB')
+        ),
+        (
+        TestHarness.compare,
+            ("PAX2",),
+            ('PAX', 'PAX2')
+        ),
+        (
+        TestHarness.display,
+            ("X",),
+            "Invalid mode or submode"
+        ),
+        (
+        TestHarness.display,
+            ("",),
+            "Invalid mode or submode"
+        ),
+    ),
+    (
+    tests.test_iter_ADIF_records,
+        (
+        TestHarness.compare,
+            ("<CALL:5>W3MIX<BAND:3>20M<EOR>\n<call:5>K0RLO<eor>\n", 4096),
+            ({}, [{"CALL":"W3MIX", "BAND":"20M"}, {"CALL":"K0RLO"}])
+        ),
+        (
+        TestHarness.compare,
+            ("Comment\n<ADIF_VER:5>3.1.3\n<EOH>\n"
+             "<CALL:5:S>W3MIX<COMMENT:8>a<b>c<d><EOR>\n", 3),
+            ({"ADIF_VER":"3.1.3"},
+             [{"CALL":"W3MIX", "COMMENT":"a<b>c<d>"}])
+        ),
+        (
+        TestHarness.compare,
+            ("<CALL:5>W3MIX<EOR>\n<CALL:5>K0RLO<BAND:3>20", 1),
+            ({}, [{"CALL":"W3MIX"}])
+        ),
+        (
+        TestHarness.exception,
+            ("<CALL:5>W3MIX<EOR>", 0),
+            "hamlibIO.hamlibIOerror"
+        ),
+    ),
+    (
+    tests.test_iter_ADIF_spans,
+        (
+        TestHarness.compare,
+            (b"<CALL:5>W3MIX<band:3:E>20M<EOR>",),
+            [("CALL", 8, 5), ("BAND", 23, 3), ("EOR", 26, None)]
+        ),
+        (
+        TestHarness.compare,
+            (b"<CALL:5>W3MIX<COMMENT:9>x<EOR>y<EOR><EOR><CALL:9>K0",),
+            [("CALL", 8, 5), ("COMMENT", 24, 9), ("EOR", 36, None)]
+        ),
+        (
+        TestHarness.compare,
+            ("<NAME:5>Grüße<CALL:5>W3MIX<EOR><X:2>日".encode(),),
+            [("NAME", 8, 7), ("CALL", 23, 5), ("EOR", 28, None)]
+        ),
+        (
+        TestHarness.exception,
+            ("<CALL:5>W3MIX<EOR>",),
+            "hamlibIO.hamlibIOerror"
+        ),
+    ),
+    (
+    ADIF_field_value,
+        (
+        TestHarness.compare,
+            (b"<CALL:5>W3MIX<EOR>", 8, 5),
+            "W3MIX"
+        ),
+    ),
+    (
+    tests.test_scan_ADIF_records,
+        (
+        TestHarness.compare,
+            (b"<PROGRAMID:4>TEST<EOH><CALL:5>W3MIX<BAND:3>20M<EOR>"
+             b"<CALL:5>K0RLO<EOR><BAND:3>40M<EOR><CALL:2>N0",
+             ["call"]),
+            [{"CALL":"W3MIX"}, {"CALL":"K0RLO"}, {}]
+        ),
+        (
+        TestHarness.compare,
+            ("<NOTES:8>日本<EOR>語<CALL:5>W3MIX<EOR>".encode(),
+             ["notes", "call"]),
+            [{"NOTES":"日本<EOR>語", "CALL":"W3MIX"}]
+        ),
     ),
-)
+))
 
 def run_tests():
-    #
-    #Run all validation tests
-    #
-    if TestHarness.TestHarness(validation_tests):
+    """
+    Run all validation tests.
+
+    Returns:
+        Number of tests that failed
+    """
+
+    import TestHarness
+
+    failed = TestHarness.TestHarness(get_validation_tests())
+    if failed:
         print("Errors detected")
 
+    return(failed)
+
+def main(argv=None):
+    """
+    Command line interface to hamlibIO:
+
+        python3 hamlibIO.py validate [-j WORKERS] FILE...
+        python3 hamlibIO.py convert IN_FILE OUT_FILE
+        python3 hamlibIO.py test
+
+    Arguments:
+        argv: Default None
+            List of command line arguments, None for sys.argv[1:]
+
+    Returns:
+        Exit status: 0 if OK, 1 if errors were found (or tests failed)
+    """
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="hamlibIO.py",
+        description="ADIF file tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate",
+        help="validate every record of ADIF (.adi) files")
+    validate.add_argument("files", nargs="+", help="ADIF files")
+    validate.add_argument("-j", "--workers", type=int, default=None,
+        help="number of worker processes (default: one per CPU)")
+
+    convert = commands.add_parser("convert",
+        help="convert between ADIF (.adi) and ADX (.adx) files")
+    convert.add_argument("in_file", help="file to convert")
+    convert.add_argument("out_file", help="file to create")
+
+    commands.add_parser("test", help="run the hamlibIO validation tests")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "test":
+        #
+        #Run the tests in hamlibIO imported as a module rather than in
+        #this script (__main__), so the exceptions raised are the
+        #hamlibIO.hamlibIOerror the tests expect.
+        #
+        return(1 if importlib.import_module("hamlibIO").run_tests() else 0)
+
+    if args.command == "convert":
+        file_errors = []
+        count = convert_ADIF_file(args.in_file, args.out_file, file_errors)
+        for (record_number, errors) in file_errors:
+            print("""
+Error: Record {} of "{}":""".format(record_number, args.in_file))
+            for error in errors:
+                print(error)
+
+        print("""
+{} records written to "{}", {} records in error.""".format(count,
+            args.out_file, len(file_errors)))
+        return(1 if file_errors else 0)
+
+    status = 0
+    for (filename, file_errors) in validate_ADIF_files(args.files,
+            args.workers):
+        for (record_number, errors) in file_errors:
+            status = 1
+            print("""
+Error: Record {} of "{}":""".format(record_number, filename))
+            for error in errors:
+                print(error)
+
+    return(status)
+
+if __name__ == "__main__":
+    sys.exit(main())
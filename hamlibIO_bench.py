@@ -0,0 +1,502 @@
+########################################################################
+########################################################################
+####
+#### Benchmarks for hamlibIO.py
+####
+#### Run from the directory hamlibIO.py is in:
+####
+####    python3 hamlibIO_bench.py import [-n RUNS] [--limit MS]
+####    python3 hamlibIO_bench.py validators [-n FIELDS]
+####    python3 hamlibIO_bench.py validate [-f FILES] [-n RECORDS]
+####        [-j WORKERS,...]
+####    python3 hamlibIO_bench.py adx [-n RECORDS]
+####    python3 hamlibIO_bench.py qsotable [-n RECORDS]
+####
+#### Times are the median of the runs. Numbers depend on the machine,
+#### compare runs made on the same machine.
+####
+#### --path DIRECTORY benchmarks the hamlibIO.py in another directory,
+#### such as an older version checked out with "git worktree add", so
+#### versions can be compared:
+####
+####    git worktree add /tmp/hamlibIO_before <commit>
+####    python3 hamlibIO_bench.py validators --path /tmp/hamlibIO_before
+####    python3 hamlibIO_bench.py validators
+####
+########################################################################
+########################################################################
+
+####
+#### Import support modules
+####
+
+import argparse
+import compileall
+import os
+import statistics
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+####
+#### Global definitions
+####
+
+#
+#Directory hamlibIO.py is in
+#
+bench_directory = os.path.dirname(os.path.abspath(__file__))
+
+#
+#Fields for the validators benchmark: a data type and valid contents for
+#each of the data types with a regular expression validator, plus
+#invalid contents for some of them (invalid fields format an error).
+#
+validator_fields = (
+    ("Boolean", "Y"),
+    ("Digit", "7"),
+    ("Integer", "-42"),
+    ("PositiveInteger", "599"),
+    ("Number", "14.250"),
+    ("Character", "A"),
+    ("String", "Park to park"),
+    ("Date", "20240101"),
+    ("Time", "1234"),
+    ("Location", "N040 26.767"),
+    ("GridSquare", "FN20xr"),
+    ("WWFFRef", "KFF-1234"),
+    ("Number", "14.25a"),
+    ("Date", "2024011"),
+    ("GridSquare", "FN2"),
+    )
+
+#
+#QSO for the validate benchmark's ADIF files. Every 100th QSO has an
+#invalid band so there are errors to report.
+#
+validate_record = ("<CALL:5>W3MIX<QSO_DATE:8>20240101<TIME_ON:4>{}"
+    "<BAND:3>{}<MODE:3>SSB<FREQ:6>14.250<RST_SENT:2>59<RST_RCVD:2>57"
+    "<GRIDSQUARE:6>FN20xr<STATE:2>PA<MY_SIG:4>POTA<MY_SIG_INFO:7>US-1234"
+    "<EOR>\n")
+
+#
+#QSO for the ADI/ADX benchmark: 15 fields, TIME_ON varies
+#
+adx_record = {
+    "CALL" : "W3MIX",
+    "QSO_DATE" : "20240101",
+    "BAND" : "20M",
+    "MODE" : "SSB",
+    "FREQ" : "14.250",
+    "RST_SENT" : "59",
+    "RST_RCVD" : "57",
+    "GRIDSQUARE" : "FN20xr",
+    "STATE" : "PA",
+    "NAME" : "Mike",
+    "COMMENT" : "Park to park <nice signal> & good copy",
+    "OPERATOR" : "K0RLO",
+    "STATION_CALLSIGN" : "K0RLO",
+    "MY_SIG" : "POTA",
+    }
+
+def qso_time(number):
+    """
+    A valid TIME_ON for a benchmark QSO, one minute after the one
+    before.
+
+    Arguments:
+        number:
+            QSO number
+
+    Returns:
+        HHMM time string
+    """
+
+    return("{:02d}{:02d}".format(number // 60 % 24, number % 60))
+
+def import_hamlibIO(path):
+    """
+    Import hamlibIO from a directory.
+
+    Arguments:
+        path:
+            Directory hamlibIO.py is in, None for this one.
+
+    Returns:
+        hamlibIO module
+    """
+
+    sys.path.insert(0, os.path.abspath(path or bench_directory))
+
+    import hamlibIO
+
+    return(hamlibIO)
+
+def import_times(module_name, runs, path=None):
+    """
+    Time importing a module in a new Python process with
+    "python -X importtime", with the module's .pyc files up to date
+    (as they are once a module has been imported once).
+
+    Arguments:
+        module_name:
+            Name of the module to import
+        runs:
+            Number of times to import it
+        path: Default None
+            Directory the module is in, None for this one.
+
+    Returns:
+        Tuple of lists of the module's own import times and its
+        cumulative import times (including the modules it imported that
+        hadn't been imported yet), in milliseconds, one of each per run.
+    """
+
+    #
+    #Python may be set not to write .pyc files (PYTHONDONTWRITEBYTECODE),
+    #in which case every import would compile the source. Write them.
+    #
+    directory = os.path.abspath(path or bench_directory)
+    for filename in os.listdir(directory):
+        if filename.startswith("hamlibIO") and filename.endswith(".py"):
+            compileall.compile_file(os.path.join(directory, filename),
+                quiet=1)
+
+    own_times = []
+    cumulative_times = []
+    for run in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c",
+            "import " + module_name], cwd=directory,
+            capture_output=True, text=True, check=True)
+
+        #
+        #Lines are "import time: SELF | CUMULATIVE | NAME", in
+        #microseconds. The module's own line has no indentation.
+        #
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if (len(fields) == 3) and (fields[2].rstrip() == " " +
+                    module_name):
+                own_times.append(int(fields[0].split(":")[1]) / 1000)
+                cumulative_times.append(int(fields[1]) / 1000)
+
+    return((own_times, cumulative_times))
+
+def bench_import(args):
+    """
+    Import benchmark: how long "import hamlibIO" takes.
+
+    Arguments:
+        args:
+            Command line arguments
+
+    Returns:
+        Exit status: 0 if OK, 1 if hamlibIO's own import time is over
+        the limit.
+    """
+
+    (own_times, cumulative_times) = import_times("hamlibIO", args.runs,
+        args.path)
+    own = statistics.median(own_times)
+    cumulative = statistics.median(cumulative_times)
+
+    print("""
+import hamlibIO, median of {} runs:
+    hamlibIO itself:                          {:7.2f} ms
+    including the modules it imports:         {:7.2f} ms""".format(
+        args.runs, own, cumulative))
+
+    if (args.limit is not None) and (own > args.limit):
+        print("""
+Error: hamlibIO's own import time is over the {} ms limit.""".format(
+            args.limit))
+        return(1)
+
+    return(0)
+
+def bench_validators(args):
+    """
+    Validators benchmark: validate fields with the data type validators
+    in hamlibIO.data_types, the way validate_field does for every field
+    of every record.
+
+    Arguments:
+        args:
+            Command line arguments
+
+    Returns:
+        Exit status: 0
+    """
+
+    hamlibIO = import_hamlibIO(args.path)
+
+    validators = [(hamlibIO.data_types[data_type][1], contents)
+        for (data_type, contents) in validator_fields]
+    fields = (validators * (args.fields // len(validators) + 1))[
+        :args.fields]
+
+    times = []
+    for run in range(args.runs):
+        start = time.perf_counter()
+        for (validate, contents) in fields:
+            validate(contents)
+        times.append(time.perf_counter() - start)
+
+    elapsed = statistics.median(times)
+
+    print("""
+Validated {} fields ({} data types) with the hamlibIO in
+{}, median of {} runs:
+    {:.2f} s, {:.2f} us per field""".format(len(fields),
+        len({data_type for (data_type, contents) in validator_fields}),
+        os.path.dirname(hamlibIO.__file__), args.runs, elapsed,
+        elapsed * 1e6 / len(fields)))
+
+    return(0)
+
+def bench_validate(args):
+    """
+    Parallel validation benchmark: validate a set of ADIF files with
+    validate_ADIF_files and different numbers of worker processes.
+
+    Arguments:
+        args:
+            Command line arguments
+
+    Returns:
+        Exit status: 0
+    """
+
+    hamlibIO = import_hamlibIO(args.path)
+
+    worker_counts = [int(workers) for workers in args.workers.split(",")]
+
+    directory = tempfile.mkdtemp()
+    try:
+        filenames = []
+        for file_number in range(args.files):
+            filename = os.path.join(directory, "{}.adi".format(file_number))
+            f = open(filename, "w")
+            f.write("Benchmark log\n<PROGRAMID:5>bench<EOH>\n")
+            for record in range(args.records):
+                f.write(validate_record.format(qso_time(record),
+                    "21M" if record % 100 == 99 else "20M"))
+            f.close()
+            filenames.append(filename)
+
+        print("""
+Validating {} files of {} QSOs with the hamlibIO in
+{}, {} CPUs:
+    workers    seconds    speedup""".format(args.files, args.records,
+            os.path.dirname(hamlibIO.__file__), os.cpu_count()))
+
+        one_worker = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            hamlibIO.validate_ADIF_files(filenames, workers)
+            elapsed = time.perf_counter() - start
+            if one_worker is None:
+                one_worker = elapsed
+            print("    {:7d}    {:7.2f}    {:6.2f}x{}".format(workers,
+                elapsed, one_worker / elapsed,
+                "  (more workers than CPUs)" if workers > os.cpu_count()
+                    else ""))
+    finally:
+        shutil.rmtree(directory)
+
+    return(0)
+
+def bench_adx(args):
+    """
+    ADI/ADX benchmark: write the same QSOs to an ADIF (.adi) file and an
+    ADX file, then read them both back, one record at a time.
+
+    Arguments:
+        args:
+            Command line arguments
+
+    Returns:
+        Exit status: 0
+    """
+
+    hamlibIO = import_hamlibIO(args.path)
+
+    records = [dict(adx_record, TIME_ON=qso_time(record))
+        for record in range(args.records)]
+    header = {"CREATED_TIMESTAMP" : "20240101 000000",
+        "PROGRAMID" : "bench"}
+
+    directory = tempfile.mkdtemp()
+    try:
+        adi_filename = os.path.join(directory, "bench.adi")
+        adx_filename = os.path.join(directory, "bench.adx")
+
+        times = {}
+
+        start = time.perf_counter()
+        hamlibIO.write_ADIF_file(records, adi_filename, header)
+        times["write ADI"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hamlibIO.write_ADX_file(records, adx_filename, header)
+        times["write ADX"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        f = open(adi_filename, "r", encoding="utf-8", newline="")
+        adi_count = sum(1 for record in hamlibIO.iter_ADIF_records(f))
+        f.close()
+        times["read ADI"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        f = open(adx_filename, "rb")
+        adx_count = sum(1 for record in hamlibIO.iter_ADX_records(f))
+        f.close()
+        times["read ADX"] = time.perf_counter() - start
+
+        sizes = {"ADI" : os.path.getsize(adi_filename),
+            "ADX" : os.path.getsize(adx_filename)}
+    finally:
+        shutil.rmtree(directory)
+
+    print("""
+{} QSOs of {} fields with the hamlibIO in
+{}:""".format(len(records), len(records[0]),
+        os.path.dirname(hamlibIO.__file__)))
+    for file_format in ("ADI", "ADX"):
+        print("""    {0}: {1:5.1f} MB, write {2:5.2f} s ({3:6.0f} QSOs/s), \
+read {4:5.2f} s ({5:6.0f} QSOs/s)""".format(file_format,
+            sizes[file_format] / 1e6, times["write " + file_format],
+            len(records) / times["write " + file_format],
+            times["read " + file_format],
+            len(records) / times["read " + file_format]))
+
+    if adi_count != adx_count:
+        print("""
+Error: {} QSOs read back from the ADI file, {} from the ADX file.""".format(
+            adi_count, adx_count))
+
+    return(0)
+
+def bench_qsotable(args):
+    """
+    QSOTable memory benchmark: load the same log as a list of
+    dictonaries and as a QSOTable, and compare the memory each takes
+    (measured with tracemalloc). Every QSO has its own CALL and TIME_ON,
+    the other fields repeat as they do in a POTA log.
+
+    Arguments:
+        args:
+            Command line arguments
+
+    Returns:
+        Exit status: 0
+    """
+
+    hamlibIO = import_hamlibIO(args.path)
+
+    records = [dict(adx_record, CALL="K{}{:04d}".format(record % 10,
+        record // 10 % 10000), TIME_ON=qso_time(record))
+        for record in range(args.records)]
+
+    directory = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(directory, "bench.adi")
+        hamlibIO.write_ADIF_file(records, filename)
+        del records
+
+        sizes = {}
+        for (name, load) in (("list of dictonaries", list),
+                ("QSOTable", hamlibIO.QSOTable)):
+            f = open(filename, "r", encoding="utf-8", newline="")
+            try:
+                tracemalloc.start()
+                log = load(hamlibIO.iter_ADIF_records(f))
+                sizes[name] = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+            finally:
+                f.close()
+            del log
+    finally:
+        shutil.rmtree(directory)
+
+    print("""
+{} QSOs of {} fields with the hamlibIO in
+{}:""".format(args.records, len(adx_record),
+        os.path.dirname(hamlibIO.__file__)))
+    for name, size in sizes.items():
+        print("    {:20s} {:7.1f} MB, {:5.0f} bytes per QSO".format(name,
+            size / 1e6, size / args.records))
+    print("    QSOTable takes {:.1f}x less memory".format(
+        sizes["list of dictonaries"] / sizes["QSOTable"]))
+
+    return(0)
+
+def main(argv=None):
+    """
+    Command line interface to the benchmarks.
+
+    Arguments:
+        argv: Default None
+            List of command line arguments, None for sys.argv[1:]
+
+    Returns:
+        Exit status
+    """
+
+    parser = argparse.ArgumentParser(prog="hamlibIO_bench.py",
+        description="hamlibIO benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("import",
+        help="time importing hamlibIO")
+    command.add_argument("-n", "--runs", type=int, default=15,
+        help="number of imports to time (default: 15)")
+    command.add_argument("--limit", type=float, default=None,
+        help="fail if hamlibIO's own import time is over LIMIT ms")
+    command.set_defaults(bench=bench_import)
+
+    command = commands.add_parser("validators",
+        help="time the data type validators")
+    command.add_argument("-n", "--fields", type=int, default=1000000,
+        help="number of fields to validate (default: 1000000)")
+    command.add_argument("-r", "--runs", type=int, default=3,
+        help="number of times to validate them (default: 3)")
+    command.set_defaults(bench=bench_validators)
+
+    command = commands.add_parser("validate",
+        help="time validate_ADIF_files with different numbers of workers")
+    command.add_argument("-f", "--files", type=int, default=8,
+        help="number of ADIF files (default: 8)")
+    command.add_argument("-n", "--records", type=int, default=25000,
+        help="number of QSOs in each file (default: 25000)")
+    command.add_argument("-j", "--workers", default="1,2,4,8",
+        help="comma separated numbers of workers to time, the first is "
+            "the one speedups are relative to (default: 1,2,4,8)")
+    command.set_defaults(bench=bench_validate)
+
+    command = commands.add_parser("adx",
+        help="time writing and reading ADI and ADX files")
+    command.add_argument("-n", "--records", type=int, default=100000,
+        help="number of QSOs (default: 100000)")
+    command.set_defaults(bench=bench_adx)
+
+    command = commands.add_parser("qsotable",
+        help="compare the memory a QSOTable and a list of dictonaries take")
+    command.add_argument("-n", "--records", type=int, default=50000,
+        help="number of QSOs (default: 50000)")
+    command.set_defaults(bench=bench_qsotable)
+
+    for command in commands.choices.values():
+        command.add_argument("--path", default=None,
+            help="directory of the hamlibIO.py to benchmark "
+                "(default: this one)")
+
+    args = parser.parse_args(argv)
+
+    return(args.bench(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,452 @@
+########################################################################
+########################################################################
+####
+#### Test helpers for the hamlibIO.py validation tests
+####
+#### Functions that wrap hamlibIO functions so TestHarness can check
+#### what they return: reading files from strings, writing to temporary
+#### files and reading them back, and so on. hamlibIO loads this module
+#### when its validation tests are run.
+####
+########################################################################
+########################################################################
+
+####
+#### Import support modules
+####
+
+import contextlib
+import io
+import os
+import re
+import tempfile
+
+import hamlibIO
+
+####
+#### Global definitions
+####
+
+#
+#Header for files written by the tests, so the file contents don't
+#change from run to run
+#
+fixed_header = {"CREATED_TIMESTAMP":"20240101 000000", "PROGRAMID":"test"}
+
+@contextlib.contextmanager
+def temporary_files(files):
+    """
+    Create temporary files, and remove them again when the with
+    statement using them ends.
+
+    Arguments:
+        files:
+            Tuple or list of (extension, contents) tuples, one per
+            file. Contents are written UTF-8 encoded, None creates an
+            empty file.
+
+    Returns:
+        List of the file names, in the order of files.
+    """
+
+    filenames = []
+    try:
+        for (suffix, text) in files:
+            (handle, filename) = tempfile.mkstemp(suffix=suffix)
+            filenames.append(filename)
+            if text is not None:
+                os.write(handle, text.encode("utf-8"))
+            os.close(handle)
+
+        yield(filenames)
+    finally:
+        for filename in filenames:
+            os.remove(filename)
+
+def read_file(filename):
+    """
+    Read a whole file, UTF-8 and with its line endings as written.
+
+    Arguments:
+        filename:
+            Name of the file
+
+    Returns:
+        File contents
+    """
+
+    f = open(filename, "r", encoding="utf-8", newline="")
+    contents = f.read()
+    f.close()
+
+    return(contents)
+
+def test_iter_ADIF_records(text, chunk_size):
+    """
+    Read all the ADIF records in a string.
+
+    Arguments:
+        text:
+            ADIF file contents.
+        chunk_size:
+            Number of characters to read at a time.
+
+    Returns:
+        Tuple of the header dictonary and a list of record dictonaries.
+    """
+
+    header = {}
+    records = list(hamlibIO.iter_ADIF_records(io.StringIO(text), header,
+        chunk_size))
+    return((header, records))
+
+def test_iter_ADIF_spans(data):
+    """
+    Tokenize ADIF data into a list.
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data.
+
+    Returns:
+        List of (name, offset, length) tuples.
+    """
+
+    return(list(hamlibIO.iter_ADIF_spans(data)))
+
+def test_scan_ADIF_records(data, field_names):
+    """
+    Scan ADIF data into a list.
+
+    Arguments:
+        data:
+            Bytes-like object containing ADIF data.
+        field_names:
+            Tuple or list of field names to return.
+
+    Returns:
+        List of record dictonaries.
+    """
+
+    return(list(hamlibIO.scan_ADIF_records(data, field_names)))
+
+def test_write_ADIF_file(records, include_data_type):
+    """
+    Write an ADIF file with a fixed header to a temporary file and
+    return what was written.
+
+    Arguments:
+        records:
+            List of record dictonaries.
+        include_data_type:
+            If True, include data type in data specifier.
+
+    Returns:
+        Tuple of the number of records written and the file contents.
+    """
+
+    with temporary_files(((".adi", None),)) as (filename,):
+        count = hamlibIO.write_ADIF_file(records, filename, fixed_header,
+            None, 0, include_data_type)
+        return((count, read_file(filename)))
+
+def test_write_ADX_file(records):
+    """
+    Write an ADX file with a fixed header to a temporary file and
+    return what was written.
+
+    Arguments:
+        records:
+            List of record dictonaries.
+
+    Returns:
+        Tuple of the number of records written and the file contents.
+    """
+
+    with temporary_files(((".adx", None),)) as (filename,):
+        count = hamlibIO.write_ADX_file(records, filename, fixed_header)
+        return((count, read_file(filename)))
+
+def test_convert_ADIF_file(text, in_suffix, out_suffix):
+    """
+    Convert a file with the given contents and return the converted
+    file, with the header comment and the CREATED_TIMESTAMP and
+    PROGRAMID header fields removed (they change from run to run).
+
+    Arguments:
+        text:
+            Contents of the file to convert
+        in_suffix:
+            Extension of the file to convert
+        out_suffix:
+            Extension of the file to create
+
+    Returns:
+        Tuple of the number of records written, the errors list and the
+        converted file contents.
+    """
+
+    with temporary_files(((in_suffix, text), (out_suffix, None))) as (
+            in_filename, out_filename):
+        errors = []
+        count = hamlibIO.convert_ADIF_file(in_filename, out_filename, errors)
+        contents = read_file(out_filename)
+
+    contents = re.sub(r"(Generated by|[ ]*<CREATED_TIMESTAMP|[ ]*<PROGRAMID)"
+        r"[^\n]*\n", "", contents)
+
+    return((count, errors, contents))
+
+def test_iter_ADX_records(text):
+    """
+    Read ADX records from a string.
+
+    Arguments:
+        text:
+            ADX file contents
+
+    Returns:
+        Tuple of the header dictonary and a list of the records.
+    """
+
+    header = {}
+    records = list(hamlibIO.iter_ADX_records(
+        io.BytesIO(text.encode("utf-8")), header))
+
+    return((header, records))
+
+def test_validate_ADIF_files(texts, workers, shard_size):
+    """
+    Write ADIF text to temporary files and validate them with
+    validate_ADIF_files.
+
+    Arguments:
+        texts:
+            Tuple of ADIF file contents
+        workers:
+            Number of worker processes
+        shard_size:
+            Approximate size of each shard in bytes.
+
+    Returns:
+        validate_ADIF_files results, with the file names replaced by
+        their offset in texts.
+    """
+
+    with temporary_files([(".adi", text) for text in texts]) as filenames:
+        results = hamlibIO.validate_ADIF_files(filenames, workers,
+            shard_size)
+
+    return([(filenames.index(filename), errors)
+        for (filename, errors) in results])
+
+def test_freqs_to_band_codes(freqs):
+    """
+    Classify frequencies with both freqs_to_band_codes versions, pure
+    Python and (if it's installed) NumPy.
+
+    Arguments:
+        freqs:
+            List of frequencies
+
+    Returns:
+        The pure Python version's band codes and invalid flags if the
+        NumPy version agrees, otherwise both versions' results.
+    """
+
+    python_result = hamlibIO.freqs_to_band_codes(freqs, False)
+    if hamlibIO.get_numpy() is None:
+        return(python_result)
+
+    (codes, invalid) = hamlibIO.freqs_to_band_codes(freqs)
+    numpy_result = (codes.tolist(), invalid.tolist())
+    if numpy_result == python_result:
+        return(python_result)
+
+    return((python_result, numpy_result))
+
+def test_QSOTable(records, field_name, field_value, bad_record=None):
+    """
+    Load records into a QSOTable and read them back.
+
+    Arguments:
+        records:
+            List of record dictonaries.
+        field_name:
+            Field to scan
+        field_value:
+            Contents to look for with find
+        bad_record: Default None
+            Record that append should reject after the records are
+            loaded, leaving the table unchanged.
+
+    Returns:
+        Tuple of the number of QSOs, the records read back, and the
+        column, find and value_counts results for the field.
+    """
+
+    table = hamlibIO.QSOTable(records)
+    if bad_record is not None:
+        try:
+            table.append(bad_record)
+        except hamlibIO.hamlibIOerror:
+            pass
+
+    return((len(table), list(table.records()), table.column(field_name),
+        table.find(field_name, field_value),
+        table.value_counts(field_name)))
+
+def test_enumeration_codes(field_name, value):
+    """
+    Look up a value's code and the value of that code.
+
+    Arguments:
+        field_name:
+            Field name
+        value:
+            Enumeration value
+
+    Returns:
+        Tuple of the code and the value of the code, None for both if
+        the value isn't in the enumeration.
+    """
+
+    codes = hamlibIO.get_enumeration_codes(field_name)
+    code = codes.code(value)
+
+    return((code, None if code is None else codes.value(code)))
+
+def test_QSOTable_order(records, field_name):
+    """
+    Sort the QSOs of a QSOTable by a field.
+
+    Arguments:
+        records:
+            List of record dictonaries.
+        field_name:
+            Field to sort by
+
+    Returns:
+        List of the field's contents in sorted order.
+    """
+
+    table = hamlibIO.QSOTable(records)
+
+    return([table.value(row, field_name)
+        for row in table.order(field_name)])
+
+def test_ADIFRecordTemplate(fields, variable_fields, values, spaces=0):
+    """
+    Create records from a template, and check them against
+    ADIF_record.
+
+    Arguments:
+        fields:
+            Dictonary of shared fields
+        variable_fields:
+            List of variable field names
+        values:
+            List of dictonaries of variable fields, one per record
+        spaces: Default 0
+            Number of spaces between fields.
+
+    Returns:
+        List of records, or "Differs from ADIF_record" if a record isn't
+        what ADIF_record returns.
+    """
+
+    template = hamlibIO.ADIFRecordTemplate(fields, variable_fields, spaces)
+    records = []
+    for record_values in values:
+        record = template.record(record_values)
+        if record != hamlibIO.ADIF_record({**fields, **record_values},
+                spaces):
+            return("Differs from ADIF_record")
+        records.append(record)
+
+    return(records)
+
+def test_error_sink(function, fields):
+    """
+    Call ADIF_record or ADIF_header with an error sink.
+
+    Arguments:
+        function:
+            ADIF_record or ADIF_header
+        fields:
+            Dictonary of fields and their contents.
+
+    Returns:
+        Tuple of what the function returned and the errors list.
+    """
+
+    errors = []
+    if function is hamlibIO.ADIF_header:
+        result = function(fields, None, False, errors)
+    else:
+        result = function(fields, 0, False, errors)
+
+    return((result, errors))
+
+def test_dxcc_entity(code, subdivision):
+    """
+    Look up a DXCC entity and one of its subdivisions.
+
+    Arguments:
+        code:
+            DXCC entity code
+        subdivision:
+            Subdivision code to look up
+
+    Returns:
+        Tuple of the entity's code, name, deleted flag and subdivision
+        table entry (None if no such subdivision), or None if no such
+        entity.
+    """
+
+    entity = hamlibIO.dxcc_entity(code)
+    if entity is None:
+        return(None)
+
+    return((entity.code, entity.name, entity.deleted,
+        entity.subdivisions.get(subdivision)))
+
+def test_field_checks(field_definitions, field_contents):
+    """
+    Check field contents with the FieldCheck of every field in a field
+    definition dictonary, both ways.
+
+    Arguments:
+        field_definitions:
+            Dictonary of valid field names.
+        field_contents:
+            Contents to check
+
+    Returns:
+        Dictonary of upper cased field name and a tuple of what valid
+        returns and whether validate returns no error text. The two
+        always agree.
+    """
+
+    checks = {field_name.upper() : hamlibIO.compile_field_type(field_type)
+        for field_name, field_type in field_definitions.items()}
+
+    return({field_name : (check.valid(field_contents),
+        check.validate(field_contents) == "")
+        for field_name, check in checks.items()})
+
+def test_compile_field_type(field_type):
+    """
+    Compile a field type.
+
+    Arguments:
+        field_type:
+            Tuple of data types or an enumeration validation function
+
+    Returns:
+        Tuple of the FieldCheck's field type and validate function.
+    """
+
+    check = hamlibIO.compile_field_type(field_type)
+
+    return((check.field_type, check.validate))